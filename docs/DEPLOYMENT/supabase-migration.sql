@@ -48,9 +48,11 @@ CREATE INDEX IF NOT EXISTS idx_lynx_drafts_created_at ON lynx_drafts(tenant_id,
 CREATE INDEX IF NOT EXISTS idx_lynx_drafts_draft_type ON lynx_drafts(tenant_id, draft_type);
 
 -- Unique index for idempotency (request_id per tenant)
-CREATE UNIQUE INDEX IF NOT EXISTS idx_lynx_drafts_request_id_unique 
-    ON lynx_drafts(tenant_id, request_id) 
-    WHERE request_id IS NOT NULL;
+-- Not partial: create_draft relies on INSERT ... ON CONFLICT (tenant_id, request_id)
+-- DO NOTHING, which needs a non-partial arbiter index. NULL request_ids stay distinct.
+DROP INDEX IF EXISTS idx_lynx_drafts_request_id_unique;
+CREATE UNIQUE INDEX idx_lynx_drafts_request_id_unique 
+    ON lynx_drafts(tenant_id, request_id);
 
 -- RLS Policy for lynx_drafts
 ALTER TABLE lynx_drafts ENABLE ROW LEVEL SECURITY;
@@ -61,6 +63,34 @@ CREATE POLICY "Tenant isolation for drafts"
     FOR ALL
     USING (tenant_id = current_setting('app.tenant_id', true));
 
+-- ============================================================================
+-- TABLE: lynx_draft_payloads
+-- ============================================================================
+-- Out-of-line storage for large draft payloads (LYNX_DRAFT_PAYLOAD_OFFLOAD_THRESHOLD).
+-- lynx_drafts.payload then holds {"$lynx_payload": {"codec", "size", "blob": true}};
+-- data is the compressed (zstd or gzip) JSON payload, base64-encoded.
+-- Written before the draft row, so there is no foreign key to lynx_drafts.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS lynx_draft_payloads (
+    draft_id UUID PRIMARY KEY,
+    tenant_id TEXT NOT NULL,
+    codec TEXT NOT NULL CHECK (codec IN ('zstd', 'gzip')),
+    size INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_lynx_draft_payloads_tenant_id ON lynx_draft_payloads(tenant_id, draft_id);
+
+ALTER TABLE lynx_draft_payloads ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Tenant isolation for draft payloads" ON lynx_draft_payloads;
+CREATE POLICY "Tenant isolation for draft payloads"
+    ON lynx_draft_payloads
+    FOR ALL
+    USING (tenant_id = current_setting('app.tenant_id', true));
+
 -- ============================================================================
 -- TABLE: lynx_executions
 -- ============================================================================
@@ -132,6 +162,17 @@ CREATE INDEX IF NOT EXISTS idx_settlement_intents_tenant_id ON settlement_intent
 CREATE INDEX IF NOT EXISTS idx_settlement_intents_status ON settlement_intents(tenant_id, settlement_status);
 CREATE INDEX IF NOT EXISTS idx_settlement_intents_created_at ON settlement_intents(tenant_id, created_at DESC);
 
+-- Settlement worker: retries with backoff and a processing lease per intent
+ALTER TABLE settlement_intents ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE settlement_intents ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+ALTER TABLE settlement_intents ADD COLUMN IF NOT EXISTS last_error TEXT;
+ALTER TABLE settlement_intents ADD COLUMN IF NOT EXISTS locked_by TEXT;
+ALTER TABLE settlement_intents ADD COLUMN IF NOT EXISTS locked_until TIMESTAMPTZ;
+
+-- Claim queries (cross-tenant: the worker runs with the service key)
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_due ON settlement_intents(next_attempt_at) WHERE settlement_status = 'queued';
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_lease ON settlement_intents(locked_until) WHERE settlement_status = 'processing';
+
 -- RLS Policy for settlement_intents
 ALTER TABLE settlement_intents ENABLE ROW LEVEL SECURITY;
 
@@ -176,6 +217,271 @@ CREATE POLICY "Tenant isolation for audit events"
     FOR ALL
     USING (tenant_id = current_setting('app.tenant_id', true));
 
+-- ============================================================================
+-- TABLE: lynx_run_summaries
+-- ============================================================================
+-- One aggregate row per Lynx run (counts, max risk, tools used, first/last
+-- event, total tool duration, query/response), maintained incrementally by
+-- lynx_record_run_event as audit events are logged, so an audit list page is
+-- one indexed read of this table instead of reading lynx_runs and
+-- aggregating audit_logs. Tool events can precede the lynx_runs row, so
+-- there is no foreign key to it; rows stay here when runs are archived.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS lynx_run_summaries (
+    run_id TEXT PRIMARY KEY,
+    tenant_id TEXT NOT NULL,
+    user_id TEXT,
+    status TEXT,
+    user_query TEXT,
+    lynx_response TEXT,
+    tool_count INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    failure_count INTEGER NOT NULL DEFAULT 0,
+    refusal_count INTEGER NOT NULL DEFAULT 0,
+    max_risk TEXT CHECK (max_risk IN ('low', 'medium', 'high')),
+    tool_ids TEXT[] NOT NULL DEFAULT '{}',
+    total_duration_ms BIGINT NOT NULL DEFAULT 0,
+    first_event_at TIMESTAMP NOT NULL,
+    last_event_at TIMESTAMP NOT NULL,
+    completed_at TIMESTAMP
+);
+
+-- Indexes for lynx_run_summaries
+CREATE INDEX IF NOT EXISTS idx_lynx_run_summaries_tenant_first_event ON lynx_run_summaries(tenant_id, first_event_at DESC, run_id DESC);
+CREATE INDEX IF NOT EXISTS idx_lynx_run_summaries_tool_ids ON lynx_run_summaries USING GIN (tool_ids);
+
+-- RLS Policy for lynx_run_summaries
+ALTER TABLE lynx_run_summaries ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Tenant isolation for run summaries" ON lynx_run_summaries;
+CREATE POLICY "Tenant isolation for run summaries"
+    ON lynx_run_summaries
+    FOR ALL
+    USING (tenant_id = current_setting('app.tenant_id', true));
+
+-- Tool call durations (audit_logs is created in lynx-ai/SETUP.md)
+ALTER TABLE IF EXISTS audit_logs ADD COLUMN IF NOT EXISTS duration_ms INTEGER;
+
+-- ============================================================================
+-- FUNCTION: lynx_commit_cell_execution
+-- ============================================================================
+-- Commits one successful Cell execution in a single transaction (one RPC
+-- round trip): draft status compare-and-set, execution record and optional
+-- settlement intent. Runs as the caller, so RLS still applies.
+--
+-- Returns {"outcome": "committed"|"duplicate"|"conflict"|"not_found", ...}:
+--   duplicate: request_id already committed ("execution" = stored record)
+--   conflict:  draft not in p_expected_status ("status" = current status)
+-- A second successful execution violates idx_lynx_executions_draft_tool_unique
+-- and rolls the whole transaction back.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION lynx_commit_cell_execution(
+    p_execution JSONB,
+    p_expected_status TEXT,
+    p_new_status TEXT,
+    p_settlement JSONB DEFAULT NULL
+) RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_existing lynx_executions%ROWTYPE;
+    v_current_status TEXT;
+BEGIN
+    -- Idempotency (request_id per tenant)
+    IF p_execution->>'request_id' IS NOT NULL THEN
+        SELECT * INTO v_existing
+        FROM lynx_executions
+        WHERE tenant_id = p_execution->>'tenant_id'
+        AND request_id = p_execution->>'request_id';
+        IF FOUND THEN
+            RETURN jsonb_build_object('outcome', 'duplicate', 'execution', to_jsonb(v_existing));
+        END IF;
+    END IF;
+
+    -- Draft status compare-and-set (row lock serializes concurrent executions)
+    UPDATE lynx_drafts
+    SET status = p_new_status
+    WHERE draft_id = (p_execution->>'draft_id')::UUID
+    AND tenant_id = p_execution->>'tenant_id'
+    AND status = p_expected_status;
+
+    IF NOT FOUND THEN
+        SELECT status INTO v_current_status
+        FROM lynx_drafts
+        WHERE draft_id = (p_execution->>'draft_id')::UUID
+        AND tenant_id = p_execution->>'tenant_id';
+        RETURN jsonb_build_object(
+            'outcome', CASE WHEN v_current_status IS NULL THEN 'not_found' ELSE 'conflict' END,
+            'status', v_current_status
+        );
+    END IF;
+
+    INSERT INTO lynx_executions
+    SELECT * FROM jsonb_populate_record(NULL::lynx_executions, p_execution);
+
+    IF p_settlement IS NOT NULL THEN
+        INSERT INTO settlement_intents
+        SELECT * FROM jsonb_populate_record(NULL::settlement_intents, p_settlement);
+    END IF;
+
+    RETURN jsonb_build_object('outcome', 'committed');
+END;
+$$;
+
+-- ============================================================================
+-- FUNCTION: lynx_claim_settlement_intents
+-- ============================================================================
+-- Claims up to p_batch_size due settlement intents for one worker: queued
+-- intents whose next_attempt_at has passed, and processing intents whose
+-- lease expired (crashed worker). FOR UPDATE SKIP LOCKED lets concurrent
+-- workers claim disjoint batches without waiting on each other.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION lynx_claim_settlement_intents(
+    p_worker_id TEXT,
+    p_providers TEXT[],
+    p_batch_size INTEGER,
+    p_lease_seconds INTEGER
+) RETURNS SETOF settlement_intents
+LANGUAGE sql
+AS $$
+    UPDATE settlement_intents s
+    SET settlement_status = 'processing',
+        locked_by = p_worker_id,
+        locked_until = NOW() + make_interval(secs => p_lease_seconds),
+        attempts = s.attempts + 1,
+        updated_at = NOW()
+    WHERE s.payment_id IN (
+        SELECT payment_id
+        FROM settlement_intents
+        WHERE provider = ANY(p_providers)
+        AND (
+            (settlement_status = 'queued' AND next_attempt_at <= NOW())
+            OR (settlement_status = 'processing' AND locked_until < NOW())
+        )
+        ORDER BY next_attempt_at
+        LIMIT p_batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING s.*;
+$$;
+
+-- ============================================================================
+-- FUNCTION: lynx_record_run_event
+-- ============================================================================
+-- Folds one audit event into its run's summary in a single statement (one
+-- RPC round trip): creates the row on the first event and adds the counters
+-- on later ones (ON CONFLICT row lock, so concurrent tool calls of a run
+-- never lose updates). p_status (completed/failed/blocked) marks the run
+-- finished and sets completed_at; the run event also carries the query and
+-- response shown in audit lists.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION lynx_record_run_event(
+    p_run_id TEXT,
+    p_tenant_id TEXT,
+    p_user_id TEXT,
+    p_at TIMESTAMP,
+    p_tool_id TEXT DEFAULT NULL,
+    p_risk TEXT DEFAULT NULL,
+    p_tool_calls INTEGER DEFAULT 0,
+    p_successes INTEGER DEFAULT 0,
+    p_failures INTEGER DEFAULT 0,
+    p_refusals INTEGER DEFAULT 0,
+    p_duration_ms BIGINT DEFAULT 0,
+    p_status TEXT DEFAULT NULL,
+    p_user_query TEXT DEFAULT NULL,
+    p_lynx_response TEXT DEFAULT NULL
+) RETURNS VOID
+LANGUAGE sql
+AS $$
+    INSERT INTO lynx_run_summaries AS s (
+        run_id, tenant_id, user_id, status, user_query, lynx_response, tool_count, success_count,
+        failure_count, refusal_count, max_risk, tool_ids, total_duration_ms, first_event_at,
+        last_event_at, completed_at
+    ) VALUES (
+        p_run_id, p_tenant_id, p_user_id, p_status, p_user_query, p_lynx_response, p_tool_calls,
+        p_successes, p_failures, p_refusals, p_risk,
+        CASE WHEN p_tool_id IS NULL THEN '{}'::TEXT[] ELSE ARRAY[p_tool_id] END,
+        COALESCE(p_duration_ms, 0), p_at, p_at,
+        CASE WHEN p_status IS NULL THEN NULL ELSE p_at END
+    )
+    ON CONFLICT (run_id) DO UPDATE SET
+        user_id = COALESCE(s.user_id, EXCLUDED.user_id),
+        status = COALESCE(EXCLUDED.status, s.status),
+        user_query = COALESCE(EXCLUDED.user_query, s.user_query),
+        lynx_response = COALESCE(EXCLUDED.lynx_response, s.lynx_response),
+        tool_count = s.tool_count + EXCLUDED.tool_count,
+        success_count = s.success_count + EXCLUDED.success_count,
+        failure_count = s.failure_count + EXCLUDED.failure_count,
+        refusal_count = s.refusal_count + EXCLUDED.refusal_count,
+        max_risk = CASE
+            WHEN array_position(ARRAY['low', 'medium', 'high'], EXCLUDED.max_risk)
+                > COALESCE(array_position(ARRAY['low', 'medium', 'high'], s.max_risk), 0)
+            THEN EXCLUDED.max_risk
+            ELSE s.max_risk
+        END,
+        tool_ids = CASE
+            WHEN p_tool_id IS NULL OR p_tool_id = ANY(s.tool_ids) THEN s.tool_ids
+            ELSE s.tool_ids || p_tool_id
+        END,
+        total_duration_ms = s.total_duration_ms + EXCLUDED.total_duration_ms,
+        first_event_at = LEAST(s.first_event_at, EXCLUDED.first_event_at),
+        last_event_at = GREATEST(s.last_event_at, EXCLUDED.last_event_at),
+        completed_at = COALESCE(EXCLUDED.completed_at, s.completed_at)
+    WHERE s.tenant_id = EXCLUDED.tenant_id;
+$$;
+
+-- ============================================================================
+-- BACKFILL: lynx_run_summaries
+-- ============================================================================
+-- Summarizes runs logged before lynx_run_summaries existed, so they stay in
+-- audit lists. Run it before archiving those runs (the archive job deletes
+-- the rows it reads). Safe to re-run: existing summaries are kept.
+-- Counts are derived from audit_logs rows: one start row per call (empty
+-- output), success/failure rows per outcome, one row per refusal, and one
+-- row per draft transition (drafts.*).
+-- ============================================================================
+
+INSERT INTO lynx_run_summaries (
+    run_id, tenant_id, user_id, status, user_query, lynx_response, tool_count, success_count,
+    failure_count, refusal_count, max_risk, tool_ids, total_duration_ms, first_event_at,
+    last_event_at, completed_at
+)
+SELECT
+    r.run_id::TEXT, r.tenant_id::TEXT, r.user_id::TEXT, r.status, r.user_query, r.lynx_response,
+    COALESCE(a.tool_count, 0), COALESCE(a.success_count, 0), COALESCE(a.failure_count, 0),
+    COALESCE(a.refusal_count, 0), (ARRAY['low', 'medium', 'high'])[a.max_risk_rank],
+    COALESCE(a.tool_ids, '{}'), COALESCE(a.total_duration_ms, 0),
+    LEAST(r.timestamp, a.first_event_at), GREATEST(r.timestamp, a.last_event_at), r.timestamp
+FROM lynx_runs r
+LEFT JOIN (
+    SELECT
+        run_id,
+        COUNT(*) FILTER (
+            WHERE refused OR tool_id LIKE 'drafts.%' OR output = '{}'::JSONB
+        ) AS tool_count,
+        COUNT(*) FILTER (
+            WHERE NOT refused AND CASE
+                WHEN tool_id LIKE 'drafts.%' THEN output->>'outcome' = 'updated'
+                ELSE output <> '{}'::JSONB AND NOT output ? 'error' AND NOT output ? 'warning'
+            END
+        ) AS success_count,
+        COUNT(*) FILTER (WHERE NOT refused AND output ? 'error') AS failure_count,
+        COUNT(*) FILTER (WHERE refused) AS refusal_count,
+        MAX(array_position(ARRAY['low', 'medium', 'high'], risk_level::TEXT)) AS max_risk_rank,
+        array_agg(DISTINCT tool_id::TEXT) AS tool_ids,
+        SUM(duration_ms) AS total_duration_ms,
+        MIN(timestamp) AS first_event_at,
+        MAX(timestamp) AS last_event_at
+    FROM audit_logs
+    WHERE run_id IS NOT NULL
+    GROUP BY run_id
+) a ON a.run_id = r.run_id
+ON CONFLICT (run_id) DO NOTHING;
+
 -- ============================================================================
 -- VERIFICATION QUERIES
 -- ============================================================================
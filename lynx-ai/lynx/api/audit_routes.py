@@ -5,16 +5,21 @@ Backend provides audit trail, UI only renders.
 Backend derives tenant_id from session (never from client).
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException, Response
-from typing import Optional, Dict, List
+from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Any, Iterator, Optional, Dict, List, Tuple
 from datetime import datetime
+import base64
 import csv
 import json
 import io
+import zlib
 
-from lynx.api.models import AuditRun, AuditListResponse, ToolCall, RunStatus, ToolCallStatus
+from lynx.api.models import AuditRun, AuditRunSummary, AuditListResponse, ToolCall, RunStatus, ToolCallStatus
 from lynx.api.auth import get_current_session
 from lynx.config import Config
+from lynx.storage.audit_archive import AuditArchive, get_audit_archive
+from lynx.storage.run_summaries import get_run_summaries, list_run_summaries
 
 try:
     from supabase import create_client, Client
@@ -25,6 +30,15 @@ except ImportError:
 
 router = APIRouter(prefix="/api/audit", tags=["audit"])
 
+# lynx_runs columns an export reads, and the fields it writes
+EXPORT_COLUMNS = ["run_id", "timestamp", "user_id", "user_query", "lynx_response", "status"]
+EXPORT_FIELDS = ["run_id", "timestamp", "user_id", "query", "response", "status", "cursor"]
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
 
 def get_supabase_client() -> Optional[Client]:
     """Get Supabase client for audit queries."""
@@ -43,6 +57,7 @@ async def list_runs(
     from_date: Optional[str] = Query(None),  # ISO 8601 date
     to_date: Optional[str] = Query(None),  # ISO 8601 date
     user_id: Optional[str] = Query(None),
+    include_tool_calls: bool = Query(False),  # Per-call list (one extra audit_logs read per page)
     # ✅ CRITICAL: Never accept tenant_id from query params - only from session
     session: Dict[str, str] = Depends(get_current_session),
 ):
@@ -52,6 +67,9 @@ async def list_runs(
     ✅ Backend derives tenant_id from session (NEVER from query params)
     ✅ Server-side filtering (date, user)
     ✅ Offset pagination (cursor TODO for future)
+    ✅ One indexed read of lynx_run_summaries per page (rows + exact count);
+       summaries stay hot when runs are archived, so archived runs are listed too
+    ✅ tool_calls are only listed with include_tool_calls=true (see GET /runs/{run_id})
     """
     tenant_id = session['tenant_id']  # ✅ Source of truth: session, not query param
     
@@ -66,90 +84,57 @@ async def list_runs(
             cursor=None,
         )
     
-    # Build query (tenant-scoped, RLS enforced)
-    # Note: Schema uses "timestamp" not "created_at" (check SETUP.md)
-    query = client.table("lynx_runs").select("*").eq("tenant_id", tenant_id)
-    
-    # Apply filters
+    # Date filters apply to the run's first audit event
+    from_ts = None
     if from_date:
         try:
-            from_dt = datetime.fromisoformat(from_date.replace('Z', '+00:00'))
-            query = query.gte("timestamp", from_dt.isoformat())
+            from_ts = datetime.fromisoformat(from_date.replace('Z', '+00:00')).isoformat()
         except ValueError:
             raise HTTPException(400, f"Invalid from_date format: {from_date}")
     
+    to_ts = None
     if to_date:
         try:
-            to_dt = datetime.fromisoformat(to_date.replace('Z', '+00:00'))
-            query = query.lte("timestamp", to_dt.isoformat())
+            to_ts = datetime.fromisoformat(to_date.replace('Z', '+00:00')).isoformat()
         except ValueError:
             raise HTTPException(400, f"Invalid to_date format: {to_date}")
     
-    if user_id:
-        query = query.eq("user_id", user_id)
-    
-    # Order by timestamp descending (newest first)
-    query = query.order("timestamp", desc=True)
-    
-    # Apply pagination
-    query = query.range(offset, offset + limit - 1)
+    # Page of runs, newest first (tenant-scoped, RLS enforced)
+    summaries, total = list_run_summaries(
+        client, tenant_id, limit=limit, since=from_ts, until=to_ts, user_id=user_id, offset=offset,
+    )
     
-    # Execute query
-    result = query.execute()
-    
-    # Get total count (for pagination metadata)
-    count_query = client.table("lynx_runs").select("*", count="exact").eq("tenant_id", tenant_id)
-    if from_date:
-        from_dt = datetime.fromisoformat(from_date.replace('Z', '+00:00'))
-        count_query = count_query.gte("timestamp", from_dt.isoformat())
-    if to_date:
-        to_dt = datetime.fromisoformat(to_date.replace('Z', '+00:00'))
-        count_query = count_query.lte("timestamp", to_dt.isoformat())
-    if user_id:
-        count_query = count_query.eq("user_id", user_id)
-    count_result = count_query.execute()
-    total = count_result.count if hasattr(count_result, 'count') else len(result.data)
+    tool_calls_by_run: Dict[str, List[Dict[str, Any]]] = {}
+    if include_tool_calls:
+        tool_calls_by_run = _page_tool_calls(client, tenant_id, [summary["run_id"] for summary in summaries])
     
     # Convert to API models
     runs: List[AuditRun] = []
-    for record in result.data:
-        # Get tool calls summary for this run (from audit_logs table)
-        tool_calls_result = client.table("audit_logs").select("tool_id, approved, refused").eq("run_id", record["run_id"]).execute()
+    for summary in summaries:
         tool_calls = [
             ToolCall(
                 tool_id=tc.get("tool_id", ""),
                 status=ToolCallStatus("success" if tc.get("approved") else "error" if tc.get("refused") else "pending"),
                 input={},
                 output=None,
-                duration_ms=None,  # Schema doesn't have duration_ms
+                duration_ms=tc.get("duration_ms"),
                 error=None,
             )
-            for tc in tool_calls_result.data
+            for tc in tool_calls_by_run.get(summary["run_id"], [])
         ]
         
-        # Map status
-        status_map = {
-            "completed": RunStatus.SUCCESS,
-            "failed": RunStatus.ERROR,
-            "pending": RunStatus.PENDING,
-        }
-        run_status = status_map.get(record.get("status", "pending"), RunStatus.PENDING)
-        
-        # Parse dates (schema uses "timestamp" not "created_at")
-        created_at = datetime.fromisoformat(record["timestamp"].replace('Z', '+00:00'))
-        completed_at = None  # Schema doesn't have completed_at, use timestamp for now
-        
         runs.append(AuditRun(
-            run_id=record["run_id"],
-            tenant_id=record["tenant_id"],  # ✅ For display only (already tenant-scoped)
-            actor_user_id=record.get("user_id", ""),
+            run_id=summary["run_id"],
+            tenant_id=summary["tenant_id"],  # ✅ For display only (already tenant-scoped)
+            actor_user_id=summary.get("user_id") or "",
             actor_role="user",  # Schema doesn't have user_role, use default
             request_id="",  # Schema doesn't have request_id, use empty
-            query=record.get("user_query", ""),
-            response=record.get("lynx_response", ""),
+            query=summary.get("user_query") or "",
+            response=summary.get("lynx_response") or "",
             tool_calls=tool_calls,
-            created_at=created_at,
-            completed_at=completed_at,
+            created_at=summary["first_event_at"],
+            completed_at=summary.get("completed_at"),
+            summary=AuditRunSummary(**summary),
         ))
     
     return AuditListResponse(
@@ -161,6 +146,75 @@ async def list_runs(
     )
 
 
+@router.get("/runs/export")
+async def export_audit(
+    format: str = Query('csv'),  # csv, ndjson or json
+    from_date: Optional[str] = Query(None),
+    to_date: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),  # ✅ Resume after the row carrying this cursor
+    limit: Optional[int] = Query(None, ge=1),  # Max rows (default: all)
+    gzip: bool = Query(False),  # ✅ Gzip-compressed download (.gz)
+    # ✅ CRITICAL: Never accept tenant_id from query params - only from session
+    session: Dict[str, str] = Depends(get_current_session),
+):
+    """
+    Export audit logs (CSV, NDJSON or JSON), streamed.
+    
+    ✅ Backend derives tenant_id from session (NEVER from query params)
+    ✅ Server-side filtering (date range)
+    ✅ Streams keyset-paginated pages (memory bounded by Config.AUDIT_EXPORT_PAGE_SIZE)
+    ✅ Every row carries a cursor - pass the last one received to resume
+    ✅ Returns file download (optionally gzip-compressed)
+    """
+    tenant_id = session['tenant_id']  # ✅ Source of truth: session
+    
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(400, "Format must be 'csv', 'ndjson' or 'json'")
+    
+    after = _decode_export_cursor(cursor) if cursor else None
+    
+    # Parse date filters
+    from_ts = None
+    if from_date:
+        try:
+            from_ts = datetime.fromisoformat(from_date.replace('Z', '+00:00')).isoformat()
+        except ValueError:
+            raise HTTPException(400, f"Invalid from_date format: {from_date}")
+    
+    to_ts = None
+    if to_date:
+        try:
+            to_ts = datetime.fromisoformat(to_date.replace('Z', '+00:00')).isoformat()
+        except ValueError:
+            raise HTTPException(400, f"Invalid to_date format: {to_date}")
+    
+    client = get_supabase_client()
+    if not client:
+        raise HTTPException(503, "Audit storage not available")
+    
+    # Pages are fetched as the client reads (sync generators run in the threadpool)
+    pages = _iter_run_pages(client, tenant_id, from_ts, to_ts, after, limit)
+    chunks = _format_export(pages, format)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"audit-{timestamp}.{format}"
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if gzip:
+        body = _gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+    else:
+        body = (chunk.encode("utf-8") for chunk in chunks)
+    
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"'
+        }
+    )
+
+
 @router.get("/runs/{run_id}", response_model=AuditRun)
 async def get_run(
     run_id: str,
@@ -171,6 +225,7 @@ async def get_run(
     
     ✅ Backend derives tenant_id from session
     ✅ Verifies tenant_id matches (RLS enforced)
+    ✅ Falls back to the audit archive for runs moved out of the hot tables
     """
     tenant_id = session['tenant_id']  # ✅ Source of truth: session
     
@@ -181,27 +236,32 @@ async def get_run(
     # Get run (tenant-scoped, RLS enforced)
     run_result = client.table("lynx_runs").select("*").eq("run_id", run_id).eq("tenant_id", tenant_id).execute()
     
-    if not run_result.data:
-        raise HTTPException(404, f"Run {run_id} not found")
-    
-    record = run_result.data[0]
+    if run_result.data:
+        record = run_result.data[0]
+        # Get tool calls for this run (from audit_logs table, not lynx_tool_calls)
+        tool_calls_data = client.table("audit_logs").select("*").eq("run_id", run_id).execute().data
+    else:
+        archive = get_audit_archive()
+        archived = archive.rows("lynx_runs", tenant_id, where={"run_id": run_id}) if archive else []
+        if not archived:
+            raise HTTPException(404, f"Run {run_id} not found")
+        record = archived[0]
+        tool_calls_data = archive.rows("audit_logs", tenant_id, where={"run_id": run_id}, newest_first=False)
     
     # ✅ Verify tenant_id matches session (double-check)
     if record["tenant_id"] != tenant_id:
         raise HTTPException(403, "Tenant access denied")
     
-    # Get tool calls for this run (from audit_logs table, not lynx_tool_calls)
-    tool_calls_result = client.table("audit_logs").select("*").eq("run_id", run_id).execute()
     tool_calls = [
         ToolCall(
             tool_id=tc.get("tool_id", ""),
             status=ToolCallStatus("success" if tc.get("approved") else "error" if tc.get("refused") else "pending"),
             input=tc.get("input", {}),
             output=tc.get("output"),
-            duration_ms=None,  # Schema doesn't have duration_ms
+            duration_ms=tc.get("duration_ms"),
             error=tc.get("refusal_reason") if tc.get("refused") else None,
         )
-        for tc in tool_calls_result.data
+        for tc in tool_calls_data
     ]
     
     # Map status
@@ -215,7 +275,8 @@ async def get_run(
     
     # Parse dates (schema uses "timestamp" not "created_at")
     created_at = datetime.fromisoformat(record["timestamp"].replace('Z', '+00:00'))
-    completed_at = None  # Schema doesn't have completed_at
+    summary = get_run_summaries(client, tenant_id, [run_id]).get(run_id)
+    completed_at = summary.get("completed_at") if summary else None
     
     return AuditRun(
         run_id=record["run_id"],
@@ -228,111 +289,167 @@ async def get_run(
         tool_calls=tool_calls,
         created_at=created_at,
         completed_at=completed_at,
+        summary=AuditRunSummary(**summary) if summary else None,
     )
 
 
-@router.get("/runs/export")
-async def export_audit(
-    format: str = Query('csv'),  # csv or json
-    from_date: Optional[str] = Query(None),
-    to_date: Optional[str] = Query(None),
-    # ✅ CRITICAL: Never accept tenant_id from query params - only from session
-    session: Dict[str, str] = Depends(get_current_session),
-):
+def _encode_export_cursor(record: Dict[str, Any]) -> str:
+    """Encode the keyset position (timestamp, run_id) of an exported row."""
+    position = json.dumps([str(record["timestamp"]), str(record["run_id"])])
+    return base64.urlsafe_b64encode(position.encode("utf-8")).decode("ascii")
+
+
+def _decode_export_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode an export cursor into (timestamp, run_id)."""
+    try:
+        timestamp, run_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid export cursor")
+    # Values are quoted into a PostgREST filter below
+    if not isinstance(run_id, str) or any(c in run_id for c in '"\\,()'):
+        raise HTTPException(400, "Invalid export cursor")
+    return timestamp, run_id
+
+
+def _iter_run_pages(
+    client: Client,
+    tenant_id: str,
+    from_ts: Optional[str],
+    to_ts: Optional[str],
+    after: Optional[Tuple[str, str]],
+    limit: Optional[int],
+) -> Iterator[List[Dict[str, Any]]]:
     """
-    Export audit logs (CSV or JSON).
+    Yield lynx_runs rows page by page, newest first.
     
-    ✅ Backend derives tenant_id from session (NEVER from query params)
-    ✅ Server-side filtering (date range)
-    ✅ Returns file download (CSV or JSON)
+    Keyset pagination on (timestamp, run_id): each page starts after the last
+    row of the previous one, so every page is an index range scan no matter
+    how deep the export is (OFFSET would rescan all skipped rows). Archived
+    runs follow once the hot table is exhausted, so cursors stay valid after
+    their rows are archived.
     """
-    tenant_id = session['tenant_id']  # ✅ Source of truth: session
-    
-    if format not in ['csv', 'json']:
-        raise HTTPException(400, "Format must be 'csv' or 'json'")
-    
-    client = get_supabase_client()
-    if not client:
-        raise HTTPException(503, "Audit storage not available")
-    
-    # Build query (tenant-scoped, RLS enforced)
-    query = client.table("lynx_runs").select("*").eq("tenant_id", tenant_id)
-    
-    # Apply date filters
-    if from_date:
-        try:
-            from_dt = datetime.fromisoformat(from_date.replace('Z', '+00:00'))
-            query = query.gte("created_at", from_dt.isoformat())
-        except ValueError:
-            raise HTTPException(400, f"Invalid from_date format: {from_date}")
-    
-    if to_date:
-        try:
-            to_dt = datetime.fromisoformat(to_date.replace('Z', '+00:00'))
-            query = query.lte("created_at", to_dt.isoformat())
-        except ValueError:
-            raise HTTPException(400, f"Invalid to_date format: {to_date}")
-    
-    # Order by created_at descending
-    query = query.order("created_at", desc=True)
-    
-    # Execute query (no limit for export)
-    result = query.execute()
-    
-    if format == 'csv':
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            "run_id", "timestamp", "user_id",
-            "query", "response", "status"
-        ])
-        
-        # Write rows
-        for record in result.data:
-            writer.writerow([
-                record.get("run_id", ""),
-                record.get("timestamp", ""),
-                record.get("user_id", ""),
-                record.get("user_query", ""),
-                record.get("lynx_response", ""),
-                record.get("status", ""),
-            ])
-        
-        csv_content = output.getvalue()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        return Response(
-            content=csv_content,
-            media_type='text/csv',
-            headers={
-                'Content-Disposition': f'attachment; filename="audit-{timestamp}.csv"'
-            }
-        )
-    
-    else:  # JSON
-        # Generate JSON
-        json_data = []
-        for record in result.data:
-            json_data.append({
-                "run_id": record.get("run_id"),
-                "timestamp": record.get("timestamp"),
-                "user_id": record.get("user_id"),
-                "query": record.get("user_query"),
-                "response": record.get("lynx_response"),
-                "status": record.get("status"),
-            })
-        
-        json_content = json.dumps(json_data, indent=2)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        return Response(
-            content=json_content,
-            media_type='application/json',
-            headers={
-                'Content-Disposition': f'attachment; filename="audit-{timestamp}.json"'
-            }
+    page_size = Config.AUDIT_EXPORT_PAGE_SIZE
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        query = client.table("lynx_runs").select(",".join(EXPORT_COLUMNS)).eq("tenant_id", tenant_id)
+        if from_ts:
+            query = query.gte("timestamp", from_ts)
+        if to_ts:
+            query = query.lte("timestamp", to_ts)
+        if after:
+            timestamp, run_id = after
+            query = query.or_(
+                f'timestamp.lt."{timestamp}",and(timestamp.eq."{timestamp}",run_id.lt."{run_id}")'
+            )
+        rows = query.order("timestamp", desc=True).order("run_id", desc=True).limit(size).execute().data
+        if rows:
+            yield rows
+            after = (str(rows[-1]["timestamp"]), str(rows[-1]["run_id"]))
+            if remaining is not None:
+                remaining -= len(rows)
+        if len(rows) < size:
+            break
+    
+    # Hot rows exhausted: continue with archived runs (all older) from the same position
+    archive = get_audit_archive()
+    if archive and (remaining is None or remaining > 0):
+        yield from archive.iter_pages(
+            "lynx_runs", tenant_id, EXPORT_COLUMNS, from_ts, to_ts,
+            after=after, page_size=page_size, limit=remaining,
         )
 
+
+def _page_tool_calls(client: Client, tenant_id: str, run_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """audit_logs of a page of runs (one read, plus one archive scan for archived runs), by run_id."""
+    tool_calls: Dict[str, List[Dict[str, Any]]] = {run_id: [] for run_id in run_ids}
+    if not run_ids:
+        return tool_calls
+    rows = (
+        client.table("audit_logs")
+        .select("run_id, tool_id, approved, refused, duration_ms")
+        .eq("tenant_id", tenant_id)
+        .in_("run_id", run_ids)
+        .order("timestamp")
+        .execute()
+        .data
+    )
+    for row in rows:
+        tool_calls[row["run_id"]].append(row)
+    # Runs without hot tool calls may have been archived
+    archive = get_audit_archive()
+    missing = [run_id for run_id, calls in tool_calls.items() if not calls]
+    if archive and missing:
+        tool_calls.update({
+            run_id: calls
+            for run_id, calls in _archived_tool_calls(archive, tenant_id, missing).items()
+            if calls
+        })
+    return tool_calls
+
+
+def _archived_tool_calls(archive: AuditArchive, tenant_id: str, run_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Archived audit_logs of runs (one archive scan), by run_id."""
+    tool_calls: Dict[str, List[Dict[str, Any]]] = {run_id: [] for run_id in run_ids}
+    if run_ids:
+        for row in archive.rows(
+            "audit_logs", tenant_id, columns=["run_id", "tool_id", "approved", "refused", "duration_ms"],
+            where={"run_id": run_ids}, newest_first=False,
+        ):
+            tool_calls[row["run_id"]].append(row)
+    return tool_calls
+
+
+def _export_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a lynx_runs row to an export row (with its resume cursor)."""
+    return {
+        "run_id": record.get("run_id"),
+        "timestamp": record.get("timestamp"),
+        "user_id": record.get("user_id"),
+        "query": record.get("user_query"),
+        "response": record.get("lynx_response"),
+        "status": record.get("status"),
+        "cursor": _encode_export_cursor(record),
+    }
+
+
+def _format_export(pages: Iterator[List[Dict[str, Any]]], format: str) -> Iterator[str]:
+    """Format pages of lynx_runs rows as CSV, NDJSON or a JSON array (one chunk per page)."""
+    if format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue()
+        for page in pages:
+            buffer.seek(0)
+            buffer.truncate()
+            for record in page:
+                row = _export_row(record)
+                writer.writerow(["" if row[field] is None else row[field] for field in EXPORT_FIELDS])
+            yield buffer.getvalue()
+    
+    elif format == 'ndjson':
+        for page in pages:
+            yield "".join(json.dumps(_export_row(record)) + "\n" for record in page)
+    
+    else:  # JSON array
+        separator = "\n  "
+        yield "["
+        for page in pages:
+            chunk = []
+            for record in page:
+                chunk.append(separator + json.dumps(_export_row(record)))
+                separator = ",\n  "
+            yield "".join(chunk)
+        yield "\n]\n"
+
+
+def _gzip_chunks(chunks: Iterator[str]) -> Iterator[bytes]:
+    """Gzip-compress a stream of text chunks incrementally."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
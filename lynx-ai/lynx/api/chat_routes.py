@@ -5,8 +5,12 @@ Backend handles MCP, UI only renders results.
 Backend derives tenant_id from session (never from client).
 """
 
+import asyncio
+import json
+import re
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, List, Optional, Set
 from uuid import uuid4
 import os
 
@@ -21,15 +25,19 @@ from lynx.api.models import (
     ToolCallStatus,
 )
 from lynx.api.auth import get_current_session
-from lynx.core.session import ExecutionContext
-from lynx.core.runtime.agent import create_lynx_agent
-from lynx.core.audit import AuditLogger
-from lynx.config import Config
-from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
-from lynx.core.runtime.app import get_app
+from lynx.core.session import ExecutionContext, TenantSnapshot
+from lynx.core.runtime.agent_pool import get_agent_pool
+from lynx.core.runtime.tool_calls import ObservedToolCall, ToolCallObserver, tool_call_observer
+from lynx.core.audit import get_audit_logger
+from lynx.observability.logging import log_context
+from lynx.observability.tracing import get_tracer
+from mcp_agent.workflows.llm.augmented_llm import RequestParams
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+# Audit writes scheduled after a stream ends (kept referenced until done)
+_background_tasks: Set[asyncio.Task] = set()
+
 
 @router.post("/query", response_model=ChatQueryResponse)
 async def chat_query(
@@ -43,96 +51,28 @@ async def chat_query(
     ✅ Backend returns policy.requires_confirmation (UI only renders)
     ✅ Creates audit log entry with tenant_id, user_id, role, request_id
     """
-    # ✅ Get tenant_id from session (not from request)
-    tenant_id = session['tenant_id']
-    user_id = session['user_id']
-    role = session['role']
-    request_id = str(uuid4())  # ✅ For debugging
-    
     # Verify tenant access (if request includes tenant_id, reject mismatch)
     # Note: request doesn't include tenant_id (per thin client doctrine)
     
     try:
-        # Initialize audit logger
-        if Config.SUPABASE_URL and Config.SUPABASE_KEY:
-            audit_logger = AuditLogger(
-                supabase_url=Config.SUPABASE_URL,
-                supabase_key=Config.SUPABASE_KEY,
-            )
-        else:
-            # Fallback: create mock logger for development
-            audit_logger = None
+        # ✅ Get tenant_id from session (not from request)
+        context = _create_chat_context(session)
         
-        # Create execution context
-        context = ExecutionContext(
-            user_id=user_id,
-            tenant_id=tenant_id,
-            user_role=role,
-            user_scope=[],
-            session_id=request_id,
-            audit_logger=audit_logger,
-        )
-        
-        # Create Lynx agent and process query
-        run_id = str(uuid4())
-        response_text = ""
-        tool_calls: list[ToolCall] = []
-        requires_confirmation = False
-        risk_level = RiskLevel.LOW
+        # Create Lynx agent and process query (run ID doubles as the trace ID)
+        run_id = context.lynx_run_id
+        observer = ToolCallObserver()
         
         try:
-            # Get MCPApp instance
-            app = get_app()
-            
-            # Run agent in app context
-            async with app.run() as agent_app:
-                agent = await create_lynx_agent(context)
-                
-                async with agent:
-                    # Attach LLM
-                    llm = await agent.attach_llm(OpenAIAugmentedLLM)
-                    
-                    # Generate response
-                    response_text = await llm.generate_str(request.query)
-                    
-                    # TODO: Extract tool calls from agent execution
-                    # For now, check if response indicates tool usage
-                    # In full implementation, we'd track tool calls during execution
-                    
+            response_text = await _generate_response(request.query, context, observer)
         except Exception as agent_error:
             # If agent fails, return error response
             response_text = f"I encountered an error processing your query: {str(agent_error)}"
-            risk_level = RiskLevel.HIGH
         
-        # Determine policy (backend decides)
-        # TODO: Integrate with actual risk classification from tool calls
-        # For now, check if any high-risk tools were used
-        if any(tc.tool_id.startswith("cell.") for tc in tool_calls):
-            requires_confirmation = True
-            risk_level = RiskLevel.HIGH
-        elif any(tc.tool_id.startswith("cluster.") for tc in tool_calls):
-            requires_confirmation = False
-            risk_level = RiskLevel.MEDIUM
-        else:
-            requires_confirmation = False
-            risk_level = RiskLevel.LOW
-        
-        policy = PolicyInfo(
-            requires_confirmation=requires_confirmation,
-            risk_level=risk_level,
-            blocked_reason=None,
-        )
+        tool_calls = [_to_tool_call(call) for call in observer.calls]
+        policy = _determine_policy(tool_calls)
         
         # Create audit log entry
-        if audit_logger:
-            await audit_logger.log_lynx_run(
-                run_id=run_id,
-                user_id=user_id,
-                tenant_id=tenant_id,
-                user_query=request.query,
-                lynx_response=response_text,
-                status="completed",
-            )
+        await _audit_run(run_id, context, request.query, response_text, "completed")
         
         return ChatQueryResponse(
             run_id=run_id,
@@ -150,6 +90,199 @@ async def chat_query(
         )
 
 
+@router.post("/query/stream")
+async def chat_query_stream(
+    request: ChatQueryRequest,
+    session: Dict[str, str] = Depends(get_current_session),
+):
+    """
+    Submit a chat query and stream the run as Server-Sent Events.
+    
+    Events (in order): run_start, tool_call_start / tool_call_finish
+    (with duration_ms) as tools run, token chunks of the response,
+    policy, then done - or error if the agent fails.
+    
+    ✅ Backend derives tenant_id from session
+    ✅ Run is audited once when the stream ends (including disconnects)
+    ✅ Client disconnect cancels the agent turn
+    """
+    context = _create_chat_context(session)
+    run_id = context.lynx_run_id
+    
+    return StreamingResponse(
+        _stream_chat_run(run_id, request.query, context),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_chat_run(
+    run_id: str,
+    query: str,
+    context: ExecutionContext,
+) -> AsyncIterator[str]:
+    """Run one agent turn and yield its SSE frames."""
+    events: asyncio.Queue = asyncio.Queue()
+    observer = ToolCallObserver(
+        on_event=lambda event, call: events.put_nowait((event, _tool_call_event(call))),
+    )
+    
+    # The generation task copies the current context, including the observer
+    token = tool_call_observer.set(observer)
+    try:
+        generation = asyncio.create_task(_generate_response(query, context))
+    finally:
+        tool_call_observer.reset(token)
+    generation.add_done_callback(lambda _: events.put_nowait(None))
+    
+    response_text = ""
+    status = "cancelled"
+    audited = False
+    try:
+        yield _sse("run_start", {"run_id": run_id})
+        
+        while (item := await events.get()) is not None:
+            yield _sse(*item)
+        
+        try:
+            response_text = generation.result()
+        except Exception as agent_error:
+            response_text = f"I encountered an error processing your query: {str(agent_error)}"
+            status = "failed"
+            await _audit_run(run_id, context, query, response_text, status)
+            audited = True
+            yield _sse("error", {"run_id": run_id, "message": response_text})
+            return
+        
+        # Generation is not natively streamed - chunk the final text into tokens
+        for chunk in _split_tokens(response_text):
+            yield _sse("token", {"text": chunk})
+        
+        tool_calls = [_to_tool_call(call) for call in observer.calls]
+        yield _sse("policy", _determine_policy(tool_calls).model_dump(mode="json"))
+        
+        status = "completed"
+        await _audit_run(run_id, context, query, response_text, status)
+        audited = True
+        yield _sse("done", {
+            "run_id": run_id,
+            "status": RunStatus.SUCCESS.value,
+            "tool_calls": [tc.model_dump(mode="json") for tc in tool_calls],
+        })
+    finally:
+        if not generation.done():
+            generation.cancel()
+        if not audited:
+            # Client went away - the request task is being cancelled, so audit in the background
+            task = asyncio.ensure_future(_audit_run(run_id, context, query, response_text, status))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+
+def _create_chat_context(session: Dict[str, str]) -> ExecutionContext:
+    """Create the execution context for a chat turn from the session."""
+    tenant_id = session['tenant_id']
+    request_id = str(uuid4())  # ✅ For debugging
+    
+    return ExecutionContext(
+        user_id=session['user_id'],
+        tenant_id=tenant_id,
+        user_role=session['role'],
+        user_scope=[],
+        session_id=request_id,
+        tenant_snapshot=TenantSnapshot(tenant_id=tenant_id),
+        # Shared audit logger (None in development without Supabase)
+        audit_logger=get_audit_logger(),
+    )
+
+
+async def _generate_response(
+    query: str,
+    context: ExecutionContext,
+    observer: Optional[ToolCallObserver] = None,
+) -> str:
+    """Generate the Lynx response for one turn on a pooled agent."""
+    token = tool_call_observer.set(observer) if observer else None
+    try:
+        with get_tracer().span("chat.run", trace_id=context.lynx_run_id, tenant_id=context.tenant_id):
+            with log_context(run_id=context.lynx_run_id, tenant_id=context.tenant_id):
+                # Lease a long-lived agent (MCPApp and MCP servers stay connected)
+                async with get_agent_pool().lease(context) as pooled:
+                    # Generate response (no history - pooled agents are shared)
+                    return await pooled.llm.generate_str(
+                        query,
+                        request_params=RequestParams(use_history=False),
+                    )
+    finally:
+        if token is not None:
+            tool_call_observer.reset(token)
+
+
+async def _audit_run(
+    run_id: str,
+    context: ExecutionContext,
+    query: str,
+    response_text: str,
+    status: str,
+) -> None:
+    """Write the Lynx Run audit entry (no-op without an audit logger)."""
+    if context.audit_logger:
+        await context.audit_logger.log_lynx_run(
+            run_id=run_id,
+            user_id=context.user_id,
+            tenant_id=context.tenant_id,
+            user_query=query,
+            lynx_response=response_text,
+            status=status,
+        )
+
+
+def _determine_policy(tool_calls: List[ToolCall]) -> PolicyInfo:
+    """Determine policy from the tools that ran (backend decides)."""
+    if any(tc.tool_id.startswith("cell.") for tc in tool_calls):
+        requires_confirmation = True
+        risk_level = RiskLevel.HIGH
+    elif any(tc.tool_id.startswith("cluster.") for tc in tool_calls):
+        requires_confirmation = False
+        risk_level = RiskLevel.MEDIUM
+    else:
+        requires_confirmation = False
+        risk_level = RiskLevel.LOW
+    
+    return PolicyInfo(
+        requires_confirmation=requires_confirmation,
+        risk_level=risk_level,
+        blocked_reason=None,
+    )
+
+
+def _to_tool_call(call: ObservedToolCall) -> ToolCall:
+    """Convert an observed tool call to the API model."""
+    return ToolCall(
+        tool_id=call.tool_id,
+        status=ToolCallStatus(call.status),
+        input=call.arguments,
+        output=call.output,
+        duration_ms=call.duration_ms,
+        error=call.error,
+    )
+
+
+def _tool_call_event(call: ObservedToolCall) -> Dict:
+    """Build the SSE payload for a tool call event."""
+    return {"call_id": call.call_id, **_to_tool_call(call).model_dump(mode="json")}
+
+
+def _split_tokens(text: str) -> List[str]:
+    """Split text into word-sized chunks, keeping whitespace."""
+    return re.findall(r"\s*\S+\s*", text) if text.strip() else ([text] if text else [])
+
+
+def _sse(event: str, data: Dict) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.get("/runs/{run_id}", response_model=ChatRun)
 async def get_chat_run(
     run_id: str,
@@ -6,19 +6,23 @@ Fixes the "squished" KPI cards and improves grid responsiveness.
 from __future__ import annotations
 
 import asyncio
+import hmac
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, FileResponse, Response
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
 from lynx.cli.status import get_lynx_status
 from lynx.__version__ import LYNX_PROTOCOL_VERSION, MCP_TOOLSET_VERSION
 from lynx.api.dashboard_models import DashboardViewModel, DeveloperCockpitViewModel, ServiceStatus
+from lynx.config import Config
+from lynx.observability.metrics import get_metrics_registry
+from lynx.observability.profiler import get_profiler, get_slow_callback_detector
 
 app = FastAPI(
     title="Lynx AI Dashboard",
@@ -247,7 +251,7 @@ def render_shell(vm: DashboardViewModel, cockpit: DeveloperCockpitViewModel) ->
             const icon = document.getElementById('refresh-icon');
             if(icon) icon.classList.add('spin');
             
-            await Promise.all(['kpis', 'services', 'recent', 'cockpit'].map(refreshFragment));
+            await Promise.all(['kpis', 'services', 'recent', 'cockpit', 'latency'].map(refreshFragment));
             
             const timeEl = document.getElementById('last-updated');
             if(timeEl) timeEl.innerText = new Date().toLocaleTimeString();
@@ -298,6 +302,10 @@ def render_shell(vm: DashboardViewModel, cockpit: DeveloperCockpitViewModel) ->
                 {render_fragment_recent(vm)}
             </div>
         </div>
+
+        <div id="fragment-latency" style="margin-top: 24px;">
+            {render_fragment_latency()}
+        </div>
     </main>
 </body>
 </html>
@@ -426,6 +434,28 @@ def render_fragment_services(vm: DashboardViewModel) -> str:
         </div>
         """
 
+    loop_html = ""
+    event_loop = data.get("event_loop")
+    if event_loop:
+        degraded = event_loop.get("status") == "degraded"
+        details = (
+            f"Lag {event_loop.get('lag_ms')}ms (max {event_loop.get('lag_max_ms')}ms) · "
+            f"Tasks {event_loop.get('pending_tasks')} · "
+            f"Executor queue {event_loop.get('executor_queue_depth')} · "
+            f"GC max {event_loop.get('gc_pause_max_ms')}ms"
+        )
+        if degraded:
+            details += f"<br>{_safe('; '.join(event_loop.get('degraded_reasons', [])))}"
+        loop_html = f"""
+        <div class="flex-between" style="padding: 16px 0; border-bottom: 1px solid var(--color-stroke-strong);">
+            <div>
+                <div style="font-weight: 600; font-size: 14px; color: var(--color-lux); margin-bottom: 4px;">Event Loop</div>
+                <div class="na-data" style="opacity: 0.7;">{details}</div>
+            </div>
+            {render_status_badge(ServiceStatus.PENDING if degraded else ServiceStatus.OK, "Degraded" if degraded else "Healthy")}
+        </div>
+        """
+
     return f"""
     <div class="na-card na-card-p6">
         <h3 class="na-h3 mb-6">System Health</h3>
@@ -433,6 +463,7 @@ def render_fragment_services(vm: DashboardViewModel) -> str:
             {row("Kernel API", data.get("kernel_api_reachable"), "Core SSOT/Registry Endpoint")}
             {row("Supabase", data.get("supabase_reachable"), f"Storage Backend: {_safe(data.get('storage_backend'))}")}
             {row("Dashboard", True, "Internal Monitoring (Port 8000)")}
+            {loop_html}
         </div>
     </div>
     """
@@ -471,6 +502,59 @@ def render_fragment_recent(vm: DashboardViewModel) -> str:
     </div>
     """
 
+def render_fragment_latency(limit: int = 12) -> str:
+    """Renders p50/p95/p99 per tool and execute_tool stage (slowest p99 first)."""
+    rows = []
+    for labels, hist in get_metrics_registry().histograms("lynx_tool_stage_seconds"):
+        if hist.count:
+            rows.append((labels, hist.count, hist.quantile(0.5), hist.quantile(0.95), hist.quantile(0.99)))
+    rows.sort(key=lambda r: r[4], reverse=True)
+    
+    def ms(seconds: float) -> str:
+        return f"{seconds * 1000:.1f}"
+    
+    if not rows:
+        content = '<div class="na-desc" style="text-align: center; padding: 48px 0;">No tool executions recorded yet.</div>'
+    else:
+        cell = 'style="padding: 8px 12px; text-align: right;"'
+        body = "".join(f"""
+            <tr style="border-bottom: 1px solid var(--color-stroke-strong);">
+                <td style="padding: 8px 12px;">{_safe(labels.get('tool_id'))}</td>
+                <td style="padding: 8px 12px;">{_safe(labels.get('stage'))}</td>
+                <td {cell}>{count}</td>
+                <td {cell}>{ms(p50)}</td>
+                <td {cell}>{ms(p95)}</td>
+                <td {cell}>{ms(p99)}</td>
+            </tr>
+            """ for labels, count, p50, p95, p99 in rows[:limit])
+        content = f"""
+        <table class="na-data" style="width: 100%; border-collapse: collapse;">
+            <thead>
+                <tr class="na-metadata" style="text-align: left;">
+                    <th style="padding: 8px 12px;">TOOL</th>
+                    <th style="padding: 8px 12px;">STAGE</th>
+                    <th {cell}>COUNT</th>
+                    <th {cell}>P50 MS</th>
+                    <th {cell}>P95 MS</th>
+                    <th {cell}>P99 MS</th>
+                </tr>
+            </thead>
+            <tbody>{body}</tbody>
+        </table>
+        """
+    
+    return f"""
+    <div class="na-card na-card-p6">
+        <div class="flex-between mb-6">
+            <h3 class="na-h3">Tool Latency</h3>
+            <span class="na-metadata">SLOWEST STAGES BY P99</span>
+        </div>
+        <div style="margin-top: 16px; overflow-x: auto;">
+            {content}
+        </div>
+    </div>
+    """
+
 # ---- 4. Endpoints ----
 
 @app.get("/", response_class=HTMLResponse)
@@ -509,10 +593,54 @@ async def fragment_recent():
     except:
         return '<div class="na-data">Activity log unavailable</div>'
 
+@app.get("/dashboard/_latency", response_class=HTMLResponse)
+async def fragment_latency():
+    try:
+        return render_fragment_latency()
+    except Exception:
+        return '<div class="na-data">Latency metrics unavailable</div>'
+
 @app.get("/dashboard/_cockpit", response_class=HTMLResponse)
 async def fragment_cockpit():
     return render_fragment_cockpit(DeveloperCockpitViewModel())
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of in-process metrics."""
+    return PlainTextResponse(
+        get_metrics_registry().render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+@app.get("/debug/profile")
+async def debug_profile(
+    seconds: Optional[float] = None,
+    format: str = "collapsed",
+    x_lynx_profiler_token: Optional[str] = Header(default=None),
+):
+    """
+    Sample all threads for N seconds and return collapsed stacks or speedscope JSON.
+    
+    Opt-in: requires LYNX_PROFILER_ENABLED=true and a matching
+    X-Lynx-Profiler-Token header (LYNX_PROFILER_TOKEN).
+    """
+    if not Config.PROFILER_ENABLED or not Config.PROFILER_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_lynx_profiler_token or not hmac.compare_digest(x_lynx_profiler_token, Config.PROFILER_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid profiler token")
+    if format not in ("collapsed", "speedscope"):
+        raise HTTPException(status_code=400, detail="format must be 'collapsed' or 'speedscope'")
+    
+    seconds = min(max(seconds or Config.PROFILER_DEFAULT_SECONDS, 0.1), Config.PROFILER_MAX_SECONDS)
+    try:
+        profile = await get_profiler().capture_async(seconds)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if format == "speedscope":
+        return JSONResponse(profile.to_speedscope())
+    return PlainTextResponse(profile.to_collapsed())
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "timestamp": datetime.now().isoformat()}
@@ -538,7 +666,33 @@ app.include_router(chat_router)
 app.include_router(draft_router)
 app.include_router(audit_router)
 
+
+@app.on_event("startup")
+async def install_slow_callback_detector():
+    """Report event loop steps that block longer than LYNX_SLOW_CALLBACK_THRESHOLD."""
+    if Config.SLOW_CALLBACK_THRESHOLD > 0:
+        get_slow_callback_detector().install()
+
+
+@app.on_event("startup")
+async def start_agent_pool_evictor():
+    """Evict idle pooled agents in the background."""
+    from lynx.core.runtime.agent_pool import get_agent_pool
+    app.state.agent_pool_evictor = asyncio.create_task(get_agent_pool().run_evictor())
+
+
+@app.on_event("shutdown")
+async def shutdown_agent_pool():
+    """Shut down pooled agents and leave the MCPApp context."""
+    from lynx.core.runtime.agent_pool import get_agent_pool
+    evictor = getattr(app.state, "agent_pool_evictor", None)
+    if evictor:
+        evictor.cancel()
+    await get_agent_pool().close()
+
 if __name__ == "__main__":
     import uvicorn
+    from lynx.observability.logging import setup_logging
+    setup_logging()
     port = int(os.getenv("PORT", "8000"))
     uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
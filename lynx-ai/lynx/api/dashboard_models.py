@@ -50,6 +50,9 @@ class DashboardViewModel:
         # Recent runs
         self.last_5_runs_summary: List[Dict[str, Any]] = raw_status.get("last_5_runs_summary", [])
         
+        # Event loop health (None when the loop monitor is not running)
+        self.event_loop: Optional[Dict[str, Any]] = raw_status.get("event_loop")
+        
         # Error state
         self.error_message: Optional[str] = raw_status.get("error_message")
         self.timestamp: datetime = datetime.now()
@@ -92,6 +95,7 @@ class DashboardViewModel:
             "pending_settlement_count": self.pending_settlement_count,
             "total_mcp_tools_registered": self.total_mcp_tools_registered,
             "last_5_runs_summary": self.last_5_runs_summary,
+            "event_loop": self.event_loop,
             "error_message": self.error_message,
             "timestamp": self.timestamp.isoformat(),
         }
@@ -15,15 +15,22 @@ from lynx.api.models import (
     DraftStatus,
     ApproveDraftRequest,
     RejectDraftRequest,
+    BulkTransitionAction,
+    BulkTransitionItem,
+    BulkTransitionRequest,
+    BulkTransitionResponse,
 )
 from lynx.api.auth import get_current_session, verify_tenant_access
-from lynx.storage.draft_storage import get_draft_storage
-from lynx.core.audit import AuditLogger
-from lynx.config import Config
+from lynx.storage.draft_storage import DraftStatusConflictError, get_draft_storage
+from lynx.core.audit import get_audit_logger
 from lynx.mcp.cluster.drafts.models import DraftStatus as ClusterDraftStatus
+from lynx.mcp.cluster.drafts.preview import render_preview
 
 router = APIRouter(prefix="/api/drafts", tags=["drafts"])
 
+# Draft columns the list view renders
+LIST_FIELDS = ("status", "risk_level", "draft_type", "created_at", "created_by")
+
 
 @router.get("", response_model=DraftListResponse)
 async def list_drafts(
@@ -31,6 +38,7 @@ async def list_drafts(
     type: Optional[str] = Query(None),
     limit: int = Query(50),
     cursor: Optional[str] = Query(None),  # ✅ Cursor pagination
+    include_payload: bool = Query(False),  # ✅ Payloads only on request (detail view has them)
     session: Dict[str, str] = Depends(get_current_session),  # ✅ Auth + tenant
 ):
     """
@@ -39,6 +47,7 @@ async def list_drafts(
     ✅ Backend derives tenant_id from session
     ✅ Server-side filtering (date range, status, type)
     ✅ Cursor pagination (better than offset for audit logs)
+    ✅ Fetches only the summary columns it renders (payload with include_payload=true)
     """
     tenant_id = session['tenant_id']
     
@@ -54,11 +63,19 @@ async def list_drafts(
             raise HTTPException(400, f"Invalid status: {status}")
     
     # List drafts (tenant-scoped)
-    cluster_drafts = await storage.list_drafts(
-        tenant_id=tenant_id,
-        draft_type=type,
-        status=status_enum,
-    )
+    if include_payload:
+        cluster_drafts = await storage.list_drafts(
+            tenant_id=tenant_id,
+            draft_type=type,
+            status=status_enum,
+        )
+    else:
+        cluster_drafts = await storage.list_draft_summaries(
+            tenant_id=tenant_id,
+            draft_type=type,
+            status=status_enum,
+            fields=LIST_FIELDS,
+        )
     
     # Convert to API models
     from lynx.api.models import Draft as APIDraft, DraftStatus as APIDraftStatus
@@ -79,7 +96,7 @@ async def list_drafts(
             requires_confirmation=cluster_draft.risk_level == "high",  # ✅ Backend decides
             risk_level=cluster_draft.risk_level,
             tool_id=cluster_draft.draft_type,  # TODO: Map properly
-            payload=cluster_draft.payload,
+            payload=cluster_draft.payload if include_payload else None,
             created_at=cluster_draft.created_at,
             created_by=cluster_draft.created_by,
             approved_by=None,  # TODO: Get from cluster draft
@@ -100,12 +117,66 @@ async def list_drafts(
     )
 
 
+@router.post("/bulk/transition", response_model=BulkTransitionResponse)
+async def bulk_transition_drafts(
+    request: BulkTransitionRequest,
+    session: Dict[str, str] = Depends(get_current_session),
+):
+    """
+    Approve or reject many drafts at once.
+    
+    ✅ One tenant-scoped compare-and-set (draft → approved/rejected)
+    ✅ Per-draft outcomes (updated | conflict | not_found)
+    ✅ One batched audit insert for the whole request
+    """
+    tenant_id = session['tenant_id']
+    user_id = session['user_id']
+    request_id = str(uuid4())
+    
+    new_status = (
+        ClusterDraftStatus.APPROVED
+        if request.action == BulkTransitionAction.APPROVE
+        else ClusterDraftStatus.REJECTED
+    )
+    
+    storage = get_draft_storage()
+    results = await storage.transition_drafts_bulk(
+        tenant_id=tenant_id,
+        draft_ids=request.draft_ids,
+        expected_status=ClusterDraftStatus.DRAFT,
+        new_status=new_status,
+    )
+    items = [
+        BulkTransitionItem(
+            draft_id=result.draft_id,
+            outcome=result.outcome,
+            status=result.status.value if result.status else None,
+        )
+        for result in results
+    ]
+    
+    audit_logger = get_audit_logger()
+    if audit_logger:
+        await audit_logger.log_draft_transitions(
+            run_id=request_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            action=request.action.value,
+            transitions=[item.model_dump() for item in items],
+            reason=request.reason,
+        )
+    
+    updated = sum(1 for item in items if item.outcome == "updated")
+    return BulkTransitionResponse(results=items, updated=updated, failed=len(items) - updated)
+
+
 @router.get("/{draft_id}", response_model=Draft)
 async def get_draft(
     draft_id: str,
+    include_preview: bool = Query(False),  # ✅ Preview rendered on demand (memoized)
     session: Dict[str, str] = Depends(get_current_session),
 ):
-    """Get draft details (tenant-scoped)."""
+    """Get draft details (tenant-scoped), optionally with its preview markdown."""
     tenant_id = session['tenant_id']
     
     # Get draft storage
@@ -132,6 +203,7 @@ async def get_draft(
         risk_level=cluster_draft.risk_level,
         tool_id=cluster_draft.draft_type,
         payload=cluster_draft.payload,
+        preview_markdown=render_preview(cluster_draft) if include_preview else None,
         created_at=cluster_draft.created_at,
         created_by=cluster_draft.created_by,
         approved_by=None,  # TODO: Get from cluster draft
@@ -163,34 +235,26 @@ async def approve_draft(
     # Get draft storage
     storage = get_draft_storage()
     
-    # Get draft (tenant-scoped)
-    cluster_draft = await storage.get_draft(draft_id, tenant_id)
+    # Update status: draft → approved (compare-and-set, tenant-scoped)
+    # ✅ Idempotency check (prevent double approval) without a pre-read
+    try:
+        cluster_draft = await storage.update_draft_status(
+            draft_id=draft_id,
+            tenant_id=tenant_id,
+            new_status=ClusterDraftStatus.APPROVED,
+            expected_status=ClusterDraftStatus.DRAFT,
+        )
+    except DraftStatusConflictError as e:
+        raise HTTPException(400, f"Draft already {e.current_status.value}")
     if not cluster_draft:
         raise HTTPException(404, f"Draft {draft_id} not found")
     
-    # ✅ Idempotency check (prevent double approval)
-    if cluster_draft.status != ClusterDraftStatus.DRAFT:
-        raise HTTPException(400, f"Draft already {cluster_draft.status.value}")
-    
-    # Update status: draft → approved
-    await storage.update_draft_status(
-        draft_id=draft_id,
-        tenant_id=tenant_id,
-        new_status=ClusterDraftStatus.APPROVED,
-    )
-    
     # TODO: If execution required (Cell MCP), update to executing → execute → executed/failed
     # For now, just approve (execution happens separately)
     
     # Create audit log entry
-    if Config.SUPABASE_URL and Config.SUPABASE_KEY:
-        audit_logger = AuditLogger(
-            supabase_url=Config.SUPABASE_URL,
-            supabase_key=Config.SUPABASE_KEY,
-        )
-        # TODO: Log draft approval event
-    else:
-        audit_logger = None
+    audit_logger = get_audit_logger()
+    # TODO: Log draft approval event
     
     return {"success": True, "draft_id": draft_id, "status": "approved"}
 
@@ -209,27 +273,22 @@ async def reject_draft(
     # Get draft storage
     storage = get_draft_storage()
     
-    # Get draft (tenant-scoped)
-    cluster_draft = await storage.get_draft(draft_id, tenant_id)
+    # Update status: draft → rejected (compare-and-set, tenant-scoped)
+    try:
+        cluster_draft = await storage.update_draft_status(
+            draft_id=draft_id,
+            tenant_id=tenant_id,
+            new_status=ClusterDraftStatus.REJECTED,
+            expected_status=ClusterDraftStatus.DRAFT,
+        )
+    except DraftStatusConflictError as e:
+        raise HTTPException(400, f"Draft already {e.current_status.value}")
     if not cluster_draft:
         raise HTTPException(404, f"Draft {draft_id} not found")
     
-    # Update status: draft → rejected
-    await storage.update_draft_status(
-        draft_id=draft_id,
-        tenant_id=tenant_id,
-        new_status=ClusterDraftStatus.REJECTED,
-    )
-    
     # Create audit log entry
-    if Config.SUPABASE_URL and Config.SUPABASE_KEY:
-        audit_logger = AuditLogger(
-            supabase_url=Config.SUPABASE_URL,
-            supabase_key=Config.SUPABASE_KEY,
-        )
-        # TODO: Log draft rejection event
-    else:
-        audit_logger = None
+    audit_logger = get_audit_logger()
+    # TODO: Log draft rejection event
     
     return {"success": True, "draft_id": draft_id, "status": "rejected"}
 
@@ -269,14 +328,8 @@ async def delete_draft(
     # await storage.delete_draft(draft_id, tenant_id)
     
     # Create audit log entry
-    if Config.SUPABASE_URL and Config.SUPABASE_KEY:
-        audit_logger = AuditLogger(
-            supabase_url=Config.SUPABASE_URL,
-            supabase_key=Config.SUPABASE_KEY,
-        )
-        # TODO: Log draft deletion event
-    else:
-        audit_logger = None
+    audit_logger = get_audit_logger()
+    # TODO: Log draft deletion event
     
     return {"success": True, "draft_id": draft_id}
 
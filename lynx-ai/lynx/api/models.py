@@ -5,7 +5,7 @@ These Pydantic models define the exact contracts between backend and frontend.
 Frontend TypeScript types should be generated from these models.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -101,7 +101,8 @@ class Draft(BaseModel):
     requires_confirmation: bool  # ✅ Backend decides
     risk_level: RiskLevel
     tool_id: str
-    payload: Dict[str, Any]
+    payload: Optional[Dict[str, Any]] = None  # ✅ Omitted from lists unless include_payload=true
+    preview_markdown: Optional[str] = None  # ✅ Only with include_preview=true
     created_at: datetime
     created_by: str
     approved_by: Optional[str] = None
@@ -131,6 +132,33 @@ class RejectDraftRequest(BaseModel):
     reason: str
 
 
+class BulkTransitionAction(str, Enum):
+    """Bulk draft transition action."""
+    APPROVE = "approve"
+    REJECT = "reject"
+
+
+class BulkTransitionRequest(BaseModel):
+    """Bulk approve/reject request (only drafts in status draft change)."""
+    draft_ids: List[str] = Field(min_length=1, max_length=500)
+    action: BulkTransitionAction
+    reason: Optional[str] = None
+
+
+class BulkTransitionItem(BaseModel):
+    """Per-draft outcome of a bulk transition."""
+    draft_id: str
+    outcome: str  # updated | conflict | not_found
+    status: Optional[str] = None
+
+
+class BulkTransitionResponse(BaseModel):
+    """Bulk transition response."""
+    results: List[BulkTransitionItem]
+    updated: int
+    failed: int
+
+
 # ============================================================================
 # Execution API Models
 # ============================================================================
@@ -155,6 +183,19 @@ class ExecutionDetail(BaseModel):
 # Audit API Models
 # ============================================================================
 
+class AuditRunSummary(BaseModel):
+    """Per-run tool call aggregates (maintained as audit events arrive)."""
+    tool_count: int = 0  # Tool calls started or refused
+    success_count: int = 0
+    failure_count: int = 0
+    refusal_count: int = 0
+    max_risk: Optional[str] = None  # low, medium, high
+    tool_ids: List[str] = []
+    total_duration_ms: int = 0  # Sum of tool handler durations
+    first_event_at: Optional[datetime] = None
+    last_event_at: Optional[datetime] = None
+
+
 class AuditRun(BaseModel):
     """Audit run information (tenant-scoped)."""
     run_id: str
@@ -167,6 +208,7 @@ class AuditRun(BaseModel):
     tool_calls: List[ToolCall]
     created_at: datetime
     completed_at: Optional[datetime] = None
+    summary: Optional[AuditRunSummary] = None  # None for runs logged before summaries existed
 
 
 class AuditListResponse(BaseModel):
@@ -5,6 +5,7 @@ Provides operator truth endpoint for system health.
 """
 
 import asyncio
+import sys
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
@@ -16,6 +17,8 @@ from lynx.mcp.server import initialize_mcp_server
 from lynx.__version__ import LYNX_PROTOCOL_VERSION, MCP_TOOLSET_VERSION
 from lynx.storage.execution_storage import get_execution_storage
 from lynx.mcp.cell.execution.models import ExecutionStatus
+from lynx.observability.loop_monitor import get_loop_monitor
+from lynx.observability.logging import setup_logging
 
 
 async def check_kernel_reachable() -> bool:
@@ -46,10 +49,7 @@ def check_supabase_reachable() -> bool:
 def get_storage_backend_type() -> str:
     """Get the storage backend type in use."""
     from lynx.storage.draft_storage import get_draft_storage
-    storage = get_draft_storage()
-    if hasattr(storage, 'client'):
-        return "supabase"
-    return "memory"
+    return get_draft_storage().backend
 
 
 async def get_draft_count_last_24h(tenant_id: Optional[str] = None) -> int:
@@ -161,9 +161,10 @@ async def get_last_n_runs_summary(n: int = 5) -> List[Dict[str, Any]]:
     """Get a summary of the last N Lynx runs."""
     execution_storage = get_execution_storage()
     # Using a dummy tenant for CLI status
-    recent_executions = await execution_storage.list_executions(
+    recent_executions = await execution_storage.list_execution_summaries(
         tenant_id="system",
         limit=n,
+        fields=("tool_id", "status", "created_at", "completed_at", "tenant_id"),
     )
     
     summary = []
@@ -238,9 +239,14 @@ async def get_lynx_status() -> Dict[str, Any]:
         current_mode = "unknown"
         maintenance_mode = False
     
+    # Event loop health (only while the daemon's loop monitor is running)
+    loop_monitor = get_loop_monitor()
+    event_loop = loop_monitor.sample().to_dict() if loop_monitor.running else None
+    loop_degraded = bool(event_loop and event_loop["status"] == "degraded")
+    
     return {
         "service_name": "Lynx AI",
-        "status": "operational" if kernel_reachable and supabase_reachable else "degraded",
+        "status": "operational" if kernel_reachable and supabase_reachable and not loop_degraded else "degraded",
         "lynx_protocol_version": LYNX_PROTOCOL_VERSION,
         "mcp_toolset_version": MCP_TOOLSET_VERSION,
         "tool_registry_hash": tool_registry_hash,
@@ -254,11 +260,14 @@ async def get_lynx_status() -> Dict[str, Any]:
         "draft_count_24h": draft_count_24h,
         "execution_count_24h": execution_count_24h,
         "pending_settlement_count": pending_settlement_count,
+        "event_loop": event_loop,
     }
 
 
 async def main():
     """Main function for the lynx status CLI."""
+    # Library logs go to stderr so they don't mix with the report on stdout
+    setup_logging(stream=sys.stderr)
     status = await get_lynx_status()
     
     print("\n--- Lynx AI System Status ---")
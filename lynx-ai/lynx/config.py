@@ -45,6 +45,11 @@ class Config:
     SUPABASE_URL: Optional[str] = os.getenv("SUPABASE_URL")
     SUPABASE_KEY: Optional[str] = os.getenv("SUPABASE_KEY")
     
+    # Storage Backend ("auto" = Supabase if configured, else in-memory; "supabase", "sqlite", "memory")
+    STORAGE_BACKEND: str = os.getenv("LYNX_STORAGE_BACKEND", "auto").lower()
+    SQLITE_PATH: str = os.getenv("LYNX_SQLITE_PATH", "lynx.db")
+    SQLITE_READ_THREADS: int = int(os.getenv("LYNX_SQLITE_READ_THREADS", "2"))
+    
     # Maintenance Mode
     MAINTENANCE_MODE: bool = os.getenv("LYNX_MAINTENANCE_MODE", "false").lower() == "true"
     
@@ -52,6 +57,83 @@ class Config:
     DAEMON_HEARTBEAT_INTERVAL: int = int(os.getenv("LYNX_DAEMON_HEARTBEAT_INTERVAL", "60"))  # seconds
     DAEMON_STATUS_CHECK_INTERVAL: int = int(os.getenv("LYNX_DAEMON_STATUS_CHECK_INTERVAL", "300"))  # seconds
     
+    # Session Store
+    SESSION_MAX_COUNT: int = int(os.getenv("LYNX_SESSION_MAX_COUNT", "10000"))
+    SESSION_SWEEP_INTERVAL: int = int(os.getenv("LYNX_SESSION_SWEEP_INTERVAL", "60"))  # seconds
+    TENANT_SNAPSHOT_TTL: int = int(os.getenv("LYNX_TENANT_SNAPSHOT_TTL", "300"))  # seconds
+    
+    # Agent Pool
+    AGENT_POOL_MAX_SIZE: int = int(os.getenv("LYNX_AGENT_POOL_MAX_SIZE", "16"))
+    AGENT_POOL_IDLE_TIMEOUT: int = int(os.getenv("LYNX_AGENT_POOL_IDLE_TIMEOUT", "600"))  # seconds
+    
+    # Tool Execution Scheduler (per-tenant fairness)
+    SCHEDULER_GLOBAL_CONCURRENCY: int = int(os.getenv("LYNX_SCHEDULER_GLOBAL_CONCURRENCY", "256"))
+    SCHEDULER_TENANT_CONCURRENCY: int = int(os.getenv("LYNX_SCHEDULER_TENANT_CONCURRENCY", "32"))
+    SCHEDULER_TENANT_RATE: float = float(os.getenv("LYNX_SCHEDULER_TENANT_RATE", "0"))  # per second, 0 = unlimited
+    SCHEDULER_TENANT_BURST: float = float(os.getenv("LYNX_SCHEDULER_TENANT_BURST", "64"))
+    
+    # Storage idempotency cache (request_id -> stored object, per tenant)
+    IDEMPOTENCY_CACHE_SIZE: int = int(os.getenv("LYNX_IDEMPOTENCY_CACHE_SIZE", "10000"))  # 0 = disabled
+    
+    # Draft read-through cache (remote draft storage; bounded by serialized size)
+    DRAFT_CACHE_MAX_BYTES: int = int(os.getenv("LYNX_DRAFT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 0 = disabled
+    DRAFT_CACHE_TTL: float = float(os.getenv("LYNX_DRAFT_CACHE_TTL", "60"))  # seconds
+    
+    # Draft previews (rendered on demand, memoized by draft_id + payload hash)
+    DRAFT_PREVIEW_CACHE_SIZE: int = int(os.getenv("LYNX_DRAFT_PREVIEW_CACHE_SIZE", "1024"))  # 0 = disabled
+    
+    # Draft payloads (size limit, compression, out-of-line storage in lynx_draft_payloads)
+    DRAFT_PAYLOAD_MAX_BYTES: int = int(os.getenv("LYNX_DRAFT_PAYLOAD_MAX_BYTES", str(16 * 1024 * 1024)))  # 0 = unlimited
+    DRAFT_PAYLOAD_COMPRESS_THRESHOLD: int = int(os.getenv("LYNX_DRAFT_PAYLOAD_COMPRESS_THRESHOLD", str(64 * 1024)))  # 0 = never
+    DRAFT_PAYLOAD_OFFLOAD_THRESHOLD: int = int(os.getenv("LYNX_DRAFT_PAYLOAD_OFFLOAD_THRESHOLD", "0"))  # 0 = never
+    DRAFT_PAYLOAD_CODEC: str = os.getenv("LYNX_DRAFT_PAYLOAD_CODEC", "auto").lower()  # "auto", "zstd" or "gzip"
+    
+    # Settlement Worker (daemon; moves queued settlement intents forward)
+    SETTLEMENT_WORKER_ENABLED: bool = os.getenv("LYNX_SETTLEMENT_WORKER_ENABLED", "false").lower() == "true"
+    SETTLEMENT_WORKER_CONCURRENCY: int = int(os.getenv("LYNX_SETTLEMENT_WORKER_CONCURRENCY", "4"))
+    SETTLEMENT_BATCH_SIZE: int = int(os.getenv("LYNX_SETTLEMENT_BATCH_SIZE", "50"))
+    SETTLEMENT_POLL_INTERVAL: float = float(os.getenv("LYNX_SETTLEMENT_POLL_INTERVAL", "5"))  # seconds
+    SETTLEMENT_LEASE_SECONDS: int = int(os.getenv("LYNX_SETTLEMENT_LEASE_SECONDS", "300"))
+    SETTLEMENT_MAX_ATTEMPTS: int = int(os.getenv("LYNX_SETTLEMENT_MAX_ATTEMPTS", "5"))
+    SETTLEMENT_BACKOFF_BASE: float = float(os.getenv("LYNX_SETTLEMENT_BACKOFF_BASE", "2"))  # seconds
+    SETTLEMENT_BACKOFF_MAX: float = float(os.getenv("LYNX_SETTLEMENT_BACKOFF_MAX", "300"))  # seconds
+    
+    # Audit export (streamed in keyset-paginated pages; memory bounded by the page size)
+    AUDIT_EXPORT_PAGE_SIZE: int = int(os.getenv("LYNX_AUDIT_EXPORT_PAGE_SIZE", "1000"))
+    
+    # Audit archive (cold audit rows in Parquet files partitioned by tenant and day; requires pyarrow)
+    AUDIT_ARCHIVE_DIR: str = os.getenv("LYNX_AUDIT_ARCHIVE_DIR", "")  # "" = no archive
+    AUDIT_ARCHIVE_AFTER_DAYS: int = int(os.getenv("LYNX_AUDIT_ARCHIVE_AFTER_DAYS", "90"))
+    AUDIT_ARCHIVE_BATCH_SIZE: int = int(os.getenv("LYNX_AUDIT_ARCHIVE_BATCH_SIZE", "1000"))
+    AUDIT_ARCHIVE_COMPRESSION: str = os.getenv("LYNX_AUDIT_ARCHIVE_COMPRESSION", "zstd")
+    
+    # Logging (structured, queue-based)
+    LOG_LEVEL: str = os.getenv("LYNX_LOG_LEVEL", "info")
+    LOG_FORMAT: str = os.getenv("LYNX_LOG_FORMAT", "json")  # "json" or "text"
+    LOG_QUEUE_SIZE: int = int(os.getenv("LYNX_LOG_QUEUE_SIZE", "10000"))
+    LOG_SAMPLE_RATES: str = os.getenv("LYNX_LOG_SAMPLE_RATES", "")  # e.g. "lynx.runtime.daemon=0.1"
+    
+    # Tracing ("none", "memory", "json", "otel")
+    TRACE_EXPORTER: str = os.getenv("LYNX_TRACE_EXPORTER", "none")
+    TRACE_FILE: str = os.getenv("LYNX_TRACE_FILE", "lynx-traces.jsonl")
+    
+    # Profiling (opt-in: SIGUSR1 / GET /debug/profile)
+    PROFILER_ENABLED: bool = os.getenv("LYNX_PROFILER_ENABLED", "false").lower() == "true"
+    PROFILER_TOKEN: Optional[str] = os.getenv("LYNX_PROFILER_TOKEN")
+    PROFILER_SAMPLE_INTERVAL: float = float(os.getenv("LYNX_PROFILER_SAMPLE_INTERVAL", "0.005"))  # seconds
+    PROFILER_DEFAULT_SECONDS: int = int(os.getenv("LYNX_PROFILER_DEFAULT_SECONDS", "10"))
+    PROFILER_MAX_SECONDS: int = int(os.getenv("LYNX_PROFILER_MAX_SECONDS", "60"))
+    PROFILER_OUTPUT_DIR: str = os.getenv("LYNX_PROFILER_OUTPUT_DIR", "profiles")
+    SLOW_CALLBACK_THRESHOLD: float = float(os.getenv("LYNX_SLOW_CALLBACK_THRESHOLD", "0"))  # seconds, 0 = disabled
+    
+    # Event Loop Health (thresholds mark the service degraded)
+    LOOP_MONITOR_INTERVAL: float = float(os.getenv("LYNX_LOOP_MONITOR_INTERVAL", "0.5"))  # seconds
+    LOOP_MONITOR_WINDOW: float = float(os.getenv("LYNX_LOOP_MONITOR_WINDOW", "60"))  # seconds
+    LOOP_LAG_THRESHOLD: float = float(os.getenv("LYNX_LOOP_LAG_THRESHOLD", "0.1"))  # seconds
+    LOOP_PENDING_TASKS_THRESHOLD: int = int(os.getenv("LYNX_LOOP_PENDING_TASKS_THRESHOLD", "1000"))
+    EXECUTOR_QUEUE_THRESHOLD: int = int(os.getenv("LYNX_EXECUTOR_QUEUE_THRESHOLD", "32"))
+    GC_PAUSE_THRESHOLD: float = float(os.getenv("LYNX_GC_PAUSE_THRESHOLD", "0.1"))  # seconds
+    
     @classmethod
     def is_production(cls) -> bool:
         """Check if running in production mode."""
@@ -4,6 +4,6 @@ Audit logging for Lynx AI.
 This module enforces PRD Law 5: Audit Is Reality.
 """
 
-from lynx.core.audit.logger import AuditLogger
+from lynx.core.audit.logger import AuditLogger, get_audit_logger
 
-__all__ = ["AuditLogger"]
+__all__ = ["AuditLogger", "get_audit_logger"]
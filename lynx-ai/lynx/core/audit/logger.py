@@ -1,14 +1,22 @@
 """
 Audit logger for Lynx AI.
 
-Logs all Lynx interactions and tool executions.
+Logs all Lynx interactions and tool executions, and keeps a per-run summary
+(lynx_run_summaries: tool/success/failure/refusal counts, max risk, first and
+last event, total tool duration) up to date as events arrive, so audit lists
+read one row per run instead of aggregating audit_logs.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from supabase import create_client, Client
+from lynx.config import Config
 from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
+from lynx.observability.logging import get_logger
+from lynx.storage.run_summaries import list_run_summaries
+
+logger = get_logger(__name__)
 
 
 class AuditLogger:
@@ -48,6 +56,7 @@ class AuditLogger:
             lynx_response: Lynx's response
             status: Run status ("completed", "failed", "blocked")
         """
+        timestamp = datetime.now().isoformat()
         try:
             self.supabase.table("lynx_runs").insert({
                 "run_id": run_id,
@@ -55,12 +64,23 @@ class AuditLogger:
                 "tenant_id": tenant_id,
                 "user_query": user_query,
                 "lynx_response": lynx_response,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp,
                 "status": status,
             }).execute()
         except Exception as e:
             # Log error but don't fail - audit logging should be resilient
-            print(f"Failed to log Lynx Run: {e}")
+            logger.warning(
+                "Failed to log Lynx Run: %s", e,
+                extra={"run_id": run_id, "tenant_id": tenant_id},
+            )
+            return
+        
+        self._record_run_event(
+            run_id, tenant_id, user_id, timestamp,
+            status=status,
+            user_query=user_query,
+            lynx_response=lynx_response,
+        )
     
     async def log_execution_start(
         self,
@@ -76,6 +96,7 @@ class AuditLogger:
             output_data=None,
             approved=False,
             refused=False,
+            summary={"tool_calls": 1},
         )
     
     async def log_execution_success(
@@ -83,8 +104,9 @@ class AuditLogger:
         context: ExecutionContext,
         tool: MCPTool,
         output_data: Dict[str, Any],
+        duration_ms: Optional[int] = None,
     ) -> None:
-        """Log successful tool execution."""
+        """Log successful tool execution (duration_ms: handler time, if measured)."""
         await self._log_tool_call(
             context=context,
             tool=tool,
@@ -92,6 +114,8 @@ class AuditLogger:
             output_data=output_data,
             approved=context.explicit_approval or tool.risk != "high",
             refused=False,
+            duration_ms=duration_ms,
+            summary={"successes": 1},
         )
     
     async def log_execution_failure(
@@ -99,8 +123,9 @@ class AuditLogger:
         context: ExecutionContext,
         tool: MCPTool,
         error: str,
+        duration_ms: Optional[int] = None,
     ) -> None:
-        """Log failed tool execution."""
+        """Log failed tool execution (duration_ms: handler time, if measured)."""
         await self._log_tool_call(
             context=context,
             tool=tool,
@@ -108,6 +133,8 @@ class AuditLogger:
             output_data={"error": error},
             approved=False,
             refused=False,
+            duration_ms=duration_ms,
+            summary={"failures": 1},
         )
     
     async def log_execution_warning(
@@ -145,6 +172,67 @@ class AuditLogger:
             approved=False,
             refused=True,
             refusal_reason=reason,
+            summary={"tool_calls": 1, "refusals": 1},  # Refused calls never start
+        )
+    
+    async def log_draft_transitions(
+        self,
+        run_id: str,
+        tenant_id: str,
+        user_id: str,
+        action: str,
+        transitions: List[Dict[str, Any]],
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Log draft status transitions as one batched insert (one row per draft).
+        
+        Args:
+            run_id: Request/run ID shared by all rows
+            tenant_id: Tenant ID
+            user_id: User who made the transition
+            action: Transition action ("approve", "reject")
+            transitions: Per-draft outcomes (draft_id, outcome, status)
+            reason: Optional reason/notes from the approver
+        """
+        if not transitions:
+            return
+        
+        timestamp = datetime.now().isoformat()
+        approved = action == "approve"
+        rows = [
+            {
+                "run_id": run_id,
+                "tool_id": f"drafts.{action}",
+                "user_id": user_id,
+                "tenant_id": tenant_id,
+                "input": {"draft_id": transition["draft_id"], "reason": reason},
+                "output": transition,
+                "risk_level": "medium",
+                "approved": approved and transition.get("outcome") == "updated",
+                "approved_by": user_id if approved and transition.get("outcome") == "updated" else None,
+                "refused": False,
+                "refusal_reason": None,
+                "timestamp": timestamp,
+            }
+            for transition in transitions
+        ]
+        try:
+            self.supabase.table("audit_logs").insert(rows).execute()
+        except Exception as e:
+            # Log error but don't fail - audit logging should be resilient
+            logger.warning(
+                "Failed to log draft transitions: %s", e,
+                extra={"run_id": run_id, "tenant_id": tenant_id, "count": len(rows)},
+            )
+            return
+        
+        self._record_run_event(
+            run_id, tenant_id, user_id, timestamp,
+            tool_id=f"drafts.{action}",
+            risk="medium",
+            tool_calls=len(rows),
+            successes=sum(1 for row in rows if row["output"].get("outcome") == "updated"),
         )
     
     async def _log_tool_call(
@@ -156,24 +244,124 @@ class AuditLogger:
         approved: bool,
         refused: bool,
         refusal_reason: Optional[str] = None,
+        duration_ms: Optional[int] = None,
+        summary: Optional[Dict[str, int]] = None,
     ) -> None:
-        """Internal method to log tool calls."""
+        """Internal method to log tool calls (summary: counters to add to the run summary)."""
+        row = {
+            "run_id": context.lynx_run_id,
+            "tool_id": tool.id,
+            "user_id": context.user_id,
+            "tenant_id": context.tenant_id,
+            "input": input_data or {},
+            "output": output_data or {},
+            "risk_level": tool.risk,
+            "approved": approved,
+            "approved_by": context.user_id if approved else None,
+            "refused": refused,
+            "refusal_reason": refusal_reason,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if duration_ms is not None:
+            row["duration_ms"] = duration_ms
         try:
-            self.supabase.table("audit_logs").insert({
-                "run_id": context.lynx_run_id,
-                "tool_id": tool.id,
-                "user_id": context.user_id,
-                "tenant_id": context.tenant_id,
-                "input": input_data or {},
-                "output": output_data or {},
-                "risk_level": tool.risk,
-                "approved": approved,
-                "approved_by": context.user_id if approved else None,
-                "refused": refused,
-                "refusal_reason": refusal_reason,
-                "timestamp": datetime.now().isoformat(),
+            self.supabase.table("audit_logs").insert(row).execute()
+        except Exception as e:
+            # Log error but don't fail - audit logging should be resilient
+            logger.warning(
+                "Failed to log tool call: %s", e,
+                extra={"run_id": context.lynx_run_id, "tenant_id": context.tenant_id, "tool_id": tool.id},
+            )
+            return
+        
+        if summary is not None:
+            self._record_run_event(
+                context.lynx_run_id, context.tenant_id, context.user_id, row["timestamp"],
+                tool_id=tool.id,
+                risk=tool.risk,
+                duration_ms=duration_ms or 0,
+                **summary,
+            )
+    
+    def _record_run_event(
+        self,
+        run_id: str,
+        tenant_id: str,
+        user_id: str,
+        timestamp: str,
+        tool_id: Optional[str] = None,
+        risk: Optional[str] = None,
+        tool_calls: int = 0,
+        successes: int = 0,
+        failures: int = 0,
+        refusals: int = 0,
+        duration_ms: int = 0,
+        status: Optional[str] = None,
+        user_query: Optional[str] = None,
+        lynx_response: Optional[str] = None,
+    ) -> None:
+        """
+        Fold one audit event into its run's summary (lynx_run_summaries).
+        
+        One RPC round trip: lynx_record_run_event upserts the summary row and
+        adds the counters atomically, so concurrent tool calls of a run never
+        lose updates.
+        """
+        try:
+            self.supabase.rpc("lynx_record_run_event", {
+                "p_run_id": run_id,
+                "p_tenant_id": tenant_id,
+                "p_user_id": user_id,
+                "p_at": timestamp,
+                "p_tool_id": tool_id,
+                "p_risk": risk,
+                "p_tool_calls": tool_calls,
+                "p_successes": successes,
+                "p_failures": failures,
+                "p_refusals": refusals,
+                "p_duration_ms": duration_ms,
+                "p_status": status,
+                "p_user_query": user_query,
+                "p_lynx_response": lynx_response,
             }).execute()
         except Exception as e:
             # Log error but don't fail - audit logging should be resilient
-            print(f"Failed to log tool call: {e}")
+            logger.warning(
+                "Failed to update run summary: %s", e,
+                extra={"run_id": run_id, "tenant_id": tenant_id},
+            )
+    
+    async def list_run_summaries(
+        self,
+        tenant_id: str,
+        limit: int = 50,
+        status: Optional[str] = None,
+        tool_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        user_id: Optional[str] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """List run summaries of a tenant, newest first (see lynx.storage.run_summaries)."""
+        return list_run_summaries(self.supabase, tenant_id, limit, status, tool_id, since, until, user_id, offset)
+
+
+# Global audit logger instance (one Supabase client per process)
+_audit_logger: Optional[AuditLogger] = None
 
+
+def get_audit_logger() -> Optional[AuditLogger]:
+    """
+    Get the global audit logger instance.
+    
+    Returns None if Supabase is not configured.
+    """
+    global _audit_logger
+    
+    if _audit_logger is None and Config.SUPABASE_URL and Config.SUPABASE_KEY:
+        _audit_logger = AuditLogger(
+            supabase_url=Config.SUPABASE_URL,
+            supabase_key=Config.SUPABASE_KEY,
+        )
+    
+    return _audit_logger
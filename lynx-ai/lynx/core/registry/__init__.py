@@ -6,10 +6,13 @@ This module manages MCP tool registration, validation, and execution.
 
 from lynx.core.registry.registry import MCPTool, MCPToolRegistry
 from lynx.core.registry.executor import execute_tool, ApprovalRequiredError
+from lynx.core.registry.scheduler import TenantScheduler, get_tool_scheduler
 
 __all__ = [
     "MCPTool",
     "MCPToolRegistry",
     "execute_tool",
     "ApprovalRequiredError",
+    "TenantScheduler",
+    "get_tool_scheduler",
 ]
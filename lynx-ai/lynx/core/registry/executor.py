@@ -4,11 +4,16 @@ MCP tool executor.
 Handles tool execution with validation, permission checks, and audit logging.
 """
 
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional
 from lynx.core.registry import MCPTool, MCPToolRegistry
+from lynx.core.registry.scheduler import TenantScheduler, get_tool_scheduler
 from lynx.core.session import ExecutionContext
 from lynx.core.permissions import PermissionChecker
 from lynx.core.audit import AuditLogger
+from lynx.observability.metrics import StageTimer
+from lynx.observability.logging import log_context
+from lynx.observability.tracing import get_tracer
 
 
 class ApprovalRequiredError(Exception):
@@ -23,6 +28,7 @@ async def execute_tool(
     registry: MCPToolRegistry,
     permission_checker: PermissionChecker,
     audit_logger: AuditLogger,
+    scheduler: Optional[TenantScheduler] = None,
 ) -> Dict[str, Any]:
     """
     Execute an MCP tool with full validation and audit.
@@ -40,6 +46,8 @@ async def execute_tool(
         registry: MCP tool registry
         permission_checker: Permission checker
         audit_logger: Audit logger
+        scheduler: Tenant scheduler bounding concurrent executions
+            (defaults to the global tool scheduler)
     
     Returns:
         Tool execution result
@@ -52,9 +60,50 @@ async def execute_tool(
     # 1. Get tool from registry
     tool = registry.get(tool_id)
     
+    # Trace the execution under the run (trace ID = lynx_run_id) and tag its logs
+    with get_tracer().span(
+        "tool.execute",
+        trace_id=context.lynx_run_id,
+        tool_id=tool.id,
+        layer=tool.layer,
+        risk=tool.risk,
+        tenant_id=context.tenant_id,
+    ), log_context(run_id=context.lynx_run_id, tenant_id=context.tenant_id, tool_id=tool.id):
+        return await _execute_tool(
+            tool,
+            input_data,
+            context,
+            permission_checker,
+            audit_logger,
+            scheduler,
+        )
+
+
+async def _execute_tool(
+    tool: MCPTool,
+    input_data: Dict[str, Any],
+    context: ExecutionContext,
+    permission_checker: PermissionChecker,
+    audit_logger: AuditLogger,
+    scheduler: Optional[TenantScheduler],
+) -> Dict[str, Any]:
+    """Run the execute_tool steps for a resolved tool (see execute_tool)."""
+    tool_id = tool.id
+    
+    # Per-stage latency histograms (lynx_tool_stage_seconds)
+    execution_start = time.perf_counter()
+    stages = StageTimer(
+        "lynx_tool_stage_seconds",
+        "Time spent in each execute_tool stage",
+        tool_id=tool.id,
+        layer=tool.layer,
+        risk=tool.risk,
+    )
+    
     # 2. Validate input
     try:
-        validated_input = tool.input_schema(**input_data)
+        with stages.stage("input_validation"):
+            validated_input = tool.input_schema(**input_data)
     except Exception as e:
         await audit_logger.log_refusal(
             context=context,
@@ -64,7 +113,8 @@ async def execute_tool(
         raise ValueError(f"Input validation failed: {str(e)}")
     
     # 3. Check permissions
-    has_permission = await permission_checker.check(tool, context)
+    with stages.stage("permission_check"):
+        has_permission = await permission_checker.check(tool, context)
     if not has_permission:
         await audit_logger.log_refusal(
             context=context,
@@ -97,51 +147,71 @@ async def execute_tool(
                     "Please use draft mode first or request approval."
                 )
     
-    # 5. Log execution start
-    await audit_logger.log_execution_start(
-        context=context,
-        tool=tool,
-        input_data=validated_input.model_dump() if hasattr(validated_input, 'model_dump') else validated_input,
-    )
+    # 5. Wait for a tenant execution slot (per-tenant limits, fair across tenants)
+    if scheduler is None:
+        scheduler = get_tool_scheduler()
     
-    # 6. Execute tool
-    try:
-        if tool.handler is None:
-            raise ValueError(f"Tool {tool_id} has no handler")
-        
-        result = await tool.handler(validated_input, context)
+    wait_start = time.perf_counter()
+    async with scheduler.slot(context.tenant_id):
+        stages.observe("scheduler_wait", time.perf_counter() - wait_start)
         
-        # 7. Validate output
-        try:
-            if isinstance(result, dict):
-                validated_output = tool.output_schema(**result)
-            else:
-                validated_output = tool.output_schema(**result.__dict__ if hasattr(result, '__dict__') else {})
-        except Exception as e:
-            # Log validation error but don't fail execution
-            await audit_logger.log_execution_warning(
+        # 6. Log execution start
+        with stages.stage("audit_start"):
+            await audit_logger.log_execution_start(
                 context=context,
                 tool=tool,
-                warning=f"Output validation failed: {str(e)}",
+                input_data=validated_input.model_dump() if hasattr(validated_input, 'model_dump') else validated_input,
             )
-            validated_output = result
-        
-        # 8. Log execution success
-        output_dict = validated_output.model_dump() if hasattr(validated_output, 'model_dump') else validated_output
-        await audit_logger.log_execution_success(
-            context=context,
-            tool=tool,
-            output_data=output_dict,
-        )
-        
-        return output_dict
         
-    except Exception as e:
-        # 9. Log execution failure
-        await audit_logger.log_execution_failure(
-            context=context,
-            tool=tool,
-            error=str(e),
-        )
-        raise
+        # 7. Execute tool
+        handler_start = time.perf_counter()
+        try:
+            if tool.handler is None:
+                raise ValueError(f"Tool {tool_id} has no handler")
+            
+            with stages.stage("handler"), get_tracer().span("tool.handler", tool_id=tool.id):
+                result = await tool.handler(validated_input, context)
+            
+            # 8. Validate output
+            output_start = time.perf_counter()
+            try:
+                if isinstance(result, dict):
+                    validated_output = tool.output_schema(**result)
+                else:
+                    validated_output = tool.output_schema(**result.__dict__ if hasattr(result, '__dict__') else {})
+            except Exception as e:
+                # Log validation error but don't fail execution
+                await audit_logger.log_execution_warning(
+                    context=context,
+                    tool=tool,
+                    warning=f"Output validation failed: {str(e)}",
+                )
+                validated_output = result
+            
+            output_dict = validated_output.model_dump() if hasattr(validated_output, 'model_dump') else validated_output
+            stages.observe("output_validation", time.perf_counter() - output_start)
+            
+            # 9. Log execution success
+            with stages.stage("audit_finish"):
+                await audit_logger.log_execution_success(
+                    context=context,
+                    tool=tool,
+                    output_data=output_dict,
+                    duration_ms=int((time.perf_counter() - handler_start) * 1000),
+                )
+            
+            stages.observe("total", time.perf_counter() - execution_start)
+            return output_dict
+            
+        except Exception as e:
+            # 10. Log execution failure
+            with stages.stage("audit_finish"):
+                await audit_logger.log_execution_failure(
+                    context=context,
+                    tool=tool,
+                    error=str(e),
+                    duration_ms=int((time.perf_counter() - handler_start) * 1000),
+                )
+            stages.observe("total", time.perf_counter() - execution_start)
+            raise
 
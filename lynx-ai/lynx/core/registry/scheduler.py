@@ -0,0 +1,306 @@
+"""
+Tenant scheduler for MCP tool execution.
+
+Bounds how much work a single tenant can push through execute_tool:
+
+- Per-tenant concurrency limit (in-flight executions)
+- Per-tenant token bucket (executions per second, with burst)
+- Shared global concurrency limit across all tenants
+- Weighted-fair ordering: waiting executions are dispatched by virtual
+  finish time (start-time fair queuing), so a tenant with a deep queue
+  cannot starve tenants that submit occasional work.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from lynx.config import Config
+from lynx.observability.metrics import Histogram, MetricsRegistry, get_metrics_registry
+
+
+@dataclass
+class _Waiter:
+    """An execution waiting for a slot."""
+    tenant_id: str
+    start_tag: float
+    finish_tag: float
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _TenantState:
+    """Scheduling state and metrics for one tenant."""
+    weight: float
+    concurrency: int
+    rate: float
+    burst: float
+    tokens: float
+    last_refill: float = field(default_factory=time.monotonic)
+    last_finish_tag: float = 0.0
+    queue: Deque[_Waiter] = field(default_factory=deque)
+    in_flight: int = 0
+
+    # Metrics
+    admitted_total: int = 0
+    cancelled_total: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    wait_histogram: Optional[Histogram] = None
+
+    def refill(self, now: float) -> None:
+        if self.rate <= 0:
+            return
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+
+class TenantScheduler:
+    """Weighted-fair, rate-limited admission of tool executions per tenant."""
+
+    def __init__(
+        self,
+        global_concurrency: Optional[int] = None,
+        tenant_concurrency: Optional[int] = None,
+        tenant_rate: Optional[float] = None,
+        tenant_burst: Optional[float] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize tenant scheduler.
+
+        Args:
+            global_concurrency: Max in-flight executions across all tenants
+                (defaults to Config.SCHEDULER_GLOBAL_CONCURRENCY)
+            tenant_concurrency: Default max in-flight executions per tenant
+                (defaults to Config.SCHEDULER_TENANT_CONCURRENCY)
+            tenant_rate: Default executions per second per tenant, 0 for unlimited
+                (defaults to Config.SCHEDULER_TENANT_RATE)
+            tenant_burst: Default token bucket size per tenant
+                (defaults to Config.SCHEDULER_TENANT_BURST)
+            metrics_registry: Registry for wait-time histograms (None to disable)
+        """
+        self.global_concurrency = global_concurrency or Config.SCHEDULER_GLOBAL_CONCURRENCY
+        self.tenant_concurrency = tenant_concurrency or Config.SCHEDULER_TENANT_CONCURRENCY
+        self.tenant_rate = tenant_rate if tenant_rate is not None else Config.SCHEDULER_TENANT_RATE
+        self.tenant_burst = tenant_burst or Config.SCHEDULER_TENANT_BURST
+
+        self._metrics_registry = metrics_registry
+        self._tenants: Dict[str, _TenantState] = {}
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def configure_tenant(
+        self,
+        tenant_id: str,
+        weight: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+    ) -> None:
+        """
+        Override scheduling parameters for one tenant.
+
+        Args:
+            tenant_id: Tenant ID
+            weight: Fair-share weight (default 1.0; higher gets more throughput)
+            concurrency: Max in-flight executions
+            rate: Executions per second (0 for unlimited)
+            burst: Token bucket size
+        """
+        state = self._tenant(tenant_id)
+        if weight is not None:
+            if weight <= 0:
+                raise ValueError("Tenant weight must be positive")
+            state.weight = weight
+        if concurrency is not None:
+            state.concurrency = concurrency
+        if rate is not None:
+            state.rate = rate
+        if burst is not None:
+            state.burst = burst
+            state.tokens = min(state.tokens, burst)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, tenant_id: str, cost: float = 1.0) -> AsyncIterator[None]:
+        """
+        Wait for an execution slot for a tenant and hold it for the block.
+
+        Args:
+            tenant_id: Tenant ID
+            cost: Relative cost of the execution (for fair ordering)
+        """
+        state = self._tenant(tenant_id)
+        start_tag = max(self._virtual_time, state.last_finish_tag)
+        finish_tag = start_tag + cost / state.weight
+        state.last_finish_tag = finish_tag
+
+        waiter = _Waiter(
+            tenant_id=tenant_id,
+            start_tag=start_tag,
+            finish_tag=finish_tag,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        state.queue.append(waiter)
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot was granted just as we were cancelled - give it back
+                self._release(state)
+            else:
+                waiter.future.cancel()
+                if waiter in state.queue:
+                    state.queue.remove(waiter)
+                state.cancelled_total += 1
+            raise
+
+        try:
+            yield
+        finally:
+            self._release(state)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get scheduler metrics.
+
+        Returns:
+            Dictionary with global counters and per-tenant queue depth,
+            in-flight count and wait times
+        """
+        tenants = {}
+        for tenant_id, state in self._tenants.items():
+            tenants[tenant_id] = {
+                "queue_depth": len(state.queue),
+                "in_flight": state.in_flight,
+                "admitted_total": state.admitted_total,
+                "cancelled_total": state.cancelled_total,
+                "wait_seconds_total": state.wait_seconds_total,
+                "wait_seconds_max": state.wait_seconds_max,
+                "wait_seconds_avg": (
+                    state.wait_seconds_total / state.admitted_total if state.admitted_total else 0.0
+                ),
+            }
+        return {
+            "global_in_flight": self._in_flight,
+            "global_concurrency": self.global_concurrency,
+            "queue_depth": sum(len(s.queue) for s in self._tenants.values()),
+            "tenants": tenants,
+        }
+
+    def export_metrics(self, registry: MetricsRegistry) -> None:
+        """
+        Publish per-tenant queue depth and in-flight gauges (metrics collector).
+
+        Args:
+            registry: Metrics registry to update
+        """
+        for tenant_id, state in self._tenants.items():
+            registry.gauge(
+                "lynx_scheduler_queue_depth", "Tool executions waiting for a slot", tenant_id=tenant_id,
+            ).set(len(state.queue))
+            registry.gauge(
+                "lynx_scheduler_in_flight", "Tool executions holding a slot", tenant_id=tenant_id,
+            ).set(state.in_flight)
+
+    def _tenant(self, tenant_id: str) -> _TenantState:
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            state = _TenantState(
+                weight=1.0,
+                concurrency=self.tenant_concurrency,
+                rate=self.tenant_rate,
+                burst=self.tenant_burst,
+                tokens=self.tenant_burst,
+                wait_histogram=self._metrics_registry.histogram(
+                    "lynx_scheduler_wait_seconds",
+                    "Time tool executions waited for a tenant slot",
+                    tenant_id=tenant_id,
+                ) if self._metrics_registry else None,
+            )
+            self._tenants[tenant_id] = state
+        return state
+
+    def _release(self, state: _TenantState) -> None:
+        state.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant slots to eligible waiters in virtual finish-time order."""
+        now = time.monotonic()
+        next_refill: Optional[float] = None
+
+        while self._in_flight < self.global_concurrency:
+            best: Optional[_TenantState] = None
+            for state in self._tenants.values():
+                # Drop waiters cancelled before they were granted
+                while state.queue and state.queue[0].future.done():
+                    state.queue.popleft()
+                if not state.queue or state.in_flight >= state.concurrency:
+                    continue
+                state.refill(now)
+                if state.rate > 0 and state.tokens < 1:
+                    delay = (1 - state.tokens) / state.rate
+                    next_refill = delay if next_refill is None else min(next_refill, delay)
+                    continue
+                if best is None or state.queue[0].finish_tag < best.queue[0].finish_tag:
+                    best = state
+
+            if best is None:
+                break
+
+            waiter = best.queue.popleft()
+            if best.rate > 0:
+                best.tokens -= 1
+            best.in_flight += 1
+            self._in_flight += 1
+            self._virtual_time = max(self._virtual_time, waiter.start_tag)
+
+            waited = now - waiter.enqueued_at
+            best.admitted_total += 1
+            best.wait_seconds_total += waited
+            best.wait_seconds_max = max(best.wait_seconds_max, waited)
+            if best.wait_histogram is not None:
+                best.wait_histogram.observe(waited)
+            waiter.future.set_result(None)
+
+        if next_refill is not None:
+            loop = asyncio.get_running_loop()
+            if self._timer is None or self._timer_loop is not loop:
+                self._timer = loop.call_later(next_refill, self._on_timer)
+                self._timer_loop = loop
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+
+# Global tool scheduler instance
+_tool_scheduler: Optional[TenantScheduler] = None
+
+
+def get_tool_scheduler() -> TenantScheduler:
+    """
+    Get the global tool execution scheduler.
+
+    Returns:
+        TenantScheduler configured from Config
+    """
+    global _tool_scheduler
+
+    if _tool_scheduler is None:
+        registry = get_metrics_registry()
+        _tool_scheduler = TenantScheduler(metrics_registry=registry)
+        registry.register_collector(_tool_scheduler.export_metrics)
+
+    return _tool_scheduler
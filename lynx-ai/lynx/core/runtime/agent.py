@@ -6,8 +6,81 @@ This module creates and configures the Lynx agent using mcp-agent.
 
 from mcp_agent.agents.agent import Agent
 from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp.types import CallToolResult
 from typing import Optional
 from lynx.core.session import ExecutionContext
+from lynx.core.runtime.tool_calls import tool_call_observer
+
+
+class LynxAgent(Agent):
+    """
+    Lynx agent that reports tool calls to the current turn's observer.
+    """
+    
+    async def call_tool(
+        self, name: str, arguments: dict | None = None, server_name: str | None = None
+    ) -> CallToolResult:
+        observer = tool_call_observer.get()
+        if observer is None:
+            return await super().call_tool(name, arguments, server_name)
+        
+        # Report the registry tool ID, not the server-namespaced name
+        namespaced = self._namespaced_tool_map.get(name)
+        call = observer.start(namespaced.tool.name if namespaced else name, arguments)
+        try:
+            result = await super().call_tool(name, arguments, server_name)
+        except Exception as e:
+            observer.finish(call, error=str(e))
+            raise
+        
+        if result.isError:
+            error = " ".join(getattr(c, "text", "") for c in result.content) or "Tool call failed"
+            observer.finish(call, error=error)
+        else:
+            observer.finish(call, output=result.model_dump(mode="json", exclude_none=True))
+        return result
+
+
+def build_lynx_instruction(context: ExecutionContext) -> str:
+    """
+    Build the Lynx system instruction for an execution context.
+    
+    Pooled agents are shared across users, so the per-turn context is injected
+    by setting this on the LLM before each generation.
+    
+    Args:
+        context: Execution context with user/tenant information
+    
+    Returns:
+        System instruction string
+    """
+    return """
+    You are Lynx AI, the intelligence layer of NexusCanon.
+    You guide users toward correct, auditable, and optimal system behavior.
+    
+    Core Principles:
+    1. You may think freely and reason broadly (cognitive freedom)
+    2. You may act only through MCP tools (operational constraint)
+    3. You must respect tenant boundaries (tenant absolutism)
+    4. You must log all actions (audit is reality)
+    5. You must suggest first, execute with consent (suggest first)
+    
+    Rules:
+    - Never invent truth - always read from Kernel SSOT
+    - Never access data from other tenants
+    - Never execute actions not available as MCP tools
+    - Always explain why actions are blocked
+    - Always suggest alternatives when actions cannot be performed
+    
+    Current Context:
+    - Tenant: {tenant_id}
+    - User: {user_id}
+    - Role: {user_role}
+    """.format(
+        tenant_id=context.tenant_id,
+        user_id=context.user_id,
+        user_role=context.user_role,
+    )
 
 
 async def create_lynx_agent(
@@ -27,35 +100,9 @@ async def create_lynx_agent(
     if server_names is None:
         server_names = ["lynx_mcp_server"]
     
-    agent = Agent(
+    agent = LynxAgent(
         name="lynx",
-        instruction="""
-        You are Lynx AI, the intelligence layer of NexusCanon.
-        You guide users toward correct, auditable, and optimal system behavior.
-        
-        Core Principles:
-        1. You may think freely and reason broadly (cognitive freedom)
-        2. You may act only through MCP tools (operational constraint)
-        3. You must respect tenant boundaries (tenant absolutism)
-        4. You must log all actions (audit is reality)
-        5. You must suggest first, execute with consent (suggest first)
-        
-        Rules:
-        - Never invent truth - always read from Kernel SSOT
-        - Never access data from other tenants
-        - Never execute actions not available as MCP tools
-        - Always explain why actions are blocked
-        - Always suggest alternatives when actions cannot be performed
-        
-        Current Context:
-        - Tenant: {tenant_id}
-        - User: {user_id}
-        - Role: {user_role}
-        """.format(
-            tenant_id=context.tenant_id,
-            user_id=context.user_id,
-            user_role=context.user_role,
-        ),
+        instruction=build_lynx_instruction(context),
         server_names=server_names,
     )
     
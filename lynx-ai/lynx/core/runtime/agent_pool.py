@@ -0,0 +1,301 @@
+"""
+Agent pool for Lynx AI.
+
+Keeps long-lived, initialized mcp-agent agents (with their LLM attached) so
+chat requests do not pay for MCPApp startup, agent initialization and MCP
+server connection on every query.
+
+Agents are keyed by (tenant_id, user_role) and leased exclusively: one turn
+uses an agent at a time. The per-turn context (user, tenant, role) is injected
+into the LLM instruction on every lease, and callers generate with
+use_history=False so nothing leaks between turns or users.
+"""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from lynx.config import Config
+from lynx.core.session import ExecutionContext
+from lynx.observability.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+AgentKey = Tuple[str, str]
+
+
+@dataclass
+class PooledAgent:
+    """An initialized agent with its attached LLM."""
+    key: AgentKey
+    agent: Any
+    llm: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    in_use: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the agent is still connected to its MCP servers."""
+        return bool(getattr(self.agent, "initialized", False))
+
+
+class AgentPool:
+    """Pool of long-lived Lynx agents keyed by tenant and role."""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        idle_timeout_seconds: Optional[float] = None,
+        agent_factory: Optional[Callable[[ExecutionContext], Awaitable[Any]]] = None,
+        llm_factory: Optional[Callable[..., Any]] = None,
+        app: Optional[Any] = None,
+    ):
+        """
+        Initialize agent pool.
+
+        Args:
+            max_size: Maximum number of agents (defaults to Config.AGENT_POOL_MAX_SIZE)
+            idle_timeout_seconds: Idle time before an agent is evicted
+                (defaults to Config.AGENT_POOL_IDLE_TIMEOUT)
+            agent_factory: Async callable creating an agent for a context
+                (defaults to create_lynx_agent)
+            llm_factory: LLM factory passed to agent.attach_llm
+                (defaults to OpenAIAugmentedLLM)
+            app: MCPApp instance (defaults to get_app())
+        """
+        self.max_size = max_size if max_size is not None else Config.AGENT_POOL_MAX_SIZE
+        self.idle_timeout_seconds = (
+            idle_timeout_seconds if idle_timeout_seconds is not None
+            else Config.AGENT_POOL_IDLE_TIMEOUT
+        )
+        self._agent_factory = agent_factory
+        self._llm_factory = llm_factory
+        self._app = app
+
+        self._agents: List[PooledAgent] = []
+        self._reserved = 0  # Slots held by agents being created
+        self._condition = asyncio.Condition()
+        self._app_stack: Optional[AsyncExitStack] = None
+        self._app_lock = asyncio.Lock()
+
+        # Metrics
+        self.created_total = 0
+        self.reused_total = 0
+        self.evicted_total = 0
+        self.unhealthy_total = 0
+
+    async def start(self) -> None:
+        """Enter the MCPApp context once for the lifetime of the pool."""
+        async with self._app_lock:
+            if self._app_stack is not None:
+                return
+            app = self._app
+            if app is None:
+                from lynx.core.runtime.app import get_app
+                app = get_app()
+            stack = AsyncExitStack()
+            await stack.enter_async_context(app.run())
+            self._app_stack = stack
+
+    @asynccontextmanager
+    async def lease(self, context: ExecutionContext) -> AsyncIterator[PooledAgent]:
+        """
+        Lease an agent for one turn.
+
+        The LLM instruction is rebuilt from the context before the agent is
+        handed out; the agent returns to the pool afterwards unless it is no
+        longer healthy.
+
+        Args:
+            context: Execution context for this turn
+
+        Yields:
+            PooledAgent with agent and llm ready to generate
+        """
+        from lynx.core.runtime.agent import build_lynx_instruction
+
+        pooled = await self._acquire(context)
+        try:
+            pooled.llm.instruction = build_lynx_instruction(context)
+            yield pooled
+        finally:
+            await self._release(pooled)
+
+    async def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Shut down agents that have been idle longer than the idle timeout.
+
+        Args:
+            now: Reference time (defaults to time.monotonic())
+
+        Returns:
+            Number of agents evicted
+        """
+        if now is None:
+            now = time.monotonic()
+        async with self._condition:
+            idle = [
+                p for p in self._agents
+                if not p.in_use and now - p.last_used >= self.idle_timeout_seconds
+            ]
+            for pooled in idle:
+                self._agents.remove(pooled)
+            self.evicted_total += len(idle)
+            if idle:
+                self._condition.notify_all()
+        for pooled in idle:
+            await self._shutdown_agent(pooled)
+        return len(idle)
+
+    async def run_evictor(self, interval_seconds: Optional[float] = None) -> None:
+        """
+        Run idle eviction until cancelled.
+
+        Args:
+            interval_seconds: Seconds between passes (defaults to a quarter of the idle timeout)
+        """
+        interval = interval_seconds or max(self.idle_timeout_seconds / 4, 1)
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                await self.evict_idle()
+        except asyncio.CancelledError:
+            pass
+
+    async def close(self) -> None:
+        """Shut down all agents and leave the MCPApp context."""
+        async with self._condition:
+            agents = list(self._agents)
+            self._agents.clear()
+            self._condition.notify_all()
+        for pooled in agents:
+            await self._shutdown_agent(pooled)
+        if self._app_stack is not None:
+            stack, self._app_stack = self._app_stack, None
+            await stack.aclose()
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get agent pool metrics.
+
+        Returns:
+            Dictionary with pool size, usage and lifecycle counters
+        """
+        return {
+            "size": len(self._agents),
+            "in_use": sum(1 for p in self._agents if p.in_use),
+            "max_size": self.max_size,
+            "created_total": self.created_total,
+            "reused_total": self.reused_total,
+            "evicted_total": self.evicted_total,
+            "unhealthy_total": self.unhealthy_total,
+        }
+
+    async def _acquire(self, context: ExecutionContext) -> PooledAgent:
+        key: AgentKey = (context.tenant_id, context.user_role)
+        victim: Optional[PooledAgent] = None
+
+        async with self._condition:
+            while True:
+                for pooled in self._agents:
+                    if pooled.key == key and not pooled.in_use and pooled.healthy:
+                        pooled.in_use = True
+                        pooled.uses += 1
+                        self.reused_total += 1
+                        return pooled
+
+                if len(self._agents) + self._reserved < self.max_size:
+                    break
+
+                # Pool full - make room by evicting the least recently used idle agent
+                idle = [p for p in self._agents if not p.in_use]
+                if idle:
+                    victim = min(idle, key=lambda p: p.last_used)
+                    self._agents.remove(victim)
+                    self.evicted_total += 1
+                    break
+
+                await self._condition.wait()
+
+            self._reserved += 1
+
+        if victim is not None:
+            await self._shutdown_agent(victim)
+
+        try:
+            pooled = await self._create(key, context)
+        except BaseException:
+            async with self._condition:
+                self._reserved -= 1
+                self._condition.notify_all()
+            raise
+
+        async with self._condition:
+            self._reserved -= 1
+            self._agents.append(pooled)
+        return pooled
+
+    async def _release(self, pooled: PooledAgent) -> None:
+        unhealthy = not pooled.healthy
+        async with self._condition:
+            pooled.in_use = False
+            pooled.last_used = time.monotonic()
+            if unhealthy and pooled in self._agents:
+                self._agents.remove(pooled)
+                self.unhealthy_total += 1
+            self._condition.notify_all()
+        if unhealthy:
+            await self._shutdown_agent(pooled)
+
+    async def _create(self, key: AgentKey, context: ExecutionContext) -> PooledAgent:
+        await self.start()
+
+        agent_factory = self._agent_factory
+        if agent_factory is None:
+            from lynx.core.runtime.agent import create_lynx_agent
+            agent_factory = create_lynx_agent
+        llm_factory = self._llm_factory
+        if llm_factory is None:
+            from mcp_agent.workflows.llm.augmented_llm_openai import OpenAIAugmentedLLM
+            llm_factory = OpenAIAugmentedLLM
+
+        agent = await agent_factory(context)
+        await agent.initialize()
+        try:
+            llm = await agent.attach_llm(llm_factory)
+        except BaseException:
+            await agent.shutdown()
+            raise
+
+        self.created_total += 1
+        return PooledAgent(key=key, agent=agent, llm=llm, uses=1, in_use=True)
+
+    async def _shutdown_agent(self, pooled: PooledAgent) -> None:
+        try:
+            await pooled.agent.shutdown()
+        except Exception as e:
+            logger.warning("Failed to shut down pooled agent %s: %s", pooled.key, e)
+
+
+# Global agent pool instance
+_agent_pool: Optional[AgentPool] = None
+
+
+def get_agent_pool() -> AgentPool:
+    """
+    Get the global agent pool instance.
+
+    Returns:
+        AgentPool configured from Config
+    """
+    global _agent_pool
+
+    if _agent_pool is None:
+        _agent_pool = AgentPool()
+
+    return _agent_pool
@@ -0,0 +1,88 @@
+"""
+Tool call observation for Lynx agent runs.
+
+LynxAgent reports every MCP tool call to the observer bound to the current
+context, so chat routes can stream tool-call events and derive policy from
+the tools that actually ran. The observer is held in a contextvar, which
+keeps concurrent turns on pooled agents isolated from each other.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+
+@dataclass
+class ObservedToolCall:
+    """A tool call made by the agent during one turn."""
+    tool_id: str
+    arguments: Dict[str, Any]
+    call_id: str = field(default_factory=lambda: str(uuid4()))
+    started_at: float = field(default_factory=time.perf_counter)
+    status: str = "pending"  # pending, success, error
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    duration_ms: Optional[int] = None
+
+
+class ToolCallObserver:
+    """Collects tool calls for one turn and forwards start/finish events."""
+
+    def __init__(
+        self,
+        on_event: Optional[Callable[[str, ObservedToolCall], None]] = None,
+    ):
+        """
+        Initialize observer.
+
+        Args:
+            on_event: Callback receiving ("tool_call_start" | "tool_call_finish", call)
+        """
+        self.calls: List[ObservedToolCall] = []
+        self._on_event = on_event
+
+    def start(self, tool_id: str, arguments: Optional[Dict[str, Any]] = None) -> ObservedToolCall:
+        """
+        Record the start of a tool call.
+
+        Args:
+            tool_id: Tool ID
+            arguments: Tool arguments
+
+        Returns:
+            ObservedToolCall to pass to finish()
+        """
+        call = ObservedToolCall(tool_id=tool_id, arguments=dict(arguments or {}))
+        self.calls.append(call)
+        if self._on_event:
+            self._on_event("tool_call_start", call)
+        return call
+
+    def finish(
+        self,
+        call: ObservedToolCall,
+        output: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the end of a tool call.
+
+        Args:
+            call: Call returned by start()
+            output: Tool output (on success)
+            error: Error message (on failure)
+        """
+        call.duration_ms = int((time.perf_counter() - call.started_at) * 1000)
+        call.status = "error" if error else "success"
+        call.output = output
+        call.error = error
+        if self._on_event:
+            self._on_event("tool_call_finish", call)
+
+
+# Observer for the current agent turn (None outside of an observed turn)
+tool_call_observer: ContextVar[Optional[ToolCallObserver]] = ContextVar(
+    "lynx_tool_call_observer", default=None
+)
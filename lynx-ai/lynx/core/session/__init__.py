@@ -9,6 +9,7 @@ from lynx.core.session.manager import (
     SessionManager,
     ExecutionContext,
 )
+from lynx.core.session.snapshot import TenantSnapshot
 from lynx.core.session.tenant import (
     enforce_tenant_isolation,
     validate_tenant_scope,
@@ -18,6 +19,7 @@ __all__ = [
     "Session",
     "SessionManager",
     "ExecutionContext",
+    "TenantSnapshot",
     "enforce_tenant_isolation",
     "validate_tenant_scope",
 ]
@@ -2,21 +2,31 @@
 Session manager for Lynx AI.
 
 Manages tenant-scoped sessions and execution context.
+
+Sessions live in an LRU-ordered map with a min-heap expiry index, so the
+daemon can sweep expired sessions without scanning every entry and keep
+memory bounded with a configurable session cap.
 """
 
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import asyncio
+import heapq
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from uuid import uuid4
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
+from lynx.config import Config
+from lynx.core.session.snapshot import TenantSnapshot
+
 if TYPE_CHECKING:
     from lynx.core.audit import AuditLogger
 # AuditLogger will be imported when needed to avoid circular imports
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
-    """Represents a Lynx session."""
+    """Represents a Lynx session (slotted - the daemon may hold many)."""
     session_id: str
     user_id: str
     tenant_id: str
@@ -24,6 +34,7 @@ class Session:
     user_scope: list[str]
     created_at: datetime
     expires_at: datetime
+    tenant_snapshot: Optional[TenantSnapshot] = None
 
 
 @dataclass
@@ -39,9 +50,10 @@ class ExecutionContext:
     session_id: str
     lynx_run_id: str = field(default_factory=lambda: str(uuid4()))
     
-    # Kernel (will be populated from Kernel API)
+    # Kernel (populated lazily from the session's tenant snapshot)
     kernel_metadata: dict = field(default_factory=dict)
     tenant_customizations: dict = field(default_factory=dict)
+    tenant_snapshot: Optional[TenantSnapshot] = None
     
     # Approval
     explicit_approval: Optional[bool] = None
@@ -53,15 +65,33 @@ class ExecutionContext:
 class SessionManager:
     """Manages tenant-scoped sessions."""
     
-    def __init__(self, session_timeout_hours: int = 8):
+    def __init__(
+        self,
+        session_timeout_hours: int = 8,
+        max_sessions: Optional[int] = None,
+    ):
         """
         Initialize session manager.
         
         Args:
             session_timeout_hours: Session timeout in hours (default: 8)
+            max_sessions: Maximum live sessions before LRU eviction
+                (default: Config.SESSION_MAX_COUNT)
         """
-        self.sessions: Dict[str, Session] = {}
+        # LRU order: least recently used first
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
         self.session_timeout_hours = session_timeout_hours
+        self.max_sessions = max_sessions if max_sessions is not None else Config.SESSION_MAX_COUNT
+        
+        # Expiry index: (expires_at, seq, session_id). Entries for sessions that
+        # were already removed are skipped lazily when popped.
+        self._expiry_heap: List[Tuple[datetime, int, str]] = []
+        self._heap_seq = 0
+        
+        # Metrics
+        self.created_total = 0
+        self.expired_total = 0
+        self.evicted_total = 0
     
     def create_session(
         self,
@@ -73,6 +103,8 @@ class SessionManager:
         """
         Create a new tenant-scoped session.
         
+        Evicts the least recently used session if the store is full.
+        
         Args:
             user_id: User ID
             tenant_id: Tenant ID (enforces tenant isolation)
@@ -82,16 +114,26 @@ class SessionManager:
         Returns:
             Created Session instance
         """
+        now = datetime.now()
         session = Session(
             session_id=str(uuid4()),
             user_id=user_id,
             tenant_id=tenant_id,
             user_role=user_role,
             user_scope=user_scope,
-            created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(hours=self.session_timeout_hours),
+            created_at=now,
+            expires_at=now + timedelta(hours=self.session_timeout_hours),
         )
         self.sessions[session.session_id] = session
+        self._push_expiry(session)
+        self.created_total += 1
+        
+        # Enforce the session cap (LRU eviction)
+        while self.max_sessions and len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+            self.evicted_total += 1
+        
+        self._compact_expiry_index()
         return session
     
     def get_session(self, session_id: str) -> Optional[Session]:
@@ -106,12 +148,98 @@ class SessionManager:
         """
         session = self.sessions.get(session_id)
         if session and session.expires_at > datetime.now():
+            # Mark as most recently used
+            self.sessions.move_to_end(session_id)
             return session
         # Remove expired session
         if session:
             del self.sessions[session_id]
+            self.expired_total += 1
         return None
     
+    def remove_session(self, session_id: str) -> bool:
+        """
+        Remove a session (e.g. on logout).
+        
+        Args:
+            session_id: Session ID
+        
+        Returns:
+            True if the session existed
+        """
+        return self.sessions.pop(session_id, None) is not None
+    
+    def sweep_expired(self, now: Optional[datetime] = None) -> int:
+        """
+        Remove all expired sessions.
+        
+        Only pops due entries from the expiry index, so the cost is
+        proportional to the number of expired sessions, not the store size.
+        
+        Args:
+            now: Reference time (default: datetime.now())
+        
+        Returns:
+            Number of sessions removed
+        """
+        now = now or datetime.now()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, _, session_id = heapq.heappop(self._expiry_heap)
+            session = self.sessions.get(session_id)
+            # Skip stale index entries (session already removed or re-keyed)
+            if session is None or session.expires_at != expires_at:
+                continue
+            del self.sessions[session_id]
+            removed += 1
+        self.expired_total += removed
+        return removed
+    
+    async def run_sweeper(self, interval_seconds: Optional[int] = None) -> None:
+        """
+        Run the background expiry sweeper until cancelled.
+        
+        Args:
+            interval_seconds: Sweep interval (default: Config.SESSION_SWEEP_INTERVAL)
+        """
+        interval = interval_seconds or Config.SESSION_SWEEP_INTERVAL
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                self.sweep_expired()
+            except asyncio.CancelledError:
+                break
+    
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get session store metrics.
+        
+        Returns:
+            Dict with active, expired and evicted session counts
+        """
+        return {
+            "active": len(self.sessions),
+            "max_sessions": self.max_sessions,
+            "created_total": self.created_total,
+            "expired_total": self.expired_total,
+            "evicted_total": self.evicted_total,
+        }
+    
+    def _push_expiry(self, session: Session) -> None:
+        """Add a session to the expiry index."""
+        self._heap_seq += 1
+        heapq.heappush(self._expiry_heap, (session.expires_at, self._heap_seq, session.session_id))
+    
+    def _compact_expiry_index(self) -> None:
+        """Drop stale index entries once they outnumber live sessions."""
+        if len(self._expiry_heap) <= 2 * len(self.sessions) + 64:
+            return
+        self._expiry_heap = [
+            entry for entry in self._expiry_heap
+            if entry[2] in self.sessions and self.sessions[entry[2]].expires_at == entry[0]
+        ]
+        heapq.heapify(self._expiry_heap)
+    
     def create_execution_context(
         self,
         session: Session,
@@ -120,6 +248,9 @@ class SessionManager:
         """
         Create execution context from session.
         
+        The context shares the session's tenant snapshot, so Kernel data is
+        fetched once per session (and per TTL) rather than once per tool call.
+        
         Args:
             session: Session instance
             audit_logger: Audit logger instance
@@ -127,12 +258,18 @@ class SessionManager:
         Returns:
             ExecutionContext instance
         """
+        if session.tenant_snapshot is None:
+            session.tenant_snapshot = TenantSnapshot(tenant_id=session.tenant_id)
+        snapshot = session.tenant_snapshot
+        
         return ExecutionContext(
             user_id=session.user_id,
             tenant_id=session.tenant_id,
             user_role=session.user_role,
             user_scope=session.user_scope,
             session_id=session.session_id,
+            kernel_metadata=snapshot.kernel_metadata,
+            tenant_customizations=snapshot.tenant_customizations,
+            tenant_snapshot=snapshot,
             audit_logger=audit_logger,
         )
-
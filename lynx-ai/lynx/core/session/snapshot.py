@@ -0,0 +1,143 @@
+"""
+Tenant snapshot for Lynx AI.
+
+Per-session cache of Kernel data (tenant customizations and entity metadata)
+shared by every tool call in a run. Entries load lazily on first access,
+concurrent callers share a single in-flight Kernel request, and entries are
+refreshed once they are older than the configured TTL.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from lynx.config import Config
+
+
+# Key used for tenant customizations in the entry table
+_CUSTOMIZATIONS_KEY = "__tenant_customizations__"
+
+
+class TenantSnapshot:
+    """Lazily populated, TTL-bound snapshot of tenant data from the Kernel."""
+
+    def __init__(
+        self,
+        tenant_id: str,
+        ttl_seconds: Optional[float] = None,
+        client_factory: Optional[Callable[[str], Any]] = None,
+    ):
+        """
+        Initialize tenant snapshot.
+
+        Args:
+            tenant_id: Tenant ID (snapshot is tenant-scoped)
+            ttl_seconds: Refresh age in seconds (defaults to Config.TENANT_SNAPSHOT_TTL)
+            client_factory: Callable returning a Kernel client for a tenant
+                (defaults to create_kernel_client)
+        """
+        self.tenant_id = tenant_id
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else Config.TENANT_SNAPSHOT_TTL
+        self._client_factory = client_factory
+
+        # Exposed to ExecutionContext - updated in place on every load
+        self.tenant_customizations: Dict[str, Any] = {}
+        self.kernel_metadata: Dict[str, Any] = {}
+
+        self._loaded_at: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Number of Kernel round trips made by this snapshot
+        self.kernel_calls = 0
+
+    async def get_tenant_customizations(self) -> Dict[str, Any]:
+        """
+        Get tenant customizations, loading from the Kernel if missing or stale.
+
+        Returns:
+            Tenant customizations dictionary
+        """
+        return await self._get(_CUSTOMIZATIONS_KEY)
+
+    async def get_metadata(self, entity_type: str) -> Dict[str, Any]:
+        """
+        Get Kernel metadata for an entity type, loading if missing or stale.
+
+        Args:
+            entity_type: Entity type (e.g., "workflow", "vendor")
+
+        Returns:
+            Metadata dictionary
+        """
+        return await self._get(entity_type)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Mark cached entries as stale so the next access reloads them.
+
+        Args:
+            key: Entity type to invalidate (all entries if None)
+        """
+        if key is None:
+            self._loaded_at.clear()
+        else:
+            self._loaded_at.pop(key, None)
+
+    def _is_fresh(self, key: str) -> bool:
+        loaded_at = self._loaded_at.get(key)
+        return loaded_at is not None and time.monotonic() - loaded_at < self.ttl_seconds
+
+    def _cached(self, key: str) -> Dict[str, Any]:
+        if key == _CUSTOMIZATIONS_KEY:
+            return self.tenant_customizations
+        return self.kernel_metadata[key]
+
+    async def _get(self, key: str) -> Dict[str, Any]:
+        if self._is_fresh(key):
+            return self._cached(key)
+
+        # Single-flight: join an in-progress load for the same key
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(key)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load(self, key: str) -> Dict[str, Any]:
+        client = self._create_client()
+        try:
+            self.kernel_calls += 1
+            if key == _CUSTOMIZATIONS_KEY:
+                data = await client.get_tenant_customizations()
+                self.tenant_customizations.clear()
+                self.tenant_customizations.update(data)
+            else:
+                data = await client.get_metadata(key)
+                self.kernel_metadata[key] = data
+        finally:
+            await client.close()
+
+        self._loaded_at[key] = time.monotonic()
+        return self._cached(key)
+
+    def _create_client(self) -> Any:
+        if self._client_factory is not None:
+            return self._client_factory(self.tenant_id)
+        from lynx.integration.kernel import create_kernel_client
+        return create_kernel_client(tenant_id=self.tenant_id)
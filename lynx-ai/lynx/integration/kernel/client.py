@@ -8,6 +8,8 @@ import httpx
 from typing import Dict, Any, Optional
 import os
 
+from lynx.observability.tracing import get_tracer
+
 
 class KernelAPI:
     """Client for Kernel SSOT API."""
@@ -56,9 +58,7 @@ class KernelAPI:
         Returns:
             Metadata dictionary
         """
-        response = await self.client.get(f"/metadata/{entity_type}")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", f"/metadata/{entity_type}")
     
     async def get_schema(self, entity_type: str) -> Dict[str, Any]:
         """
@@ -70,9 +70,7 @@ class KernelAPI:
         Returns:
             Schema dictionary
         """
-        response = await self.client.get(f"/schema/{entity_type}")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", f"/schema/{entity_type}")
     
     async def check_permission(
         self,
@@ -91,7 +89,8 @@ class KernelAPI:
         Returns:
             Permission check result with "allowed" field
         """
-        response = await self.client.post(
+        return await self._request(
+            "POST",
             "/permissions/check",
             json={
                 "user_id": user_id,
@@ -100,8 +99,6 @@ class KernelAPI:
                 "resource_type": resource_type,
             },
         )
-        response.raise_for_status()
-        return response.json()
     
     async def get_tenant_customizations(self) -> Dict[str, Any]:
         """
@@ -110,9 +107,25 @@ class KernelAPI:
         Returns:
             Tenant customizations dictionary
         """
-        response = await self.client.get(f"/tenants/{self.tenant_id}/customizations")
-        response.raise_for_status()
-        return response.json()
+        return await self._request("GET", f"/tenants/{self.tenant_id}/customizations")
+    
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Send a request to Kernel and decode the JSON response (traced as "kernel.http").
+        
+        Args:
+            method: HTTP method
+            path: Request path
+            **kwargs: Extra arguments for httpx (e.g., json)
+        
+        Returns:
+            Decoded response body
+        """
+        with get_tracer().span("kernel.http", method=method, path=path, tenant_id=self.tenant_id) as span:
+            response = await self.client.request(method, path, **kwargs)
+            span.set_attribute("status_code", response.status_code)
+            response.raise_for_status()
+            return response.json()
     
     async def close(self):
         """Close the HTTP client."""
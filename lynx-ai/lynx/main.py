@@ -13,28 +13,33 @@ from lynx.core.registry import MCPToolRegistry
 from lynx.core.permissions import PermissionChecker
 from lynx.core.audit import AuditLogger
 from lynx.integration.kernel import KernelAPI
+from lynx.observability.logging import get_logger, setup_logging, shutdown_logging
+
+logger = get_logger(__name__)
 
 
 async def main():
     """Main application entry point."""
-    print("🚀 Starting Lynx AI...")
-    print("=" * 60)
+    setup_logging()
+    logger.info("Starting Lynx AI")
     
     # Load configuration
     try:
         config = load_config()
-        print("✅ Configuration loaded")
+        logger.info("Configuration loaded")
     except Exception as e:
-        print(f"❌ Failed to load configuration: {e}")
-        print("\n💡 Please:")
-        print("   1. Copy config/config.yaml.example to config/config.yaml")
-        print("   2. Set required environment variables")
+        logger.error(
+            "Failed to load configuration: %s "
+            "(copy config/config.yaml.example to config/config.yaml and set required environment variables)",
+            e,
+        )
+        shutdown_logging()
         sys.exit(1)
     
     # Initialize components
     session_manager = SessionManager()
     tool_registry = MCPToolRegistry()
-    print("✅ Core components initialized")
+    logger.info("Core components initialized")
     
     # Initialize audit logger
     try:
@@ -42,35 +47,30 @@ async def main():
             supabase_url=config["supabase"]["url"],
             supabase_key=config["supabase"]["key"],
         )
-        print("✅ Audit logger initialized")
+        logger.info("Audit logger initialized")
     except Exception as e:
-        print(f"⚠️  Audit logger initialization failed: {e}")
-        print("   Continuing without audit logging (not recommended for production)")
+        logger.warning(
+            "Audit logger initialization failed: %s - continuing without audit logging "
+            "(not recommended for production)",
+            e,
+        )
         audit_logger = None
     
     # Initialize MCP server and register tools
     try:
         from lynx.mcp.server import initialize_mcp_server
         initialize_mcp_server(tool_registry)
-        print("✅ MCP server initialized")
+        logger.info("MCP server initialized")
     except Exception as e:
-        print(f"⚠️  MCP server initialization failed: {e}")
-        print("   Some tools may not be available")
+        logger.warning("MCP server initialization failed: %s - some tools may not be available", e)
     
-    print("\n" + "=" * 60)
-    print("📋 Lynx AI Status:")
-    print(f"   ✅ Tools registered: {len(tool_registry.list_all())}")
-    print(f"   ✅ Domain MCPs: {len(tool_registry.list_by_layer('domain'))}")
-    print(f"   ✅ Cluster MCPs: {len(tool_registry.list_by_layer('cluster'))}")
-    print(f"   ✅ Cell MCPs: {len(tool_registry.list_by_layer('cell'))}")
-    print(f"   ✅ Active sessions: {len(session_manager.sessions)}")
-    print("\n💡 Next steps:")
-    print("   1. Complete Phase 1: Foundation + Governance")
-    print("   2. Implement remaining Domain MCPs")
-    print("   3. Implement Cluster MCPs")
-    print("   4. Implement Cell MCPs")
-    print("\n🔗 See docs/IMPLEMENTATION/IMPLEMENTATION-LYNX-001.md for details")
-    print("=" * 60)
+    logger.info("Lynx AI status", extra={
+        "tools_registered": len(tool_registry.list_all()),
+        "domain_tools": len(tool_registry.list_by_layer('domain')),
+        "cluster_tools": len(tool_registry.list_by_layer('cluster')),
+        "cell_tools": len(tool_registry.list_by_layer('cell')),
+        "active_sessions": len(session_manager.sessions),
+    })
 
 
 if __name__ == "__main__":
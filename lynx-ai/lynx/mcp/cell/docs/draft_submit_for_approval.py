@@ -11,7 +11,7 @@ from typing import Dict, Any
 from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.models import DraftStatus
-from lynx.storage.draft_storage import get_draft_storage
+from lynx.storage.draft_storage import DraftStatusConflictError, get_draft_storage
 from lynx.mcp.cell.execution.base import (
     validate_cell_execution,
     create_execution_record,
@@ -20,6 +20,15 @@ from lynx.mcp.cell.execution.base import (
 )
 
 
+# Error messages for drafts that are no longer in DRAFT status
+_SUBMIT_CONFLICT_MESSAGES = {
+    DraftStatus.CANCELLED: "Draft {draft_id} is cancelled and cannot be submitted",
+    DraftStatus.SUBMITTED: "Draft {draft_id} is already submitted",
+    DraftStatus.APPROVED: "Draft {draft_id} is already approved",
+    DraftStatus.REJECTED: "Draft {draft_id} is rejected and cannot be resubmitted without modification",
+}
+
+
 class DocsDraftSubmitInput(BaseModel):
     """Input schema for document draft submission."""
     draft_id: str = Field(description="Draft ID to submit for approval")
@@ -63,28 +72,27 @@ async def docs_draft_submit_for_approval_handler(
     """
     tool_id = "docs.cell.draft.submit_for_approval"
     
-    # Validate execution (draft exists, tenant match, status check)
-    # Note: For submit, we allow DRAFT status (not just APPROVED)
+    # Validate + transition in one step: DRAFT → SUBMITTED (compare-and-set),
+    # so concurrent submissions cannot both succeed
     draft_storage = get_draft_storage()
-    draft = await draft_storage.get_draft(input.draft_id, context.tenant_id)
+    try:
+        draft = await draft_storage.update_draft_status(
+            draft_id=input.draft_id,
+            tenant_id=context.tenant_id,
+            new_status=DraftStatus.SUBMITTED,
+            expected_status=DraftStatus.DRAFT,
+        )
+    except DraftStatusConflictError as e:
+        raise ValueError(_SUBMIT_CONFLICT_MESSAGES.get(
+            e.current_status,
+            f"Draft {{draft_id}} cannot be submitted (status: {e.current_status.value})",
+        ).format(draft_id=input.draft_id))
     
     if draft is None:
         raise ValueError(
             f"Draft {input.draft_id} not found or does not belong to tenant {context.tenant_id}"
         )
     
-    if draft.status == DraftStatus.CANCELLED:
-        raise ValueError(f"Draft {input.draft_id} is cancelled and cannot be submitted")
-    
-    if draft.status == DraftStatus.SUBMITTED:
-        raise ValueError(f"Draft {input.draft_id} is already submitted")
-    
-    if draft.status == DraftStatus.APPROVED:
-        raise ValueError(f"Draft {input.draft_id} is already approved")
-    
-    if draft.status == DraftStatus.REJECTED:
-        raise ValueError(f"Draft {input.draft_id} is rejected and cannot be resubmitted without modification")
-    
     # Create execution record (STARTED)
     execution = await create_execution_record(
         draft_id=input.draft_id,
@@ -93,9 +101,6 @@ async def docs_draft_submit_for_approval_handler(
     )
     
     try:
-        # Update draft status to SUBMITTED
-        draft.status = DraftStatus.SUBMITTED
-        
         # Complete execution (SUCCEEDED)
         execution = await complete_execution(
             execution_id=execution.execution_id,
@@ -7,7 +7,10 @@ This module defines the Cell Execution Protocol that all Cell MCPs must follow.
 from lynx.mcp.cell.execution.models import ExecutionRecord, ExecutionStatus
 from lynx.mcp.cell.execution.base import (
     validate_cell_execution,
+    validate_cell_execution_with_draft,
     create_execution_record,
+    build_execution_record,
+    record_failed_execution,
     complete_execution,
 )
 
@@ -15,7 +18,10 @@ __all__ = [
     "ExecutionRecord",
     "ExecutionStatus",
     "validate_cell_execution",
+    "validate_cell_execution_with_draft",
     "create_execution_record",
+    "build_execution_record",
+    "record_failed_execution",
     "complete_execution",
 ]
 
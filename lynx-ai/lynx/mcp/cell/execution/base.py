@@ -13,10 +13,11 @@ from datetime import datetime
 from uuid import uuid4
 
 from lynx.core.session import ExecutionContext
+from lynx.observability.logging import get_logger
 
 # Import models (separated to avoid circular imports)
 from lynx.mcp.cell.execution.models import ExecutionRecord, ExecutionStatus
-from lynx.mcp.cluster.drafts.models import DraftStatus
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus
 
 # Import storage (will use Supabase if available, otherwise in-memory)
 from lynx.storage.draft_storage import get_draft_storage
@@ -26,6 +27,8 @@ from lynx.storage.execution_storage import get_execution_storage
 # ExecutionStorage is now imported from lynx.storage.execution_storage
 # This maintains backward compatibility while allowing Supabase backend
 
+logger = get_logger(__name__)
+
 
 async def check_draft_already_executed(
     draft_id: str,
@@ -52,6 +55,7 @@ async def check_draft_already_executed(
         draft_id=draft_id,
         tool_id=tool_id,
         status=ExecutionStatus.SUCCEEDED,
+        limit=1,
     )
     
     if executions:
@@ -68,12 +72,46 @@ async def validate_cell_execution(
     """
     Validate that a Cell execution is allowed.
     
+    Same checks as validate_cell_execution_with_draft(), without returning
+    the draft.
+    
+    Args:
+        draft_id: Draft ID to validate
+        context: Execution context
+        tool_id: Cell MCP tool ID
+        allow_bypass: Whether to allow policy bypass (default: False)
+    
+    Returns:
+        Tuple of (is_valid, error_message, bypass_info)
+    """
+    is_valid, error_message, bypass_info, _ = await validate_cell_execution_with_draft(
+        draft_id=draft_id,
+        context=context,
+        tool_id=tool_id,
+        allow_bypass=allow_bypass,
+    )
+    return is_valid, error_message, bypass_info
+
+
+async def validate_cell_execution_with_draft(
+    draft_id: str,
+    context: ExecutionContext,
+    tool_id: str,
+    allow_bypass: bool = False,
+) -> tuple[bool, Optional[str], Optional[Dict[str, Any]], Optional[DraftProtocol]]:
+    """
+    Validate that a Cell execution is allowed and return the loaded draft.
+    
     This enforces the Cell Execution Protocol invariants:
     1. Draft exists & tenant match
     2. Draft status is APPROVED (or bypass allowed)
     3. Permissions pass (checked externally)
     4. Policy passes (checked externally)
     
+    The draft and its successful execution (exactly-once check) are read
+    in one storage call; handlers should use the returned draft instead of
+    reading it again.
+    
     Args:
         draft_id: Draft ID to validate
         context: Execution context
@@ -81,36 +119,35 @@ async def validate_cell_execution(
         allow_bypass: Whether to allow policy bypass (default: False)
     
     Returns:
-        Tuple of (is_valid, error_message, bypass_info)
+        Tuple of (is_valid, error_message, bypass_info, draft)
         - is_valid: True if execution is allowed
         - error_message: Error message if validation fails
         - bypass_info: Bypass information if bypass is used
+        - draft: The draft (None if not found)
     """
-    # 1. Draft exists & tenant match
+    # 1. Draft exists & tenant match (+ existing successful execution, same call)
     draft_storage = get_draft_storage()
-    draft = await draft_storage.get_draft(draft_id, context.tenant_id)
+    draft, existing_execution_id = await draft_storage.get_draft_for_execution(
+        draft_id=draft_id,
+        tenant_id=context.tenant_id,
+        tool_id=tool_id,
+    )
     
     if draft is None:
-        return False, f"Draft {draft_id} not found or does not belong to tenant {context.tenant_id}", None
+        return False, f"Draft {draft_id} not found or does not belong to tenant {context.tenant_id}", None, None
     
     # Check draft status
     if draft.status == DraftStatus.CANCELLED:
-        return False, f"Draft {draft_id} is cancelled and cannot be executed", None
+        return False, f"Draft {draft_id} is cancelled and cannot be executed", None, draft
     
     # Check if draft already executed (exactly-once semantics)
     # This must be checked BEFORE approval check, because executed drafts have status PUBLISHED/EXECUTED
-    existing_execution_id = await check_draft_already_executed(
-        draft_id=draft_id,
-        tool_id=tool_id,
-        tenant_id=context.tenant_id,
-    )
-    
     if existing_execution_id:
-        return False, f"Draft {draft_id} has already been successfully executed by {tool_id} (execution_id: {existing_execution_id})", None
+        return False, f"Draft {draft_id} has already been successfully executed by {tool_id} (execution_id: {existing_execution_id})", None, draft
     
     # Also check if draft status indicates it's already been executed
     if draft.status in [DraftStatus.PUBLISHED, DraftStatus.EXECUTED]:
-        return False, f"Draft {draft_id} has already been executed (status: {draft.status.value})", None
+        return False, f"Draft {draft_id} has already been executed (status: {draft.status.value})", None, draft
     
     # 2. Draft status is APPROVED (or bypass allowed)
     if draft.status != DraftStatus.APPROVED:
@@ -122,11 +159,42 @@ async def validate_cell_execution(
                 "bypass_timestamp": datetime.now().isoformat(),
                 "bypass_policy_reference": f"tool:{tool_id}:allow_bypass",
             }
-            return True, None, bypass_info
+            return True, None, bypass_info, draft
         else:
-            return False, f"Draft {draft_id} is not approved (status: {draft.status.value})", None
+            return False, f"Draft {draft_id} is not approved (status: {draft.status.value})", None, draft
+    
+    return True, None, None, draft
+
+
+async def release_draft_claim(
+    draft_id: str,
+    context: ExecutionContext,
+    claimed_status: DraftStatus,
+    previous_status: DraftStatus,
+) -> None:
+    """
+    Undo a compare-and-set claim after a failed Cell execution.
     
-    return True, None, None
+    Never raises: the caller is already handling the original failure.
+    
+    Args:
+        draft_id: Draft ID
+        context: Execution context
+        claimed_status: Status set by the claim (e.g., EXECUTED)
+        previous_status: Status to restore (e.g., APPROVED)
+    """
+    try:
+        await get_draft_storage().update_draft_status(
+            draft_id=draft_id,
+            tenant_id=context.tenant_id,
+            new_status=previous_status,
+            expected_status=claimed_status,
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to release draft claim: %s", e,
+            extra={"draft_id": draft_id, "tenant_id": context.tenant_id},
+        )
 
 
 async def create_execution_record(
@@ -151,20 +219,101 @@ async def create_execution_record(
     """
     storage = get_execution_storage()
     
-    execution = ExecutionRecord(
+    execution = build_execution_record(
+        draft_id=draft_id,
+        tool_id=tool_id,
+        context=context,
+        status=ExecutionStatus.STARTED,
+        request_id=request_id,
+        source_context=source_context,
+    )
+    
+    return await storage.create_execution(execution)
+
+
+def build_execution_record(
+    draft_id: str,
+    tool_id: str,
+    context: ExecutionContext,
+    status: ExecutionStatus,
+    result_payload: Optional[Dict[str, Any]] = None,
+    error_message: Optional[str] = None,
+    rollback_instructions: Optional[Dict[str, Any]] = None,
+    request_id: Optional[str] = None,
+    source_context: Optional[Dict[str, Any]] = None,
+) -> ExecutionRecord:
+    """
+    Build an execution record without storing it.
+    
+    Records in a final status (anything but STARTED) get completed_at set,
+    so they can be written once instead of created and then completed.
+    
+    Args:
+        draft_id: Source draft ID
+        tool_id: Cell MCP tool ID
+        context: Execution context
+        status: Execution status
+        result_payload: Execution result payload
+        error_message: Error message (if failed)
+        rollback_instructions: Rollback plan (if applicable)
+        request_id: Request ID for idempotency
+        source_context: Snapshot of relevant Domain/Cluster reads and policy checks
+    
+    Returns:
+        Unsaved ExecutionRecord
+    """
+    now = datetime.now().isoformat()
+    return ExecutionRecord(
         execution_id=str(uuid4()),
         draft_id=draft_id,
         tool_id=tool_id,
         tenant_id=context.tenant_id,
         actor_id=context.user_id,
-        status=ExecutionStatus.STARTED,
-        result_payload={},
-        created_at=datetime.now().isoformat(),
+        status=status,
+        result_payload=result_payload or {},
+        created_at=now,
+        completed_at=None if status == ExecutionStatus.STARTED else now,
+        error_message=error_message,
+        rollback_instructions=rollback_instructions,
         request_id=request_id,
         source_context=source_context or {},
     )
+
+
+async def record_failed_execution(
+    draft_id: str,
+    tool_id: str,
+    context: ExecutionContext,
+    error_message: str,
+    rollback_instructions: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Store a FAILED execution record in one write.
     
-    return await storage.create_execution(execution)
+    Used after a failed unit-of-work commit, which wrote nothing. Never
+    raises: the caller is already handling the original failure.
+    
+    Args:
+        draft_id: Source draft ID
+        tool_id: Cell MCP tool ID
+        context: Execution context
+        error_message: Error message
+        rollback_instructions: Rollback plan (if applicable)
+    """
+    try:
+        await get_execution_storage().create_execution(build_execution_record(
+            draft_id=draft_id,
+            tool_id=tool_id,
+            context=context,
+            status=ExecutionStatus.FAILED,
+            error_message=error_message,
+            rollback_instructions=rollback_instructions,
+        ))
+    except Exception as e:
+        logger.warning(
+            "Failed to record failed execution: %s", e,
+            extra={"draft_id": draft_id, "tenant_id": context.tenant_id},
+        )
 
 
 async def complete_execution(
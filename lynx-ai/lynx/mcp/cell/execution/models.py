@@ -5,7 +5,7 @@ Core models for the Execution Protocol (separated to avoid circular imports).
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Sequence
 from enum import Enum
 
 
@@ -58,3 +58,42 @@ class ExecutionRecord(BaseModel):
         description="Snapshot of relevant Domain/Cluster reads and policy checks at execution time"
     )
 
+
+class ExecutionSummary(BaseModel):
+    """
+    Execution listing row - summary columns only (no result payload,
+    rollback instructions or source context).
+    
+    Fields other than execution_id are None when a projection left them out.
+    """
+    execution_id: str = Field(description="Unique execution identifier")
+    draft_id: Optional[str] = Field(default=None, description="Source draft ID")
+    tool_id: Optional[str] = Field(default=None, description="Cell MCP tool ID")
+    tenant_id: Optional[str] = Field(default=None, description="Tenant ID")
+    actor_id: Optional[str] = Field(default=None, description="User ID who executed")
+    status: Optional[ExecutionStatus] = Field(default=None, description="Execution status")
+    created_at: Optional[str] = Field(default=None, description="Creation timestamp (ISO format)")
+    completed_at: Optional[str] = Field(default=None, description="Completion timestamp (ISO format)")
+    error_message: Optional[str] = Field(default=None, description="Error message (if failed)")
+    request_id: Optional[str] = Field(default=None, description="Request ID for idempotency")
+    
+    @classmethod
+    def columns(cls, fields: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Columns to select for a projection.
+        
+        Args:
+            fields: Summary fields to fetch (None = all; execution_id is always included)
+        
+        Returns:
+            Column names, in model order
+        
+        Raises:
+            ValueError: If a field is not a summary field
+        """
+        if fields is None:
+            return list(cls.model_fields)
+        unknown = set(fields) - set(cls.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown execution summary field(s): {', '.join(sorted(unknown))}")
+        return [name for name in cls.model_fields if name == "execution_id" or name in fields]
@@ -6,18 +6,20 @@ Layer: cell
 Risk: high
 """
 
+from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional
 from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
-from lynx.mcp.cluster.drafts.base import get_draft_storage, DraftStatus
+from lynx.mcp.cluster.drafts.base import DraftStatus
 from lynx.mcp.cell.execution.base import (
-    validate_cell_execution,
-    create_execution_record,
-    complete_execution,
+    validate_cell_execution_with_draft,
+    build_execution_record,
+    record_failed_execution,
     ExecutionStatus,
 )
-from lynx.storage.settlement_storage import SettlementIntent, get_settlement_storage
+from lynx.storage.cell_execution_unit import get_cell_execution_unit
+from lynx.storage.settlement_storage import SettlementIntent
 
 
 # SettlementIntent is now imported from lynx.storage.settlement_storage
@@ -57,6 +59,7 @@ async def vpm_payment_execute_handler(
     - Sets payment status to pending_settlement
     - Creates settlement intent object
     - Creates execution record
+    - Commits draft status, execution record and settlement intent atomically
     - Logs audit events
     
     Note: This is internal-only execution. No bank API integration.
@@ -75,7 +78,7 @@ async def vpm_payment_execute_handler(
     tool_id = "vpm.cell.payment.execute"
     
     # Validate execution (draft exists, tenant match, status APPROVED, not already executed)
-    is_valid, error_message, bypass_info = await validate_cell_execution(
+    is_valid, error_message, bypass_info, draft = await validate_cell_execution_with_draft(
         draft_id=input.draft_id,
         context=context,
         tool_id=tool_id,
@@ -85,12 +88,6 @@ async def vpm_payment_execute_handler(
     if not is_valid:
         raise ValueError(error_message)
     
-    # Get draft
-    draft_storage = get_draft_storage()
-    draft = await draft_storage.get_draft(input.draft_id, context.tenant_id)
-    if draft is None:
-        raise ValueError(f"Draft {input.draft_id} not found")
-    
     # Validate vendor is active (from draft payload)
     vendor_snapshot = draft.payload.get("vendor_snapshot", {})
     if vendor_snapshot.get("status") != "active":
@@ -113,71 +110,73 @@ async def vpm_payment_execute_handler(
     # Note: High-risk payments should have been flagged in draft creation
     # Here we just ensure the draft was approved with full knowledge of risk
     
-    # Create execution record (STARTED)
-    execution = await create_execution_record(
+    # Create internal payment_id
+    # In production, this would create a payment record in the database
+    payment_id = f"payment-{draft.draft_id[:8]}-{context.tenant_id[:8]}"
+    
+    # Create settlement intent object
+    now = datetime.now().isoformat()
+    settlement_intent = SettlementIntent(
+        payment_id=payment_id,
+        settlement_status="queued",
+        provider="none",  # No bank integration yet
+        tenant_id=context.tenant_id,
+        created_at=now,
+        updated_at=now,
+    )
+    
+    # Execution record (SUCCEEDED), written together with its side effects
+    execution = build_execution_record(
         draft_id=input.draft_id,
         tool_id=tool_id,
         context=context,
+        status=ExecutionStatus.SUCCEEDED,
+        result_payload={
+            "draft_id": input.draft_id,
+            "payment_id": payment_id,
+            "old_status": "approved",
+            "new_status": "executed",
+            "payment_status": "pending_settlement",
+            "vendor_id": vendor_snapshot.get("vendor_id"),
+            "amount": amount,
+            "currency": draft.payload.get("currency", "USD"),
+            "settlement_intent": settlement_intent.model_dump(),
+        },
     )
     
     try:
-        # Create internal payment_id
-        # In production, this would create a payment record in the database
-        payment_id = f"payment-{draft.draft_id[:8]}-{context.tenant_id[:8]}"
-        
-        # Create settlement intent object
-        settlement_storage = get_settlement_storage()
-        settlement_intent = SettlementIntent(
-            payment_id=payment_id,
-            settlement_status="queued",
-            provider="none",  # No bank integration yet
-            tenant_id=context.tenant_id,
-        )
-        
-        # Store settlement intent
-        await settlement_storage.create_intent(settlement_intent)
-        
-        # Update draft status to EXECUTED
-        draft.status = DraftStatus.EXECUTED
-        
-        # Complete execution (SUCCEEDED)
-        execution = await complete_execution(
-            execution_id=execution.execution_id,
-            status=ExecutionStatus.SUCCEEDED,
-            result_payload={
-                "draft_id": input.draft_id,
-                "payment_id": payment_id,
-                "old_status": "approved",
-                "new_status": "executed",
-                "payment_status": "pending_settlement",
-                "vendor_id": vendor_snapshot.get("vendor_id"),
-                "amount": amount,
-                "currency": draft.payload.get("currency", "USD"),
-                "settlement_intent": settlement_intent.model_dump(),
-            },
-        )
-        
-        return VPMPaymentExecuteOutput(
-            execution_id=execution.execution_id,
-            draft_id=input.draft_id,
-            payment_id=payment_id,
-            status="pending_settlement",
+        # One atomic commit: draft APPROVED → EXECUTED (compare-and-set),
+        # execution record and settlement intent. A concurrent execution
+        # loses the compare-and-set and nothing of it is written.
+        execution = await get_cell_execution_unit().commit(
+            draft=draft,
+            execution=execution,
+            expected_status=DraftStatus.APPROVED,
+            new_status=DraftStatus.EXECUTED,
             settlement_intent=settlement_intent,
-            tenant_id=context.tenant_id,
         )
     except Exception as e:
-        # Complete execution (FAILED)
-        await complete_execution(
-            execution_id=execution.execution_id,
-            status=ExecutionStatus.FAILED,
-            result_payload={},
+        # Nothing was committed; keep an audit trail of the failed attempt
+        await record_failed_execution(
+            draft_id=input.draft_id,
+            tool_id=tool_id,
+            context=context,
             error_message=str(e),
             rollback_instructions={
                 "action": "revert_payment_creation",
-                "payment_id": payment_id if 'payment_id' in locals() else None,
+                "payment_id": payment_id,
             },
         )
         raise
+    
+    return VPMPaymentExecuteOutput(
+        execution_id=execution.execution_id,
+        draft_id=input.draft_id,
+        payment_id=payment_id,
+        status="pending_settlement",
+        settlement_intent=settlement_intent,
+        tenant_id=context.tenant_id,
+    )
 
 
 # Register the tool
@@ -13,9 +13,10 @@ from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.models import DraftStatus
 from lynx.storage.draft_storage import get_draft_storage
 from lynx.mcp.cell.execution.base import (
-    validate_cell_execution,
+    validate_cell_execution_with_draft,
     create_execution_record,
     complete_execution,
+    release_draft_claim,
     ExecutionStatus,
 )
 
@@ -66,7 +67,7 @@ async def workflow_draft_publish_handler(
     tool_id = "workflow.cell.draft.publish"
     
     # Validate execution (draft exists, tenant match, status APPROVED, not already executed)
-    is_valid, error_message, bypass_info = await validate_cell_execution(
+    is_valid, error_message, bypass_info, draft = await validate_cell_execution_with_draft(
         draft_id=input.draft_id,
         context=context,
         tool_id=tool_id,
@@ -76,11 +77,7 @@ async def workflow_draft_publish_handler(
     if not is_valid:
         raise ValueError(error_message)
     
-    # Get draft
     draft_storage = get_draft_storage()
-    draft = await draft_storage.get_draft(input.draft_id, context.tenant_id)
-    if draft is None:
-        raise ValueError(f"Draft {input.draft_id} not found")
     
     # Create execution record (STARTED)
     execution = await create_execution_record(
@@ -89,15 +86,25 @@ async def workflow_draft_publish_handler(
         context=context,
     )
     
+    claimed = False
     try:
+        # Claim the draft: APPROVED → PUBLISHED (compare-and-set), so a
+        # concurrent publish of the same draft fails here
+        draft = await draft_storage.update_draft_status(
+            draft_id=input.draft_id,
+            tenant_id=context.tenant_id,
+            new_status=DraftStatus.PUBLISHED,
+            expected_status=DraftStatus.APPROVED,
+        )
+        if draft is None:
+            raise ValueError(f"Draft {input.draft_id} not found")
+        claimed = True
+        
         # Convert workflow draft → published workflow record
         # In production, this would create a workflow record in the database
         # For now, we generate a workflow_id and store it in execution result
         workflow_id = f"workflow-{draft.draft_id[:8]}-{context.tenant_id[:8]}"
         
-        # Update draft status to PUBLISHED
-        draft.status = DraftStatus.PUBLISHED
-        
         # Complete execution (SUCCEEDED)
         execution = await complete_execution(
             execution_id=execution.execution_id,
@@ -120,6 +127,10 @@ async def workflow_draft_publish_handler(
             tenant_id=context.tenant_id,
         )
     except Exception as e:
+        if claimed:
+            # Release the claim so the draft can be published again
+            await release_draft_claim(input.draft_id, context, DraftStatus.PUBLISHED, DraftStatus.APPROVED)
+        
         # Complete execution (FAILED)
         await complete_execution(
             execution_id=execution.execution_id,
@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -39,13 +40,17 @@ class BatchDocsDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class BatchDocsDraftOutput(BaseModel):
     """Output schema for batch docs draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with batch summary")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with batch summary (if include_preview)")
     batch_summary: Dict[str, Any] = Field(description="Batch summary (count, doc_types, etc.)")
     next_actions: List[str] = Field(description="Next actions")
     tenant_id: str = Field(description="Tenant ID")
@@ -150,44 +155,8 @@ async def batch_docs_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        requests_list = "\n".join([
-            f"{i+1}. **{req.title}** ({req.doc_type})"
-            for i, req in enumerate(input.requests)
-        ])
-        
-        doc_types_summary = ", ".join([
-            f"{count}x {doc_type}"
-            for doc_type, count in sorted(doc_type_counts.items())
-        ])
-        
-        preview_markdown = f"""# Batch Document Request: {input.batch_name}
-
-**Batch Size:** {len(input.requests)} documents
-**Status:** Draft
-**Created:** {draft.created_at}
-**Created By:** {context.user_id}
-
-## Document Types
-
-{doc_types_summary}
-
-## Document Requests
-
-{requests_list}
-
-## Shared References
-
-{chr(10).join(f"- {ref}" for ref in (input.source_refs or [])) if input.source_refs else "- No shared references"}
-
-## Risk Assessment
-
-- **Risk Level:** {risk_level}
-- **Recommended Approvers:** {', '.join(recommended_approvers) or 'None'}
-
----
-*This is a batch draft. Submit for approval to process all documents.*
-"""
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
         # Build batch summary
         batch_summary = {
@@ -215,6 +184,53 @@ async def batch_docs_draft_create_handler(
             await kernel_api.close()
 
 
+def render_batch_docs_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a batch docs draft."""
+    payload = draft.payload
+    source_refs = payload.get("source_refs") or []
+    
+    requests_list = "\n".join([
+        f"{i+1}. **{req['title']}** ({req['doc_type']})"
+        for i, req in enumerate(payload["requests"])
+    ])
+    
+    doc_types_summary = ", ".join([
+        f"{count}x {doc_type}"
+        for doc_type, count in sorted(payload["doc_type_counts"].items())
+    ])
+    
+    return f"""# Batch Document Request: {payload['batch_name']}
+
+**Batch Size:** {payload['batch_size']} documents
+**Status:** Draft
+**Created:** {draft.created_at}
+**Created By:** {draft.created_by}
+
+## Document Types
+
+{doc_types_summary}
+
+## Document Requests
+
+{requests_list}
+
+## Shared References
+
+{chr(10).join(f"- {ref}" for ref in source_refs) if source_refs else "- No shared references"}
+
+## Risk Assessment
+
+- **Risk Level:** {draft.risk_level}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers) or 'None'}
+
+---
+*This is a batch draft. Submit for approval to process all documents.*
+"""
+
+
+register_preview_renderer("docs_batch", render_batch_docs_draft_preview)
+
+
 # Register the tool
 def register_batch_docs_draft_create_tool(registry) -> None:
     """Register the docs.cluster.batch.draft.create tool."""
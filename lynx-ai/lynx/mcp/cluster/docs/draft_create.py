@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -37,13 +38,17 @@ class DocsDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class DocsDraftOutput(BaseModel):
     """Output schema for docs draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown content")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown content (if include_preview)")
     diff_summary: Optional[str] = Field(description="Diff summary (if applicable)")
     next_actions: List[str] = Field(description="Next actions (submit-for-approval, edit, cancel)")
     tenant_id: str = Field(description="Tenant ID")
@@ -145,25 +150,8 @@ async def docs_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        preview_markdown = f"""# {input.title}
-
-**Document Type:** {input.doc_type}
-**Status:** Draft
-**Created:** {draft.created_at}
-**Created By:** {context.user_id}
-
-## Content Outline
-
-{input.content_outline or "No outline provided"}
-
-## Source References
-
-{chr(10).join(f"- {ref}" for ref in (input.source_refs or [])) if input.source_refs else "- No references"}
-
----
-*This is a draft. Submit for approval to publish.*
-"""
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
         # Generate diff summary (if applicable)
         diff_summary = None
@@ -188,6 +176,34 @@ async def docs_draft_create_handler(
             await kernel_api.close()
 
 
+def render_docs_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a docs draft."""
+    payload = draft.payload
+    source_refs = payload.get("source_refs") or []
+    
+    return f"""# {payload['title']}
+
+**Document Type:** {payload['doc_type']}
+**Status:** Draft
+**Created:** {draft.created_at}
+**Created By:** {draft.created_by}
+
+## Content Outline
+
+{payload.get('content_outline') or "No outline provided"}
+
+## Source References
+
+{chr(10).join(f"- {ref}" for ref in source_refs) if source_refs else "- No references"}
+
+---
+*This is a draft. Submit for approval to publish.*
+"""
+
+
+register_preview_renderer("docs", render_docs_draft_preview)
+
+
 # Register the tool
 def register_docs_draft_create_tool(registry) -> None:
     """Register the docs.cluster.draft.create tool."""
@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -38,13 +39,17 @@ class DocsMessageDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class DocsMessageDraftOutput(BaseModel):
     """Output schema for docs message draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with message content")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with message content (if include_preview)")
     recipient_summary: Dict[str, Any] = Field(description="Recipient summary")
     next_actions: List[str] = Field(description="Next actions")
     tenant_id: str = Field(description="Tenant ID")
@@ -148,49 +153,8 @@ async def message_docs_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        recipients_list = "\n".join([
-            f"- {recipient_id}"
-            for recipient_id in input.recipient_ids
-        ])
-        
-        linked_doc_section = ""
-        if input.linked_document_id:
-            linked_doc_section = f"""
-## Linked Document
-
-- **Document ID:** {input.linked_document_id}
-"""
-        
-        preview_markdown = f"""# Document Message Draft
-
-**Message Type:** {input.message_type}
-**Priority:** {input.priority}
-**Status:** Draft
-**Created:** {draft.created_at}
-**Created By:** {context.user_id}
-
-## Recipients
-
-{recipients_list}
-
-## Subject
-
-{input.subject}
-
-## Body
-
-{input.body}
-{linked_doc_section}
-## Risk Assessment
-
-- **Risk Level:** {risk_level}
-- **Recipient Count:** {len(input.recipient_ids)}
-- **Recommended Approvers:** {', '.join(recommended_approvers) or 'None'}
-
----
-*This is a message draft. Submit for approval to send.*
-"""
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
         # Build recipient summary
         recipient_summary = {
@@ -218,6 +182,57 @@ async def message_docs_draft_create_handler(
             await kernel_api.close()
 
 
+def render_message_docs_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a docs message draft."""
+    payload = draft.payload
+    
+    recipients_list = "\n".join([
+        f"- {recipient_id}"
+        for recipient_id in payload["recipient_ids"]
+    ])
+    
+    linked_doc_section = ""
+    if payload.get("linked_document_id"):
+        linked_doc_section = f"""
+## Linked Document
+
+- **Document ID:** {payload['linked_document_id']}
+"""
+    
+    return f"""# Document Message Draft
+
+**Message Type:** {payload['message_type']}
+**Priority:** {payload['priority']}
+**Status:** Draft
+**Created:** {draft.created_at}
+**Created By:** {draft.created_by}
+
+## Recipients
+
+{recipients_list}
+
+## Subject
+
+{payload['subject']}
+
+## Body
+
+{payload['body']}
+{linked_doc_section}
+## Risk Assessment
+
+- **Risk Level:** {draft.risk_level}
+- **Recipient Count:** {len(payload['recipient_ids'])}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers) or 'None'}
+
+---
+*This is a message draft. Submit for approval to send.*
+"""
+
+
+register_preview_renderer("docs_message", render_message_docs_draft_preview)
+
+
 # Register the tool
 def register_message_docs_draft_create_tool(registry) -> None:
     """Register the docs.cluster.message.draft.create tool."""
@@ -52,7 +52,63 @@ async def create_draft(
     """
     storage = get_draft_storage()
     
-    draft = DraftProtocol(
+    draft = _build_draft(
+        tenant_id=tenant_id,
+        draft_type=draft_type,
+        payload=payload,
+        created_by=created_by,
+        source_context=source_context,
+        risk_level=risk_level,
+        recommended_approvers=recommended_approvers,
+        request_id=request_id,
+    )
+    
+    return await storage.create_draft(draft)
+
+
+async def create_drafts(
+    tenant_id: str,
+    created_by: str,
+    items: List[Dict[str, Any]],
+) -> List[DraftProtocol]:
+    """
+    Create many drafts following the Draft Protocol in one storage call.
+    
+    Use this instead of gathering create_draft() calls: storage writes the
+    whole batch in one statement while keeping per-item idempotency.
+    
+    Args:
+        tenant_id: Tenant ID
+        created_by: User ID who created the drafts
+        items: One dict per draft with create_draft() arguments
+            (draft_type, payload, source_context, and optionally
+            risk_level, recommended_approvers, request_id)
+    
+    Returns:
+        Created (or, for repeated request_ids, existing) drafts in input order
+    """
+    storage = get_draft_storage()
+    
+    drafts = [
+        _build_draft(tenant_id=tenant_id, created_by=created_by, **item)
+        for item in items
+    ]
+    
+    return await storage.create_drafts_bulk(drafts)
+
+
+def _build_draft(
+    tenant_id: str,
+    draft_type: str,
+    payload: Dict[str, Any],
+    created_by: str,
+    source_context: Dict[str, Any],
+    risk_level: str = "medium",
+    recommended_approvers: Optional[List[str]] = None,
+    request_id: Optional[str] = None,
+) -> DraftProtocol:
+    """Build a new DraftProtocol instance (status = draft)."""
+    return DraftProtocol(
         draft_id=str(uuid4()),
         tenant_id=tenant_id,
         draft_type=draft_type,
@@ -65,6 +121,3 @@ async def create_draft(
         recommended_approvers=recommended_approvers or [],
         request_id=request_id,
     )
-    
-    return await storage.create_draft(draft)
-
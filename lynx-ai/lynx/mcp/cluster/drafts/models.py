@@ -5,7 +5,7 @@ Core models for the Draft Protocol (separated to avoid circular imports).
 """
 
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from enum import Enum
 
 
@@ -50,3 +50,49 @@ class DraftProtocol(BaseModel):
         description="Request ID for idempotency"
     )
 
+
+class DraftSummary(BaseModel):
+    """
+    Draft listing row - summary columns only (no payload or source context).
+    
+    Fields other than draft_id are None when a projection left them out.
+    """
+    draft_id: str = Field(description="Unique draft identifier")
+    tenant_id: Optional[str] = Field(default=None, description="Tenant ID")
+    draft_type: Optional[str] = Field(default=None, description="Draft type (docs|workflow|vpm_payment)")
+    status: Optional[DraftStatus] = Field(default=None, description="Draft status")
+    risk_level: Optional[str] = Field(default=None, description="Risk level (low|medium|high)")
+    created_by: Optional[str] = Field(default=None, description="User ID who created the draft")
+    created_at: Optional[str] = Field(default=None, description="Creation timestamp (ISO format)")
+    request_id: Optional[str] = Field(default=None, description="Request ID for idempotency")
+    
+    @classmethod
+    def columns(cls, fields: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Columns to select for a projection.
+        
+        Args:
+            fields: Summary fields to fetch (None = all; draft_id is always included)
+        
+        Returns:
+            Column names, in model order
+        
+        Raises:
+            ValueError: If a field is not a summary field
+        """
+        if fields is None:
+            return list(cls.model_fields)
+        unknown = set(fields) - set(cls.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown draft summary field(s): {', '.join(sorted(unknown))}")
+        return [name for name in cls.model_fields if name == "draft_id" or name in fields]
+
+
+class DraftTransitionResult(BaseModel):
+    """Per-draft outcome of a bulk status transition."""
+    draft_id: str = Field(description="Draft ID")
+    outcome: str = Field(description="Outcome (updated|conflict|not_found)")
+    status: Optional[DraftStatus] = Field(
+        default=None,
+        description="Status after the call (None if the draft was not found)"
+    )
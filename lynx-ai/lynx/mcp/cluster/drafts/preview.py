@@ -0,0 +1,88 @@
+"""
+Draft previews - preview_markdown rendered on demand per draft_type.
+
+Each Cluster MCP registers a renderer for its draft_type that builds the
+preview from the stored draft (payload plus draft metadata), instead of
+formatting it on every create call. Previews are rendered only when asked
+for and memoized by draft_id and payload hash, so idempotent replays and
+repeated reads of an unchanged draft reuse the rendered markdown.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from lynx.config import Config
+from lynx.mcp.cluster.drafts.models import DraftProtocol
+
+PreviewRenderer = Callable[[DraftProtocol], str]
+
+# draft_type -> renderer
+_renderers: Dict[str, PreviewRenderer] = {}
+
+# (draft_id, payload hash) -> rendered markdown (LRU)
+_previews: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def register_preview_renderer(draft_type: str, renderer: PreviewRenderer) -> None:
+    """
+    Register the preview renderer for a draft type.
+    
+    Args:
+        draft_type: Draft type (e.g., "docs", "vpm_payment")
+        renderer: Function rendering preview markdown from a stored draft
+    """
+    _renderers[draft_type] = renderer
+
+
+def get_preview_renderer(draft_type: str) -> Optional[PreviewRenderer]:
+    """Get the registered preview renderer for a draft type (None if not registered)."""
+    return _renderers.get(draft_type)
+
+
+def payload_hash(payload: Dict[str, Any]) -> str:
+    """Hash a payload independently of key order (JSONB does not keep it)."""
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def render_preview(draft: DraftProtocol) -> Optional[str]:
+    """
+    Render a draft's preview markdown (memoized).
+    
+    Args:
+        draft: Stored draft
+    
+    Returns:
+        Preview markdown, or None if no renderer is registered for the draft type
+    """
+    renderer = _renderers.get(draft.draft_type)
+    if renderer is None:
+        return None
+    
+    key = (draft.draft_id, payload_hash(draft.payload))
+    with _lock:
+        preview = _previews.get(key)
+        if preview is not None:
+            _previews.move_to_end(key)
+            return preview
+    
+    preview = renderer(draft)
+    
+    max_entries = Config.DRAFT_PREVIEW_CACHE_SIZE
+    if max_entries > 0:
+        with _lock:
+            _previews[key] = preview
+            while len(_previews) > max_entries:
+                _previews.popitem(last=False)
+    
+    return preview
+
+
+def clear_preview_cache() -> None:
+    """Drop all memoized previews."""
+    with _lock:
+        _previews.clear()
@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -33,13 +34,17 @@ class PortalConfigDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class PortalConfigDraftOutput(BaseModel):
     """Output schema for portal config draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with config changes")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with config changes (if include_preview)")
     risk_level: str = Field(description="Risk level")
     recommended_approvers: List[str] = Field(description="Recommended approver roles")
     config_summary: Dict[str, Any] = Field(description="Configuration summary")
@@ -169,53 +174,8 @@ async def portal_config_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        config_sections_list = "\n".join([
-            f"### {section_name}\n```json\n{str(section_config)}\n```"
-            for section_name, section_config in input.config_sections.items()
-        ])
-        
-        changes_summary = []
-        if has_routing_changes:
-            changes_summary.append("Routing changes")
-        if has_permission_changes:
-            changes_summary.append("Permission changes")
-        if has_integration_changes:
-            changes_summary.append("Integration changes")
-        if has_security_changes:
-            changes_summary.append("Security changes")
-        
-        changes_section = ""
-        if changes_summary:
-            changes_section = f"""
-## Change Summary
-
-{chr(10).join(f"- {change}" for change in changes_summary)}
-"""
-        
-        preview_markdown = f"""# Portal Configuration Draft
-
-**Portal ID:** {input.portal_id}
-**Config Version:** {input.config_version or 'Not specified'}
-**Status:** Draft
-**Created:** {draft.created_at}
-**Created By:** {context.user_id}
-
-{input.description or 'No description provided'}
-{changes_section}
-## Configuration Sections
-
-{config_sections_list}
-
-## Approval Requirements
-
-- **Risk Level:** {risk_level}
-- **Recommended Approvers:** {', '.join(recommended_approvers) or 'None'}
-- **Config Sections:** {len(input.config_sections)}
-
----
-*This is a portal configuration draft. Submit for approval to apply changes.*
-"""
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
         # Build config summary
         config_summary = {
@@ -241,6 +201,62 @@ async def portal_config_draft_create_handler(
             await kernel_api.close()
 
 
+def render_portal_config_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a portal configuration draft."""
+    payload = draft.payload
+    config_sections = payload["config_sections"]
+    
+    config_sections_list = "\n".join([
+        f"### {section_name}\n```json\n{str(section_config)}\n```"
+        for section_name, section_config in config_sections.items()
+    ])
+    
+    changes_summary = []
+    if "routing" in config_sections:
+        changes_summary.append("Routing changes")
+    if "permissions" in config_sections:
+        changes_summary.append("Permission changes")
+    if "integrations" in config_sections:
+        changes_summary.append("Integration changes")
+    if "security" in config_sections:
+        changes_summary.append("Security changes")
+    
+    changes_section = ""
+    if changes_summary:
+        changes_section = f"""
+## Change Summary
+
+{chr(10).join(f"- {change}" for change in changes_summary)}
+"""
+    
+    return f"""# Portal Configuration Draft
+
+**Portal ID:** {payload['portal_id']}
+**Config Version:** {payload.get('config_version') or 'Not specified'}
+**Status:** Draft
+**Created:** {draft.created_at}
+**Created By:** {draft.created_by}
+
+{payload.get('description') or 'No description provided'}
+{changes_section}
+## Configuration Sections
+
+{config_sections_list}
+
+## Approval Requirements
+
+- **Risk Level:** {draft.risk_level}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers) or 'None'}
+- **Config Sections:** {len(config_sections)}
+
+---
+*This is a portal configuration draft. Submit for approval to apply changes.*
+"""
+
+
+register_preview_renderer("portal_config", render_portal_config_draft_preview)
+
+
 # Register the tool
 def register_portal_config_draft_create_tool(registry) -> None:
     """Register the portal.cluster.config.draft.create tool."""
@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -46,13 +47,17 @@ class PortalScaffoldDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class PortalScaffoldDraftOutput(BaseModel):
     """Output schema for portal scaffold draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with portal structure")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with portal structure (if include_preview)")
     risk_level: str = Field(description="Risk level")
     recommended_approvers: List[str] = Field(description="Recommended approver roles")
     scaffold_summary: Dict[str, Any] = Field(description="Scaffold summary")
@@ -175,44 +180,8 @@ async def portal_scaffold_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        modules_list = "\n".join([
-            f"{i+1}. **{module.get('module_name', 'Unnamed')}** ({module.get('module_type', 'unknown')})"
-            for i, module in enumerate(input.modules)
-        ])
-        
-        branding_section = ""
-        if input.branding_config:
-            branding_section = f"""
-## Branding Configuration
-
-- **Logo:** {input.branding_config.get('logo', 'Not specified')}
-- **Primary Color:** {input.branding_config.get('primary_color', 'Not specified')}
-- **Theme:** {input.branding_config.get('theme', 'Not specified')}
-"""
-        
-        preview_markdown = f"""# Portal Scaffold Draft: {input.portal_name}
-
-**Description:** {input.portal_description}
-**Portal Type:** {input.portal_type}
-**Access Level:** {input.access_level}
-**Status:** Draft
-**Created:** {draft.created_at}
-**Created By:** {context.user_id}
-
-## Portal Modules
-
-{modules_list}
-{branding_section}
-## Approval Requirements
-
-- **Risk Level:** {risk_level}
-- **Recommended Approvers:** {', '.join(recommended_approvers) or 'None'}
-- **Module Count:** {len(input.modules)}
-
----
-*This is a portal scaffold draft. Submit for approval to create portal structure.*
-"""
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
         # Build scaffold summary
         module_types = [module.get("module_type") for module in input.modules]
@@ -238,6 +207,54 @@ async def portal_scaffold_draft_create_handler(
             await kernel_api.close()
 
 
+def render_portal_scaffold_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a portal scaffold draft."""
+    payload = draft.payload
+    modules = payload["modules"]
+    branding_config = payload.get("branding_config") or {}
+    
+    modules_list = "\n".join([
+        f"{i+1}. **{module.get('module_name', 'Unnamed')}** ({module.get('module_type', 'unknown')})"
+        for i, module in enumerate(modules)
+    ])
+    
+    branding_section = ""
+    if branding_config:
+        branding_section = f"""
+## Branding Configuration
+
+- **Logo:** {branding_config.get('logo', 'Not specified')}
+- **Primary Color:** {branding_config.get('primary_color', 'Not specified')}
+- **Theme:** {branding_config.get('theme', 'Not specified')}
+"""
+    
+    return f"""# Portal Scaffold Draft: {payload['portal_name']}
+
+**Description:** {payload['portal_description']}
+**Portal Type:** {payload['portal_type']}
+**Access Level:** {payload['access_level']}
+**Status:** Draft
+**Created:** {draft.created_at}
+**Created By:** {draft.created_by}
+
+## Portal Modules
+
+{modules_list}
+{branding_section}
+## Approval Requirements
+
+- **Risk Level:** {draft.risk_level}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers) or 'None'}
+- **Module Count:** {len(modules)}
+
+---
+*This is a portal scaffold draft. Submit for approval to create portal structure.*
+"""
+
+
+register_preview_renderer("portal_scaffold", render_portal_scaffold_draft_preview)
+
+
 # Register the tool
 def register_portal_scaffold_draft_create_tool(registry) -> None:
     """Register the portal.cluster.scaffold.draft.create tool."""
@@ -13,6 +13,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -52,6 +53,10 @@ class VPMPaymentDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class ExecutionReadinessChecklist(BaseModel):
@@ -66,7 +71,7 @@ class VPMPaymentDraftOutput(BaseModel):
     """Output schema for VPM payment draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with vendor snapshot and approval requirements")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with vendor snapshot and approval requirements (if include_preview)")
     risk_level: str = Field(description="Risk level")
     recommended_approvers: List[str] = Field(description="Recommended approver roles")
     vendor_snapshot: Dict[str, Any] = Field(description="Vendor snapshot (name, status, risk flags)")
@@ -242,26 +247,51 @@ async def vpm_payment_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        risk_flags_markdown = "\n".join([
-            f"- {flag}" for flag in vendor_snapshot.get("risk_flags", [])
-        ]) or "None"
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
-        readiness_markdown = f"""
-- Vendor Active: {'Yes' if execution_readiness.is_vendor_active else 'No'}
-- Bank Details: {'Yes' if execution_readiness.bank_details_present else 'Unknown' if execution_readiness.bank_details_present is None else 'No'}
-- Amount Within Threshold: {'Yes' if execution_readiness.amount_within_threshold else 'No'}
-- Requires Manual Review: {'Yes' if execution_readiness.requires_manual_review else 'No'}
+        return VPMPaymentDraftOutput(
+            draft_id=draft.draft_id,
+            status=draft.status.value,
+            preview_markdown=preview_markdown,
+            risk_level=draft.risk_level,
+            recommended_approvers=draft.recommended_approvers,
+            vendor_snapshot=vendor_snapshot,
+            execution_readiness=execution_readiness,
+            tenant_id=context.tenant_id,
+        )
+    finally:
+        if kernel_api:
+            await kernel_api.close()
+
+
+def render_vpm_payment_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a payment draft."""
+    payload = draft.payload
+    vendor_snapshot = payload["vendor_snapshot"]
+    readiness = payload["execution_readiness"]
+    invoice_refs = payload.get("invoice_refs") or []
+    bank_details_present = readiness.get("bank_details_present")
+    
+    risk_flags_markdown = "\n".join([
+        f"- {flag}" for flag in vendor_snapshot.get("risk_flags", [])
+    ]) or "None"
+    
+    readiness_markdown = f"""
+- Vendor Active: {'Yes' if readiness['is_vendor_active'] else 'No'}
+- Bank Details: {'Yes' if bank_details_present else 'Unknown' if bank_details_present is None else 'No'}
+- Amount Within Threshold: {'Yes' if readiness['amount_within_threshold'] else 'No'}
+- Requires Manual Review: {'Yes' if readiness['requires_manual_review'] else 'No'}
 """
-        
-        preview_markdown = f"""# Payment Draft
+    
+    return f"""# Payment Draft
 
-**Vendor:** {vendor_snapshot['vendor_name']} ({input.vendor_id})
-**Amount:** {input.currency} {input.amount:,.2f}
-**Due Date:** {input.due_date}
+**Vendor:** {vendor_snapshot['vendor_name']} ({payload['vendor_id']})
+**Amount:** {payload['currency']} {payload['amount']:,.2f}
+**Due Date:** {payload['due_date']}
 **Status:** Draft
 **Created:** {draft.created_at}
-**Created By:** {context.user_id}
+**Created By:** {draft.created_by}
 
 ## Vendor Snapshot
 
@@ -273,8 +303,8 @@ async def vpm_payment_draft_create_handler(
 
 ## Approval Requirements
 
-- **Risk Level:** {risk_level}
-- **Recommended Approvers:** {', '.join(recommended_approvers)}
+- **Risk Level:** {draft.risk_level}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers)}
 - **Policy Source:** workflow.domain.policy.read
 
 ## Execution Readiness Checklist
@@ -283,25 +313,14 @@ async def vpm_payment_draft_create_handler(
 
 ## Invoice References
 
-{chr(10).join(f"- {ref}" for ref in input.invoice_refs) if input.invoice_refs else "- None"}
+{chr(10).join(f"- {ref}" for ref in invoice_refs) if invoice_refs else "- None"}
 
 ---
 *This is a draft. Submit for approval to execute payment.*
 """
-        
-        return VPMPaymentDraftOutput(
-            draft_id=draft.draft_id,
-            status=draft.status.value,
-            preview_markdown=preview_markdown,
-            risk_level=draft.risk_level,
-            recommended_approvers=draft.recommended_approvers,
-            vendor_snapshot=vendor_snapshot,
-            execution_readiness=execution_readiness,
-            tenant_id=context.tenant_id,
-        )
-    finally:
-        if kernel_api:
-            await kernel_api.close()
+
+
+register_preview_renderer("vpm_payment", render_vpm_payment_draft_preview)
 
 
 # Register the tool
@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -46,13 +47,17 @@ class DigitalWorkflowDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class DigitalWorkflowDraftOutput(BaseModel):
     """Output schema for digital workflow draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with digital workflow details")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with digital workflow details (if include_preview)")
     risk_level: str = Field(description="Risk level")
     recommended_approvers: List[str] = Field(description="Recommended approver roles")
     automation_summary: Dict[str, Any] = Field(description="Automation summary")
@@ -193,44 +198,8 @@ async def digital_workflow_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        steps_markdown = "\n".join([
-            f"### Step {i+1}: {step.get('name', 'Unnamed')}\n"
-            f"- Type: {step.get('step_type', 'unknown')}\n"
-            f"- Automation: {step.get('automation_type', 'none')}\n"
-            for i, step in enumerate(input.steps)
-        ])
-        
-        integrations_section = ""
-        if input.integration_points:
-            integrations_section = f"""
-## Integration Points
-
-{chr(10).join(f"- {point}" for point in input.integration_points)}
-"""
-        
-        preview_markdown = f"""# Digital Workflow Draft: {input.workflow_name}
-
-**Description:** {input.workflow_description}
-**Trigger Type:** {input.trigger_type}
-**Status:** Draft
-**Created:** {draft.created_at}
-**Created By:** {context.user_id}
-
-## Workflow Steps
-
-{steps_markdown}
-{integrations_section}
-## Approval Requirements
-
-- **Risk Level:** {risk_level}
-- **Recommended Approvers:** {', '.join(recommended_approvers) or 'None'}
-- **Policy Source:** workflow.domain.policy.read
-- **Automation Complexity:** {'High' if has_external_integrations or has_webhooks else 'Medium'}
-
----
-*This is a digital workflow draft. Submit for approval to publish.*
-"""
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
         # Build automation summary
         automation_summary = {
@@ -255,6 +224,55 @@ async def digital_workflow_draft_create_handler(
             await kernel_api.close()
 
 
+def render_digital_workflow_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a digital workflow draft."""
+    payload = draft.payload
+    steps = payload["steps"]
+    integration_points = payload.get("integration_points") or []
+    has_webhooks = any("webhook" in str(step.get("automation_type", "")).lower() for step in steps)
+    
+    steps_markdown = "\n".join([
+        f"### Step {i+1}: {step.get('name', 'Unnamed')}\n"
+        f"- Type: {step.get('step_type', 'unknown')}\n"
+        f"- Automation: {step.get('automation_type', 'none')}\n"
+        for i, step in enumerate(steps)
+    ])
+    
+    integrations_section = ""
+    if integration_points:
+        integrations_section = f"""
+## Integration Points
+
+{chr(10).join(f"- {point}" for point in integration_points)}
+"""
+    
+    return f"""# Digital Workflow Draft: {payload['workflow_name']}
+
+**Description:** {payload['workflow_description']}
+**Trigger Type:** {payload['trigger_type']}
+**Status:** Draft
+**Created:** {draft.created_at}
+**Created By:** {draft.created_by}
+
+## Workflow Steps
+
+{steps_markdown}
+{integrations_section}
+## Approval Requirements
+
+- **Risk Level:** {draft.risk_level}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers) or 'None'}
+- **Policy Source:** workflow.domain.policy.read
+- **Automation Complexity:** {'High' if integration_points or has_webhooks else 'Medium'}
+
+---
+*This is a digital workflow draft. Submit for approval to publish.*
+"""
+
+
+register_preview_renderer("workflow_digital", render_digital_workflow_draft_preview)
+
+
 # Register the tool
 def register_digital_workflow_draft_create_tool(registry) -> None:
     """Register the workflow.cluster.digital.draft.create tool."""
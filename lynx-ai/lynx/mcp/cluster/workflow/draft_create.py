@@ -12,6 +12,7 @@ from lynx.core.registry import MCPTool
 from lynx.core.session import ExecutionContext
 from lynx.mcp.cluster.drafts.base import create_draft
 from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.mcp.cluster.drafts.preview import register_preview_renderer, render_preview
 from lynx.integration.kernel import KernelAPI
 
 
@@ -41,13 +42,17 @@ class WorkflowDraftInput(BaseModel):
         default=None,
         description="Request ID for idempotency",
     )
+    include_preview: bool = Field(
+        default=True,
+        description="Render preview_markdown (false skips rendering for high-volume callers)",
+    )
 
 
 class WorkflowDraftOutput(BaseModel):
     """Output schema for workflow draft creation."""
     draft_id: str = Field(description="Draft ID")
     status: str = Field(description="Draft status (draft)")
-    preview_markdown: str = Field(description="Preview markdown with steps, approvers, gates")
+    preview_markdown: Optional[str] = Field(default=None, description="Preview markdown with steps, approvers, gates (if include_preview)")
     risk_level: str = Field(description="Risk level")
     recommended_approvers: List[str] = Field(description="Recommended approver roles")
     tenant_id: str = Field(description="Tenant ID")
@@ -188,20 +193,39 @@ async def workflow_draft_create_handler(
             request_id=input.request_id,
         )
         
-        # Generate preview markdown
-        steps_markdown = "\n".join([
-            f"### Step {i+1}: {step.get('name', 'Unnamed')}\n"
-            f"- Type: {step.get('step_type', 'unknown')}\n"
-            f"- Required Role: {', '.join(step.get('required_role', [])) or 'None'}\n"
-            for i, step in enumerate(input.steps)
-        ])
+        # Render preview markdown (on demand, memoized per draft)
+        preview_markdown = render_preview(draft) if input.include_preview else None
         
-        preview_markdown = f"""# Workflow Draft: {input.name}
+        return WorkflowDraftOutput(
+            draft_id=draft.draft_id,
+            status=draft.status.value,
+            preview_markdown=preview_markdown,
+            risk_level=draft.risk_level,
+            recommended_approvers=draft.recommended_approvers,
+            tenant_id=context.tenant_id,
+        )
+    finally:
+        if kernel_api:
+            await kernel_api.close()
+
+
+def render_workflow_draft_preview(draft: DraftProtocol) -> str:
+    """Render preview markdown for a workflow draft."""
+    payload = draft.payload
+    
+    steps_markdown = "\n".join([
+        f"### Step {i+1}: {step.get('name', 'Unnamed')}\n"
+        f"- Type: {step.get('step_type', 'unknown')}\n"
+        f"- Required Role: {', '.join(step.get('required_role', [])) or 'None'}\n"
+        for i, step in enumerate(payload["steps"])
+    ])
+    
+    return f"""# Workflow Draft: {payload['name']}
 
-**Workflow Kind:** {input.workflow_kind}
+**Workflow Kind:** {payload['workflow_kind']}
 **Status:** Draft
 **Created:** {draft.created_at}
-**Created By:** {context.user_id}
+**Created By:** {draft.created_by}
 
 ## Workflow Steps
 
@@ -209,29 +233,20 @@ async def workflow_draft_create_handler(
 
 ## Approval Requirements
 
-- **Risk Level:** {risk_level}
-- **Recommended Approvers:** {', '.join(recommended_approvers) or 'None'}
+- **Risk Level:** {draft.risk_level}
+- **Recommended Approvers:** {', '.join(draft.recommended_approvers) or 'None'}
 - **Policy Source:** workflow.domain.policy.read
 
 ## Linked Objects
 
-{input.linked_object if input.linked_object else "None"}
+{payload.get('linked_object') or "None"}
 
 ---
 *This is a draft. Submit for approval to publish.*
 """
-        
-        return WorkflowDraftOutput(
-            draft_id=draft.draft_id,
-            status=draft.status.value,
-            preview_markdown=preview_markdown,
-            risk_level=draft.risk_level,
-            recommended_approvers=draft.recommended_approvers,
-            tenant_id=context.tenant_id,
-        )
-    finally:
-        if kernel_api:
-            await kernel_api.close()
+
+
+register_preview_renderer("workflow", render_workflow_draft_preview)
 
 
 # Register the tool
@@ -8,10 +8,9 @@ Risk: low
 
 from pydantic import BaseModel, Field
 from typing import List, Optional
-from datetime import datetime
 from lynx.core.registry import MCPTool
+from lynx.core.audit import get_audit_logger
 from lynx.core.session import ExecutionContext
-from lynx.integration.kernel import KernelAPI
 
 
 class AuditRunInput(BaseModel):
@@ -44,6 +43,13 @@ class RunSummary(BaseModel):
     outcome: str
     tool_id: Optional[str] = None
     status: str
+    tool_count: int = 0
+    success_count: int = 0
+    failure_count: int = 0
+    refusal_count: int = 0
+    max_risk: Optional[str] = None
+    duration_ms: int = 0
+    completed_at: Optional[str] = None
 
 
 class AuditRunOutput(BaseModel):
@@ -69,57 +75,53 @@ async def audit_run_read_handler(
     Returns:
         AuditRunOutput with run history
     """
-    # Initialize Kernel API for this tenant (if available)
-    kernel_api = None
-    try:
-        kernel_api = KernelAPI(tenant_id=context.tenant_id)
-    except (ValueError, Exception):
-        # Kernel API not available (e.g., in tests) - use mock data
-        pass
+    # Read run summaries (tenant-scoped, one indexed read of lynx_run_summaries)
+    audit_logger = get_audit_logger()
+    if audit_logger is None:
+        # Audit storage not configured - no run history
+        return AuditRunOutput(runs=[], total_count=0, tenant_id=context.tenant_id)
     
-    try:
-        # Read audit runs from Kernel/Supabase (tenant-scoped)
-        # TODO: Implement actual Kernel API call or Supabase query
-        # For now, return mock data
-        
-        # In production, this would query the audit_logs table filtered by tenant_id
-        runs = [
-            RunSummary(
-                run_id="run-001",
-                actor_id=context.user_id,
-                timestamp=datetime.now().isoformat(),
-                outcome="completed",
-                tool_id="finance.domain.health.read",
-                status="completed",
-            ),
-            RunSummary(
-                run_id="run-002",
-                actor_id=context.user_id,
-                timestamp=datetime.now().isoformat(),
-                outcome="denied",
-                tool_id="test.restricted.tool",
-                status="blocked",
-            ),
-        ]
-        
-        # Apply filters
-        if input.tool_id:
-            runs = [r for r in runs if r.tool_id == input.tool_id]
-        
-        if input.status:
-            runs = [r for r in runs if r.status == input.status]
-        
-        # Limit results
-        runs = runs[:input.limit]
-        
-        return AuditRunOutput(
-            runs=runs,
-            total_count=len(runs),  # In production, this would be total count from query
-            tenant_id=context.tenant_id,
+    summaries, total_count = await audit_logger.list_run_summaries(
+        tenant_id=context.tenant_id,
+        limit=input.limit,
+        status=input.status,
+        tool_id=input.tool_id,
+        since=input.since,
+    )
+    
+    runs = [
+        RunSummary(
+            run_id=summary["run_id"],
+            actor_id=summary.get("user_id") or "",
+            timestamp=str(summary["first_event_at"]),
+            outcome=_outcome(summary),
+            tool_id=input.tool_id or next(iter(summary.get("tool_ids") or []), None),
+            status=summary.get("status") or "in_progress",
+            tool_count=summary.get("tool_count", 0),
+            success_count=summary.get("success_count", 0),
+            failure_count=summary.get("failure_count", 0),
+            refusal_count=summary.get("refusal_count", 0),
+            max_risk=summary.get("max_risk"),
+            duration_ms=summary.get("total_duration_ms", 0),
+            completed_at=str(summary["completed_at"]) if summary.get("completed_at") else None,
         )
-    finally:
-        if kernel_api:
-            await kernel_api.close()
+        for summary in summaries
+    ]
+    
+    return AuditRunOutput(
+        runs=runs,
+        total_count=total_count,
+        tenant_id=context.tenant_id,
+    )
+
+
+def _outcome(summary: dict) -> str:
+    """Outcome of a run's tool calls (failed > denied > completed)."""
+    if summary.get("failure_count"):
+        return "failed"
+    if summary.get("refusal_count"):
+        return "denied"
+    return "completed"
 
 
 # Register the tool
@@ -36,6 +36,10 @@ class TenantProfileOutput(BaseModel):
     user_scope: List[str] = Field(description="Current user scope (if requested)")
 
 
+# Returned when the Kernel is not available (e.g., in tests)
+_MOCK_TENANT_CUSTOMIZATIONS = {"name": "Test Tenant", "plan": "standard", "region": "us-east"}
+
+
 async def tenant_profile_read_handler(
     input: TenantProfileInput,
     context: ExecutionContext,
@@ -52,6 +56,15 @@ async def tenant_profile_read_handler(
     Returns:
         TenantProfileOutput with tenant profile and context
     """
+    # Use the session's tenant snapshot when present (shared across the run)
+    if context.tenant_snapshot is not None:
+        try:
+            tenant_customizations = await context.tenant_snapshot.get_tenant_customizations()
+        except Exception:
+            # Kernel not available - use mock data (same as the direct path)
+            tenant_customizations = dict(_MOCK_TENANT_CUSTOMIZATIONS)
+        return _build_profile_output(input, context, tenant_customizations)
+    
     # Initialize Kernel API for this tenant (if available)
     kernel_api = None
     try:
@@ -70,27 +83,36 @@ async def tenant_profile_read_handler(
         if kernel_api:
             tenant_customizations = await kernel_api.get_tenant_customizations()
         else:
-            tenant_customizations = {"name": "Test Tenant", "plan": "standard", "region": "us-east"}
+            tenant_customizations = dict(_MOCK_TENANT_CUSTOMIZATIONS)
         
-        enabled_modules = []
-        if input.include_modules:
-            # In production, this would come from Kernel
-            enabled_modules = ["finance", "workflow", "vpm", "document"]
-        
-        return TenantProfileOutput(
-            tenant_id=context.tenant_id,
-            tenant_name=tenant_customizations.get("name", "Unknown Tenant"),
-            plan=tenant_customizations.get("plan", "standard"),
-            region=tenant_customizations.get("region", "us-east"),
-            enabled_modules=enabled_modules if input.include_modules else [],
-            user_role=context.user_role if input.include_user_context else None,
-            user_scope=context.user_scope if input.include_user_context else [],
-        )
+        return _build_profile_output(input, context, tenant_customizations)
     finally:
         if kernel_api:
             await kernel_api.close()
 
 
+def _build_profile_output(
+    input: TenantProfileInput,
+    context: ExecutionContext,
+    tenant_customizations: Dict,
+) -> TenantProfileOutput:
+    """Build the profile output from tenant customizations."""
+    enabled_modules = []
+    if input.include_modules:
+        # In production, this would come from Kernel
+        enabled_modules = ["finance", "workflow", "vpm", "document"]
+    
+    return TenantProfileOutput(
+        tenant_id=context.tenant_id,
+        tenant_name=tenant_customizations.get("name", "Unknown Tenant"),
+        plan=tenant_customizations.get("plan", "standard"),
+        region=tenant_customizations.get("region", "us-east"),
+        enabled_modules=enabled_modules if input.include_modules else [],
+        user_role=context.user_role if input.include_user_context else None,
+        user_scope=context.user_scope if input.include_user_context else [],
+    )
+
+
 # Register the tool
 def register_tenant_profile_read_tool(registry) -> None:
     """Register the tenant.domain.profile.read tool."""
@@ -46,6 +46,10 @@ class WorkflowStatusOutput(BaseModel):
     tenant_id: str = Field(description="Tenant ID for these workflows")
 
 
+# Returned when the Kernel is not available (e.g., in tests)
+_MOCK_WORKFLOW_METADATA = {"active_count": 5, "pending_approvals": 2}
+
+
 async def workflow_status_read_handler(
     input: WorkflowStatusInput,
     context: ExecutionContext,
@@ -62,6 +66,15 @@ async def workflow_status_read_handler(
     Returns:
         WorkflowStatusOutput with workflow status
     """
+    # Use the session's tenant snapshot when present (shared across the run)
+    if context.tenant_snapshot is not None:
+        try:
+            workflow_metadata = await context.tenant_snapshot.get_metadata("workflow")
+        except Exception:
+            # Kernel not available - use mock data (same as the direct path)
+            workflow_metadata = dict(_MOCK_WORKFLOW_METADATA)
+        return _build_status_output(input, context, workflow_metadata)
+    
     # Initialize Kernel API for this tenant (if available)
     kernel_api = None
     try:
@@ -79,45 +92,54 @@ async def workflow_status_read_handler(
         if kernel_api:
             workflow_metadata = await kernel_api.get_metadata("workflow")
         else:
-            workflow_metadata = {"active_count": 5, "pending_approvals": 2}
-        
-        # In production, this would query active workflows and pending approvals
-        active_workflows_count = workflow_metadata.get("active_count", 5)
-        pending_approvals_count = workflow_metadata.get("pending_approvals", 2)
+            workflow_metadata = dict(_MOCK_WORKFLOW_METADATA)
         
-        recent_events = []
-        if input.include_events:
-            # In production, this would query workflow events table
-            recent_events = [
-                WorkflowEvent(
-                    event_id="event-001",
-                    workflow_id="workflow-001",
-                    event_type="approval_requested",
-                    timestamp=datetime.now().isoformat(),
-                    actor_id=context.user_id,
-                    description="Document approval requested",
-                ),
-                WorkflowEvent(
-                    event_id="event-002",
-                    workflow_id="workflow-002",
-                    event_type="workflow_completed",
-                    timestamp=datetime.now().isoformat(),
-                    actor_id=context.user_id,
-                    description="Payment workflow completed",
-                ),
-            ][:input.event_limit]
-        
-        return WorkflowStatusOutput(
-            active_workflows_count=active_workflows_count,
-            pending_approvals_count=pending_approvals_count,
-            recent_events=recent_events,
-            tenant_id=context.tenant_id,
-        )
+        return _build_status_output(input, context, workflow_metadata)
     finally:
         if kernel_api:
             await kernel_api.close()
 
 
+def _build_status_output(
+    input: WorkflowStatusInput,
+    context: ExecutionContext,
+    workflow_metadata: dict,
+) -> WorkflowStatusOutput:
+    """Build the status output from workflow metadata."""
+    # In production, this would query active workflows and pending approvals
+    active_workflows_count = workflow_metadata.get("active_count", 5)
+    pending_approvals_count = workflow_metadata.get("pending_approvals", 2)
+    
+    recent_events = []
+    if input.include_events:
+        # In production, this would query workflow events table
+        recent_events = [
+            WorkflowEvent(
+                event_id="event-001",
+                workflow_id="workflow-001",
+                event_type="approval_requested",
+                timestamp=datetime.now().isoformat(),
+                actor_id=context.user_id,
+                description="Document approval requested",
+            ),
+            WorkflowEvent(
+                event_id="event-002",
+                workflow_id="workflow-002",
+                event_type="workflow_completed",
+                timestamp=datetime.now().isoformat(),
+                actor_id=context.user_id,
+                description="Payment workflow completed",
+            ),
+        ][:input.event_limit]
+    
+    return WorkflowStatusOutput(
+        active_workflows_count=active_workflows_count,
+        pending_approvals_count=pending_approvals_count,
+        recent_events=recent_events,
+        tenant_id=context.tenant_id,
+    )
+
+
 # Register the tool
 def register_workflow_status_read_tool(registry) -> None:
     """Register the workflow.domain.status.read tool."""
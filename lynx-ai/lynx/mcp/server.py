@@ -35,6 +35,9 @@ from lynx.mcp.cluster.portal.config_draft_create import register_portal_config_d
 from lynx.mcp.cell.docs.draft_submit_for_approval import register_docs_draft_submit_for_approval_tool
 from lynx.mcp.cell.workflow.draft_publish import register_workflow_draft_publish_tool
 from lynx.mcp.cell.vpm.payment_execute import register_vpm_payment_execute_tool
+from lynx.observability.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 def initialize_mcp_server(registry: MCPToolRegistry) -> None:
@@ -76,5 +79,5 @@ def initialize_mcp_server(registry: MCPToolRegistry) -> None:
     # All Cluster MCPs registered (8 tools total)
     # TODO: Register more Cell MCPs (if needed)
     
-    print(f"[OK] MCP Server initialized with {len(registry.list_all())} tools")
+    logger.info("MCP server initialized", extra={"tools_registered": len(registry.list_all())})
 
@@ -0,0 +1,65 @@
+"""
+Observability for Lynx AI.
+
+Structured logging, metrics, latency histograms, tracing, profiling and
+event loop health for the runtime hot paths.
+"""
+
+from lynx.observability.logging import get_logger, log_context, setup_logging, shutdown_logging
+from lynx.observability.loop_monitor import LoopHealth, LoopMonitor, get_loop_monitor
+from lynx.observability.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    StageTimer,
+    get_metrics_registry,
+)
+from lynx.observability.profiler import (
+    Profile,
+    SamplingProfiler,
+    SlowCallbackDetector,
+    get_profiler,
+    get_slow_callback_detector,
+)
+from lynx.observability.tracing import (
+    InMemorySpanExporter,
+    JsonFileSpanExporter,
+    NoopSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    get_tracer,
+    trace_methods,
+    traced,
+)
+
+__all__ = [
+    "get_logger",
+    "log_context",
+    "setup_logging",
+    "shutdown_logging",
+    "LoopHealth",
+    "LoopMonitor",
+    "get_loop_monitor",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "StageTimer",
+    "get_metrics_registry",
+    "Profile",
+    "SamplingProfiler",
+    "SlowCallbackDetector",
+    "get_profiler",
+    "get_slow_callback_detector",
+    "InMemorySpanExporter",
+    "JsonFileSpanExporter",
+    "NoopSpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "get_tracer",
+    "trace_methods",
+    "traced",
+]
@@ -0,0 +1,302 @@
+"""
+Structured logging for Lynx AI.
+
+All Lynx modules log through standard `logging` loggers under "lynx". Once
+setup_logging() has run, records go through a non-blocking pipeline:
+
+    logger -> QueueHandler (caller's thread: correlation + sampling, put_nowait)
+           -> bounded queue
+           -> QueueListener thread -> JSON (or text) formatter -> stdout
+
+so the event loop never waits on stdout. When the queue is full the record is
+dropped and counted instead of blocking.
+
+Correlation fields (run_id, tenant_id, tool_id, ...) are bound per context
+with log_context() and added to every record logged inside it. High-volume
+messages can be sampled per call (extra={"sample_rate": 0.1}) or per logger
+(LYNX_LOG_SAMPLE_RATES); warnings and errors are never sampled.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from lynx.config import Config
+from lynx.observability.metrics import get_metrics_registry
+
+# Correlation fields for the current context (run_id, tenant_id, tool_id, ...)
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("lynx_log_context", default={})
+
+# Attributes every LogRecord has (anything else was passed via `extra`)
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a Lynx logger.
+
+    Args:
+        name: Module name (e.g., __name__)
+
+    Returns:
+        Logger under the "lynx" hierarchy
+    """
+    return logging.getLogger(name if name.startswith("lynx") else f"lynx.{name}")
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """
+    Add correlation fields to every record logged in the block.
+
+    Args:
+        **fields: Fields such as run_id, tenant_id, tool_id (None values are skipped)
+    """
+    token = _log_context.set({**_log_context.get(), **{k: v for k, v in fields.items() if v is not None}})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """Copies the bound correlation fields onto records (runs in the caller's context)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps 1 in N records of high-volume messages.
+
+    Sampling is deterministic per (logger, message template): with a rate
+    of 0.1 the 1st, 11th, 21st... occurrence is kept. Records at WARNING
+    and above always pass.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        """
+        Initialize filter.
+
+        Args:
+            rates: Sample rate per logger name prefix (e.g., {"lynx.runtime.daemon": 0.1})
+        """
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.dropped_total = 0
+        self._counts: Dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = getattr(record, "sample_rate", None)
+        if rate is None:
+            rate = self._rate_for(record.name)
+        if rate >= 1.0:
+            return True
+
+        key = (record.name, record.msg)
+        with self._lock:
+            seen = self._counts.get(key, 0)
+            self._counts[key] = seen + 1
+        every = max(1, round(1 / rate)) if rate > 0 else 0
+        if every and seen % every == 0:
+            record.sample_rate = rate
+            return True
+        self.dropped_total += 1
+        return False
+
+    def _rate_for(self, name: str) -> float:
+        best, rate = -1, 1.0
+        for prefix, value in self.rates.items():
+            if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best:
+                best, rate = len(prefix), value
+        return rate
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped_total = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and render the traceback now (the listener thread sees a copy),
+        # but keep the message and traceback separate for the JSON formatter
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_total += 1
+
+
+def _exception_text(formatter: logging.Formatter, record: logging.LogRecord) -> Optional[str]:
+    if record.exc_info:
+        return formatter.formatException(record.exc_info)
+    return record.exc_text
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        exc_text = _exception_text(self, record)
+        if exc_text:
+            entry["exc_info"] = exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable format for local development ("msg key=value ...")."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = " ".join(
+            f"{key}={value}" for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+        )
+        line = f"{datetime.fromtimestamp(record.created).strftime('%H:%M:%S')} {record.levelname:<7} {record.getMessage()}"
+        if fields:
+            line = f"{line} | {fields}"
+        exc_text = _exception_text(self, record)
+        if exc_text:
+            line = f"{line}\n{exc_text}"
+        return line
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """
+    Parse "logger=rate,logger=rate" into a dict.
+
+    Args:
+        spec: Sample rate spec (e.g., "lynx.runtime.daemon=0.1")
+
+    Returns:
+        Rates by logger name prefix
+    """
+    rates = {}
+    for part in spec.split(","):
+        if "=" in part:
+            name, rate = part.split("=", 1)
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+# Pipeline state (set by setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_sampling_filter: Optional[SamplingFilter] = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    stream: Optional[TextIO] = None,
+    queue_size: Optional[int] = None,
+    sample_rates: Optional[Dict[str, float]] = None,
+) -> logging.handlers.QueueListener:
+    """
+    Install the queue-based logging pipeline on the "lynx" logger (idempotent).
+
+    Args:
+        level: Log level (defaults to Config.LOG_LEVEL)
+        log_format: "json" or "text" (defaults to Config.LOG_FORMAT)
+        stream: Output stream (defaults to stdout)
+        queue_size: Max queued records before dropping (defaults to Config.LOG_QUEUE_SIZE)
+        sample_rates: Sample rate per logger prefix (defaults to Config.LOG_SAMPLE_RATES)
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _queue_handler, _sampling_filter
+
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(JsonFormatter() if (log_format or Config.LOG_FORMAT) == "json" else TextFormatter())
+
+        _sampling_filter = SamplingFilter(
+            sample_rates if sample_rates is not None else parse_sample_rates(Config.LOG_SAMPLE_RATES)
+        )
+        _queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size or Config.LOG_QUEUE_SIZE))
+        _queue_handler.addFilter(CorrelationFilter())
+        _queue_handler.addFilter(_sampling_filter)
+
+        logger = logging.getLogger("lynx")
+        logger.setLevel((level or Config.LOG_LEVEL).upper())
+        logger.addHandler(_queue_handler)
+        logger.propagate = False
+
+        _listener = logging.handlers.QueueListener(_queue_handler.queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        get_metrics_registry().register_collector(_export_metrics)
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and remove the pipeline."""
+    global _listener, _queue_handler, _sampling_filter
+
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        logger = logging.getLogger("lynx")
+        logger.removeHandler(_queue_handler)
+        logger.setLevel(logging.NOTSET)
+        logger.propagate = True
+        _listener = None
+        _queue_handler = None
+        _sampling_filter = None
+
+
+def _export_metrics(registry) -> None:
+    """Publish dropped-record counters (metrics collector)."""
+    if _queue_handler is not None:
+        registry.gauge(
+            "lynx_log_queue_dropped_total", "Log records dropped because the queue was full",
+        ).set(_queue_handler.dropped_total)
+        registry.gauge(
+            "lynx_log_queue_depth", "Log records waiting to be written",
+        ).set(_queue_handler.queue.qsize())
+    if _sampling_filter is not None:
+        registry.gauge(
+            "lynx_log_sampled_out_total", "Log records dropped by sampling",
+        ).set(_sampling_filter.dropped_total)
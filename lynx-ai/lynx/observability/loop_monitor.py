@@ -0,0 +1,266 @@
+"""
+Event loop health monitoring for Lynx AI.
+
+A probe task sleeps for a short interval and measures how late the loop woke
+it up (scheduled vs actual wakeup = loop lag). Together with the number of
+pending tasks, the default thread pool's queue depth and garbage-collector
+pause times this tells whether something is blocking the daemon's loop.
+
+Values are exported as metrics, printed by the daemon heartbeat and shown in
+the dashboard services fragment; crossing a threshold marks the service as
+degraded.
+"""
+
+import asyncio
+import gc
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from lynx.config import Config
+from lynx.observability.metrics import MetricsRegistry, get_metrics_registry
+
+
+@dataclass
+class LoopHealth:
+    """Event loop health over the monitoring window."""
+    lag_seconds: float
+    lag_max_seconds: float
+    pending_tasks: int
+    executor_queue_depth: int
+    gc_pause_max_seconds: float
+    gc_collections: int
+    degraded_reasons: List[str] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        """"degraded" if any threshold was crossed, otherwise "ok"."""
+        return "degraded" if self.degraded_reasons else "ok"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for status payloads."""
+        return {
+            "status": self.status,
+            "lag_ms": round(self.lag_seconds * 1000, 1),
+            "lag_max_ms": round(self.lag_max_seconds * 1000, 1),
+            "pending_tasks": self.pending_tasks,
+            "executor_queue_depth": self.executor_queue_depth,
+            "gc_pause_max_ms": round(self.gc_pause_max_seconds * 1000, 1),
+            "gc_collections": self.gc_collections,
+            "degraded_reasons": list(self.degraded_reasons),
+        }
+
+
+class LoopMonitor:
+    """Measures event loop lag, task backlog, executor backlog and GC pauses."""
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        window_seconds: Optional[float] = None,
+        lag_threshold: Optional[float] = None,
+        pending_tasks_threshold: Optional[int] = None,
+        executor_queue_threshold: Optional[int] = None,
+        gc_pause_threshold: Optional[float] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize loop monitor.
+
+        Args:
+            interval: Seconds between lag probes (defaults to Config.LOOP_MONITOR_INTERVAL)
+            window_seconds: Window for max lag / GC pause (defaults to Config.LOOP_MONITOR_WINDOW)
+            lag_threshold: Max lag before degraded (defaults to Config.LOOP_LAG_THRESHOLD)
+            pending_tasks_threshold: Max pending tasks before degraded
+                (defaults to Config.LOOP_PENDING_TASKS_THRESHOLD)
+            executor_queue_threshold: Max queued thread pool jobs before degraded
+                (defaults to Config.EXECUTOR_QUEUE_THRESHOLD)
+            gc_pause_threshold: Max GC pause before degraded (defaults to Config.GC_PAUSE_THRESHOLD)
+            metrics_registry: Registry for lag / GC histograms (None to disable)
+        """
+        self.interval = interval or Config.LOOP_MONITOR_INTERVAL
+        self.window_seconds = window_seconds or Config.LOOP_MONITOR_WINDOW
+        self.lag_threshold = lag_threshold or Config.LOOP_LAG_THRESHOLD
+        self.pending_tasks_threshold = pending_tasks_threshold or Config.LOOP_PENDING_TASKS_THRESHOLD
+        self.executor_queue_threshold = executor_queue_threshold or Config.EXECUTOR_QUEUE_THRESHOLD
+        self.gc_pause_threshold = gc_pause_threshold or Config.GC_PAUSE_THRESHOLD
+
+        self._metrics_registry = metrics_registry
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_lag = 0.0
+        self._lags: Deque[Tuple[float, float]] = deque()  # (monotonic time, lag)
+        self._gc_pauses: Deque[Tuple[float, float]] = deque()  # (monotonic time, pause)
+        self._gc_started: Dict[int, float] = {}  # thread ident -> GC start
+        # Filled by the gc callback without locking (it can fire inside any
+        # allocation, including ones made while _lock is held); drained by
+        # sample() and the lag probe
+        self._gc_pending: Deque[Tuple[float, float, Any]] = deque()  # (monotonic time, pause, generation)
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the probe task is attached to a loop."""
+        return self._loop is not None
+
+    async def run(self) -> None:
+        """Probe the current event loop until cancelled."""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        gc.callbacks.append(self._on_gc)
+        try:
+            while True:
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                self._record_lag(max(0.0, loop.time() - expected))
+        finally:
+            if self._on_gc in gc.callbacks:
+                gc.callbacks.remove(self._on_gc)
+            self._loop = None
+
+    def sample(self) -> LoopHealth:
+        """
+        Get the current loop health (does not reset the window).
+
+        Returns:
+            LoopHealth with threshold violations in degraded_reasons
+        """
+        self._drain_gc()
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            lag_max = max((lag for _, lag in self._lags), default=0.0)
+            gc_pause_max = max((pause for _, pause in self._gc_pauses), default=0.0)
+            gc_collections = len(self._gc_pauses)
+
+        health = LoopHealth(
+            lag_seconds=self._last_lag,
+            lag_max_seconds=lag_max,
+            pending_tasks=self._pending_tasks(),
+            executor_queue_depth=self._executor_queue_depth(),
+            gc_pause_max_seconds=gc_pause_max,
+            gc_collections=gc_collections,
+        )
+        if health.lag_max_seconds > self.lag_threshold:
+            health.degraded_reasons.append(
+                f"loop lag {health.lag_max_seconds * 1000:.0f}ms > {self.lag_threshold * 1000:.0f}ms"
+            )
+        if health.pending_tasks > self.pending_tasks_threshold:
+            health.degraded_reasons.append(
+                f"{health.pending_tasks} pending tasks > {self.pending_tasks_threshold}"
+            )
+        if health.executor_queue_depth > self.executor_queue_threshold:
+            health.degraded_reasons.append(
+                f"executor queue {health.executor_queue_depth} > {self.executor_queue_threshold}"
+            )
+        if health.gc_pause_max_seconds > self.gc_pause_threshold:
+            health.degraded_reasons.append(
+                f"GC pause {health.gc_pause_max_seconds * 1000:.0f}ms > {self.gc_pause_threshold * 1000:.0f}ms"
+            )
+        return health
+
+    def export_metrics(self, registry: MetricsRegistry) -> None:
+        """
+        Publish loop health gauges (metrics collector).
+
+        Args:
+            registry: Metrics registry to update
+        """
+        if not self.running:
+            return
+        health = self.sample()
+        registry.gauge(
+            "lynx_loop_lag_max_seconds", "Max event loop lag over the monitoring window",
+        ).set(health.lag_max_seconds)
+        registry.gauge(
+            "lynx_loop_pending_tasks", "Pending asyncio tasks on the daemon loop",
+        ).set(health.pending_tasks)
+        registry.gauge(
+            "lynx_executor_queue_depth", "Jobs waiting in the default thread pool",
+        ).set(health.executor_queue_depth)
+        registry.gauge(
+            "lynx_gc_pause_max_seconds", "Max GC pause over the monitoring window",
+        ).set(health.gc_pause_max_seconds)
+        registry.gauge(
+            "lynx_loop_degraded", "1 if event loop health crossed a threshold",
+        ).set(1 if health.degraded_reasons else 0)
+
+    def _record_lag(self, lag: float) -> None:
+        self._drain_gc()
+        now = time.monotonic()
+        self._last_lag = lag
+        with self._lock:
+            self._lags.append((now, lag))
+            self._trim(now)
+        if self._metrics_registry is not None:
+            self._metrics_registry.histogram(
+                "lynx_loop_lag_seconds", "Event loop wakeup lag (scheduled vs actual)",
+            ).observe(lag)
+
+    def _on_gc(self, phase: str, info: Dict[str, Any]) -> None:
+        thread_id = threading.get_ident()
+        if phase == "start":
+            self._gc_started[thread_id] = time.perf_counter()
+            return
+        started = self._gc_started.pop(thread_id, None)
+        if started is None:
+            return
+        # No locks here: the collection may have started while this thread
+        # held _lock or a metrics lock (deque.append is atomic)
+        self._gc_pending.append((time.monotonic(), time.perf_counter() - started, info.get("generation")))
+
+    def _drain_gc(self) -> None:
+        pauses = []
+        while self._gc_pending:
+            pauses.append(self._gc_pending.popleft())
+        if not pauses:
+            return
+        with self._lock:
+            self._gc_pauses.extend((at, pause) for at, pause, _ in pauses)
+        if self._metrics_registry is not None:
+            for _, pause, generation in pauses:
+                self._metrics_registry.histogram(
+                    "lynx_gc_pause_seconds", "Garbage collector pause times",
+                    generation=str(generation),
+                ).observe(pause)
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._lags and self._lags[0][0] < cutoff:
+            self._lags.popleft()
+        while self._gc_pauses and self._gc_pauses[0][0] < cutoff:
+            self._gc_pauses.popleft()
+
+    def _pending_tasks(self) -> int:
+        loop = self._loop
+        if loop is None:
+            return 0
+        return sum(1 for task in asyncio.all_tasks(loop) if not task.done())
+
+    def _executor_queue_depth(self) -> int:
+        # The loop creates its default ThreadPoolExecutor lazily on first run_in_executor/to_thread
+        executor = getattr(self._loop, "_default_executor", None)
+        work_queue = getattr(executor, "_work_queue", None)
+        return work_queue.qsize() if work_queue is not None else 0
+
+
+# Global loop monitor instance
+_loop_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """
+    Get the global event loop monitor instance.
+
+    Returns:
+        LoopMonitor configured from Config
+    """
+    global _loop_monitor
+
+    if _loop_monitor is None:
+        registry = get_metrics_registry()
+        _loop_monitor = LoopMonitor(metrics_registry=registry)
+        registry.register_collector(_loop_monitor.export_metrics)
+
+    return _loop_monitor
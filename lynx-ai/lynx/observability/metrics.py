@@ -0,0 +1,303 @@
+"""
+Metrics for Lynx AI.
+
+In-process counters, gauges and HDR-style latency histograms, with a
+Prometheus text exposition for the /metrics endpoint.
+
+Histograms use log-linear buckets (HdrHistogram layout): values are recorded
+in microseconds, bucketed by power of two and split into 2**SUB_BUCKET_BITS
+linear sub-buckets, so recording is a couple of integer operations and
+quantiles are accurate to about 3% at any magnitude.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Linear sub-buckets per power of two (5 bits => ~3% relative error)
+SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF_SUB_BUCKETS = _SUB_BUCKETS >> 1
+
+# Upper bounds (seconds) used for the Prometheus histogram exposition
+DEFAULT_EXPORT_BOUNDS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF_SUB_BUCKETS + (micros >> shift)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """Return the [lower, upper) bounds of a bucket in microseconds."""
+    if index < _SUB_BUCKETS:
+        return index, index + 1
+    shift = index // _HALF_SUB_BUCKETS - 1
+    mantissa = index - shift * _HALF_SUB_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class Histogram:
+    """Log-linear latency histogram (values in seconds)."""
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one value.
+
+        Args:
+            seconds: Observed duration in seconds
+        """
+        index = _bucket_index(max(int(seconds * 1_000_000), 0))
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.sum += seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1] (e.g. 0.99)
+
+        Returns:
+            Estimated value in seconds (0.0 if empty)
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, int(q * self.count + 0.5))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    lower, upper = _bucket_bounds(index)
+                    return (lower + upper) / 2 / 1_000_000
+        return 0.0
+
+    def cumulative_counts(self, bounds: Tuple[float, ...]) -> List[int]:
+        """
+        Count values at or below each bound (for Prometheus `le` buckets).
+
+        Args:
+            bounds: Ascending upper bounds in seconds
+
+        Returns:
+            Cumulative counts, one per bound
+        """
+        with self._lock:
+            items = sorted(self._counts.items())
+        result = []
+        seen = 0
+        position = 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while position < len(items) and _bucket_bounds(items[position][0])[1] <= limit:
+                seen += items[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+
+class Counter:
+    """Monotonic counter."""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter."""
+        with self._lock:
+            self.value += amount
+
+
+class Gauge:
+    """Point-in-time value."""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge value."""
+        self.value = value
+
+
+class MetricsRegistry:
+    """Holds labelled metrics and renders them in Prometheus text format."""
+
+    def __init__(self):
+        self._families: Dict[str, Tuple[str, str]] = {}  # name -> (type, help)
+        self._metrics: Dict[str, Dict[LabelKey, object]] = {}
+        self._collectors: List[Callable[["MetricsRegistry"], None]] = []
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, help: str = "", **labels: str) -> Histogram:
+        """Get or create a histogram for a label set."""
+        return self._get(name, "histogram", help, Histogram, labels)
+
+    def counter(self, name: str, help: str = "", **labels: str) -> Counter:
+        """Get or create a counter for a label set."""
+        return self._get(name, "counter", help, Counter, labels)
+
+    def gauge(self, name: str, help: str = "", **labels: str) -> Gauge:
+        """Get or create a gauge for a label set."""
+        return self._get(name, "gauge", help, Gauge, labels)
+
+    def register_collector(self, collector: Callable[["MetricsRegistry"], None]) -> None:
+        """
+        Register a callback that refreshes gauges just before rendering.
+
+        Args:
+            collector: Callable receiving this registry
+        """
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def histograms(self, name: str) -> Iterator[Tuple[Dict[str, str], Histogram]]:
+        """
+        Iterate over the label sets and histograms of a family.
+
+        Args:
+            name: Metric name
+        """
+        for key, metric in list(self._metrics.get(name, {}).items()):
+            yield dict(key), metric
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format (0.0.4).
+
+        Returns:
+            Exposition text
+        """
+        for collector in list(self._collectors):
+            try:
+                collector(self)
+            except Exception as e:
+                logger.warning("Metrics collector failed: %s", e)
+
+        lines: List[str] = []
+        for name, (metric_type, help) in sorted(self._families.items()):
+            if help:
+                lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for key, metric in sorted(self._metrics[name].items()):
+                if metric_type == "histogram":
+                    counts = metric.cumulative_counts(DEFAULT_EXPORT_BOUNDS)
+                    for bound, count in zip(DEFAULT_EXPORT_BOUNDS, counts):
+                        lines.append(f"{name}_bucket{_format_labels(key, le=repr(bound))} {count}")
+                    lines.append(f'{name}_bucket{_format_labels(key, le="+Inf")} {metric.count}')
+                    lines.append(f"{name}_sum{_format_labels(key)} {metric.sum}")
+                    lines.append(f"{name}_count{_format_labels(key)} {metric.count}")
+                else:
+                    lines.append(f"{name}{_format_labels(key)} {metric.value}")
+        return "\n".join(lines) + "\n"
+
+    def _get(self, name: str, metric_type: str, help: str, factory, labels: Dict[str, str]):
+        key: LabelKey = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        family = self._metrics.get(name)
+        if family is not None and self._families[name][0] == metric_type:
+            metric = family.get(key)
+            if metric is not None:
+                return metric
+        with self._lock:
+            known = self._families.get(name)
+            if known is None:
+                self._families[name] = (metric_type, help)
+                self._metrics[name] = {}
+            elif known[0] != metric_type:
+                raise ValueError(f"Metric {name} is already registered as {known[0]}")
+            return self._metrics[name].setdefault(key, factory())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class StageTimer:
+    """
+    Times the stages of one operation into a labelled histogram family.
+
+    Usage:
+        timer = StageTimer("lynx_tool_stage_seconds", tool_id="...")
+        with timer.stage("handler"):
+            ...
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str = "",
+        registry: Optional[MetricsRegistry] = None,
+        **labels: str,
+    ):
+        self._name = name
+        self._help = help
+        self._registry = registry or get_metrics_registry()
+        self._labels = labels
+
+    def stage(self, stage: str) -> "_Stage":
+        """Return a context manager timing one stage."""
+        return _Stage(self._registry.histogram(self._name, self._help, stage=stage, **self._labels))
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record a stage duration measured by the caller."""
+        self._registry.histogram(self._name, self._help, stage=stage, **self._labels).observe(seconds)
+
+
+class _Stage:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self) -> "_Stage":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+# Global metrics registry instance
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the global metrics registry instance.
+
+    Returns:
+        MetricsRegistry shared by the process
+    """
+    global _metrics_registry
+
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+
+    return _metrics_registry
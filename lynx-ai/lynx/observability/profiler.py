@@ -0,0 +1,361 @@
+"""
+Profiling for Lynx AI.
+
+Opt-in diagnostics for a running daemon:
+
+- SamplingProfiler: samples the stacks of every thread (event loop, dashboard
+  server, worker threads) via sys._current_frames() for N seconds and returns
+  collapsed stacks (flamegraph.pl / speedscope input) or speedscope JSON.
+- SlowCallbackDetector: times every event loop step and reports the ones
+  that block the loop longer than a threshold (e.g., synchronous Supabase
+  calls made from async code).
+
+Captures are triggered with SIGUSR1 on the daemon or through the
+token-protected /debug/profile dashboard endpoint.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from lynx.config import Config
+from lynx.observability.logging import get_logger
+from lynx.observability.metrics import MetricsRegistry, get_metrics_registry
+
+logger = get_logger(__name__)
+
+# (function name, file, first line)
+Frame = Tuple[str, str, int]
+
+
+def _short_path(filename: str) -> str:
+    """Trim a source path to its last two components."""
+    parts = filename.replace("\\", "/").rsplit("/", 2)
+    return "/".join(parts[-2:])
+
+
+@dataclass
+class Profile:
+    """Aggregated stack samples from one capture."""
+    duration: float
+    interval: float
+    samples: Counter = field(default_factory=Counter)  # (thread name, frames root-first) -> count
+    sample_count: int = 0
+
+    def to_collapsed(self) -> str:
+        """
+        Render collapsed stacks ("thread;frame;frame count" per line).
+
+        Returns:
+            Collapsed-stack text, heaviest stacks first
+        """
+        lines = []
+        for (thread, frames), count in self.samples.most_common():
+            names = [thread] + [f"{name} ({path}:{line})" for name, path, line in frames]
+            lines.append(";".join(n.replace(";", ":") for n in names) + f" {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self, name: str = "lynx") -> Dict[str, Any]:
+        """
+        Render the capture in speedscope's file format (one profile per thread).
+
+        Args:
+            name: Profile name shown in speedscope
+
+        Returns:
+            Speedscope JSON document
+        """
+        frame_index: Dict[Frame, int] = {}
+        frames: List[Dict[str, Any]] = []
+        by_thread: Dict[str, List[Tuple[List[int], int]]] = {}
+
+        for (thread, stack), count in self.samples.items():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                indexes.append(frame_index[frame])
+            by_thread.setdefault(thread, []).append((indexes, count))
+
+        profiles = [
+            {
+                "type": "sampled",
+                "name": thread,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.duration,
+                "samples": [indexes for indexes, _ in stacks],
+                "weights": [count * self.interval for _, count in stacks],
+            }
+            for thread, stacks in sorted(by_thread.items())
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "lynx",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+class SamplingProfiler:
+    """Wall-clock stack sampler for all threads in the process."""
+
+    def __init__(self, interval: Optional[float] = None):
+        """
+        Initialize profiler.
+
+        Args:
+            interval: Seconds between samples (defaults to Config.PROFILER_SAMPLE_INTERVAL)
+        """
+        self.interval = interval or Config.PROFILER_SAMPLE_INTERVAL
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        """Whether a capture is running."""
+        return self._lock.locked()
+
+    def capture(self, seconds: float) -> Profile:
+        """
+        Sample all threads for a duration (blocking - run off the event loop).
+
+        Args:
+            seconds: Capture duration
+
+        Returns:
+            Aggregated Profile
+
+        Raises:
+            RuntimeError: If another capture is already running
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile capture is already running")
+        try:
+            return self._capture(seconds)
+        finally:
+            self._lock.release()
+
+    async def capture_async(self, seconds: float) -> Profile:
+        """Sample all threads for a duration without blocking the event loop."""
+        return await asyncio.to_thread(self.capture, seconds)
+
+    def _capture(self, seconds: float) -> Profile:
+        own_thread = threading.get_ident()
+        code_labels: Dict[Any, Frame] = {}
+        samples: Counter = Counter()
+        sample_count = 0
+
+        start = time.monotonic()
+        deadline = start + seconds
+        while True:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = code_labels.get(code)
+                    if label is None:
+                        label = (code.co_name, _short_path(code.co_filename), code.co_firstlineno)
+                        code_labels[code] = label
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.reverse()
+                samples[(names.get(thread_id, str(thread_id)), tuple(stack))] += 1
+            sample_count += 1
+
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            time.sleep(min(self.interval, deadline - now))
+
+        return Profile(
+            duration=time.monotonic() - start,
+            interval=self.interval,
+            samples=samples,
+            sample_count=sample_count,
+        )
+
+    def capture_to_files(self, seconds: float, output_dir: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Capture a profile and write collapsed and speedscope files.
+
+        Args:
+            seconds: Capture duration
+            output_dir: Directory for the files (defaults to Config.PROFILER_OUTPUT_DIR)
+
+        Returns:
+            (collapsed path, speedscope path)
+        """
+        profile = self.capture(seconds)
+        output_dir = output_dir or Config.PROFILER_OUTPUT_DIR
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.join(output_dir, f"lynx-profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}")
+
+        collapsed_path = f"{stem}.collapsed.txt"
+        with open(collapsed_path, "w", encoding="utf-8") as f:
+            f.write(profile.to_collapsed())
+        speedscope_path = f"{stem}.speedscope.json"
+        with open(speedscope_path, "w", encoding="utf-8") as f:
+            json.dump(profile.to_speedscope(), f)
+        return collapsed_path, speedscope_path
+
+    def start_background_capture(self, seconds: Optional[float] = None) -> threading.Thread:
+        """
+        Capture to files in a background thread (safe to call from a signal handler).
+
+        Args:
+            seconds: Capture duration (defaults to Config.PROFILER_DEFAULT_SECONDS)
+
+        Returns:
+            The capture thread
+        """
+        seconds = seconds or Config.PROFILER_DEFAULT_SECONDS
+
+        def run():
+            # Logging happens on this thread - the signal handler must not touch the log queue
+            logger.info("Capturing profile", extra={"seconds": seconds})
+            try:
+                collapsed_path, speedscope_path = self.capture_to_files(seconds)
+            except Exception as e:
+                logger.warning("Profile capture failed: %s", e)
+                return
+            logger.info("Profile written", extra={"collapsed": collapsed_path, "speedscope": speedscope_path})
+
+        thread = threading.Thread(target=run, name="lynx-profiler", daemon=True)
+        thread.start()
+        return thread
+
+
+# ============================================================================
+# Slow callback detection
+# ============================================================================
+
+def _describe_callback(handle: asyncio.Handle) -> str:
+    """Describe the callback of an event loop handle."""
+    callback = handle._callback
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        return f"Task {owner.get_name()} ({getattr(coro, '__qualname__', coro)})"
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+class SlowCallbackDetector:
+    """Reports event loop steps that block longer than a threshold."""
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
+        max_events: int = 100,
+    ):
+        """
+        Initialize detector.
+
+        Args:
+            threshold: Seconds a single loop step may take before it is reported
+                (defaults to Config.SLOW_CALLBACK_THRESHOLD)
+            metrics_registry: Registry for the slow-callback histogram (None to disable)
+            max_events: Number of recent slow callbacks to keep
+        """
+        self.threshold = threshold if threshold is not None else Config.SLOW_CALLBACK_THRESHOLD
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self.slow_total = 0
+        self._histogram = metrics_registry.histogram(
+            "lynx_loop_slow_callback_seconds",
+            "Event loop steps that blocked longer than the slow-callback threshold",
+        ) if metrics_registry else None
+        self._original_run = None
+
+    @property
+    def installed(self) -> bool:
+        """Whether the detector is timing loop steps."""
+        return self._original_run is not None
+
+    def install(self) -> None:
+        """Start timing every event loop step (all loops in the process)."""
+        if self.installed:
+            return
+        original_run = asyncio.events.Handle._run
+        detector = self
+
+        def _run(handle):
+            start = time.perf_counter()
+            try:
+                return original_run(handle)
+            finally:
+                elapsed = time.perf_counter() - start
+                if elapsed >= detector.threshold:
+                    detector._report(handle, elapsed)
+
+        self._original_run = original_run
+        asyncio.events.Handle._run = _run
+
+    def uninstall(self) -> None:
+        """Stop timing loop steps."""
+        if self._original_run is not None:
+            asyncio.events.Handle._run = self._original_run
+            self._original_run = None
+
+    def _report(self, handle: asyncio.Handle, elapsed: float) -> None:
+        callback = _describe_callback(handle)
+        self.slow_total += 1
+        self.events.append({
+            "callback": callback,
+            "duration_ms": round(elapsed * 1000, 1),
+            "thread": threading.current_thread().name,
+            "timestamp": datetime.now().isoformat(),
+        })
+        if self._histogram is not None:
+            self._histogram.observe(elapsed)
+        logger.warning(
+            "Slow callback blocked the event loop for %.1fms: %s", elapsed * 1000, callback,
+            extra={"duration_ms": round(elapsed * 1000, 1)},
+        )
+
+
+# Global instances
+_profiler: Optional[SamplingProfiler] = None
+_slow_callback_detector: Optional[SlowCallbackDetector] = None
+
+
+def get_profiler() -> SamplingProfiler:
+    """
+    Get the global sampling profiler instance.
+
+    Returns:
+        SamplingProfiler shared by the process
+    """
+    global _profiler
+
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+
+    return _profiler
+
+
+def get_slow_callback_detector() -> SlowCallbackDetector:
+    """
+    Get the global slow-callback detector instance.
+
+    Returns:
+        SlowCallbackDetector reporting into the global metrics registry
+    """
+    global _slow_callback_detector
+
+    if _slow_callback_detector is None:
+        _slow_callback_detector = SlowCallbackDetector(metrics_registry=get_metrics_registry())
+
+    return _slow_callback_detector
@@ -0,0 +1,395 @@
+"""
+Tracing for Lynx AI.
+
+Lightweight, OpenTelemetry-style spans for tool execution, handlers, Kernel
+HTTP calls, storage calls and chat runs. Spans are linked through a
+contextvar and share the run's lynx_run_id as their trace ID, so everything
+one run did can be pulled out of an exporter by run ID.
+
+Exporters:
+- "none" (default): tracing is disabled and spans cost almost nothing
+- "memory": keeps finished spans in memory (tests)
+- "json": appends one JSON object per span to a file (offline analysis)
+- "otel": forwards spans to OpenTelemetry (requires opentelemetry-api)
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from lynx.config import Config
+from lynx.observability.logging import get_logger
+
+try:
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+    otel_trace = None
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Span:
+    """A timed operation within a run."""
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"  # ok, error
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Span duration in milliseconds (None while open)."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set a span attribute."""
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the span."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """Span stand-in used while tracing is disabled."""
+
+    __slots__ = ()
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+# ============================================================================
+# Exporters
+# ============================================================================
+
+class SpanExporter:
+    """Receives finished spans."""
+
+    enabled = True
+
+    def export(self, span: Span) -> None:
+        """Export one finished span."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+        pass
+
+
+class NoopSpanExporter(SpanExporter):
+    """Drops all spans (tracing disabled)."""
+
+    enabled = False
+
+    def export(self, span: Span) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in memory."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def get_spans(self, trace_id: Optional[str] = None, name: Optional[str] = None) -> List[Span]:
+        """
+        Get finished spans, optionally filtered.
+
+        Args:
+            trace_id: Only spans of this trace (lynx_run_id)
+            name: Only spans with this name
+        """
+        with self._lock:
+            spans = list(self.spans)
+        return [
+            s for s in spans
+            if (trace_id is None or s.trace_id == trace_id) and (name is None or s.name == name)
+        ]
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """Appends spans as JSON lines to a local file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize exporter.
+
+        Args:
+            path: Output file (one JSON span per line)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OpenTelemetrySpanExporter(SpanExporter):
+    """Forwards finished spans to the configured OpenTelemetry tracer provider."""
+
+    def __init__(self):
+        if not OTEL_AVAILABLE:
+            raise ImportError("opentelemetry-api is required for the otel trace exporter")
+        self._tracer = otel_trace.get_tracer("lynx")
+
+    def export(self, span: Span) -> None:
+        otel_span = self._tracer.start_span(
+            span.name,
+            start_time=span.start_time_ns,
+            attributes={
+                "lynx.trace_id": span.trace_id,
+                "lynx.span_id": span.span_id,
+                "lynx.parent_id": span.parent_id or "",
+                **{k: v if isinstance(v, (str, bool, int, float)) else str(v) for k, v in span.attributes.items()},
+            },
+        )
+        if span.status == "error":
+            otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=span.end_time_ns)
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("lynx_current_span", default=None)
+
+
+class Tracer:
+    """Creates spans and hands finished spans to an exporter."""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        """
+        Initialize tracer.
+
+        Args:
+            exporter: Span exporter (defaults to no-op)
+        """
+        self.exporter = exporter or NoopSpanExporter()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being recorded."""
+        return self.exporter.enabled
+
+    def set_exporter(self, exporter: SpanExporter) -> None:
+        """Replace the exporter (the previous one is shut down)."""
+        previous, self.exporter = self.exporter, exporter
+        if previous is not exporter:
+            previous.shutdown()
+
+    def current_span(self) -> Optional[Span]:
+        """Get the span active in the current context."""
+        return _current_span.get()
+
+    def start_span(
+        self,
+        name: str,
+        trace_id: Optional[str] = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Start a span without activating it (end it with end_span).
+
+        Args:
+            name: Span name (e.g., "tool.execute")
+            trace_id: Trace ID (defaults to the parent's, or a new ID)
+            **attributes: Span attributes
+
+        Returns:
+            The started Span
+        """
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=trace_id or (parent.trace_id if parent else uuid4().hex),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+
+    def end_span(self, span: Span) -> None:
+        """Finish a span and export it."""
+        span.end_time_ns = time.time_ns()
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logger.warning("Span export failed: %s", e)
+
+    @contextmanager
+    def use_span(self, span: Span) -> Iterator[Span]:
+        """Make a span current for the block (without ending it)."""
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    @contextmanager
+    def span(self, name: str, trace_id: Optional[str] = None, **attributes: Any) -> Iterator[Any]:
+        """
+        Record a span around a block.
+
+        Args:
+            name: Span name
+            trace_id: Trace ID (pass context.lynx_run_id at run boundaries)
+            **attributes: Span attributes
+
+        Yields:
+            The active Span (a no-op span when tracing is disabled)
+        """
+        if not self.exporter.enabled:
+            yield _NOOP_SPAN
+            return
+
+        span = self.start_span(name, trace_id=trace_id, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+
+def traced(name: str, **attributes: Any) -> Callable:
+    """
+    Decorator recording a span around an async function.
+
+    Args:
+        name: Span name
+        **attributes: Static span attributes
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            span_attributes = dict(attributes)
+            tenant_id = signature.bind_partial(*args, **kwargs).arguments.get("tenant_id")
+            if tenant_id is not None:
+                span_attributes["tenant_id"] = tenant_id
+            with tracer.span(name, **span_attributes):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def trace_methods(prefix: str) -> Callable[[type], type]:
+    """
+    Class decorator recording a span around each public async method
+    defined on the class (span name "<prefix>.<method>").
+
+    Args:
+        prefix: Span name prefix (e.g., "storage.drafts")
+    """
+    def decorator(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and inspect.iscoroutinefunction(value):
+                setattr(cls, attr, traced(f"{prefix}.{attr}", backend=cls.__name__)(value))
+        return cls
+    return decorator
+
+
+def create_span_exporter(kind: Optional[str] = None) -> SpanExporter:
+    """
+    Create a span exporter from configuration.
+
+    Args:
+        kind: "none", "memory", "json" or "otel" (defaults to Config.TRACE_EXPORTER)
+
+    Returns:
+        SpanExporter instance (no-op if the kind is unknown or unavailable)
+    """
+    kind = (kind or Config.TRACE_EXPORTER).lower()
+    if kind == "memory":
+        return InMemorySpanExporter()
+    if kind == "json":
+        return JsonFileSpanExporter(Config.TRACE_FILE)
+    if kind == "otel":
+        if OTEL_AVAILABLE:
+            return OpenTelemetrySpanExporter()
+        logger.warning("LYNX_TRACE_EXPORTER=otel but opentelemetry is not installed - tracing disabled")
+    return NoopSpanExporter()
+
+
+# Global tracer instance
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the global tracer instance.
+
+    Returns:
+        Tracer using the exporter selected by LYNX_TRACE_EXPORTER
+    """
+    global _tracer
+
+    if _tracer is None:
+        _tracer = Tracer(create_span_exporter())
+
+    return _tracer
@@ -9,7 +9,6 @@ import asyncio
 import os
 import signal
 import sys
-from datetime import datetime
 from typing import Optional
 
 from lynx.config import Config
@@ -18,7 +17,13 @@ from lynx.core.session import SessionManager
 from lynx.core.registry import MCPToolRegistry
 from lynx.core.audit import AuditLogger
 from lynx.mcp.server import initialize_mcp_server
+from lynx.observability.logging import get_logger, setup_logging
+from lynx.observability.loop_monitor import get_loop_monitor
+from lynx.observability.profiler import get_profiler, get_slow_callback_detector
 from lynx.runtime.dashboard_server import start_dashboard_server
+from lynx.runtime.settlement_worker import get_settlement_worker
+
+logger = get_logger(__name__)
 
 
 class LynxDaemon:
@@ -32,40 +37,55 @@ class LynxDaemon:
         self.tool_registry: Optional[MCPToolRegistry] = None
         self.audit_logger: Optional[AuditLogger] = None
         self.config: Optional[dict] = None
+        self.shutdown_signal: Optional[int] = None
         
         # Setup signal handlers
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
+        
+        # Opt-in profiling: SIGUSR1 captures a profile to LYNX_PROFILER_OUTPUT_DIR
+        if Config.PROFILER_ENABLED and hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, self._handle_profile_signal)
     
     def _handle_shutdown(self, signum, frame):
         """Handle shutdown signals (SIGTERM/SIGINT)."""
-        print(f"\n🛑 Received signal {signum}, initiating graceful shutdown...")
+        # No logging here: the handler may interrupt a thread holding the log queue lock
+        self.shutdown_signal = signum
         self.running = False
         self.shutdown_event.set()
     
+    def _handle_profile_signal(self, signum, frame):
+        """Handle SIGUSR1 by sampling all threads in the background."""
+        get_profiler().start_background_capture()
+    
     async def initialize(self) -> bool:
         """Initialize Lynx components."""
-        print("🚀 Starting Lynx AI Daemon...")
-        print("=" * 60)
+        logger.info("Starting Lynx AI daemon")
         
         # Load configuration
         try:
             self.config = load_config()
-            print("✅ Configuration loaded")
+            logger.info("Configuration loaded")
         except Exception as e:
-            print(f"❌ Failed to load configuration: {e}")
-            print("\n💡 Please:")
-            print("   1. Copy config/config.yaml.example to config/config.yaml")
-            print("   2. Set required environment variables")
+            logger.error(
+                "Failed to load configuration: %s "
+                "(copy config/config.yaml.example to config/config.yaml and set required environment variables)",
+                e,
+            )
             return False
         
+        # Report event loop steps that block longer than the threshold
+        if Config.SLOW_CALLBACK_THRESHOLD > 0:
+            get_slow_callback_detector().install()
+            logger.info("Slow callback detector enabled", extra={"threshold_ms": Config.SLOW_CALLBACK_THRESHOLD * 1000})
+        
         # Initialize components
         try:
             self.session_manager = SessionManager()
             self.tool_registry = MCPToolRegistry()
-            print("✅ Core components initialized")
+            logger.info("Core components initialized")
         except Exception as e:
-            print(f"❌ Failed to initialize core components: {e}")
+            logger.error("Failed to initialize core components: %s", e)
             return False
         
         # Initialize audit logger
@@ -74,46 +94,44 @@ class LynxDaemon:
                 supabase_url=self.config["supabase"]["url"],
                 supabase_key=self.config["supabase"]["key"],
             )
-            print("✅ Audit logger initialized")
+            logger.info("Audit logger initialized")
         except Exception as e:
-            print(f"⚠️  Audit logger initialization failed: {e}")
-            print("   Continuing without audit logging (not recommended for production)")
+            logger.warning(
+                "Audit logger initialization failed: %s - continuing without audit logging "
+                "(not recommended for production)",
+                e,
+            )
             self.audit_logger = None
         
         # Initialize MCP server and register tools
         try:
             initialize_mcp_server(self.tool_registry)
-            print("✅ MCP server initialized")
+            logger.info("MCP server initialized")
         except Exception as e:
-            print(f"⚠️  MCP server initialization failed: {e}")
-            print("   Some tools may not be available")
+            logger.error("MCP server initialization failed: %s - some tools may not be available", e)
             return False
         
         # Get storage backend type
         from lynx.storage.draft_storage import get_draft_storage
         storage = get_draft_storage()
-        storage_backend = "supabase" if hasattr(storage, 'client') else "memory"
+        storage_backend = storage.backend
         
         # Get version info
         from lynx.__version__ import LYNX_PROTOCOL_VERSION, MCP_TOOLSET_VERSION
         
-        # Print startup banner
-        print("\n" + "=" * 60)
-        print("📋 Lynx AI Startup Banner")
-        print("=" * 60)
-        print(f"   Environment:        {Config.LYNX_MODE.value.upper()}")
-        print(f"   Runner Mode:         {Config.LYNX_RUNNER.value.upper()}")
-        print(f"   Storage Backend:     {storage_backend.upper()}")
-        print(f"   Protocol Version:   {LYNX_PROTOCOL_VERSION}")
-        print(f"   Toolset Version:    {MCP_TOOLSET_VERSION}")
-        print("=" * 60)
-        print("\n📋 Lynx AI Status:")
-        print(f"   ✅ Tools registered: {len(self.tool_registry.list_all())}")
-        print(f"   ✅ Domain MCPs: {len(self.tool_registry.list_by_layer('domain'))}")
-        print(f"   ✅ Cluster MCPs: {len(self.tool_registry.list_by_layer('cluster'))}")
-        print(f"   ✅ Cell MCPs: {len(self.tool_registry.list_by_layer('cell'))}")
-        print(f"   ✅ Active sessions: {len(self.session_manager.sessions)}")
-        print("=" * 60)
+        # Startup banner
+        logger.info("Lynx AI startup", extra={
+            "environment": Config.LYNX_MODE.value,
+            "runner_mode": Config.LYNX_RUNNER.value,
+            "storage_backend": storage_backend,
+            "protocol_version": LYNX_PROTOCOL_VERSION,
+            "toolset_version": MCP_TOOLSET_VERSION,
+            "tools_registered": len(self.tool_registry.list_all()),
+            "domain_tools": len(self.tool_registry.list_by_layer('domain')),
+            "cluster_tools": len(self.tool_registry.list_by_layer('cluster')),
+            "cell_tools": len(self.tool_registry.list_by_layer('cell')),
+            "active_sessions": len(self.session_manager.sessions),
+        })
         # Start dashboard server (if enabled)
         dashboard_enabled = os.getenv("DASHBOARD_ENABLED", "true").lower() == "true"
         if dashboard_enabled:
@@ -121,17 +139,22 @@ class LynxDaemon:
                 dashboard_port = int(os.getenv("PORT", "8000"))
                 start_dashboard_server(dashboard_port)
             except Exception as e:
-                print(f"⚠️  Dashboard server failed to start: {e}")
-                print("   Continuing without dashboard (daemon will still work)")
+                logger.warning("Dashboard server failed to start: %s - continuing without dashboard", e)
         
-        print("\n💚 Daemon running. Waiting for MCP client connections...")
-        print(f"   Heartbeat interval: {Config.DAEMON_HEARTBEAT_INTERVAL}s")
-        print(f"   Status check interval: {Config.DAEMON_STATUS_CHECK_INTERVAL}s")
+        running_fields = {
+            "heartbeat_interval_s": Config.DAEMON_HEARTBEAT_INTERVAL,
+            "status_check_interval_s": Config.DAEMON_STATUS_CHECK_INTERVAL,
+            "pid": os.getpid(),
+        }
         if dashboard_enabled:
-            dashboard_url = os.getenv("RAILWAY_PUBLIC_DOMAIN", f"http://localhost:{os.getenv('PORT', '8000')}")
-            print(f"   🌐 Dashboard: {dashboard_url}/")
-            print(f"   📊 Health: {dashboard_url}/health")
-        print("   Press Ctrl+C or send SIGTERM to shutdown gracefully\n")
+            running_fields["dashboard_url"] = os.getenv(
+                "RAILWAY_PUBLIC_DOMAIN", f"http://localhost:{os.getenv('PORT', '8000')}"
+            )
+        if Config.SETTLEMENT_WORKER_ENABLED:
+            running_fields["settlement_worker_concurrency"] = Config.SETTLEMENT_WORKER_CONCURRENCY
+        if Config.PROFILER_ENABLED:
+            running_fields["profiler_output_dir"] = Config.PROFILER_OUTPUT_DIR  # kill -USR1 <pid>
+        logger.info("Daemon running, waiting for MCP client connections", extra=running_fields)
         
         return True
     
@@ -147,17 +170,31 @@ class LynxDaemon:
                     break
                 
                 heartbeat_count += 1
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 # Simple heartbeat log
-                print(f"💓 [{timestamp}] Heartbeat #{heartbeat_count} | "
-                      f"Tools: {len(self.tool_registry.list_all())} | "
-                      f"Sessions: {len(self.session_manager.sessions)}")
+                session_metrics = self.session_manager.metrics()
+                loop_health = get_loop_monitor().sample()
+                logger.info("Heartbeat", extra={
+                    "heartbeat": heartbeat_count,
+                    "tools": len(self.tool_registry.list_all()),
+                    "sessions": len(self.session_manager.sessions),
+                    "sessions_expired_total": session_metrics['expired_total'],
+                    "sessions_evicted_total": session_metrics['evicted_total'],
+                    "loop_lag_ms": round(loop_health.lag_seconds * 1000, 1),
+                    "loop_lag_max_ms": round(loop_health.lag_max_seconds * 1000, 1),
+                    "pending_tasks": loop_health.pending_tasks,
+                    "executor_queue_depth": loop_health.executor_queue_depth,
+                    "gc_pause_max_ms": round(loop_health.gc_pause_max_seconds * 1000, 1),
+                })
+                if loop_health.degraded_reasons:
+                    logger.warning("Event loop degraded: %s", "; ".join(loop_health.degraded_reasons))
+                if Config.SETTLEMENT_WORKER_ENABLED:
+                    logger.info("Settlement worker", extra=get_settlement_worker().metrics())
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"⚠️  Heartbeat error: {e}")
+                logger.warning("Heartbeat error: %s", e)
     
     async def run_status_check(self):
         """Run periodic status checks (every N seconds)."""
@@ -173,30 +210,31 @@ class LynxDaemon:
                     break
                 
                 status_check_count += 1
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 # Run status check
                 try:
                     status = await get_lynx_status()
-                    print(f"📊 [{timestamp}] Status Check #{status_check_count}:")
-                    print(f"   Status: {status['status'].upper()}")
-                    print(f"   Storage: {status['storage_backend'].upper()}")
-                    print(f"   Drafts (24h): {status['draft_count_24h']}")
-                    print(f"   Executions (24h): {status['execution_count_24h']}")
-                    print(f"   Pending Settlements: {status['pending_settlement_count']}")
+                    logger.info("Status check", extra={
+                        "status_check": status_check_count,
+                        "status": status['status'],
+                        "storage_backend": status['storage_backend'],
+                        "draft_count_24h": status['draft_count_24h'],
+                        "execution_count_24h": status['execution_count_24h'],
+                        "pending_settlement_count": status['pending_settlement_count'],
+                    })
                 except Exception as e:
-                    print(f"⚠️  Status check error: {e}")
+                    logger.warning("Status check error: %s", e)
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"⚠️  Status check loop error: {e}")
+                logger.warning("Status check loop error: %s", e)
     
     async def run(self):
         """Run daemon main loop."""
         # Initialize
         if not await self.initialize():
-            print("❌ Initialization failed, exiting")
+            logger.error("Initialization failed, exiting")
             sys.exit(1)
         
         self.running = True
@@ -204,35 +242,40 @@ class LynxDaemon:
         # Start background tasks
         heartbeat_task = asyncio.create_task(self.run_heartbeat())
         status_task = asyncio.create_task(self.run_status_check())
+        sweeper_task = asyncio.create_task(self.session_manager.run_sweeper())
+        loop_monitor_task = asyncio.create_task(get_loop_monitor().run())
+        background_tasks = [heartbeat_task, status_task, sweeper_task, loop_monitor_task]
+        if Config.SETTLEMENT_WORKER_ENABLED:
+            background_tasks.append(asyncio.create_task(get_settlement_worker().run()))
         
         try:
             # Wait for shutdown signal
             await self.shutdown_event.wait()
             
-            print("\n🛑 Shutdown signal received, cleaning up...")
+            logger.info("Shutdown signal received, cleaning up", extra={"signal": self.shutdown_signal})
             
             # Cancel background tasks
-            heartbeat_task.cancel()
-            status_task.cancel()
+            for task in background_tasks:
+                task.cancel()
             
             # Wait for tasks to finish (with timeout)
             try:
                 await asyncio.wait_for(
-                    asyncio.gather(heartbeat_task, status_task, return_exceptions=True),
+                    asyncio.gather(*background_tasks, return_exceptions=True),
                     timeout=5.0
                 )
             except asyncio.TimeoutError:
-                print("⚠️  Some tasks did not finish in time")
+                logger.warning("Some tasks did not finish in time")
             
-            print("✅ Graceful shutdown complete")
+            logger.info("Graceful shutdown complete")
             
         except KeyboardInterrupt:
-            print("\n🛑 Keyboard interrupt received")
+            logger.info("Keyboard interrupt received")
             self.running = False
-            heartbeat_task.cancel()
-            status_task.cancel()
+            for task in background_tasks:
+                task.cancel()
         except Exception as e:
-            print(f"❌ Daemon error: {e}")
+            logger.exception("Daemon error: %s", e)
             raise
         finally:
             self.running = False
@@ -240,6 +283,7 @@ class LynxDaemon:
 
 async def main():
     """Main entry point for daemon mode."""
+    setup_logging()
     daemon = LynxDaemon()
     await daemon.run()
 
@@ -10,6 +10,9 @@ import uvicorn
 from threading import Thread
 
 from lynx.api.dashboard import app
+from lynx.observability.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 def start_dashboard_server(port: Optional[int] = None):
@@ -33,9 +36,11 @@ def start_dashboard_server(port: Optional[int] = None):
     # Start dashboard in background thread
     dashboard_thread = Thread(target=run_server, daemon=True)
     dashboard_thread.start()
-    print(f"🌐 Dashboard server started on port {port}")
-    print(f"   Access at: http://localhost:{port}/")
-    print(f"   Health check: http://localhost:{port}/health")
-    print(f"   API status: http://localhost:{port}/api/status")
+    logger.info("Dashboard server started", extra={
+        "port": port,
+        "url": f"http://localhost:{port}/",
+        "health_url": f"http://localhost:{port}/health",
+        "status_url": f"http://localhost:{port}/api/status",
+    })
     return dashboard_thread
 
@@ -0,0 +1,315 @@
+"""
+Settlement Worker
+
+Background processor for settlement intents (created as "queued" by payment
+execution):
+- Claims due intents in batches (Supabase: FOR UPDATE SKIP LOCKED; every
+  claim carries a lease, so intents held by a crashed worker are claimed
+  again once the lease expires)
+- Settles each intent through the SettlementProvider registered for
+  intent.provider, with bounded concurrency
+- Completes the intent, or re-queues it with exponential backoff until
+  max_attempts, then marks it failed
+- Exports throughput metrics (claimed / completed / retried / failed,
+  attempt latency)
+"""
+
+import asyncio
+import os
+import random
+import socket
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from lynx.config import Config
+from lynx.observability.logging import get_logger
+from lynx.observability.metrics import MetricsRegistry, get_metrics_registry
+from lynx.storage.settlement_storage import (
+    SettlementIntent,
+    SettlementIntentStorage,
+    get_settlement_storage,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SettlementResult:
+    """Outcome of one settlement attempt."""
+    success: bool
+    reference: Optional[str] = None  # Provider-side settlement reference
+    error: Optional[str] = None
+    retryable: bool = True
+
+
+class SettlementProvider:
+    """
+    Settlement provider interface.
+    
+    One instance per provider name (the intent's provider column). settle()
+    handles one intent; raising counts as a retryable failure.
+    """
+    
+    name: str = ""
+    
+    async def settle(self, intent: SettlementIntent) -> SettlementResult:
+        """
+        Settle one intent.
+        
+        Args:
+            intent: Claimed settlement intent
+        
+        Returns:
+            SettlementResult
+        """
+        raise NotImplementedError
+
+
+class FakeSettlementProvider(SettlementProvider):
+    """
+    Local provider for development and tests (no external calls).
+    
+    Waits `latency` seconds per intent and fails with probability
+    `failure_rate` (retryable).
+    """
+    
+    def __init__(
+        self,
+        name: str = "none",
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize fake provider.
+        
+        Args:
+            name: Provider name it handles (default "none": internal-only payments)
+            latency: Simulated settlement latency in seconds
+            failure_rate: Probability of a simulated failure (0-1)
+            rng: Random source (for reproducible failures)
+        """
+        self.name = name
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._rng = rng or random.Random()
+    
+    async def settle(self, intent: SettlementIntent) -> SettlementResult:
+        """Settle one intent (simulated)."""
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        if self._rng.random() < self.failure_rate:
+            return SettlementResult(success=False, error="simulated provider failure")
+        return SettlementResult(success=True, reference=f"fake-{intent.payment_id}")
+
+
+class SettlementWorker:
+    """Claims queued settlement intents and settles them through providers."""
+    
+    def __init__(
+        self,
+        storage: Optional[SettlementIntentStorage] = None,
+        providers: Optional[Dict[str, SettlementProvider]] = None,
+        concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        worker_id: Optional[str] = None,
+        metrics_registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initialize settlement worker.
+        
+        Args:
+            storage: Settlement storage (defaults to the global instance)
+            providers: Provider name -> provider; only intents of these
+                providers are claimed (defaults to a FakeSettlementProvider for "none")
+            concurrency: Max intents settled at once (defaults to Config.SETTLEMENT_WORKER_CONCURRENCY)
+            batch_size: Max intents per claim (defaults to Config.SETTLEMENT_BATCH_SIZE)
+            poll_interval: Seconds to wait when the queue is drained
+                (defaults to Config.SETTLEMENT_POLL_INTERVAL)
+            lease_seconds: Processing lease per claim (defaults to Config.SETTLEMENT_LEASE_SECONDS)
+            max_attempts: Attempts before an intent is failed (defaults to Config.SETTLEMENT_MAX_ATTEMPTS)
+            backoff_base: First retry delay in seconds (defaults to Config.SETTLEMENT_BACKOFF_BASE)
+            backoff_max: Max retry delay in seconds (defaults to Config.SETTLEMENT_BACKOFF_MAX)
+            worker_id: Lease owner name (defaults to hostname-pid)
+            metrics_registry: Registry for throughput metrics (None to disable)
+        """
+        self.storage = storage
+        self.providers = providers if providers is not None else {"none": FakeSettlementProvider()}
+        self.concurrency = concurrency or Config.SETTLEMENT_WORKER_CONCURRENCY
+        self.batch_size = batch_size or Config.SETTLEMENT_BATCH_SIZE
+        self.poll_interval = poll_interval or Config.SETTLEMENT_POLL_INTERVAL
+        self.lease_seconds = lease_seconds or Config.SETTLEMENT_LEASE_SECONDS
+        self.max_attempts = max_attempts or Config.SETTLEMENT_MAX_ATTEMPTS
+        self.backoff_base = backoff_base or Config.SETTLEMENT_BACKOFF_BASE
+        self.backoff_max = backoff_max or Config.SETTLEMENT_BACKOFF_MAX
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        
+        self._metrics_registry = metrics_registry
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._started_at: Optional[float] = None
+        self.in_flight = 0
+        self.claimed_total = 0
+        self.outcomes: Dict[str, int] = {"completed": 0, "retried": 0, "failed": 0, "lease_lost": 0}
+    
+    def backoff_seconds(self, attempts: int) -> float:
+        """
+        Delay before the next attempt (exponential, with jitter).
+        
+        Args:
+            attempts: Attempts made so far (>= 1)
+        
+        Returns:
+            Seconds in [delay / 2, delay], delay = min(backoff_max, backoff_base * 2^(attempts - 1))
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** max(attempts - 1, 0))
+        return delay * random.uniform(0.5, 1.0)
+    
+    async def run_once(self) -> int:
+        """
+        Claim one batch and settle it.
+        
+        Returns:
+            Number of intents claimed
+        """
+        storage = self.storage or get_settlement_storage()
+        intents = await storage.claim_intents(
+            worker_id=self.worker_id,
+            providers=list(self.providers),
+            batch_size=self.batch_size,
+            lease_seconds=self.lease_seconds,
+        )
+        self.claimed_total += len(intents)
+        if self._metrics_registry is not None and intents:
+            self._metrics_registry.counter(
+                "lynx_settlement_claimed_total", "Settlement intents claimed by the worker",
+            ).inc(len(intents))
+        
+        if intents:
+            await asyncio.gather(*(self._process(storage, intent) for intent in intents))
+        return len(intents)
+    
+    async def run(self) -> None:
+        """Process batches until cancelled; waits poll_interval once the queue is drained."""
+        self._started_at = time.monotonic()
+        logger.info("Settlement worker started", extra={
+            "worker_id": self.worker_id,
+            "providers": sorted(self.providers),
+            "concurrency": self.concurrency,
+            "batch_size": self.batch_size,
+        })
+        while True:
+            try:
+                claimed = await self.run_once()
+                if claimed < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning("Settlement worker error: %s", e)
+                await asyncio.sleep(self.poll_interval)
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get worker metrics.
+        
+        Returns:
+            Dict with claimed / outcome totals, in-flight count and
+            completed intents per second since start
+        """
+        uptime = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "worker_id": self.worker_id,
+            "in_flight": self.in_flight,
+            "claimed_total": self.claimed_total,
+            "completed_total": self.outcomes["completed"],
+            "retried_total": self.outcomes["retried"],
+            "failed_total": self.outcomes["failed"],
+            "lease_lost_total": self.outcomes["lease_lost"],
+            "completed_per_second": round(self.outcomes["completed"] / uptime, 3) if uptime > 0 else 0.0,
+        }
+    
+    async def _process(self, storage: SettlementIntentStorage, intent: SettlementIntent) -> None:
+        """Settle one claimed intent and record the outcome."""
+        async with self._semaphore:
+            self.in_flight += 1
+            start = time.perf_counter()
+            try:
+                result = await self.providers[intent.provider].settle(intent)
+            except Exception as e:
+                result = SettlementResult(success=False, error=str(e) or type(e).__name__)
+            finally:
+                self.in_flight -= 1
+            if self._metrics_registry is not None:
+                self._metrics_registry.histogram(
+                    "lynx_settlement_attempt_seconds", "Settlement provider call latency",
+                    provider=intent.provider,
+                ).observe(time.perf_counter() - start)
+        
+        release = dict(payment_id=intent.payment_id, tenant_id=intent.tenant_id, worker_id=self.worker_id)
+        if result.success:
+            outcome = "completed"
+            released = await storage.release_intent(
+                **release,
+                new_status="completed",
+                metadata={**intent.metadata, "settlement_reference": result.reference},
+            )
+        elif result.retryable and intent.attempts < self.max_attempts:
+            outcome = "retried"
+            next_attempt_at = datetime.now() + timedelta(seconds=self.backoff_seconds(intent.attempts))
+            released = await storage.release_intent(
+                **release,
+                new_status="queued",
+                last_error=result.error,
+                next_attempt_at=next_attempt_at.isoformat(),
+            )
+        else:
+            outcome = "failed"
+            released = await storage.release_intent(**release, new_status="failed", last_error=result.error)
+        
+        if released is None:
+            # Lease expired and another worker took the intent over
+            outcome = "lease_lost"
+            logger.warning(
+                "Settlement lease lost",
+                extra={"payment_id": intent.payment_id, "tenant_id": intent.tenant_id},
+            )
+        elif outcome == "failed":
+            logger.warning(
+                "Settlement failed after %d attempts: %s", intent.attempts, result.error,
+                extra={"payment_id": intent.payment_id, "tenant_id": intent.tenant_id},
+            )
+        
+        self.outcomes[outcome] += 1
+        if self._metrics_registry is not None:
+            self._metrics_registry.counter(
+                "lynx_settlement_intents_total", "Settlement attempts by outcome",
+                outcome=outcome, provider=intent.provider,
+            ).inc()
+
+
+# Global settlement worker instance
+_settlement_worker: Optional[SettlementWorker] = None
+
+
+def get_settlement_worker() -> SettlementWorker:
+    """
+    Get the global settlement worker instance.
+    
+    Returns:
+        SettlementWorker configured from Config
+    """
+    global _settlement_worker
+    
+    if _settlement_worker is None:
+        _settlement_worker = SettlementWorker(metrics_registry=get_metrics_registry())
+    
+    return _settlement_worker
@@ -0,0 +1,528 @@
+"""
+Audit Archive - cold audit history in partitioned Parquet files.
+
+Audit rows (lynx_runs, audit_logs, lynx_audit_events) older than
+Config.AUDIT_ARCHIVE_AFTER_DAYS are moved out of the hot Supabase tables into
+compressed Parquet files, partitioned by tenant and day:
+    
+    <LYNX_AUDIT_ARCHIVE_DIR>/<table>/tenant_id=<tenant>/day=<YYYY-MM-DD>/part-<id>.parquet
+
+Reads use pyarrow.dataset with predicate pushdown: a tenant-scoped scan only
+lists that tenant's directory, day partitions outside the time range are
+pruned, and row filters (time range, run_id, tool_id, ...) are checked
+against Parquet row-group statistics before any data is decoded.
+
+Requires pyarrow (optional dependency); without it (or without an archive
+directory configured) get_audit_archive() returns None and audit reads only
+see the hot tables.
+"""
+
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+from lynx.config import Config
+from lynx.observability.logging import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = pc = ds = pq = None
+
+try:
+    from supabase import Client
+except ImportError:
+    Client = None
+
+logger = get_logger(__name__)
+
+# Max values per in_() filter (PostgREST puts them in the URL)
+_IN_CHUNK = 100
+
+
+@dataclass(frozen=True)
+class ArchiveTable:
+    """Archived columns of one audit table (tenant_id is the partition)."""
+    name: str
+    key: str  # Primary key
+    timestamp: str  # Column the archive cutoff and day partition use
+    columns: Tuple[str, ...]
+    bool_columns: Tuple[str, ...] = ()
+    int_columns: Tuple[str, ...] = ()
+    json_columns: Tuple[str, ...] = ()  # JSONB, stored as JSON text
+    
+    @property
+    def schema(self) -> "pa.Schema":
+        """Arrow schema of the data files."""
+        return pa.schema([
+            (
+                column,
+                pa.bool_() if column in self.bool_columns
+                else pa.int64() if column in self.int_columns
+                else pa.string(),
+            )
+            for column in self.columns
+        ])
+
+
+ARCHIVE_TABLES: Dict[str, ArchiveTable] = {
+    "lynx_runs": ArchiveTable(
+        name="lynx_runs",
+        key="run_id",
+        timestamp="timestamp",
+        columns=("run_id", "user_id", "user_query", "lynx_response", "timestamp", "status", "created_at"),
+    ),
+    "audit_logs": ArchiveTable(
+        name="audit_logs",
+        key="audit_id",
+        timestamp="timestamp",
+        columns=(
+            "audit_id", "run_id", "tool_id", "user_id", "input", "output", "risk_level",
+            "approved", "approved_by", "refused", "refusal_reason", "duration_ms", "timestamp", "created_at",
+        ),
+        bool_columns=("approved", "refused"),
+        int_columns=("duration_ms",),
+        json_columns=("input", "output"),
+    ),
+    "lynx_audit_events": ArchiveTable(
+        name="lynx_audit_events",
+        key="event_id",
+        timestamp="created_at",
+        columns=(
+            "event_id", "run_id", "tool_id", "event_type", "status",
+            "input_data", "output_data", "error_message", "created_at",
+        ),
+        json_columns=("input_data", "output_data"),
+    ),
+}
+
+# Archived together with their run (audit_logs.run_id references lynx_runs)
+RUN_CHILD_TABLES = ("audit_logs", "lynx_audit_events")
+
+
+class AuditArchive:
+    """
+    Partitioned Parquet archive of audit tables.
+    
+    Archiving is at-least-once: files are written before the hot rows are
+    deleted, so an interrupted run can archive some rows twice. Reads drop
+    such duplicates by primary key.
+    """
+    
+    def __init__(self, root: str, compression: Optional[str] = None):
+        """
+        Initialize the archive.
+        
+        Args:
+            root: Archive directory
+            compression: Parquet compression codec (if None, uses Config.AUDIT_ARCHIVE_COMPRESSION)
+        """
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow not installed")
+        self.root = root
+        self.compression = compression or Config.AUDIT_ARCHIVE_COMPRESSION
+    
+    # -- Archiving --------------------------------------------------------
+    
+    def archive(
+        self,
+        client: Client,
+        before: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Move audit rows older than a cutoff from Supabase into the archive.
+        
+        Runs are archived oldest first, each batch together with its
+        audit_logs and lynx_audit_events rows (children are deleted before
+        their run); remaining old child rows (no run) are archived afterwards.
+        
+        Args:
+            client: Supabase client (service role; archiving spans all tenants)
+            before: Cutoff (if None, now minus Config.AUDIT_ARCHIVE_AFTER_DAYS)
+            batch_size: Rows per batch (if None, uses Config.AUDIT_ARCHIVE_BATCH_SIZE)
+        
+        Returns:
+            Number of rows archived per table
+        """
+        if before is None:
+            before = datetime.now() - timedelta(days=Config.AUDIT_ARCHIVE_AFTER_DAYS)
+        cutoff = before.isoformat()
+        batch_size = batch_size or Config.AUDIT_ARCHIVE_BATCH_SIZE
+        counts = {name: 0 for name in ARCHIVE_TABLES}
+        
+        runs = ARCHIVE_TABLES["lynx_runs"]
+        while True:
+            rows = self._select_batch(client, runs, cutoff, batch_size)
+            if not rows:
+                break
+            run_ids = [row["run_id"] for row in rows]
+            for name in RUN_CHILD_TABLES:
+                child = ARCHIVE_TABLES[name]
+                children = [
+                    row
+                    for chunk in _chunks(run_ids)
+                    for row in client.table(name).select("*").in_("run_id", chunk).execute().data
+                ]
+                counts[name] += self._move(client, child, children)
+            counts["lynx_runs"] += self._move(client, runs, rows)
+            if len(rows) < batch_size:
+                break
+        
+        for name in RUN_CHILD_TABLES:
+            child = ARCHIVE_TABLES[name]
+            while True:
+                rows = self._select_batch(client, child, cutoff, batch_size)
+                counts[name] += self._move(client, child, rows)
+                if len(rows) < batch_size:
+                    break
+        
+        logger.info("Archived audit rows older than %s", cutoff, extra={"counts": counts})
+        return counts
+    
+    def _select_batch(self, client: Client, spec: ArchiveTable, cutoff: str, batch_size: int) -> List[Dict[str, Any]]:
+        """Select the oldest hot rows before the cutoff."""
+        return (
+            client.table(spec.name)
+            .select("*")
+            .lt(spec.timestamp, cutoff)
+            .order(spec.timestamp)
+            .order(spec.key)
+            .limit(batch_size)
+            .execute()
+            .data
+        )
+    
+    def _move(self, client: Client, spec: ArchiveTable, rows: List[Dict[str, Any]]) -> int:
+        """Write rows to the archive, then delete them from the hot table."""
+        if not rows:
+            return 0
+        self.write(spec.name, rows)
+        for chunk in _chunks([row[spec.key] for row in rows]):
+            client.table(spec.name).delete().in_(spec.key, chunk).execute()
+        return len(rows)
+    
+    def write(self, table: str, rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Write rows to the archive (one new file per tenant and day).
+        
+        Args:
+            table: Audit table name (key of ARCHIVE_TABLES)
+            rows: Rows as returned by Supabase (JSONB columns as Python values)
+        """
+        spec = ARCHIVE_TABLES[table]
+        partitions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for row in rows:
+            day = str(row[spec.timestamp])[:10]
+            partitions.setdefault((str(row["tenant_id"]), day), []).append(_encode_row(spec, row))
+        
+        for (tenant_id, day), records in partitions.items():
+            directory = os.path.join(self._tenant_dir(spec, tenant_id), f"day={quote(day, safe='')}")
+            os.makedirs(directory, exist_ok=True)
+            name = f"part-{uuid.uuid4().hex}.parquet"
+            # Write under a hidden name first (datasets skip "."-prefixed files)
+            temp_path = os.path.join(directory, f".{name}.tmp")
+            pq.write_table(
+                pa.Table.from_pylist(records, schema=spec.schema),
+                temp_path,
+                compression=self.compression,
+            )
+            os.replace(temp_path, os.path.join(directory, name))
+    
+    # -- Reading ----------------------------------------------------------
+    
+    def scan(
+        self,
+        table: str,
+        tenant_id: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        from_ts: Optional[str] = None,
+        to_ts: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None,
+        after: Optional[Tuple[str, str]] = None,
+        filter: Optional["ds.Expression"] = None,
+        day: Optional[str] = None,
+    ) -> "pa.Table":
+        """
+        Scan archived rows with predicate pushdown.
+        
+        Args:
+            table: Audit table name (key of ARCHIVE_TABLES)
+            tenant_id: Tenant (if None, scans all tenants - for operator analytics)
+            columns: Columns to read (if None, all columns plus "tenant_id" and "day")
+            from_ts: Inclusive lower bound on the table's timestamp column (ISO 8601)
+            to_ts: Inclusive upper bound on the table's timestamp column (ISO 8601)
+            where: Equality filters, column -> value (a list/tuple/set matches any of its values)
+            after: Keyset position (timestamp, key); only rows before it (newest-first order)
+            filter: Additional pyarrow.dataset expression (e.g. ds.field("approved") == False)
+            day: Single day partition to read (YYYY-MM-DD)
+        
+        Returns:
+            Arrow table (JSONB columns as JSON text), duplicates dropped by primary key
+        """
+        spec = ARCHIVE_TABLES[table]
+        read = None
+        if columns is not None:
+            # The primary key is always read (duplicates are dropped by it)
+            read = list(dict.fromkeys([spec.key, *columns]))
+            if tenant_id is not None:
+                read = [column for column in read if column != "tenant_id"]  # Added below
+        dataset = self._dataset(spec, tenant_id, day)
+        if dataset is None:
+            result = _file_schema(spec, tenant_id, day).empty_table()
+            if read is not None:
+                result = result.select(read)
+        else:
+            result = dataset.to_table(
+                columns=read,
+                filter=_expression(spec, from_ts, to_ts, where, after, filter, partitioned=day is None),
+            )
+        if tenant_id is not None and (columns is None or "tenant_id" in columns):
+            result = result.append_column("tenant_id", pa.array([tenant_id] * result.num_rows, pa.string()))
+        result = _dedupe(result, spec.key)
+        if columns is not None:
+            result = result.select(list(columns))
+        return result
+    
+    def count(
+        self,
+        table: str,
+        tenant_id: Optional[str] = None,
+        from_ts: Optional[str] = None,
+        to_ts: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Count archived rows (reads only the primary key column)."""
+        spec = ARCHIVE_TABLES[table]
+        return self.scan(table, tenant_id, [spec.key], from_ts, to_ts, where).num_rows
+    
+    def rows(
+        self,
+        table: str,
+        tenant_id: str,
+        columns: Optional[Sequence[str]] = None,
+        from_ts: Optional[str] = None,
+        to_ts: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        newest_first: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read archived rows of a tenant as dicts, ordered by timestamp.
+        
+        Returns:
+            Rows shaped like the hot table's rows (JSONB columns decoded)
+        """
+        spec = ARCHIVE_TABLES[table]
+        if columns is not None:
+            columns = list(dict.fromkeys([*columns, spec.timestamp, spec.key]))
+        order = "descending" if newest_first else "ascending"
+        result = self.scan(table, tenant_id, columns, from_ts, to_ts, where)
+        result = result.sort_by([(spec.timestamp, order), (spec.key, order)])
+        result = result.slice(offset, limit)
+        return [_decode_row(spec, row) for row in result.to_pylist()]
+    
+    def iter_pages(
+        self,
+        table: str,
+        tenant_id: str,
+        columns: Optional[Sequence[str]] = None,
+        from_ts: Optional[str] = None,
+        to_ts: Optional[str] = None,
+        after: Optional[Tuple[str, str]] = None,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield a tenant's archived rows page by page, newest first.
+        
+        Reads one day partition at a time, so memory is bounded by the
+        largest day rather than the whole history.
+        
+        Args:
+            after: Keyset position (timestamp, key) to continue after
+            page_size: Rows per page
+            limit: Max rows in total (if None, all)
+        """
+        spec = ARCHIVE_TABLES[table]
+        if columns is not None:
+            columns = list(dict.fromkeys([*columns, spec.timestamp, spec.key]))
+        upper_bounds = [bound[:10] for bound in (to_ts, after[0] if after else None) if bound]
+        from_day = from_ts[:10] if from_ts else None
+        to_day = min(upper_bounds) if upper_bounds else None
+        remaining = limit
+        for day in self.days(table, tenant_id, from_day, to_day):
+            result = self.scan(table, tenant_id, columns, from_ts, to_ts, after=after, day=day)
+            result = result.sort_by([(spec.timestamp, "descending"), (spec.key, "descending")])
+            for start in range(0, result.num_rows, page_size):
+                if remaining is not None and remaining <= 0:
+                    return
+                size = page_size if remaining is None else min(page_size, remaining)
+                page = result.slice(start, min(size, result.num_rows - start))
+                yield [_decode_row(spec, row) for row in page.to_pylist()]
+                if remaining is not None:
+                    remaining -= page.num_rows
+    
+    def days(
+        self,
+        table: str,
+        tenant_id: str,
+        from_day: Optional[str] = None,
+        to_day: Optional[str] = None,
+    ) -> List[str]:
+        """List a tenant's archived day partitions (newest first, inclusive bounds)."""
+        directory = self._tenant_dir(ARCHIVE_TABLES[table], tenant_id)
+        if not os.path.isdir(directory):
+            return []
+        days = [unquote(entry[4:]) for entry in os.listdir(directory) if entry.startswith("day=")]
+        return sorted(
+            (day for day in days if (not from_day or day >= from_day) and (not to_day or day <= to_day)),
+            reverse=True,
+        )
+    
+    def _tenant_dir(self, spec: ArchiveTable, tenant_id: str) -> str:
+        return os.path.join(self.root, spec.name, f"tenant_id={quote(tenant_id, safe='')}")
+    
+    def _dataset(self, spec: ArchiveTable, tenant_id: Optional[str], day: Optional[str]) -> Optional["ds.Dataset"]:
+        """Dataset over the narrowest directory covering the scan (None if nothing archived)."""
+        if tenant_id is None:
+            path = os.path.join(self.root, spec.name)
+        else:
+            path = self._tenant_dir(spec, tenant_id)
+            if day is not None:
+                path = os.path.join(path, f"day={quote(day, safe='')}")
+        if not os.path.isdir(path):
+            return None
+        fields = _partition_fields(tenant_id, day)
+        partitioning = ds.partitioning(pa.schema(fields), flavor="hive") if fields else None
+        return ds.dataset(path, format="parquet", partitioning=partitioning, schema=_file_schema(spec, tenant_id, day))
+
+
+def _chunks(values: List[Any], size: int = _IN_CHUNK) -> Iterator[List[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _encode_row(spec: ArchiveTable, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a Supabase row to an archive record (tenant_id lives in the path)."""
+    record = {}
+    for column in spec.columns:
+        value = row.get(column)
+        if value is None or column in spec.bool_columns:
+            record[column] = value
+        elif column in spec.int_columns:
+            record[column] = int(value)
+        elif column in spec.json_columns:
+            record[column] = json.dumps(value, separators=(",", ":"), default=str)
+        else:
+            record[column] = str(value)
+    return record
+
+
+def _decode_row(spec: ArchiveTable, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an archive record back to the hot table's row shape."""
+    row.pop("day", None)
+    for column in spec.json_columns:
+        if isinstance(row.get(column), str):
+            row[column] = json.loads(row[column])
+    return row
+
+
+def _partition_fields(tenant_id: Optional[str], day: Optional[str]) -> List[Tuple[str, "pa.DataType"]]:
+    """Partition columns below the directory a scan reads."""
+    if tenant_id is None:
+        return [("tenant_id", pa.string()), ("day", pa.string())]
+    return [] if day is not None else [("day", pa.string())]
+
+
+def _file_schema(spec: ArchiveTable, tenant_id: Optional[str], day: Optional[str]) -> "pa.Schema":
+    schema = spec.schema
+    for name, type_ in _partition_fields(tenant_id, day):
+        schema = schema.append(pa.field(name, type_))
+    return schema
+
+
+def _expression(
+    spec: ArchiveTable,
+    from_ts: Optional[str],
+    to_ts: Optional[str],
+    where: Optional[Dict[str, Any]],
+    after: Optional[Tuple[str, str]],
+    extra: Optional["ds.Expression"],
+    partitioned: bool,
+) -> Optional["ds.Expression"]:
+    """Build the pushdown filter (day bounds prune partitions, the rest uses row-group stats)."""
+    conditions = []
+    timestamp = ds.field(spec.timestamp)
+    if from_ts:
+        conditions.append(timestamp >= from_ts)
+        if partitioned:
+            conditions.append(ds.field("day") >= from_ts[:10])
+    if to_ts:
+        conditions.append(timestamp <= to_ts)
+        if partitioned:
+            conditions.append(ds.field("day") <= to_ts[:10])
+    if after:
+        after_ts, after_key = after
+        conditions.append((timestamp < after_ts) | ((timestamp == after_ts) & (ds.field(spec.key) < after_key)))
+        if partitioned:
+            conditions.append(ds.field("day") <= after_ts[:10])
+    for column, value in (where or {}).items():
+        if isinstance(value, (list, tuple, set)):
+            conditions.append(ds.field(column).isin(list(value)))
+        else:
+            conditions.append(ds.field(column) == value)
+    if extra is not None:
+        conditions.append(extra)
+    
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _dedupe(table: "pa.Table", key: str) -> "pa.Table":
+    """Drop rows whose primary key repeats (archived twice by an interrupted run)."""
+    if key not in table.column_names or table.num_rows == 0:
+        return table
+    if len(pc.unique(table[key])) == table.num_rows:
+        return table
+    others = [column for column in table.column_names if column != key]
+    grouped = table.group_by(key, use_threads=False).aggregate([(column, "first") for column in others])
+    return grouped.rename_columns(
+        [name[:-len("_first")] if name.endswith("_first") else name for name in grouped.column_names]
+    ).select(table.column_names)
+
+
+# Global archive instance
+_audit_archive: Optional[AuditArchive] = None
+_audit_archive_loaded = False
+
+
+def get_audit_archive() -> Optional[AuditArchive]:
+    """
+    Get the global audit archive.
+    
+    Returns None unless Config.AUDIT_ARCHIVE_DIR is set and pyarrow is
+    installed (audit reads then only see the hot tables).
+    """
+    global _audit_archive, _audit_archive_loaded
+    
+    if not _audit_archive_loaded:
+        _audit_archive_loaded = True
+        if Config.AUDIT_ARCHIVE_DIR and PYARROW_AVAILABLE:
+            _audit_archive = AuditArchive(Config.AUDIT_ARCHIVE_DIR)
+        elif Config.AUDIT_ARCHIVE_DIR:
+            logger.warning("LYNX_AUDIT_ARCHIVE_DIR is set but pyarrow is not installed; archive disabled")
+    
+    return _audit_archive
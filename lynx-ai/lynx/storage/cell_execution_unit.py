@@ -0,0 +1,325 @@
+"""
+Cell Execution Unit - Atomic commit of one Cell execution.
+
+A successful Cell execution writes up to three rows: the execution record,
+the draft status transition and an optional side effect (settlement
+intent). The unit of work applies them all or none:
+- Supabase: one RPC (lynx_commit_cell_execution), one transaction
+- SQLite: one writer transaction
+- In-memory: checks first, then applies without yielding to the event loop
+
+Preserves all Execution Protocol guarantees:
+- Idempotency (request_id)
+- Exactly-once semantics (draft compare-and-set + unique succeeded execution)
+- Tenant isolation
+"""
+
+import sqlite3
+from typing import Dict, Any, Optional
+
+from lynx.observability.tracing import trace_methods
+
+# Import models (separated to avoid circular imports)
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus
+from lynx.mcp.cell.execution.models import ExecutionRecord, ExecutionStatus
+from lynx.storage.draft_storage import (
+    DraftStatusConflictError,
+    DraftStorage,
+    DraftStorageSQLite,
+    DraftStorageSupabase,
+    get_draft_storage,
+)
+from lynx.storage.execution_storage import (
+    ExecutionStorage,
+    ExecutionStorageSQLite,
+    ExecutionStorageSupabase,
+    get_execution_storage,
+)
+from lynx.storage.settlement_storage import (
+    SettlementIntent,
+    SettlementIntentStorage,
+    SettlementIntentStorageSQLite,
+    SettlementIntentStorageSupabase,
+    get_settlement_storage,
+)
+
+
+@trace_methods("storage.cell_execution")
+class CellExecutionUnit:
+    """
+    Cell execution unit of work (in-memory implementation).
+    
+    This is the fallback when Supabase is not available or in testing.
+    """
+    
+    def __init__(
+        self,
+        draft_storage: Optional[DraftStorage] = None,
+        execution_storage: Optional[ExecutionStorage] = None,
+        settlement_storage: Optional[SettlementIntentStorage] = None,
+    ):
+        """
+        Initialize the unit of work.
+        
+        Args:
+            draft_storage: Draft storage (if None, uses the global instance)
+            execution_storage: Execution storage (if None, uses the global instance)
+            settlement_storage: Settlement storage (if None, uses the global instance)
+        """
+        self.draft_storage = draft_storage
+        self.execution_storage = execution_storage
+        self.settlement_storage = settlement_storage
+    
+    async def commit(
+        self,
+        draft: DraftProtocol,
+        execution: ExecutionRecord,
+        expected_status: DraftStatus,
+        new_status: DraftStatus,
+        settlement_intent: Optional[SettlementIntent] = None,
+    ) -> ExecutionRecord:
+        """
+        Commit a successful execution atomically.
+        
+        Moves the draft from expected_status to new_status, stores the
+        execution record and, if given, the settlement intent. A retry with
+        the same execution.request_id returns the stored execution without
+        writing anything.
+        
+        Args:
+            draft: Draft being executed (as validated)
+            execution: Completed execution record (SUCCEEDED)
+            expected_status: Status the draft must still be in (e.g., APPROVED)
+            new_status: Status to set (e.g., EXECUTED)
+            settlement_intent: Settlement intent to create (optional)
+        
+        Returns:
+            Stored ExecutionRecord
+        
+        Raises:
+            DraftStatusConflictError: If the draft is no longer in expected_status
+            ValueError: If the draft is not found or was already executed by this tool
+        """
+        draft_storage = self.draft_storage or get_draft_storage()
+        execution_storage = self.execution_storage or get_execution_storage()
+        settlement_storage = self.settlement_storage or get_settlement_storage()
+        
+        # No awaits below: checks and writes run as one step on the event loop
+        
+        # Check idempotency
+        if execution.request_id and execution.request_id in execution_storage.request_id_map:
+            return execution_storage.executions[execution_storage.request_id_map[execution.request_id]]
+        
+        stored = draft_storage.drafts.get(draft.draft_id)
+        if stored is None or stored.tenant_id != execution.tenant_id:
+            raise ValueError(f"Draft {draft.draft_id} not found")
+        if stored.status != expected_status:
+            raise DraftStatusConflictError(draft.draft_id, expected_status, stored.status)
+        
+        # Exactly-once (mirrors the unique succeeded-execution index)
+        for existing in execution_storage.executions.values():
+            if (
+                existing.tenant_id == execution.tenant_id
+                and existing.draft_id == execution.draft_id
+                and existing.tool_id == execution.tool_id
+                and existing.status == ExecutionStatus.SUCCEEDED
+            ):
+                raise ValueError(
+                    f"Draft {draft.draft_id} has already been successfully executed by "
+                    f"{execution.tool_id} (execution_id: {existing.execution_id})"
+                )
+        
+        if settlement_intent and settlement_intent.payment_id in settlement_storage.intents:
+            raise ValueError(f"Settlement intent {settlement_intent.payment_id} already exists")
+        
+        # Apply
+        stored.status = new_status
+        execution_storage.executions[execution.execution_id] = execution
+        if execution.request_id:
+            execution_storage.request_id_map[execution.request_id] = execution.execution_id
+        if settlement_intent:
+            settlement_storage.intents[settlement_intent.payment_id] = settlement_intent
+        
+        return execution
+
+
+@trace_methods("storage.cell_execution")
+class CellExecutionUnitSupabase(CellExecutionUnit):
+    """
+    Supabase-backed unit of work.
+    
+    All writes go through the lynx_commit_cell_execution function (see
+    docs/DEPLOYMENT/supabase-migration.sql), so a commit is one round trip
+    and one transaction.
+    """
+    
+    def __init__(
+        self,
+        draft_storage: DraftStorageSupabase,
+        execution_storage: ExecutionStorageSupabase,
+        settlement_storage: SettlementIntentStorageSupabase,
+    ):
+        """
+        Initialize Supabase unit of work.
+        
+        Args:
+            draft_storage: Supabase draft storage (its client runs the RPC)
+            execution_storage: Supabase execution storage
+            settlement_storage: Supabase settlement storage
+        """
+        super().__init__(draft_storage, execution_storage, settlement_storage)
+        self.client = draft_storage.client
+    
+    async def commit(
+        self,
+        draft: DraftProtocol,
+        execution: ExecutionRecord,
+        expected_status: DraftStatus,
+        new_status: DraftStatus,
+        settlement_intent: Optional[SettlementIntent] = None,
+    ) -> ExecutionRecord:
+        """Commit a successful execution in one RPC (see CellExecutionUnit.commit)."""
+        params: Dict[str, Any] = {
+            "p_execution": self.execution_storage._to_db_record(execution),
+            "p_expected_status": expected_status.value,
+            "p_new_status": new_status.value,
+            "p_settlement": (
+                self.settlement_storage._to_db_record(settlement_intent) if settlement_intent else None
+            ),
+        }
+        
+        try:
+            result = self.client.rpc("lynx_commit_cell_execution", params).execute()
+        except Exception as e:
+            # Unique succeeded-execution index (exactly-once); the transaction rolled back
+            if "unique" in str(e).lower() or "duplicate" in str(e).lower():
+                raise ValueError(
+                    f"Draft {draft.draft_id} has already been successfully executed by {execution.tool_id}"
+                ) from e
+            raise
+        
+        outcome = result.data or {}
+        if outcome.get("outcome") in ("not_found", "conflict"):
+            self.draft_storage.draft_cache.invalidate(draft.tenant_id, draft.draft_id)
+        if outcome.get("outcome") == "not_found":
+            raise ValueError(f"Draft {draft.draft_id} not found")
+        if outcome.get("outcome") == "conflict":
+            raise DraftStatusConflictError(draft.draft_id, expected_status, DraftStatus(outcome["status"]))
+        if outcome.get("outcome") == "duplicate":
+            return self.execution_storage._from_db_record(outcome["execution"])
+        
+        executed = draft.model_copy(update={"status": new_status})
+        if draft.request_id:
+            self.draft_storage.idempotency_cache.refresh(draft.tenant_id, draft.draft_type, draft.request_id, executed)
+        self.draft_storage.draft_cache.put(executed)
+        return execution
+
+
+@trace_methods("storage.cell_execution")
+class CellExecutionUnitSQLite(CellExecutionUnit):
+    """
+    SQLite-backed unit of work.
+    
+    Mirrors lynx_commit_cell_execution in one writer transaction; any
+    failure rolls back every write.
+    """
+    
+    def __init__(
+        self,
+        draft_storage: DraftStorageSQLite,
+        execution_storage: ExecutionStorageSQLite,
+        settlement_storage: SettlementIntentStorageSQLite,
+    ):
+        """
+        Initialize SQLite unit of work.
+        
+        Args:
+            draft_storage: SQLite draft storage (its database runs the transaction)
+            execution_storage: SQLite execution storage
+            settlement_storage: SQLite settlement storage
+        """
+        super().__init__(draft_storage, execution_storage, settlement_storage)
+        self.database = draft_storage.database
+    
+    async def commit(
+        self,
+        draft: DraftProtocol,
+        execution: ExecutionRecord,
+        expected_status: DraftStatus,
+        new_status: DraftStatus,
+        settlement_intent: Optional[SettlementIntent] = None,
+    ) -> ExecutionRecord:
+        """Commit a successful execution in one transaction (see CellExecutionUnit.commit)."""
+        def commit(connection: sqlite3.Connection) -> ExecutionRecord:
+            if execution.request_id:
+                existing = self.execution_storage._select_one(
+                    connection,
+                    "SELECT * FROM lynx_executions WHERE tenant_id = ? AND request_id = ?",
+                    (execution.tenant_id, execution.request_id),
+                )
+                if existing:
+                    return existing
+            
+            row = connection.execute(
+                "SELECT status FROM lynx_drafts WHERE draft_id = ? AND tenant_id = ?",
+                (draft.draft_id, execution.tenant_id),
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Draft {draft.draft_id} not found")
+            if row["status"] != expected_status.value:
+                raise DraftStatusConflictError(draft.draft_id, expected_status, DraftStatus(row["status"]))
+            
+            connection.execute(
+                "UPDATE lynx_drafts SET status = ?, updated_at = ? WHERE draft_id = ? AND tenant_id = ?",
+                (new_status.value, execution.completed_at, draft.draft_id, execution.tenant_id),
+            )
+            try:
+                self.execution_storage._insert(connection, execution)
+            except sqlite3.IntegrityError as e:
+                # Unique succeeded-execution index (exactly-once)
+                raise ValueError(
+                    f"Draft {draft.draft_id} has already been successfully executed by {execution.tool_id}"
+                ) from e
+            if settlement_intent:
+                try:
+                    self.settlement_storage._insert(connection, settlement_intent)
+                except sqlite3.IntegrityError as e:
+                    raise ValueError(f"Settlement intent {settlement_intent.payment_id} already exists") from e
+            return execution
+        
+        return await self.database.write(commit)
+
+
+# Global unit instance
+_cell_execution_unit: Optional[CellExecutionUnit] = None
+
+
+def get_cell_execution_unit() -> CellExecutionUnit:
+    """
+    Get the global Cell execution unit of work.
+    
+    Returns the Supabase (or SQLite) unit when all storages use that
+    backend, otherwise in-memory.
+    """
+    global _cell_execution_unit
+    
+    if _cell_execution_unit is None:
+        draft_storage = get_draft_storage()
+        execution_storage = get_execution_storage()
+        settlement_storage = get_settlement_storage()
+        if (
+            isinstance(draft_storage, DraftStorageSupabase)
+            and isinstance(execution_storage, ExecutionStorageSupabase)
+            and isinstance(settlement_storage, SettlementIntentStorageSupabase)
+        ):
+            _cell_execution_unit = CellExecutionUnitSupabase(draft_storage, execution_storage, settlement_storage)
+        elif (
+            isinstance(draft_storage, DraftStorageSQLite)
+            and isinstance(execution_storage, ExecutionStorageSQLite)
+            and isinstance(settlement_storage, SettlementIntentStorageSQLite)
+        ):
+            _cell_execution_unit = CellExecutionUnitSQLite(draft_storage, execution_storage, settlement_storage)
+        else:
+            _cell_execution_unit = CellExecutionUnit()
+    
+    return _cell_execution_unit
@@ -0,0 +1,155 @@
+"""
+Read-through cache of drafts for remote draft storage.
+
+Bounded, tenant-scoped LRU of (tenant_id, draft_id) -> DraftProtocol, so
+repeated get_draft calls (draft routes, Cell validation, Cell handlers) are
+answered from memory instead of a SELECT. The bound is in bytes (serialized
+draft size), since payloads range from a few fields to large documents.
+
+Status changes made through the storage write through to the cache; a
+conflict or a missing draft invalidates the entry. Entries also expire after
+a TTL, which bounds staleness from writes made by other processes. Keys
+always include the tenant ID, so a draft is never served to another tenant.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from lynx.config import Config
+from lynx.mcp.cluster.drafts.models import DraftProtocol
+from lynx.observability.metrics import get_metrics_registry
+
+# Per-entry bookkeeping (key, OrderedDict node, model object) on top of the payload
+ENTRY_OVERHEAD_BYTES = 512
+
+
+class DraftCache:
+    """Byte-bounded LRU of (tenant_id, draft_id) -> draft."""
+
+    def __init__(self, name: str = "drafts", max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialize draft cache.
+
+        Args:
+            name: Cache name (metrics label)
+            max_bytes: Max total size of cached drafts (defaults to Config.DRAFT_CACHE_MAX_BYTES; 0 disables)
+            ttl: Seconds an entry stays valid (defaults to Config.DRAFT_CACHE_TTL)
+        """
+        self.name = name
+        self.max_bytes = max_bytes if max_bytes is not None else Config.DRAFT_CACHE_MAX_BYTES
+        self.ttl = ttl if ttl is not None else Config.DRAFT_CACHE_TTL
+        # (tenant_id, draft_id) -> (draft, size in bytes, expires_at)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[DraftProtocol, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        registry = get_metrics_registry()
+        self._hit_counter = registry.counter(
+            "lynx_draft_cache_hits_total", "Draft reads answered from memory", cache=name,
+        )
+        self._miss_counter = registry.counter(
+            "lynx_draft_cache_misses_total", "Draft reads that went to storage", cache=name,
+        )
+        self._hit_ratio_gauge = registry.gauge(
+            "lynx_draft_cache_hit_ratio", "Share of draft reads answered from memory", cache=name,
+        )
+        self._bytes_gauge = registry.gauge(
+            "lynx_draft_cache_bytes", "Estimated size of cached drafts", cache=name,
+        )
+
+    def get(self, tenant_id: str, draft_id: str) -> Optional[DraftProtocol]:
+        """
+        Look up a cached draft.
+
+        Args:
+            tenant_id: Tenant ID
+            draft_id: Draft ID
+
+        Returns:
+            Copy of the cached draft (callers may change its fields), or None
+        """
+        key = (tenant_id, draft_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            hit_ratio = self.hits / (self.hits + self.misses)
+        (self._hit_counter if entry is not None else self._miss_counter).inc()
+        self._hit_ratio_gauge.set(hit_ratio)
+        return entry[0].model_copy() if entry is not None else None
+
+    def put(self, draft: DraftProtocol) -> None:
+        """
+        Cache a draft as stored (evicting least recently used drafts to fit).
+
+        Args:
+            draft: Draft as stored
+        """
+        if self.max_bytes <= 0:
+            return
+        size = len(draft.model_dump_json()) + ENTRY_OVERHEAD_BYTES
+        key = (draft.tenant_id, draft.draft_id)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (draft.model_copy(), size, time.monotonic() + self.ttl)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            total = self.bytes
+        self._bytes_gauge.set(total)
+
+    def invalidate(self, tenant_id: str, draft_id: str) -> None:
+        """Drop a draft (e.g., after a conflicting or failed update)."""
+        with self._lock:
+            if (tenant_id, draft_id) in self._entries:
+                self._remove((tenant_id, draft_id))
+            total = self.bytes
+        self._bytes_gauge.set(total)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+        self._bytes_gauge.set(0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with size, bytes, capacity, hits, misses, evictions and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
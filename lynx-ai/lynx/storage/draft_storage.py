@@ -7,12 +7,26 @@ Preserves all Draft Protocol guarantees:
 - Draft immutability
 """
 
-from typing import Dict, Any, Optional, List
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from uuid import UUID
 from lynx.config import Config
+from lynx.observability.logging import get_logger
+from lynx.observability.tracing import trace_methods
+from lynx.storage.draft_cache import DraftCache
+from lynx.storage.idempotency import IdempotencyCache
+from lynx.storage.payload_codec import (
+    EncodedPayload,
+    PayloadCodec,
+    check_payload_size,
+    get_payload_codec,
+    is_offloaded,
+)
+from lynx.storage.sqlite import SQLiteDatabase, dumps, get_sqlite_database, loads, placeholders
 
 # Import models (separated to avoid circular imports)
-from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus, DraftSummary, DraftTransitionResult
 
 try:
     from supabase import create_client, Client
@@ -21,7 +35,22 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None
 
+logger = get_logger(__name__)
 
+
+class DraftStatusConflictError(ValueError):
+    """Raised when a conditional status update finds the draft in another status."""
+    
+    def __init__(self, draft_id: str, expected_status: DraftStatus, current_status: DraftStatus):
+        super().__init__(
+            f"Draft {draft_id} is {current_status.value} (expected {expected_status.value})"
+        )
+        self.draft_id = draft_id
+        self.expected_status = expected_status
+        self.current_status = current_status
+
+
+@trace_methods("storage.drafts")
 class DraftStorage:
     """
     Base draft storage interface (in-memory implementation).
@@ -29,27 +58,48 @@ class DraftStorage:
     This is the fallback when Supabase is not available or in testing.
     """
     
+    backend = "memory"
+    
     def __init__(self):
         """Initialize draft storage."""
         self.drafts: Dict[str, DraftProtocol] = {}
-        self.request_id_map: Dict[str, str] = {}  # request_id -> draft_id
+        self.request_id_map: Dict[Tuple[str, str], str] = {}  # (tenant_id, request_id) -> draft_id
     
     async def create_draft(self, draft: DraftProtocol) -> DraftProtocol:
         """Create a draft."""
-        # Check idempotency
-        if draft.request_id and draft.request_id in self.request_id_map:
-            existing_draft_id = self.request_id_map[draft.request_id]
+        # Check idempotency (request_id is unique per tenant)
+        request_key = (draft.tenant_id, draft.request_id)
+        if draft.request_id and request_key in self.request_id_map:
+            existing_draft_id = self.request_id_map[request_key]
             return self.drafts[existing_draft_id]
         
+        # Same payload size limit as the persistent backends
+        check_payload_size(draft.payload)
+        
         # Store draft
         self.drafts[draft.draft_id] = draft
         
         # Map request_id for idempotency
         if draft.request_id:
-            self.request_id_map[draft.request_id] = draft.draft_id
+            self.request_id_map[request_key] = draft.draft_id
         
         return draft
     
+    async def create_drafts_bulk(self, drafts: List[DraftProtocol]) -> List[DraftProtocol]:
+        """
+        Create many drafts at once.
+        
+        Idempotency applies per item: an item whose request_id already exists
+        (in storage or earlier in the same batch) resolves to the existing draft.
+        
+        Args:
+            drafts: Drafts to create
+        
+        Returns:
+            Stored drafts, in input order
+        """
+        return [await self.create_draft(draft) for draft in drafts]
+    
     async def get_draft(self, draft_id: str, tenant_id: str) -> Optional[DraftProtocol]:
         """Get a draft by ID (tenant-scoped)."""
         draft = self.drafts.get(draft_id)
@@ -57,6 +107,40 @@ class DraftStorage:
             return draft
         return None
     
+    async def get_draft_for_execution(
+        self,
+        draft_id: str,
+        tenant_id: str,
+        tool_id: str,
+    ) -> Tuple[Optional[DraftProtocol], Optional[str]]:
+        """
+        Get a draft together with its successful execution by a Cell tool.
+        
+        Args:
+            draft_id: Draft ID
+            tenant_id: Tenant ID
+            tool_id: Cell MCP tool ID
+        
+        Returns:
+            Tuple of (draft or None, succeeded execution_id or None)
+        """
+        # Imported here: execution storage imports the Cell protocol, which imports this module
+        from lynx.mcp.cell.execution.models import ExecutionStatus
+        from lynx.storage.execution_storage import get_execution_storage
+        
+        draft = await self.get_draft(draft_id, tenant_id)
+        if draft is None:
+            return None, None
+        
+        executions = await get_execution_storage().list_executions(
+            tenant_id=tenant_id,
+            draft_id=draft_id,
+            tool_id=tool_id,
+            status=ExecutionStatus.SUCCEEDED,
+            limit=1,
+        )
+        return draft, executions[0].execution_id if executions else None
+    
     async def list_drafts(
         self,
         tenant_id: str,
@@ -74,21 +158,113 @@ class DraftStorage:
         
         return drafts
     
+    async def list_draft_summaries(
+        self,
+        tenant_id: str,
+        draft_type: Optional[str] = None,
+        status: Optional[DraftStatus] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[DraftSummary]:
+        """
+        List draft summaries for a tenant (newest first).
+        
+        Fetches only the requested summary columns - never the payload or
+        source context - for list views that render a row per draft.
+        
+        Args:
+            tenant_id: Tenant ID
+            draft_type: Filter by draft type
+            status: Filter by status
+            limit: Max number of drafts
+            fields: DraftSummary fields to fetch (None = all; draft_id is always included)
+        
+        Returns:
+            Draft summaries (fields left out of the projection are None)
+        
+        Raises:
+            ValueError: If a field is not a DraftSummary field
+        """
+        columns = DraftSummary.columns(fields)
+        drafts = sorted(
+            await self.list_drafts(tenant_id, draft_type=draft_type, status=status),
+            key=lambda d: d.created_at,
+            reverse=True,
+        )
+        
+        if limit:
+            drafts = drafts[:limit]
+        
+        return [DraftSummary(**{column: getattr(d, column) for column in columns}) for d in drafts]
+    
     async def update_draft_status(
         self,
         draft_id: str,
         tenant_id: str,
         new_status: DraftStatus,
+        expected_status: Optional[DraftStatus] = None,
     ) -> Optional[DraftProtocol]:
-        """Update draft status (for submit/publish/executed transitions)."""
+        """
+        Update draft status (for submit/publish/executed transitions).
+        
+        Args:
+            draft_id: Draft ID
+            tenant_id: Tenant ID
+            new_status: Status to set
+            expected_status: If set, only update a draft currently in this
+                status (compare-and-set)
+        
+        Returns:
+            Updated draft, or None if not found
+        
+        Raises:
+            DraftStatusConflictError: If the draft is not in expected_status
+        """
         draft = await self.get_draft(draft_id, tenant_id)
         if draft:
+            if expected_status is not None and draft.status != expected_status:
+                raise DraftStatusConflictError(draft_id, expected_status, draft.status)
             draft.status = new_status
             # Re-save
             self.drafts[draft_id] = draft
         return draft
+    
+    async def transition_drafts_bulk(
+        self,
+        tenant_id: str,
+        draft_ids: List[str],
+        expected_status: DraftStatus,
+        new_status: DraftStatus,
+    ) -> List[DraftTransitionResult]:
+        """
+        Compare-and-set the status of many drafts (e.g., DRAFT -> APPROVED).
+        
+        Only drafts of the tenant that are currently in expected_status change;
+        the others are reported as conflict (other status) or not_found.
+        
+        Args:
+            tenant_id: Tenant ID
+            draft_ids: Draft IDs to transition
+            expected_status: Status each draft must have
+            new_status: Status to set
+        
+        Returns:
+            One result per draft ID, in input order
+        """
+        outcomes: Dict[str, DraftTransitionResult] = {}
+        for draft_id in dict.fromkeys(draft_ids):
+            draft = await self.get_draft(draft_id, tenant_id)
+            if draft is None:
+                outcomes[draft_id] = DraftTransitionResult(draft_id=draft_id, outcome="not_found")
+            elif draft.status != expected_status:
+                outcomes[draft_id] = DraftTransitionResult(draft_id=draft_id, outcome="conflict", status=draft.status)
+            else:
+                draft.status = new_status
+                outcomes[draft_id] = DraftTransitionResult(draft_id=draft_id, outcome="updated", status=new_status)
+        return [outcomes[draft_id] for draft_id in draft_ids]
 
 
+@trace_methods("storage.drafts")
 class DraftStorageSupabase(DraftStorage):
     """
     Supabase-backed draft storage.
@@ -97,14 +273,24 @@ class DraftStorageSupabase(DraftStorage):
     - Idempotency via request_id (unique per tenant + draft_type + request_id)
     - Tenant isolation (RLS + code checks)
     - Draft immutability
+    
+    Reads go through a local DraftCache; every status change made here
+    writes through to it (or invalidates the entry on conflict).
+    
+    Large payloads are compressed, and optionally stored out-of-line in
+    lynx_draft_payloads (see lynx.storage.payload_codec); they are loaded
+    back whenever a full draft is returned.
     """
     
-    def __init__(self, supabase_client: Optional[Client] = None):
+    backend = "supabase"
+    
+    def __init__(self, supabase_client: Optional[Client] = None, payload_codec: Optional[PayloadCodec] = None):
         """
         Initialize Supabase draft storage.
         
         Args:
             supabase_client: Supabase client (if None, creates from Config)
+            payload_codec: Payload codec (if None, uses the global codec from Config)
         """
         super().__init__()
         
@@ -117,46 +303,139 @@ class DraftStorageSupabase(DraftStorage):
             self.client: Client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
         else:
             self.client = supabase_client
+        
+        self.idempotency_cache: IdempotencyCache[DraftProtocol] = IdempotencyCache("drafts")
+        self.draft_cache = DraftCache("drafts")
+        self.payload_codec = payload_codec or get_payload_codec()
     
     async def create_draft(self, draft: DraftProtocol) -> DraftProtocol:
-        """Create a draft with idempotency check."""
-        # Check idempotency: query by request_id (if provided)
+        """
+        Create a draft with idempotency check.
+        
+        Retries are answered from the idempotency cache. Otherwise the draft is
+        written with "insert ... on conflict do nothing returning *", so a
+        first-time create is one round trip; only a conflict (a retry that
+        missed the cache) needs a second query to fetch the existing draft.
+        """
         if draft.request_id:
-            existing = await self._get_by_request_id(draft.tenant_id, draft.request_id, draft.draft_type)
-            if existing:
-                return existing
+            cached = self.idempotency_cache.get(draft.tenant_id, draft.draft_type, draft.request_id)
+            if cached is not None:
+                return cached
         
-        # Convert to DB format
-        db_record = {
-            "draft_id": draft.draft_id,
-            "tenant_id": draft.tenant_id,
-            "draft_type": draft.draft_type,
-            "payload": draft.payload,
-            "status": draft.status.value,
-            "risk_level": draft.risk_level,
-            "created_by": draft.created_by,
-            "created_at": draft.created_at,
-            "source_context": draft.source_context,
-            "recommended_approvers": draft.recommended_approvers,
-            "request_id": draft.request_id,
-        }
+        encoded = self.payload_codec.encode(draft.payload)
+        db_record = self._to_db_record(draft, encoded)
+        self._insert_payloads([(draft, encoded)])
         
-        # Insert (will fail if unique constraint violated)
-        try:
+        if not draft.request_id:
             self.client.table("lynx_drafts").insert(db_record).execute()
-        except Exception as e:
-            # If unique constraint violation, fetch existing
-            if "unique" in str(e).lower() or "duplicate" in str(e).lower():
+            self.draft_cache.put(draft)
+            return draft
+        
+        result = (
+            self.client.table("lynx_drafts")
+            .upsert(db_record, on_conflict="tenant_id,request_id", ignore_duplicates=True)
+            .execute()
+        )
+        if result.data:
+            stored = self._from_db_record(result.data[0], payload=draft.payload)
+        else:
+            # Conflict: another request with this request_id got there first
+            self._delete_payloads(draft.tenant_id, [draft.draft_id] if encoded.blob else [])
+            stored = await self._get_by_request_id(draft.tenant_id, draft.request_id, draft.draft_type)
+            if stored is None:
+                raise ValueError(
+                    f"request_id {draft.request_id} is already used by a draft of another type"
+                )
+        
+        self.idempotency_cache.put(draft.tenant_id, draft.draft_type, draft.request_id, stored)
+        self.draft_cache.put(stored)
+        return stored
+    
+    async def create_drafts_bulk(self, drafts: List[DraftProtocol]) -> List[DraftProtocol]:
+        """
+        Create many drafts in one batched INSERT ... ON CONFLICT DO NOTHING.
+        
+        Idempotency applies per item: cached retries never reach the database,
+        and items that conflict on request_id are fetched with one extra query
+        per tenant and resolve to the existing draft. Out-of-line payloads are
+        written first, in one batched insert.
+        
+        Args:
+            drafts: Drafts to create
+        
+        Returns:
+            Stored drafts, in input order
+        """
+        results: List[Optional[DraftProtocol]] = [None] * len(drafts)
+        pending: Dict[Any, List[int]] = {}  # request key (or item index) -> positions
+        
+        for i, draft in enumerate(drafts):
+            if draft.request_id:
+                cached = self.idempotency_cache.get(draft.tenant_id, draft.draft_type, draft.request_id)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+                key: Any = (draft.tenant_id, draft.request_id)
+            else:
+                key = i
+            pending.setdefault(key, []).append(i)
+        
+        if pending:
+            to_insert = [drafts[positions[0]] for positions in pending.values()]
+            encoded = [self.payload_codec.encode(draft.payload) for draft in to_insert]
+            self._insert_payloads(list(zip(to_insert, encoded)))
+            result = (
+                self.client.table("lynx_drafts")
+                .upsert(
+                    [self._to_db_record(draft, e) for draft, e in zip(to_insert, encoded)],
+                    on_conflict="tenant_id,request_id",
+                    ignore_duplicates=True,
+                )
+                .execute()
+            )
+            payloads = {draft.draft_id: draft.payload for draft in to_insert}
+            inserted = {
+                str(record["draft_id"]): self._from_db_record(record, payload=payloads[str(record["draft_id"])])
+                for record in result.data or []
+            }
+            
+            conflicts: Dict[str, List[str]] = {}  # tenant_id -> request_ids
+            orphaned: Dict[str, List[str]] = {}  # tenant_id -> draft_ids of unused out-of-line payloads
+            for draft, e in zip(to_insert, encoded):
+                if draft.draft_id not in inserted:
+                    conflicts.setdefault(draft.tenant_id, []).append(draft.request_id)
+                    if e.blob:
+                        orphaned.setdefault(draft.tenant_id, []).append(draft.draft_id)
+            for tenant_id, draft_ids in orphaned.items():
+                self._delete_payloads(tenant_id, draft_ids)
+            existing: Dict[Tuple[str, str], DraftProtocol] = {}
+            for tenant_id, request_ids in conflicts.items():
+                existing.update(
+                    ((d.tenant_id, d.request_id), d)
+                    for d in await self._get_by_request_ids(tenant_id, request_ids)
+                )
+            
+            for key, positions in pending.items():
+                draft = drafts[positions[0]]
+                stored = inserted.get(draft.draft_id) or existing.get((draft.tenant_id, draft.request_id))
+                if stored is None or stored.draft_type != draft.draft_type:
+                    raise ValueError(
+                        f"request_id {draft.request_id} is already used by a draft of another type"
+                    )
                 if draft.request_id:
-                    existing = await self._get_by_request_id(draft.tenant_id, draft.request_id, draft.draft_type)
-                    if existing:
-                        return existing
-            raise
+                    self.idempotency_cache.put(draft.tenant_id, draft.draft_type, draft.request_id, stored)
+                self.draft_cache.put(stored)
+                for i in positions:
+                    results[i] = stored
         
-        return draft
+        return results  # type: ignore[return-value]
     
     async def get_draft(self, draft_id: str, tenant_id: str) -> Optional[DraftProtocol]:
-        """Get a draft by ID (tenant-scoped)."""
+        """Get a draft by ID (tenant-scoped, read-through cache)."""
+        cached = self.draft_cache.get(tenant_id, draft_id)
+        if cached is not None:
+            return cached
+        
         # Defense-in-depth: check tenant in query
         result = (
             self.client.table("lynx_drafts")
@@ -170,7 +449,44 @@ class DraftStorageSupabase(DraftStorage):
         if not result.data:
             return None
         
-        return self._from_db_record(result.data)
+        draft = self._from_db_record(result.data)
+        await self._load_payloads([draft])
+        self.draft_cache.put(draft)
+        return draft
+    
+    async def get_draft_for_execution(
+        self,
+        draft_id: str,
+        tenant_id: str,
+        tool_id: str,
+    ) -> Tuple[Optional[DraftProtocol], Optional[str]]:
+        """
+        Get a draft and its successful execution in one query.
+        
+        Embeds lynx_executions (via the draft_id foreign key), filtered to
+        the tool's succeeded execution, into the draft row.
+        """
+        result = (
+            self.client.table("lynx_drafts")
+            .select("*, lynx_executions(execution_id)")
+            .eq("draft_id", draft_id)
+            .eq("tenant_id", tenant_id)  # Tenant check in code
+            .eq("lynx_executions.tenant_id", tenant_id)
+            .eq("lynx_executions.tool_id", tool_id)
+            .eq("lynx_executions.status", "succeeded")
+            .limit(1, foreign_table="lynx_executions")
+            .execute()
+        )
+        
+        if not result.data:
+            return None, None
+        
+        record = result.data[0]
+        executions = record.get("lynx_executions") or []
+        draft = self._from_db_record(record)
+        await self._load_payloads([draft])
+        self.draft_cache.put(draft)
+        return draft, str(executions[0]["execution_id"]) if executions else None
     
     async def list_drafts(
         self,
@@ -194,28 +510,148 @@ class DraftStorageSupabase(DraftStorage):
         
         result = query.execute()
         
-        return [self._from_db_record(record) for record in result.data]
+        drafts = [self._from_db_record(record) for record in result.data]
+        await self._load_payloads(drafts)
+        return drafts
+    
+    async def list_draft_summaries(
+        self,
+        tenant_id: str,
+        draft_type: Optional[str] = None,
+        status: Optional[DraftStatus] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[DraftSummary]:
+        """List draft summaries for a tenant (selects only the summary columns)."""
+        columns = DraftSummary.columns(fields)
+        query = (
+            self.client.table("lynx_drafts")
+            .select(",".join(columns))
+            .eq("tenant_id", tenant_id)
+            .order("created_at", desc=True)
+        )
+        
+        if draft_type:
+            query = query.eq("draft_type", draft_type)
+        
+        if status:
+            query = query.eq("status", status.value)
+        
+        if limit:
+            query = query.limit(limit)
+        
+        result = query.execute()
+        
+        return [
+            DraftSummary(**{**record, "draft_id": str(record["draft_id"])})
+            for record in result.data
+        ]
     
     async def update_draft_status(
         self,
         draft_id: str,
         tenant_id: str,
         new_status: DraftStatus,
+        expected_status: Optional[DraftStatus] = None,
     ) -> Optional[DraftProtocol]:
-        """Update draft status."""
+        """
+        Update draft status.
+        
+        With expected_status this is a single conditional UPDATE
+        (... WHERE status = expected_status), so concurrent transitions
+        cannot overwrite each other. The current status is only read when
+        the update did not match, to tell a conflict from a missing draft.
+        """
         # Defense-in-depth: check tenant in update
-        result = (
+        query = (
             self.client.table("lynx_drafts")
             .update({"status": new_status.value})
             .eq("draft_id", draft_id)
             .eq("tenant_id", tenant_id)  # Tenant check in code
-            .execute()
         )
+        if expected_status is not None:
+            query = query.eq("status", expected_status.value)
+        result = query.execute()
         
         if not result.data:
+            if expected_status is not None:
+                current = (
+                    self.client.table("lynx_drafts")
+                    .select("status")
+                    .eq("draft_id", draft_id)
+                    .eq("tenant_id", tenant_id)
+                    .limit(1)
+                    .execute()
+                )
+                if current.data:
+                    self.draft_cache.invalidate(tenant_id, draft_id)
+                    raise DraftStatusConflictError(draft_id, expected_status, DraftStatus(current.data[0]["status"]))
+            self.draft_cache.invalidate(tenant_id, draft_id)
             return None
         
-        return self._from_db_record(result.data[0])
+        draft = self._from_db_record(result.data[0])
+        await self._load_payloads([draft])
+        if draft.request_id:
+            self.idempotency_cache.refresh(draft.tenant_id, draft.draft_type, draft.request_id, draft)
+        self.draft_cache.put(draft)
+        return draft
+    
+    async def transition_drafts_bulk(
+        self,
+        tenant_id: str,
+        draft_ids: List[str],
+        expected_status: DraftStatus,
+        new_status: DraftStatus,
+    ) -> List[DraftTransitionResult]:
+        """
+        Compare-and-set the status of many drafts in one UPDATE.
+        
+        The UPDATE is tenant-scoped and conditioned on expected_status, so
+        concurrent transitions cannot overwrite each other. Drafts it did not
+        change are classified (conflict/not_found) with one extra SELECT.
+        """
+        unique_ids = list(dict.fromkeys(draft_ids))
+        if not unique_ids:
+            return []
+        
+        result = (
+            self.client.table("lynx_drafts")
+            .update({"status": new_status.value})
+            .eq("tenant_id", tenant_id)  # Tenant check in code
+            .eq("status", expected_status.value)
+            .in_("draft_id", unique_ids)
+            .execute()
+        )
+        updated = {str(record["draft_id"]): self._from_db_record(record) for record in result.data or []}
+        await self._load_payloads(list(updated.values()))
+        for draft in updated.values():
+            if draft.request_id:
+                self.idempotency_cache.refresh(draft.tenant_id, draft.draft_type, draft.request_id, draft)
+            self.draft_cache.put(draft)
+        
+        current: Dict[str, DraftStatus] = {}
+        missed = [draft_id for draft_id in unique_ids if draft_id not in updated]
+        for draft_id in missed:
+            self.draft_cache.invalidate(tenant_id, draft_id)
+        if missed:
+            lookup = (
+                self.client.table("lynx_drafts")
+                .select("draft_id,status")
+                .eq("tenant_id", tenant_id)
+                .in_("draft_id", missed)
+                .execute()
+            )
+            current = {str(r["draft_id"]): DraftStatus(r["status"]) for r in lookup.data or []}
+        
+        results = []
+        for draft_id in draft_ids:
+            if draft_id in updated:
+                results.append(DraftTransitionResult(draft_id=draft_id, outcome="updated", status=new_status))
+            elif draft_id in current:
+                results.append(DraftTransitionResult(draft_id=draft_id, outcome="conflict", status=current[draft_id]))
+            else:
+                results.append(DraftTransitionResult(draft_id=draft_id, outcome="not_found"))
+        return results
     
     async def _get_by_request_id(
         self,
@@ -237,16 +673,102 @@ class DraftStorageSupabase(DraftStorage):
         result = query.limit(1).execute()
         
         if result.data:
-            return self._from_db_record(result.data[0])
+            draft = self._from_db_record(result.data[0])
+            await self._load_payloads([draft])
+            return draft
         return None
     
-    def _from_db_record(self, record: Dict[str, Any]) -> DraftProtocol:
-        """Convert DB record to DraftProtocol."""
+    async def _get_by_request_ids(self, tenant_id: str, request_ids: List[str]) -> List[DraftProtocol]:
+        """Get drafts by request_id in one query (for bulk idempotency)."""
+        result = (
+            self.client.table("lynx_drafts")
+            .select("*")
+            .eq("tenant_id", tenant_id)
+            .in_("request_id", request_ids)
+            .execute()
+        )
+        drafts = [self._from_db_record(record) for record in result.data or []]
+        await self._load_payloads(drafts)
+        return drafts
+    
+    def _insert_payloads(self, items: List[Tuple[DraftProtocol, EncodedPayload]]) -> None:
+        """
+        Write out-of-line payloads in one insert.
+        
+        Runs before the drafts are inserted, so a stored draft never refers
+        to a missing payload; payloads of drafts that end up not inserted
+        (request_id conflict) are deleted again.
+        """
+        records = [
+            {"draft_id": draft.draft_id, "tenant_id": draft.tenant_id, **encoded.blob}
+            for draft, encoded in items
+            if encoded.blob
+        ]
+        if records:
+            self.client.table("lynx_draft_payloads").insert(records).execute()
+    
+    def _delete_payloads(self, tenant_id: str, draft_ids: List[str]) -> None:
+        """Delete out-of-line payloads (tenant-scoped)."""
+        if draft_ids:
+            (
+                self.client.table("lynx_draft_payloads")
+                .delete()
+                .eq("tenant_id", tenant_id)
+                .in_("draft_id", draft_ids)
+                .execute()
+            )
+    
+    async def _load_payloads(self, drafts: List[DraftProtocol]) -> None:
+        """Load out-of-line payloads into drafts, in one query per tenant."""
+        by_tenant: Dict[str, Dict[str, DraftProtocol]] = {}
+        for draft in drafts:
+            if is_offloaded(draft.payload):
+                by_tenant.setdefault(draft.tenant_id, {})[draft.draft_id] = draft
+        
+        for tenant_id, pending in by_tenant.items():
+            result = (
+                self.client.table("lynx_draft_payloads")
+                .select("*")
+                .eq("tenant_id", tenant_id)  # Tenant check in code
+                .in_("draft_id", list(pending))
+                .execute()
+            )
+            for record in result.data or []:
+                draft = pending.pop(str(record["draft_id"]))
+                draft.payload = self.payload_codec.decode(draft.payload, blob=record)
+            if pending:
+                raise ValueError(f"Payload of draft(s) {', '.join(pending)} not found")
+    
+    def _to_db_record(self, draft: DraftProtocol, encoded: Optional[EncodedPayload] = None) -> Dict[str, Any]:
+        """Convert DraftProtocol to DB record (encoded: payload as encoded for storage)."""
+        if encoded is None:
+            encoded = self.payload_codec.encode(draft.payload, allow_offload=False)
+        return {
+            "draft_id": draft.draft_id,
+            "tenant_id": draft.tenant_id,
+            "draft_type": draft.draft_type,
+            "payload": encoded.column,
+            "status": draft.status.value,
+            "risk_level": draft.risk_level,
+            "created_by": draft.created_by,
+            "created_at": draft.created_at,
+            "source_context": draft.source_context,
+            "recommended_approvers": draft.recommended_approvers,
+            "request_id": draft.request_id,
+        }
+    
+    def _from_db_record(self, record: Dict[str, Any], payload: Optional[Dict[str, Any]] = None) -> DraftProtocol:
+        """
+        Convert DB record to DraftProtocol.
+        
+        Compressed payloads are decoded; an out-of-line payload stays a
+        reference until _load_payloads (unless the payload is passed in).
+        """
         return DraftProtocol(
             draft_id=str(record["draft_id"]),
             tenant_id=record["tenant_id"],
             draft_type=record["draft_type"],
-            payload=record["payload"],
+            payload=payload if payload is not None else self.payload_codec.decode(record["payload"]),
             status=DraftStatus(record["status"]),
             risk_level=record["risk_level"],
             created_by=record["created_by"],
@@ -257,6 +779,266 @@ class DraftStorageSupabase(DraftStorage):
         )
 
 
+@trace_methods("storage.drafts")
+class DraftStorageSQLite(DraftStorage):
+    """
+    SQLite-backed draft storage (embedded, durable on a single node).
+    
+    Preserves all guarantees:
+    - Idempotency via request_id (unique index on tenant_id + request_id)
+    - Tenant isolation (every statement is tenant-scoped)
+    - Compare-and-set status transitions (single writer transaction)
+    """
+    
+    backend = "sqlite"
+    
+    INSERT_SQL = (
+        "INSERT INTO lynx_drafts (draft_id, tenant_id, draft_type, payload, status, risk_level,"
+        " created_by, created_at, source_context, recommended_approvers, request_id)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (tenant_id, request_id) DO NOTHING"
+    )
+    
+    def __init__(self, database: Optional[SQLiteDatabase] = None, payload_codec: Optional[PayloadCodec] = None):
+        """
+        Initialize SQLite draft storage.
+        
+        Args:
+            database: SQLite database (if None, uses the global database from Config)
+            payload_codec: Payload codec (if None, uses the global codec from Config;
+                large payloads are compressed inline, never stored out-of-line)
+        """
+        super().__init__()
+        self.database = database or get_sqlite_database()
+        self.payload_codec = payload_codec or get_payload_codec()
+    
+    async def create_draft(self, draft: DraftProtocol) -> DraftProtocol:
+        """
+        Create a draft with idempotency check.
+        
+        The insert ignores a request_id conflict; only then is the existing
+        draft read back, in the same transaction.
+        """
+        return await self.database.write(lambda connection: self._create(connection, draft))
+    
+    async def create_drafts_bulk(self, drafts: List[DraftProtocol]) -> List[DraftProtocol]:
+        """Create many drafts in one transaction (idempotency applies per item)."""
+        if not drafts:
+            return []
+        return await self.database.write(
+            lambda connection: [self._create(connection, draft) for draft in drafts]
+        )
+    
+    async def get_draft(self, draft_id: str, tenant_id: str) -> Optional[DraftProtocol]:
+        """Get a draft by ID (tenant-scoped)."""
+        def select(connection: sqlite3.Connection) -> Optional[DraftProtocol]:
+            row = connection.execute(
+                "SELECT * FROM lynx_drafts WHERE draft_id = ? AND tenant_id = ?",
+                (draft_id, tenant_id),
+            ).fetchone()
+            return self._from_row(row) if row else None
+        
+        return await self.database.read(select)
+    
+    async def get_draft_for_execution(
+        self,
+        draft_id: str,
+        tenant_id: str,
+        tool_id: str,
+    ) -> Tuple[Optional[DraftProtocol], Optional[str]]:
+        """Get a draft and its successful execution in one query (correlated subquery)."""
+        def select(connection: sqlite3.Connection) -> Tuple[Optional[DraftProtocol], Optional[str]]:
+            row = connection.execute(
+                "SELECT d.*, ("
+                " SELECT e.execution_id FROM lynx_executions e"
+                " WHERE e.tenant_id = d.tenant_id AND e.draft_id = d.draft_id"
+                " AND e.tool_id = ? AND e.status = 'succeeded' LIMIT 1"
+                ") AS succeeded_execution_id"
+                " FROM lynx_drafts d WHERE d.draft_id = ? AND d.tenant_id = ?",
+                (tool_id, draft_id, tenant_id),
+            ).fetchone()
+            if row is None:
+                return None, None
+            return self._from_row(row), row["succeeded_execution_id"]
+        
+        return await self.database.read(select)
+    
+    async def list_drafts(
+        self,
+        tenant_id: str,
+        draft_type: Optional[str] = None,
+        status: Optional[DraftStatus] = None,
+    ) -> List[DraftProtocol]:
+        """List drafts for a tenant (newest first)."""
+        sql = "SELECT * FROM lynx_drafts WHERE tenant_id = ?"
+        params: List[Any] = [tenant_id]
+        
+        if draft_type:
+            sql += " AND draft_type = ?"
+            params.append(draft_type)
+        
+        if status:
+            sql += " AND status = ?"
+            params.append(status.value)
+        
+        sql += " ORDER BY created_at DESC"
+        
+        return await self.database.read(
+            lambda connection: [self._from_row(row) for row in connection.execute(sql, params)]
+        )
+    
+    async def list_draft_summaries(
+        self,
+        tenant_id: str,
+        draft_type: Optional[str] = None,
+        status: Optional[DraftStatus] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[DraftSummary]:
+        """List draft summaries for a tenant (selects only the summary columns)."""
+        # Column names come from DraftSummary, never from the caller
+        columns = DraftSummary.columns(fields)
+        sql = f"SELECT {', '.join(columns)} FROM lynx_drafts WHERE tenant_id = ?"
+        params: List[Any] = [tenant_id]
+        
+        if draft_type:
+            sql += " AND draft_type = ?"
+            params.append(draft_type)
+        
+        if status:
+            sql += " AND status = ?"
+            params.append(status.value)
+        
+        sql += " ORDER BY created_at DESC"
+        
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        return await self.database.read(
+            lambda connection: [DraftSummary(**dict(row)) for row in connection.execute(sql, params)]
+        )
+    
+    async def update_draft_status(
+        self,
+        draft_id: str,
+        tenant_id: str,
+        new_status: DraftStatus,
+        expected_status: Optional[DraftStatus] = None,
+    ) -> Optional[DraftProtocol]:
+        """
+        Update draft status.
+        
+        With expected_status the UPDATE is conditioned on the current status
+        (compare-and-set); the writer transaction makes check and write atomic.
+        """
+        def update(connection: sqlite3.Connection) -> Optional[DraftProtocol]:
+            sql = "UPDATE lynx_drafts SET status = ?, updated_at = ? WHERE draft_id = ? AND tenant_id = ?"
+            params: List[Any] = [new_status.value, datetime.now().isoformat(), draft_id, tenant_id]
+            if expected_status is not None:
+                sql += " AND status = ?"
+                params.append(expected_status.value)
+            updated = connection.execute(sql, params).rowcount
+            
+            row = connection.execute(
+                "SELECT * FROM lynx_drafts WHERE draft_id = ? AND tenant_id = ?",
+                (draft_id, tenant_id),
+            ).fetchone()
+            if row is None:
+                return None
+            draft = self._from_row(row)
+            if not updated and expected_status is not None:
+                raise DraftStatusConflictError(draft_id, expected_status, draft.status)
+            return draft
+        
+        return await self.database.write(update)
+    
+    async def transition_drafts_bulk(
+        self,
+        tenant_id: str,
+        draft_ids: List[str],
+        expected_status: DraftStatus,
+        new_status: DraftStatus,
+    ) -> List[DraftTransitionResult]:
+        """Compare-and-set the status of many drafts in one transaction (one SELECT, one UPDATE)."""
+        unique_ids = list(dict.fromkeys(draft_ids))
+        if not unique_ids:
+            return []
+        
+        def transition(connection: sqlite3.Connection) -> Dict[str, DraftStatus]:
+            in_list = placeholders(len(unique_ids))
+            current = {
+                row["draft_id"]: DraftStatus(row["status"])
+                for row in connection.execute(
+                    f"SELECT draft_id, status FROM lynx_drafts WHERE tenant_id = ? AND draft_id IN ({in_list})",
+                    [tenant_id, *unique_ids],
+                )
+            }
+            connection.execute(
+                f"UPDATE lynx_drafts SET status = ?, updated_at = ?"
+                f" WHERE tenant_id = ? AND status = ? AND draft_id IN ({in_list})",
+                [new_status.value, datetime.now().isoformat(), tenant_id, expected_status.value, *unique_ids],
+            )
+            return current
+        
+        current = await self.database.write(transition)
+        
+        results = []
+        for draft_id in draft_ids:
+            if draft_id not in current:
+                results.append(DraftTransitionResult(draft_id=draft_id, outcome="not_found"))
+            elif current[draft_id] == expected_status:
+                results.append(DraftTransitionResult(draft_id=draft_id, outcome="updated", status=new_status))
+            else:
+                results.append(DraftTransitionResult(draft_id=draft_id, outcome="conflict", status=current[draft_id]))
+        return results
+    
+    def _create(self, connection: sqlite3.Connection, draft: DraftProtocol) -> DraftProtocol:
+        """Insert one draft, or resolve its request_id to the existing draft (writer thread)."""
+        if connection.execute(self.INSERT_SQL, self._to_row(draft)).rowcount:
+            return draft
+        
+        row = connection.execute(
+            "SELECT * FROM lynx_drafts WHERE tenant_id = ? AND request_id = ?",
+            (draft.tenant_id, draft.request_id),
+        ).fetchone()
+        if row is None or row["draft_type"] != draft.draft_type:
+            raise ValueError(f"request_id {draft.request_id} is already used by a draft of another type")
+        return self._from_row(row)
+    
+    def _to_row(self, draft: DraftProtocol) -> Tuple[Any, ...]:
+        """Convert DraftProtocol to INSERT_SQL parameters."""
+        return (
+            draft.draft_id,
+            draft.tenant_id,
+            draft.draft_type,
+            dumps(self.payload_codec.encode(draft.payload, allow_offload=False).column),
+            draft.status.value,
+            draft.risk_level,
+            draft.created_by,
+            draft.created_at,
+            dumps(draft.source_context),
+            dumps(draft.recommended_approvers),
+            draft.request_id,
+        )
+    
+    def _from_row(self, row: sqlite3.Row) -> DraftProtocol:
+        """Convert DB row to DraftProtocol."""
+        return DraftProtocol(
+            draft_id=row["draft_id"],
+            tenant_id=row["tenant_id"],
+            draft_type=row["draft_type"],
+            payload=self.payload_codec.decode(loads(row["payload"])),
+            status=DraftStatus(row["status"]),
+            risk_level=row["risk_level"],
+            created_by=row["created_by"],
+            created_at=row["created_at"],
+            source_context=loads(row["source_context"]),
+            recommended_approvers=loads(row["recommended_approvers"]),
+            request_id=row["request_id"],
+        )
+
+
 # Global storage instance
 _draft_storage: Optional[DraftStorage] = None
 
@@ -265,20 +1047,26 @@ def get_draft_storage() -> DraftStorage:
     """
     Get the global draft storage instance.
     
-    Returns Supabase storage if configured, otherwise in-memory.
+    Config.STORAGE_BACKEND selects the backend ("supabase", "sqlite" or
+    "memory"). With "auto" (default), returns Supabase storage if configured,
+    otherwise in-memory; a failed Supabase init is logged before falling back.
     """
     global _draft_storage
     
     if _draft_storage is None:
-        # Try Supabase first
-        if SUPABASE_AVAILABLE and Config.SUPABASE_URL and Config.SUPABASE_KEY:
+        backend = Config.STORAGE_BACKEND
+        if backend == "sqlite":
+            _draft_storage = DraftStorageSQLite()
+        elif backend == "supabase":
+            _draft_storage = DraftStorageSupabase()
+        elif backend == "auto" and SUPABASE_AVAILABLE and Config.SUPABASE_URL and Config.SUPABASE_KEY:
             try:
                 _draft_storage = DraftStorageSupabase()
-            except Exception:
-                # Fallback to in-memory
+            except Exception as e:
+                # Fallback to in-memory (drafts are lost on restart)
+                logger.warning("Supabase draft storage unavailable, using in-memory storage: %s", e)
                 _draft_storage = DraftStorage()
         else:
             _draft_storage = DraftStorage()
     
     return _draft_storage
-
@@ -7,11 +7,16 @@ Preserves all Execution Protocol guarantees:
 - Tenant isolation
 """
 
-from typing import Dict, Any, Optional, List
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from lynx.config import Config
+from lynx.observability.logging import get_logger
+from lynx.observability.tracing import trace_methods
+from lynx.storage.sqlite import SQLiteDatabase, dumps, get_sqlite_database, loads
 
 # Import models (separated to avoid circular imports)
-from lynx.mcp.cell.execution.models import ExecutionRecord, ExecutionStatus
+from lynx.mcp.cell.execution.models import ExecutionRecord, ExecutionStatus, ExecutionSummary
 
 try:
     from supabase import create_client, Client
@@ -20,7 +25,10 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None
 
+logger = get_logger(__name__)
 
+
+@trace_methods("storage.executions")
 class ExecutionStorage:
     """
     Base execution storage interface (in-memory implementation).
@@ -28,6 +36,8 @@ class ExecutionStorage:
     This is the fallback when Supabase is not available or in testing.
     """
     
+    backend = "memory"
+    
     def __init__(self):
         """Initialize execution storage."""
         self.executions: Dict[str, ExecutionRecord] = {}
@@ -84,6 +94,41 @@ class ExecutionStorage:
         
         return executions
     
+    async def list_execution_summaries(
+        self,
+        tenant_id: str,
+        draft_id: Optional[str] = None,
+        tool_id: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ExecutionSummary]:
+        """
+        List execution summaries for a tenant (newest first).
+        
+        Fetches only the requested summary columns - never the result payload,
+        rollback instructions or source context - for list views.
+        
+        Args:
+            tenant_id: Tenant ID
+            draft_id: Filter by source draft
+            tool_id: Filter by Cell tool
+            status: Filter by status
+            limit: Max number of executions
+            fields: ExecutionSummary fields to fetch (None = all; execution_id is always included)
+        
+        Returns:
+            Execution summaries (fields left out of the projection are None)
+        
+        Raises:
+            ValueError: If a field is not an ExecutionSummary field
+        """
+        columns = ExecutionSummary.columns(fields)
+        executions = await self.list_executions(
+            tenant_id, draft_id=draft_id, tool_id=tool_id, status=status, limit=limit,
+        )
+        return [ExecutionSummary(**{column: getattr(e, column) for column in columns}) for e in executions]
+    
     async def update_execution_status(
         self,
         execution_id: str,
@@ -105,6 +150,7 @@ class ExecutionStorage:
         return execution
 
 
+@trace_methods("storage.executions")
 class ExecutionStorageSupabase(ExecutionStorage):
     """
     Supabase-backed execution storage.
@@ -115,6 +161,8 @@ class ExecutionStorageSupabase(ExecutionStorage):
     - Tenant isolation (RLS + code checks)
     """
     
+    backend = "supabase"
+    
     def __init__(self, supabase_client: Optional[Client] = None):
         """
         Initialize Supabase execution storage.
@@ -143,21 +191,7 @@ class ExecutionStorageSupabase(ExecutionStorage):
                 return existing
         
         # Convert to DB format
-        db_record = {
-            "execution_id": execution.execution_id,
-            "draft_id": execution.draft_id,
-            "tool_id": execution.tool_id,
-            "tenant_id": execution.tenant_id,
-            "actor_id": execution.actor_id,
-            "status": execution.status.value,
-            "result_payload": execution.result_payload,
-            "created_at": execution.created_at,
-            "completed_at": execution.completed_at,
-            "error_message": execution.error_message,
-            "rollback_instructions": execution.rollback_instructions,
-            "request_id": execution.request_id,
-            "source_context": execution.source_context,
-        }
+        db_record = self._to_db_record(execution)
         
         # Insert (will fail if unique constraint violated for exactly-once)
         try:
@@ -231,6 +265,47 @@ class ExecutionStorageSupabase(ExecutionStorage):
         
         return [self._from_db_record(record) for record in result.data]
     
+    async def list_execution_summaries(
+        self,
+        tenant_id: str,
+        draft_id: Optional[str] = None,
+        tool_id: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ExecutionSummary]:
+        """List execution summaries for a tenant (selects only the summary columns)."""
+        columns = ExecutionSummary.columns(fields)
+        query = (
+            self.client.table("lynx_executions")
+            .select(",".join(columns))
+            .eq("tenant_id", tenant_id)
+            .order("created_at", desc=True)
+        )
+        
+        if draft_id:
+            query = query.eq("draft_id", draft_id)
+        
+        if tool_id:
+            query = query.eq("tool_id", tool_id)
+        
+        if status:
+            query = query.eq("status", status.value)
+        
+        if limit:
+            query = query.limit(limit)
+        
+        result = query.execute()
+        
+        return [
+            ExecutionSummary(**{
+                **record,
+                "execution_id": str(record["execution_id"]),
+                **({"draft_id": str(record["draft_id"])} if record.get("draft_id") else {}),
+            })
+            for record in result.data
+        ]
+    
     async def update_execution_status(
         self,
         execution_id: str,
@@ -323,6 +398,24 @@ class ExecutionStorageSupabase(ExecutionStorage):
             return self._from_db_record(result.data[0])
         return None
     
+    def _to_db_record(self, execution: ExecutionRecord) -> Dict[str, Any]:
+        """Convert ExecutionRecord to DB record."""
+        return {
+            "execution_id": execution.execution_id,
+            "draft_id": execution.draft_id,
+            "tool_id": execution.tool_id,
+            "tenant_id": execution.tenant_id,
+            "actor_id": execution.actor_id,
+            "status": execution.status.value,
+            "result_payload": execution.result_payload,
+            "created_at": execution.created_at,
+            "completed_at": execution.completed_at,
+            "error_message": execution.error_message,
+            "rollback_instructions": execution.rollback_instructions,
+            "request_id": execution.request_id,
+            "source_context": execution.source_context,
+        }
+    
     def _from_db_record(self, record: Dict[str, Any]) -> ExecutionRecord:
         """Convert DB record to ExecutionRecord."""
         return ExecutionRecord(
@@ -342,6 +435,238 @@ class ExecutionStorageSupabase(ExecutionStorage):
         )
 
 
+@trace_methods("storage.executions")
+class ExecutionStorageSQLite(ExecutionStorage):
+    """
+    SQLite-backed execution storage (embedded, durable on a single node).
+    
+    Preserves all guarantees:
+    - Idempotency via request_id
+    - Exactly-once semantics (unique index on succeeded executions)
+    - Tenant isolation (every statement is tenant-scoped)
+    """
+    
+    backend = "sqlite"
+    
+    INSERT_SQL = (
+        "INSERT INTO lynx_executions (execution_id, draft_id, tool_id, tenant_id, actor_id, status,"
+        " result_payload, created_at, completed_at, error_message, rollback_instructions,"
+        " request_id, source_context)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    
+    def __init__(self, database: Optional[SQLiteDatabase] = None):
+        """
+        Initialize SQLite execution storage.
+        
+        Args:
+            database: SQLite database (if None, uses the global database from Config)
+        """
+        super().__init__()
+        self.database = database or get_sqlite_database()
+    
+    async def create_execution(self, execution: ExecutionRecord) -> ExecutionRecord:
+        """
+        Create an execution record with idempotency check.
+        
+        Lookup and insert share one writer transaction. If the insert hits the
+        exactly-once index, the existing successful execution is returned.
+        """
+        def create(connection: sqlite3.Connection) -> ExecutionRecord:
+            if execution.request_id:
+                existing = self._select_one(
+                    connection,
+                    "SELECT * FROM lynx_executions WHERE tenant_id = ? AND request_id = ?",
+                    (execution.tenant_id, execution.request_id),
+                )
+                if existing:
+                    return existing
+            try:
+                self._insert(connection, execution)
+            except sqlite3.IntegrityError:
+                existing = self._select_one(
+                    connection,
+                    "SELECT * FROM lynx_executions WHERE tenant_id = ? AND draft_id = ?"
+                    " AND tool_id = ? AND status = 'succeeded' LIMIT 1",
+                    (execution.tenant_id, execution.draft_id, execution.tool_id),
+                )
+                if existing:
+                    return existing
+                raise
+            return execution
+        
+        return await self.database.write(create)
+    
+    async def get_execution(self, execution_id: str, tenant_id: str) -> Optional[ExecutionRecord]:
+        """Get an execution record by ID (tenant-scoped)."""
+        return await self.database.read(lambda connection: self._select_one(
+            connection,
+            "SELECT * FROM lynx_executions WHERE execution_id = ? AND tenant_id = ?",
+            (execution_id, tenant_id),
+        ))
+    
+    async def list_executions(
+        self,
+        tenant_id: str,
+        draft_id: Optional[str] = None,
+        tool_id: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        limit: Optional[int] = None,
+    ) -> List[ExecutionRecord]:
+        """List executions for a tenant (newest first)."""
+        sql = "SELECT * FROM lynx_executions WHERE tenant_id = ?"
+        params: List[Any] = [tenant_id]
+        
+        if draft_id:
+            sql += " AND draft_id = ?"
+            params.append(draft_id)
+        
+        if tool_id:
+            sql += " AND tool_id = ?"
+            params.append(tool_id)
+        
+        if status:
+            sql += " AND status = ?"
+            params.append(status.value)
+        
+        sql += " ORDER BY created_at DESC"
+        
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        return await self.database.read(
+            lambda connection: [self._from_row(row) for row in connection.execute(sql, params)]
+        )
+    
+    async def list_execution_summaries(
+        self,
+        tenant_id: str,
+        draft_id: Optional[str] = None,
+        tool_id: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ExecutionSummary]:
+        """List execution summaries for a tenant (selects only the summary columns)."""
+        # Column names come from ExecutionSummary, never from the caller
+        columns = ExecutionSummary.columns(fields)
+        sql = f"SELECT {', '.join(columns)} FROM lynx_executions WHERE tenant_id = ?"
+        params: List[Any] = [tenant_id]
+        
+        if draft_id:
+            sql += " AND draft_id = ?"
+            params.append(draft_id)
+        
+        if tool_id:
+            sql += " AND tool_id = ?"
+            params.append(tool_id)
+        
+        if status:
+            sql += " AND status = ?"
+            params.append(status.value)
+        
+        sql += " ORDER BY created_at DESC"
+        
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        return await self.database.read(
+            lambda connection: [ExecutionSummary(**dict(row)) for row in connection.execute(sql, params)]
+        )
+    
+    async def update_execution_status(
+        self,
+        execution_id: str,
+        status: ExecutionStatus,
+        result_payload: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        rollback_instructions: Optional[Dict[str, Any]] = None,
+    ) -> Optional[ExecutionRecord]:
+        """Update execution status (payload merge and update in one transaction)."""
+        def update(connection: sqlite3.Connection) -> Optional[ExecutionRecord]:
+            existing = self._select_one(
+                connection, "SELECT * FROM lynx_executions WHERE execution_id = ?", (execution_id,),
+            )
+            if existing is None:
+                return None
+            
+            merged_payload = existing.result_payload
+            if result_payload is not None:
+                merged_payload = {**merged_payload, **result_payload}
+            connection.execute(
+                "UPDATE lynx_executions SET status = ?, completed_at = ?, result_payload = ?,"
+                " error_message = COALESCE(?, error_message),"
+                " rollback_instructions = COALESCE(?, rollback_instructions)"
+                " WHERE execution_id = ? AND tenant_id = ?",
+                (
+                    status.value,
+                    datetime.now().isoformat(),
+                    dumps(merged_payload),
+                    error_message,
+                    dumps(rollback_instructions),
+                    execution_id,
+                    existing.tenant_id,  # Tenant check in code
+                ),
+            )
+            return self._select_one(
+                connection, "SELECT * FROM lynx_executions WHERE execution_id = ?", (execution_id,),
+            )
+        
+        return await self.database.write(update)
+    
+    def _insert(self, connection: sqlite3.Connection, execution: ExecutionRecord) -> None:
+        """Insert one execution record (writer thread; raises sqlite3.IntegrityError on duplicates)."""
+        connection.execute(self.INSERT_SQL, self._to_row(execution))
+    
+    def _select_one(
+        self,
+        connection: sqlite3.Connection,
+        sql: str,
+        params: Tuple[Any, ...],
+    ) -> Optional[ExecutionRecord]:
+        """Run a SELECT and convert its first row."""
+        row = connection.execute(sql, params).fetchone()
+        return self._from_row(row) if row else None
+    
+    def _to_row(self, execution: ExecutionRecord) -> Tuple[Any, ...]:
+        """Convert ExecutionRecord to INSERT_SQL parameters."""
+        return (
+            execution.execution_id,
+            execution.draft_id,
+            execution.tool_id,
+            execution.tenant_id,
+            execution.actor_id,
+            execution.status.value,
+            dumps(execution.result_payload),
+            execution.created_at,
+            execution.completed_at,
+            execution.error_message,
+            dumps(execution.rollback_instructions),
+            execution.request_id,
+            dumps(execution.source_context),
+        )
+    
+    def _from_row(self, row: sqlite3.Row) -> ExecutionRecord:
+        """Convert DB row to ExecutionRecord."""
+        return ExecutionRecord(
+            execution_id=row["execution_id"],
+            draft_id=row["draft_id"],
+            tool_id=row["tool_id"],
+            tenant_id=row["tenant_id"],
+            actor_id=row["actor_id"],
+            status=ExecutionStatus(row["status"]),
+            result_payload=loads(row["result_payload"]),
+            created_at=row["created_at"],
+            completed_at=row["completed_at"],
+            error_message=row["error_message"],
+            rollback_instructions=loads(row["rollback_instructions"]),
+            request_id=row["request_id"],
+            source_context=loads(row["source_context"]),
+        )
+
+
 # Global storage instance
 _execution_storage: Optional[ExecutionStorage] = None
 
@@ -350,20 +675,24 @@ def get_execution_storage() -> ExecutionStorage:
     """
     Get the global execution storage instance.
     
-    Returns Supabase storage if configured, otherwise in-memory.
+    Config.STORAGE_BACKEND selects the backend (see get_draft_storage).
     """
     global _execution_storage
     
     if _execution_storage is None:
-        # Try Supabase first
-        if SUPABASE_AVAILABLE and Config.SUPABASE_URL and Config.SUPABASE_KEY:
+        backend = Config.STORAGE_BACKEND
+        if backend == "sqlite":
+            _execution_storage = ExecutionStorageSQLite()
+        elif backend == "supabase":
+            _execution_storage = ExecutionStorageSupabase()
+        elif backend == "auto" and SUPABASE_AVAILABLE and Config.SUPABASE_URL and Config.SUPABASE_KEY:
             try:
                 _execution_storage = ExecutionStorageSupabase()
-            except Exception:
-                # Fallback to in-memory
+            except Exception as e:
+                # Fallback to in-memory (executions are lost on restart)
+                logger.warning("Supabase execution storage unavailable, using in-memory storage: %s", e)
                 _execution_storage = ExecutionStorage()
         else:
             _execution_storage = ExecutionStorage()
     
     return _execution_storage
-
@@ -0,0 +1,117 @@
+"""
+Idempotency cache for storage writes.
+
+Bounded, tenant-scoped LRU of request_id -> stored object, so retried
+requests are answered from memory instead of a request_id SELECT. Keys
+always include the tenant ID, so one tenant's request_id can never resolve
+to another tenant's object.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from lynx.config import Config
+from lynx.observability.metrics import get_metrics_registry
+
+T = TypeVar("T")
+
+
+class IdempotencyCache(Generic[T]):
+    """LRU of (tenant_id, scope, request_id) -> object."""
+
+    def __init__(self, name: str, max_entries: Optional[int] = None):
+        """
+        Initialize idempotency cache.
+
+        Args:
+            name: Cache name (metrics label, e.g., "drafts")
+            max_entries: Max cached objects (defaults to Config.IDEMPOTENCY_CACHE_SIZE)
+        """
+        self.name = name
+        self.max_entries = max_entries if max_entries is not None else Config.IDEMPOTENCY_CACHE_SIZE
+        self._entries: "OrderedDict[Tuple[str, Hashable, str], T]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        registry = get_metrics_registry()
+        self._hit_counter = registry.counter(
+            "lynx_idempotency_cache_hits_total", "Idempotent requests answered from memory", cache=name,
+        )
+        self._miss_counter = registry.counter(
+            "lynx_idempotency_cache_misses_total", "Idempotency lookups that went to storage", cache=name,
+        )
+
+    def get(self, tenant_id: str, scope: Hashable, request_id: str) -> Optional[T]:
+        """
+        Look up a cached object.
+
+        Args:
+            tenant_id: Tenant ID
+            scope: Additional key part (e.g., draft_type)
+            request_id: Client request ID
+
+        Returns:
+            Cached object or None
+        """
+        key = (tenant_id, scope, request_id)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        (self._hit_counter if value is not None else self._miss_counter).inc()
+        return value
+
+    def put(self, tenant_id: str, scope: Hashable, request_id: str, value: T) -> None:
+        """
+        Cache an object (evicting the least recently used one when full).
+
+        Args:
+            tenant_id: Tenant ID
+            scope: Additional key part (e.g., draft_type)
+            request_id: Client request ID
+            value: Stored object
+        """
+        if self.max_entries <= 0:
+            return
+        key = (tenant_id, scope, request_id)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, tenant_id: str, scope: Hashable, request_id: str, value: T) -> None:
+        """Replace an entry only if it is cached (e.g., after a status change)."""
+        key = (tenant_id, scope, request_id)
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Dictionary with size, capacity, hits, misses and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
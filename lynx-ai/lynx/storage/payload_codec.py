@@ -0,0 +1,202 @@
+"""
+Draft payload codec - size limit, compression and out-of-line storage.
+
+Payloads are stored as JSON. Above a threshold the serialized payload is
+compressed (zstd if the zstandard package is installed, otherwise gzip) and
+the payload column holds an envelope instead:
+
+    {"$lynx_payload": {"codec": "zstd", "size": 1048576, "data": "<base64>"}}
+
+Above a second (optional) threshold the compressed data moves to the
+lynx_draft_payloads table and the envelope keeps only a reference
+("blob": true), so row scans of lynx_drafts stay small; the payload is
+loaded when the full draft is read.
+"""
+
+import base64
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from lynx.config import Config
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+ENVELOPE_KEY = "$lynx_payload"
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when a draft payload exceeds Config.DRAFT_PAYLOAD_MAX_BYTES."""
+
+    def __init__(self, size: int, max_bytes: int):
+        super().__init__(f"Draft payload is {size} bytes (limit {max_bytes} bytes)")
+        self.size = size
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class EncodedPayload:
+    """Result of encoding one payload."""
+    column: Dict[str, Any]  # Value for the payload column
+    blob: Optional[Dict[str, Any]] = None  # codec/size/data for lynx_draft_payloads (out-of-line only)
+    size: int = 0  # Serialized (uncompressed) size in bytes
+
+
+def serialize_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload to compact JSON bytes."""
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def check_payload_size(payload: Dict[str, Any], max_bytes: Optional[int] = None) -> int:
+    """
+    Check a payload against the size limit.
+
+    Args:
+        payload: Draft payload
+        max_bytes: Limit (defaults to Config.DRAFT_PAYLOAD_MAX_BYTES; 0 = unlimited)
+
+    Returns:
+        Serialized size in bytes
+
+    Raises:
+        PayloadTooLargeError: If the payload is over the limit
+    """
+    max_bytes = Config.DRAFT_PAYLOAD_MAX_BYTES if max_bytes is None else max_bytes
+    size = len(serialize_payload(payload))
+    if max_bytes and size > max_bytes:
+        raise PayloadTooLargeError(size, max_bytes)
+    return size
+
+
+def is_offloaded(column: Any) -> bool:
+    """Check whether a payload column value refers to lynx_draft_payloads."""
+    return isinstance(column, dict) and bool(column.get(ENVELOPE_KEY, {}).get("blob"))
+
+
+class PayloadCodec:
+    """Encodes draft payloads for storage and decodes them back."""
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        compress_threshold: Optional[int] = None,
+        offload_threshold: Optional[int] = None,
+        codec: Optional[str] = None,
+    ):
+        """
+        Initialize payload codec.
+
+        Args:
+            max_bytes: Size limit (defaults to Config.DRAFT_PAYLOAD_MAX_BYTES; 0 = unlimited)
+            compress_threshold: Compress payloads from this size on
+                (defaults to Config.DRAFT_PAYLOAD_COMPRESS_THRESHOLD; 0 = never)
+            offload_threshold: Store payloads out-of-line from this size on
+                (defaults to Config.DRAFT_PAYLOAD_OFFLOAD_THRESHOLD; 0 = never)
+            codec: "zstd" or "gzip" (defaults to Config.DRAFT_PAYLOAD_CODEC;
+                "auto" = zstd if installed, otherwise gzip)
+        """
+        self.max_bytes = Config.DRAFT_PAYLOAD_MAX_BYTES if max_bytes is None else max_bytes
+        self.compress_threshold = (
+            Config.DRAFT_PAYLOAD_COMPRESS_THRESHOLD if compress_threshold is None else compress_threshold
+        )
+        self.offload_threshold = (
+            Config.DRAFT_PAYLOAD_OFFLOAD_THRESHOLD if offload_threshold is None else offload_threshold
+        )
+        codec = codec or Config.DRAFT_PAYLOAD_CODEC
+        if codec == "auto":
+            codec = "zstd" if ZSTD_AVAILABLE else "gzip"
+        if codec == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError("zstandard package not installed")
+        if codec not in ("zstd", "gzip"):
+            raise ValueError(f"Unknown payload codec: {codec}")
+        self.codec = codec
+
+    def encode(self, payload: Dict[str, Any], allow_offload: bool = True) -> EncodedPayload:
+        """
+        Encode a payload for storage.
+
+        Args:
+            payload: Draft payload
+            allow_offload: Whether the backend has a lynx_draft_payloads table
+
+        Returns:
+            EncodedPayload (column is the payload itself below the compression threshold)
+
+        Raises:
+            PayloadTooLargeError: If the payload is over the size limit
+        """
+        raw = serialize_payload(payload)
+        size = len(raw)
+        if self.max_bytes and size > self.max_bytes:
+            raise PayloadTooLargeError(size, self.max_bytes)
+        if not self.compress_threshold or size < self.compress_threshold:
+            return EncodedPayload(column=payload, size=size)
+
+        data = base64.b64encode(self._compress(raw)).decode("ascii")
+        if allow_offload and self.offload_threshold and size >= self.offload_threshold:
+            return EncodedPayload(
+                column={ENVELOPE_KEY: {"codec": self.codec, "size": size, "blob": True}},
+                blob={"codec": self.codec, "size": size, "data": data},
+                size=size,
+            )
+        return EncodedPayload(
+            column={ENVELOPE_KEY: {"codec": self.codec, "size": size, "data": data}},
+            size=size,
+        )
+
+    def decode(self, column: Any, blob: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Decode a stored payload.
+
+        Args:
+            column: Payload column value
+            blob: lynx_draft_payloads row for an out-of-line payload
+
+        Returns:
+            Payload (an out-of-line payload without its blob is returned as stored)
+        """
+        envelope = column.get(ENVELOPE_KEY) if isinstance(column, dict) and len(column) == 1 else None
+        if envelope is None:
+            return column
+        source = blob if envelope.get("blob") else envelope
+        if source is None:
+            return column
+        raw = self._decompress(source["codec"], base64.b64decode(source["data"]))
+        return json.loads(raw)
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor().compress(raw)
+        return gzip.compress(raw, compresslevel=6)
+
+    @staticmethod
+    def _decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstandard package not installed (payload was stored with zstd)")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+
+# Global codec instance
+_payload_codec: Optional[PayloadCodec] = None
+
+
+def get_payload_codec() -> PayloadCodec:
+    """
+    Get the global payload codec.
+
+    Returns:
+        PayloadCodec configured from Config
+    """
+    global _payload_codec
+
+    if _payload_codec is None:
+        _payload_codec = PayloadCodec()
+
+    return _payload_codec
@@ -0,0 +1,101 @@
+"""
+Run Summaries - per-run audit aggregates (lynx_run_summaries).
+
+One row per Lynx run: tool call, success, failure and refusal counts, max
+risk, tools used, first/last event, total tool duration and the run's
+query/response. AuditLogger maintains the rows incrementally
+(lynx_record_run_event RPC) as audit events arrive, so audit lists are one
+indexed read of this table instead of reading lynx_runs and aggregating
+audit_logs. Summaries stay hot when runs are archived.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from supabase import Client
+except ImportError:
+    Client = None
+
+RUN_SUMMARY_COLUMNS = [
+    "run_id", "tenant_id", "user_id", "status", "user_query", "lynx_response", "tool_count", "success_count", "failure_count",
+    "refusal_count", "max_risk", "tool_ids", "total_duration_ms", "first_event_at",
+    "last_event_at", "completed_at",
+]
+
+
+def get_run_summaries(client: Client, tenant_id: str, run_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the summaries of runs (one read).
+    
+    Args:
+        client: Supabase client
+        tenant_id: Tenant ID
+        run_ids: Run IDs
+    
+    Returns:
+        Summary rows by run_id (runs without a summary are missing)
+    """
+    if not run_ids:
+        return {}
+    rows = (
+        client.table("lynx_run_summaries")
+        .select(",".join(RUN_SUMMARY_COLUMNS))
+        .eq("tenant_id", tenant_id)
+        .in_("run_id", list(run_ids))
+        .execute()
+        .data
+    )
+    return {row["run_id"]: row for row in rows}
+
+
+def list_run_summaries(
+    client: Client,
+    tenant_id: str,
+    limit: int = 50,
+    status: Optional[str] = None,
+    tool_id: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    user_id: Optional[str] = None,
+    offset: int = 0,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    List run summaries of a tenant, newest first (one indexed read, count included).
+    
+    Args:
+        client: Supabase client
+        tenant_id: Tenant ID
+        limit: Max summaries to return
+        status: Filter by run status ("completed", "failed", "blocked")
+        tool_id: Filter to runs that called this tool
+        since: Filter to runs started at or after this timestamp (ISO 8601)
+        until: Filter to runs started at or before this timestamp (ISO 8601)
+        user_id: Filter to runs of this user
+        offset: Summaries to skip (offset pagination)
+    
+    Returns:
+        (summaries, total number of matching runs)
+    """
+    query = (
+        client.table("lynx_run_summaries")
+        .select(",".join(RUN_SUMMARY_COLUMNS), count="exact")
+        .eq("tenant_id", tenant_id)
+    )
+    if status:
+        query = query.eq("status", status)
+    if tool_id:
+        query = query.contains("tool_ids", [tool_id])
+    if since:
+        query = query.gte("first_event_at", since)
+    if until:
+        query = query.lte("first_event_at", until)
+    if user_id:
+        query = query.eq("user_id", user_id)
+    result = (
+        query.order("first_event_at", desc=True)
+        .order("run_id", desc=True)
+        .range(offset, offset + limit - 1)
+        .execute()
+    )
+    total = result.count if result.count is not None else len(result.data)
+    return result.data, total
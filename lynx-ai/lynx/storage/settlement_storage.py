@@ -4,9 +4,14 @@ Settlement Intent Storage - Supabase backend implementation.
 Stores settlement intent objects for payment executions.
 """
 
-from typing import Dict, Any, Optional
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from pydantic import BaseModel, Field
 from lynx.config import Config
+from lynx.observability.logging import get_logger
+from lynx.observability.tracing import trace_methods
+from lynx.storage.sqlite import SQLiteDatabase, dumps, get_sqlite_database, loads, placeholders
 
 try:
     from supabase import create_client, Client
@@ -15,6 +20,8 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None
 
+logger = get_logger(__name__)
+
 
 class SettlementIntent(BaseModel):
     """Settlement Intent object for payment execution."""
@@ -25,8 +32,23 @@ class SettlementIntent(BaseModel):
     created_at: Optional[str] = Field(default=None, description="Creation timestamp")
     updated_at: Optional[str] = Field(default=None, description="Update timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    attempts: int = Field(default=0, description="Settlement attempts so far")
+    next_attempt_at: Optional[str] = Field(default=None, description="Earliest next attempt (None = now)")
+    last_error: Optional[str] = Field(default=None, description="Error of the last failed attempt")
+    locked_by: Optional[str] = Field(default=None, description="Worker holding the processing lease")
+    locked_until: Optional[str] = Field(default=None, description="Processing lease expiry")
+
 
+def _is_claimable(intent: SettlementIntent, now: datetime) -> bool:
+    """Queued and due, or processing with an expired lease (crashed worker)."""
+    if intent.settlement_status == "queued":
+        return intent.next_attempt_at is None or datetime.fromisoformat(intent.next_attempt_at) <= now
+    if intent.settlement_status == "processing":
+        return intent.locked_until is None or datetime.fromisoformat(intent.locked_until) < now
+    return False
 
+
+@trace_methods("storage.settlements")
 class SettlementIntentStorage:
     """
     Base settlement intent storage interface (in-memory implementation).
@@ -34,6 +56,8 @@ class SettlementIntentStorage:
     This is the fallback when Supabase is not available or in testing.
     """
     
+    backend = "memory"
+    
     def __init__(self):
         """Initialize settlement intent storage."""
         self.intents: Dict[str, SettlementIntent] = {}  # payment_id -> SettlementIntent
@@ -60,12 +84,92 @@ class SettlementIntentStorage:
         intent = await self.get_intent(payment_id, tenant_id)
         if intent:
             intent.settlement_status = new_status
-            from datetime import datetime
             intent.updated_at = datetime.now().isoformat()
             self.intents[payment_id] = intent
         return intent
+    
+    async def claim_intents(
+        self,
+        worker_id: str,
+        providers: Sequence[str],
+        batch_size: int,
+        lease_seconds: int,
+    ) -> List[SettlementIntent]:
+        """
+        Claim due intents for processing (all tenants).
+        
+        Claimable intents are queued and due, or processing with an expired
+        lease. Claimed intents move to "processing", leased to worker_id
+        for lease_seconds, and their attempts count goes up by one.
+        
+        Args:
+            worker_id: Claiming worker
+            providers: Only claim intents of these providers
+            batch_size: Max intents to claim
+            lease_seconds: Lease duration
+        
+        Returns:
+            Claimed intents (oldest due first)
+        """
+        now = datetime.now()
+        due = sorted(
+            (i for i in self.intents.values() if i.provider in providers and _is_claimable(i, now)),
+            key=lambda i: i.next_attempt_at or i.created_at or "",
+        )[:batch_size]
+        
+        locked_until = (now + timedelta(seconds=lease_seconds)).isoformat()
+        for intent in due:
+            intent.settlement_status = "processing"
+            intent.locked_by = worker_id
+            intent.locked_until = locked_until
+            intent.attempts += 1
+            intent.updated_at = now.isoformat()
+        # Copies: a lease taken over later must not change what this worker holds
+        return [intent.model_copy(deep=True) for intent in due]
+    
+    async def release_intent(
+        self,
+        payment_id: str,
+        tenant_id: str,
+        worker_id: str,
+        new_status: str,
+        last_error: Optional[str] = None,
+        next_attempt_at: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SettlementIntent]:
+        """
+        Finish processing a claimed intent and drop the lease.
+        
+        Only applies while worker_id still holds the lease, so a worker
+        whose lease expired cannot overwrite the result of its successor.
+        
+        Args:
+            payment_id: Payment ID
+            tenant_id: Tenant ID
+            worker_id: Worker that claimed the intent
+            new_status: "completed", "failed" or "queued" (retry)
+            last_error: Error of this attempt (if any)
+            next_attempt_at: Earliest retry (for "queued")
+            metadata: Replacement metadata (if given)
+        
+        Returns:
+            Updated intent, or None if the lease was lost
+        """
+        intent = await self.get_intent(payment_id, tenant_id)
+        if not intent or intent.settlement_status != "processing" or intent.locked_by != worker_id:
+            return None
+        intent.settlement_status = new_status
+        intent.last_error = last_error
+        intent.next_attempt_at = next_attempt_at
+        intent.locked_by = None
+        intent.locked_until = None
+        if metadata is not None:
+            intent.metadata = metadata
+        intent.updated_at = datetime.now().isoformat()
+        return intent.model_copy(deep=True)
 
 
+@trace_methods("storage.settlements")
 class SettlementIntentStorageSupabase(SettlementIntentStorage):
     """
     Supabase-backed settlement intent storage.
@@ -73,6 +177,8 @@ class SettlementIntentStorageSupabase(SettlementIntentStorage):
     Preserves tenant isolation (RLS + code checks).
     """
     
+    backend = "supabase"
+    
     def __init__(self, supabase_client: Optional[Client] = None):
         """
         Initialize Supabase settlement intent storage.
@@ -94,17 +200,7 @@ class SettlementIntentStorageSupabase(SettlementIntentStorage):
     
     async def create_intent(self, intent: SettlementIntent) -> SettlementIntent:
         """Create a settlement intent."""
-        from datetime import datetime
-        
-        db_record = {
-            "payment_id": intent.payment_id,
-            "settlement_status": intent.settlement_status,
-            "provider": intent.provider,
-            "tenant_id": intent.tenant_id,
-            "created_at": intent.created_at or datetime.now().isoformat(),
-            "updated_at": intent.updated_at or datetime.now().isoformat(),
-            "metadata": intent.metadata,
-        }
+        db_record = self._to_db_record(intent)
         
         self.client.table("settlement_intents").insert(db_record).execute()
         
@@ -134,8 +230,6 @@ class SettlementIntentStorageSupabase(SettlementIntentStorage):
         new_status: str,
     ) -> Optional[SettlementIntent]:
         """Update settlement status."""
-        from datetime import datetime
-        
         # Defense-in-depth: check tenant in update
         result = (
             self.client.table("settlement_intents")
@@ -153,6 +247,85 @@ class SettlementIntentStorageSupabase(SettlementIntentStorage):
         
         return self._from_db_record(result.data[0])
     
+    async def claim_intents(
+        self,
+        worker_id: str,
+        providers: Sequence[str],
+        batch_size: int,
+        lease_seconds: int,
+    ) -> List[SettlementIntent]:
+        """
+        Claim due intents in one RPC (see SettlementIntentStorage.claim_intents).
+        
+        lynx_claim_settlement_intents selects with FOR UPDATE SKIP LOCKED,
+        so concurrent workers never claim the same intent.
+        """
+        result = self.client.rpc("lynx_claim_settlement_intents", {
+            "p_worker_id": worker_id,
+            "p_providers": list(providers),
+            "p_batch_size": batch_size,
+            "p_lease_seconds": lease_seconds,
+        }).execute()
+        
+        return [self._from_db_record(record) for record in result.data or []]
+    
+    async def release_intent(
+        self,
+        payment_id: str,
+        tenant_id: str,
+        worker_id: str,
+        new_status: str,
+        last_error: Optional[str] = None,
+        next_attempt_at: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SettlementIntent]:
+        """Finish a claimed intent (see SettlementIntentStorage.release_intent)."""
+        update_data: Dict[str, Any] = {
+            "settlement_status": new_status,
+            "last_error": last_error,
+            "locked_by": None,
+            "locked_until": None,
+            "updated_at": datetime.now().isoformat(),
+        }
+        if next_attempt_at is not None:
+            update_data["next_attempt_at"] = next_attempt_at
+        if metadata is not None:
+            update_data["metadata"] = metadata
+        
+        # Conditional on the lease (defense-in-depth: tenant check in code)
+        result = (
+            self.client.table("settlement_intents")
+            .update(update_data)
+            .eq("payment_id", payment_id)
+            .eq("tenant_id", tenant_id)
+            .eq("settlement_status", "processing")
+            .eq("locked_by", worker_id)
+            .execute()
+        )
+        
+        if not result.data:
+            return None
+        
+        return self._from_db_record(result.data[0])
+    
+    def _to_db_record(self, intent: SettlementIntent) -> Dict[str, Any]:
+        """Convert SettlementIntent to DB record."""
+        now = datetime.now().isoformat()
+        return {
+            "payment_id": intent.payment_id,
+            "settlement_status": intent.settlement_status,
+            "provider": intent.provider,
+            "tenant_id": intent.tenant_id,
+            "created_at": intent.created_at or now,
+            "updated_at": intent.updated_at or now,
+            "metadata": intent.metadata,
+            "attempts": intent.attempts,
+            "next_attempt_at": intent.next_attempt_at or now,
+            "last_error": intent.last_error,
+            "locked_by": intent.locked_by,
+            "locked_until": intent.locked_until,
+        }
+    
     def _from_db_record(self, record: Dict[str, Any]) -> SettlementIntent:
         """Convert DB record to SettlementIntent."""
         return SettlementIntent(
@@ -162,7 +335,198 @@ class SettlementIntentStorageSupabase(SettlementIntentStorage):
             tenant_id=record["tenant_id"],
             created_at=record.get("created_at"),
             updated_at=record.get("updated_at"),
-            metadata=record.get("metadata", {}),
+            metadata=record.get("metadata") or {},
+            attempts=record.get("attempts") or 0,
+            next_attempt_at=record.get("next_attempt_at"),
+            last_error=record.get("last_error"),
+            locked_by=record.get("locked_by"),
+            locked_until=record.get("locked_until"),
+        )
+
+
+@trace_methods("storage.settlements")
+class SettlementIntentStorageSQLite(SettlementIntentStorage):
+    """
+    SQLite-backed settlement intent storage (embedded, durable on a single node).
+    
+    Preserves tenant isolation (every statement is tenant-scoped). Claims run
+    in one writer transaction, so concurrent workers never claim the same
+    intent (the single-writer equivalent of FOR UPDATE SKIP LOCKED).
+    """
+    
+    backend = "sqlite"
+    
+    INSERT_SQL = (
+        "INSERT INTO settlement_intents (payment_id, settlement_status, provider, tenant_id,"
+        " created_at, updated_at, metadata, attempts, next_attempt_at, last_error, locked_by, locked_until)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    
+    def __init__(self, database: Optional[SQLiteDatabase] = None):
+        """
+        Initialize SQLite settlement intent storage.
+        
+        Args:
+            database: SQLite database (if None, uses the global database from Config)
+        """
+        super().__init__()
+        self.database = database or get_sqlite_database()
+    
+    async def create_intent(self, intent: SettlementIntent) -> SettlementIntent:
+        """Create a settlement intent."""
+        await self.database.write(lambda connection: self._insert(connection, intent))
+        return intent
+    
+    async def get_intent(self, payment_id: str, tenant_id: str) -> Optional[SettlementIntent]:
+        """Get a settlement intent by payment_id (tenant-scoped)."""
+        return await self.database.read(lambda connection: self._select(connection, payment_id, tenant_id))
+    
+    async def update_status(
+        self,
+        payment_id: str,
+        tenant_id: str,
+        new_status: str,
+    ) -> Optional[SettlementIntent]:
+        """Update settlement status."""
+        def update(connection: sqlite3.Connection) -> Optional[SettlementIntent]:
+            connection.execute(
+                "UPDATE settlement_intents SET settlement_status = ?, updated_at = ?"
+                " WHERE payment_id = ? AND tenant_id = ?",
+                (new_status, datetime.now().isoformat(), payment_id, tenant_id),
+            )
+            return self._select(connection, payment_id, tenant_id)
+        
+        return await self.database.write(update)
+    
+    async def claim_intents(
+        self,
+        worker_id: str,
+        providers: Sequence[str],
+        batch_size: int,
+        lease_seconds: int,
+    ) -> List[SettlementIntent]:
+        """Claim due intents in one transaction (see SettlementIntentStorage.claim_intents)."""
+        if not providers:
+            return []
+        
+        def claim(connection: sqlite3.Connection) -> List[SettlementIntent]:
+            now = datetime.now()
+            payment_ids = [
+                row["payment_id"]
+                for row in connection.execute(
+                    f"SELECT payment_id FROM settlement_intents"
+                    f" WHERE provider IN ({placeholders(len(providers))})"
+                    f" AND ((settlement_status = 'queued' AND next_attempt_at <= ?)"
+                    f" OR (settlement_status = 'processing' AND (locked_until IS NULL OR locked_until < ?)))"
+                    f" ORDER BY next_attempt_at LIMIT ?",
+                    [*providers, now.isoformat(), now.isoformat(), batch_size],
+                )
+            ]
+            if not payment_ids:
+                return []
+            
+            in_list = placeholders(len(payment_ids))
+            connection.execute(
+                f"UPDATE settlement_intents SET settlement_status = 'processing', locked_by = ?,"
+                f" locked_until = ?, attempts = attempts + 1, updated_at = ?"
+                f" WHERE payment_id IN ({in_list})",
+                [
+                    worker_id,
+                    (now + timedelta(seconds=lease_seconds)).isoformat(),
+                    now.isoformat(),
+                    *payment_ids,
+                ],
+            )
+            return [
+                self._from_row(row)
+                for row in connection.execute(
+                    f"SELECT * FROM settlement_intents WHERE payment_id IN ({in_list}) ORDER BY next_attempt_at",
+                    payment_ids,
+                )
+            ]
+        
+        return await self.database.write(claim)
+    
+    async def release_intent(
+        self,
+        payment_id: str,
+        tenant_id: str,
+        worker_id: str,
+        new_status: str,
+        last_error: Optional[str] = None,
+        next_attempt_at: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SettlementIntent]:
+        """Finish a claimed intent (see SettlementIntentStorage.release_intent)."""
+        def release(connection: sqlite3.Connection) -> Optional[SettlementIntent]:
+            # Conditional on the lease (tenant check in code)
+            updated = connection.execute(
+                "UPDATE settlement_intents SET settlement_status = ?, last_error = ?,"
+                " locked_by = NULL, locked_until = NULL, updated_at = ?,"
+                " next_attempt_at = COALESCE(?, next_attempt_at), metadata = COALESCE(?, metadata)"
+                " WHERE payment_id = ? AND tenant_id = ? AND settlement_status = 'processing' AND locked_by = ?",
+                (
+                    new_status,
+                    last_error,
+                    datetime.now().isoformat(),
+                    next_attempt_at,
+                    dumps(metadata),
+                    payment_id,
+                    tenant_id,
+                    worker_id,
+                ),
+            ).rowcount
+            if not updated:
+                return None
+            return self._select(connection, payment_id, tenant_id)
+        
+        return await self.database.write(release)
+    
+    def _insert(self, connection: sqlite3.Connection, intent: SettlementIntent) -> None:
+        """Insert one intent (writer thread; raises sqlite3.IntegrityError on a duplicate payment_id)."""
+        connection.execute(self.INSERT_SQL, self._to_row(intent))
+    
+    def _select(self, connection: sqlite3.Connection, payment_id: str, tenant_id: str) -> Optional[SettlementIntent]:
+        """Select one intent (tenant-scoped)."""
+        row = connection.execute(
+            "SELECT * FROM settlement_intents WHERE payment_id = ? AND tenant_id = ?",
+            (payment_id, tenant_id),
+        ).fetchone()
+        return self._from_row(row) if row else None
+    
+    def _to_row(self, intent: SettlementIntent) -> Tuple[Any, ...]:
+        """Convert SettlementIntent to INSERT_SQL parameters."""
+        now = datetime.now().isoformat()
+        return (
+            intent.payment_id,
+            intent.settlement_status,
+            intent.provider,
+            intent.tenant_id,
+            intent.created_at or now,
+            intent.updated_at or now,
+            dumps(intent.metadata),
+            intent.attempts,
+            intent.next_attempt_at or now,
+            intent.last_error,
+            intent.locked_by,
+            intent.locked_until,
+        )
+    
+    def _from_row(self, row: sqlite3.Row) -> SettlementIntent:
+        """Convert DB row to SettlementIntent."""
+        return SettlementIntent(
+            payment_id=row["payment_id"],
+            settlement_status=row["settlement_status"],
+            provider=row["provider"],
+            tenant_id=row["tenant_id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            metadata=loads(row["metadata"]),
+            attempts=row["attempts"],
+            next_attempt_at=row["next_attempt_at"],
+            last_error=row["last_error"],
+            locked_by=row["locked_by"],
+            locked_until=row["locked_until"],
         )
 
 
@@ -174,20 +538,24 @@ def get_settlement_storage() -> SettlementIntentStorage:
     """
     Get the global settlement intent storage instance.
     
-    Returns Supabase storage if configured, otherwise in-memory.
+    Config.STORAGE_BACKEND selects the backend (see get_draft_storage).
     """
     global _settlement_storage
     
     if _settlement_storage is None:
-        # Try Supabase first
-        if SUPABASE_AVAILABLE and Config.SUPABASE_URL and Config.SUPABASE_KEY:
+        backend = Config.STORAGE_BACKEND
+        if backend == "sqlite":
+            _settlement_storage = SettlementIntentStorageSQLite()
+        elif backend == "supabase":
+            _settlement_storage = SettlementIntentStorageSupabase()
+        elif backend == "auto" and SUPABASE_AVAILABLE and Config.SUPABASE_URL and Config.SUPABASE_KEY:
             try:
                 _settlement_storage = SettlementIntentStorageSupabase()
-            except Exception:
-                # Fallback to in-memory
+            except Exception as e:
+                # Fallback to in-memory (settlement intents are lost on restart)
+                logger.warning("Supabase settlement storage unavailable, using in-memory storage: %s", e)
                 _settlement_storage = SettlementIntentStorage()
         else:
             _settlement_storage = SettlementIntentStorage()
     
     return _settlement_storage
-
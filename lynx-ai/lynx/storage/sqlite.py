@@ -0,0 +1,232 @@
+"""
+SQLite Database - embedded storage for single-node deployments.
+
+One database file in WAL mode holds lynx_drafts, lynx_executions and
+settlement_intents with the same columns, constraints and indexes as
+docs/DEPLOYMENT/supabase-migration.sql (JSON columns stored as TEXT).
+
+Threading:
+- All writes run on one dedicated writer thread, each callback in one
+  transaction (SQLite allows a single writer anyway)
+- Reads run on a small pool of reader threads with their own connections;
+  WAL lets them proceed while the writer commits
+- Statements are constant parameterized SQL, so each connection's statement
+  cache reuses the prepared statements
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, TypeVar
+
+from lynx.config import Config
+
+T = TypeVar("T")
+
+# Statement cache per connection (prepared statements reused across calls)
+STATEMENT_CACHE_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lynx_drafts (
+    draft_id TEXT PRIMARY KEY,
+    tenant_id TEXT NOT NULL,
+    draft_type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'draft' CHECK (status IN ('draft', 'submitted', 'approved', 'rejected', 'cancelled', 'published', 'executed')),
+    risk_level TEXT NOT NULL CHECK (risk_level IN ('low', 'medium', 'high')),
+    created_by TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    source_context TEXT NOT NULL DEFAULT '{}',
+    recommended_approvers TEXT NOT NULL DEFAULT '[]',
+    request_id TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_lynx_drafts_tenant_id ON lynx_drafts(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_lynx_drafts_status ON lynx_drafts(tenant_id, status);
+CREATE INDEX IF NOT EXISTS idx_lynx_drafts_request_id ON lynx_drafts(tenant_id, request_id) WHERE request_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_lynx_drafts_created_at ON lynx_drafts(tenant_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_lynx_drafts_draft_type ON lynx_drafts(tenant_id, draft_type);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_lynx_drafts_request_id_unique ON lynx_drafts(tenant_id, request_id);
+
+CREATE TABLE IF NOT EXISTS lynx_executions (
+    execution_id TEXT PRIMARY KEY,
+    draft_id TEXT NOT NULL REFERENCES lynx_drafts(draft_id) ON DELETE CASCADE,
+    tool_id TEXT NOT NULL,
+    tenant_id TEXT NOT NULL,
+    actor_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'started' CHECK (status IN ('started', 'succeeded', 'failed', 'denied')),
+    result_payload TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL,
+    completed_at TEXT,
+    error_message TEXT,
+    rollback_instructions TEXT,
+    request_id TEXT,
+    source_context TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE INDEX IF NOT EXISTS idx_lynx_executions_tenant_id ON lynx_executions(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_lynx_executions_draft_id ON lynx_executions(tenant_id, draft_id);
+CREATE INDEX IF NOT EXISTS idx_lynx_executions_tool_id ON lynx_executions(tenant_id, tool_id);
+CREATE INDEX IF NOT EXISTS idx_lynx_executions_status ON lynx_executions(tenant_id, status);
+CREATE INDEX IF NOT EXISTS idx_lynx_executions_request_id ON lynx_executions(tenant_id, request_id) WHERE request_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_lynx_executions_created_at ON lynx_executions(tenant_id, created_at DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_lynx_executions_draft_tool_unique
+    ON lynx_executions(tenant_id, draft_id, tool_id) WHERE status = 'succeeded';
+CREATE UNIQUE INDEX IF NOT EXISTS idx_lynx_executions_request_id_unique
+    ON lynx_executions(tenant_id, request_id) WHERE request_id IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS settlement_intents (
+    payment_id TEXT NOT NULL PRIMARY KEY,
+    settlement_status TEXT NOT NULL DEFAULT 'queued' CHECK (settlement_status IN ('queued', 'processing', 'completed', 'failed')),
+    provider TEXT NOT NULL DEFAULT 'none' CHECK (provider IN ('none', 'manual', 'bank_x')),
+    tenant_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL,
+    last_error TEXT,
+    locked_by TEXT,
+    locked_until TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_tenant_id ON settlement_intents(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_status ON settlement_intents(tenant_id, settlement_status);
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_created_at ON settlement_intents(tenant_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_due ON settlement_intents(next_attempt_at) WHERE settlement_status = 'queued';
+CREATE INDEX IF NOT EXISTS idx_settlement_intents_lease ON settlement_intents(locked_until) WHERE settlement_status = 'processing';
+"""
+
+
+def dumps(value: Any) -> Optional[str]:
+    """Encode a JSON column (None stays NULL)."""
+    return None if value is None else json.dumps(value, separators=(",", ":"))
+
+
+def loads(value: Optional[str]) -> Any:
+    """Decode a JSON column (NULL stays None)."""
+    return None if value is None else json.loads(value)
+
+
+def placeholders(count: int) -> str:
+    """Placeholders for an IN (...) list of count parameters."""
+    return ",".join("?" * count)
+
+
+class SQLiteDatabase:
+    """SQLite database file with a writer thread and reader threads."""
+    
+    def __init__(self, path: Optional[str] = None, read_threads: Optional[int] = None):
+        """
+        Open (and create if needed) the database.
+        
+        Args:
+            path: Database file (defaults to Config.SQLITE_PATH; ":memory:"
+                runs reads on the writer thread, since each connection
+                would see its own empty database)
+            read_threads: Reader threads (defaults to Config.SQLITE_READ_THREADS)
+        """
+        self.path = path or Config.SQLITE_PATH
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lynx-sqlite-writer")
+        if self.path == ":memory:":
+            self._readers = self._writer
+        else:
+            self._readers = ThreadPoolExecutor(
+                max_workers=read_threads or Config.SQLITE_READ_THREADS,
+                thread_name_prefix="lynx-sqlite-reader",
+            )
+        self._writer.submit(self._create_schema).result()
+    
+    async def write(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Run fn(connection) on the writer thread in one transaction.
+        
+        The transaction commits if fn returns and rolls back if it raises.
+        
+        Args:
+            fn: Callback issuing the statements
+        
+        Returns:
+            fn's return value
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._writer, self._transaction, fn)
+    
+    async def read(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Run fn(connection) on a reader thread.
+        
+        Args:
+            fn: Callback issuing SELECT statements
+        
+        Returns:
+            fn's return value
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._readers, lambda: fn(self._connection()))
+    
+    def close(self) -> None:
+        """Stop the threads and close all connections."""
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Connection of the current thread (opened on first use)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                isolation_level=None,  # Transactions are explicit (BEGIN IMMEDIATE)
+                check_same_thread=False,  # Used by one thread; closed from close()
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+    
+    def _transaction(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return result
+    
+    def _create_schema(self) -> None:
+        self._connection().executescript(SCHEMA)
+
+
+# Global database instance
+_sqlite_database: Optional[SQLiteDatabase] = None
+
+
+def get_sqlite_database() -> SQLiteDatabase:
+    """
+    Get the global SQLite database (shared by all SQLite storages).
+    
+    Returns:
+        SQLiteDatabase at Config.SQLITE_PATH
+    """
+    global _sqlite_database
+    
+    if _sqlite_database is None:
+        _sqlite_database = SQLiteDatabase()
+    
+    return _sqlite_database
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Audit Archive - Move cold audit rows from Supabase into Parquet files.
+
+Archives lynx_runs (with their audit_logs and lynx_audit_events rows) older
+than LYNX_AUDIT_ARCHIVE_AFTER_DAYS into LYNX_AUDIT_ARCHIVE_DIR, partitioned
+by tenant and day, then deletes them from the hot tables. Safe to re-run
+(e.g. daily from cron); requires pyarrow.
+
+Usage:
+    export SUPABASE_URL=https://<project-ref>.supabase.co
+    export SUPABASE_KEY=your-service-role-key
+    export LYNX_AUDIT_ARCHIVE_DIR=/var/lib/lynx/audit-archive
+    python scripts/archive-audit.py [days]
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from supabase import create_client
+
+from lynx.config import Config
+from lynx.storage.audit_archive import PYARROW_AVAILABLE, get_audit_archive
+
+
+def main():
+    """Archive audit rows older than the retention window."""
+    if not Config.SUPABASE_URL or not Config.SUPABASE_KEY:
+        print("❌ ERROR: SUPABASE_URL and SUPABASE_KEY must be set")
+        sys.exit(1)
+    if not Config.AUDIT_ARCHIVE_DIR or not PYARROW_AVAILABLE:
+        print("❌ ERROR: LYNX_AUDIT_ARCHIVE_DIR must be set and pyarrow installed")
+        sys.exit(1)
+
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else Config.AUDIT_ARCHIVE_AFTER_DAYS
+    before = datetime.now() - timedelta(days=days)
+
+    client = create_client(Config.SUPABASE_URL, Config.SUPABASE_KEY)
+    counts = get_audit_archive().archive(client, before=before)
+
+    print(f"Archived audit rows older than {before.isoformat()} to {Config.AUDIT_ARCHIVE_DIR}:")
+    for table, count in counts.items():
+        print(f"   {table:<20} {count}")
+
+
+if __name__ == "__main__":
+    main()
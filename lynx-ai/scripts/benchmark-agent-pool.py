@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Agent Pool Benchmark - Compare per-request agent startup with pooled agents.
+
+Uses a local stub agent and stub LLM, so no OpenAI key or MCP server is needed.
+The stub agent sleeps on initialize to stand in for MCPApp startup and MCP
+server connection; the stub LLM sleeps to stand in for generation.
+
+Usage:
+    python scripts/benchmark-agent-pool.py [requests] [concurrency]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lynx.core.runtime.agent_pool import AgentPool
+from lynx.core.session import ExecutionContext
+
+STARTUP_SECONDS = float(os.getenv("BENCH_AGENT_STARTUP_MS", "250")) / 1000
+LLM_SECONDS = float(os.getenv("BENCH_LLM_MS", "20")) / 1000
+
+
+class StubApp:
+    """Stand-in for MCPApp."""
+
+    @asynccontextmanager
+    async def run(self):
+        await asyncio.sleep(STARTUP_SECONDS / 2)
+        yield self
+
+
+class StubLLM:
+    """Stand-in for OpenAIAugmentedLLM."""
+
+    def __init__(self, agent=None, **kwargs):
+        self.agent = agent
+        self.instruction = agent.instruction if agent else None
+
+    async def generate_str(self, message, request_params=None):
+        await asyncio.sleep(LLM_SECONDS)
+        return f"stub answer to: {message}"
+
+
+class StubAgent:
+    """Stand-in for mcp-agent Agent."""
+
+    def __init__(self, context: ExecutionContext):
+        self.instruction = f"tenant={context.tenant_id}"
+        self.initialized = False
+
+    async def initialize(self):
+        await asyncio.sleep(STARTUP_SECONDS / 2)
+        self.initialized = True
+
+    async def attach_llm(self, llm_factory):
+        return llm_factory(agent=self)
+
+    async def shutdown(self):
+        self.initialized = False
+
+
+async def create_stub_agent(context: ExecutionContext) -> StubAgent:
+    return StubAgent(context)
+
+
+def make_context(i: int) -> ExecutionContext:
+    return ExecutionContext(
+        user_id=f"user-{i}",
+        tenant_id=f"tenant-{i % 4}",
+        user_role="admin",
+        user_scope=[],
+        session_id=f"session-{i}",
+    )
+
+
+async def per_request_turn(i: int) -> float:
+    """Old chat path: app.run(), new agent and LLM for every query."""
+    start = time.perf_counter()
+    async with StubApp().run():
+        agent = await create_stub_agent(make_context(i))
+        await agent.initialize()
+        try:
+            llm = await agent.attach_llm(StubLLM)
+            await llm.generate_str(f"query {i}")
+        finally:
+            await agent.shutdown()
+    return time.perf_counter() - start
+
+
+async def pooled_turn(pool: AgentPool, i: int) -> float:
+    """Pooled chat path: lease a long-lived agent."""
+    start = time.perf_counter()
+    async with pool.lease(make_context(i)) as pooled:
+        await pooled.llm.generate_str(f"query {i}")
+    return time.perf_counter() - start
+
+
+async def run_batch(turn, count: int, concurrency: int) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(i: int) -> float:
+        async with semaphore:
+            return await turn(i)
+
+    return await asyncio.gather(*[bounded(i) for i in range(count)])
+
+
+def report(label: str, latencies: list, elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"  {label:<12} p50={statistics.median(ordered) * 1000:7.1f}ms "
+          f"p95={p95 * 1000:7.1f}ms  throughput={len(ordered) / elapsed:7.1f} req/s")
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    print(f"\n🧪 Agent pool benchmark ({count} requests, concurrency {concurrency})")
+    print(f"   Stub startup: {STARTUP_SECONDS * 1000:.0f}ms, stub LLM: {LLM_SECONDS * 1000:.0f}ms\n")
+
+    start = time.perf_counter()
+    latencies = await run_batch(per_request_turn, count, concurrency)
+    report("per-request", latencies, time.perf_counter() - start)
+
+    pool = AgentPool(
+        max_size=concurrency,
+        agent_factory=create_stub_agent,
+        llm_factory=StubLLM,
+        app=StubApp(),
+    )
+    start = time.perf_counter()
+    latencies = await run_batch(lambda i: pooled_turn(pool, i), count, concurrency)
+    report("pooled", latencies, time.perf_counter() - start)
+    print(f"   Pool metrics: {pool.metrics()}\n")
+    await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+List Projection Benchmark - Compare full-row and summary draft/execution lists.
+
+Seeds a tenant with drafts and executions, then lists them with
+list_drafts/list_executions (every column, payloads decoded) and with
+list_draft_summaries/list_execution_summaries (summary columns only).
+Reports bytes returned by the database per list (rows as JSON, i.e. what
+PostgREST sends) and p50/p95 latency per list call.
+
+Backends: the embedded SQLite backend (a real database file), and Supabase
+storage over the in-process FakeSupabase client from the test utilities
+(no network, so its latency is client-side work only; bytes are exact).
+
+Usage:
+    python scripts/benchmark-list-projection.py [drafts] [iterations]
+
+Environment:
+    BENCH_PAYLOAD_BYTES   Approximate payload size per draft/execution (default 4096)
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus, DraftSummary
+from lynx.mcp.cell.execution.models import ExecutionRecord, ExecutionStatus, ExecutionSummary
+from lynx.storage.draft_storage import DraftStorageSQLite, DraftStorageSupabase
+from lynx.storage.execution_storage import ExecutionStorageSQLite, ExecutionStorageSupabase
+from lynx.storage.sqlite import SQLiteDatabase
+from tests.utils.fake_supabase import FakeSupabase
+
+PAYLOAD_BYTES = int(os.getenv("BENCH_PAYLOAD_BYTES", "4096"))
+TENANT_ID = "tenant-bench"
+
+
+def make_records(count: int):
+    """Build drafts and one execution per draft."""
+    start = datetime.now(timezone.utc)
+    text = "lorem ipsum dolor sit amet " * (PAYLOAD_BYTES // 27 + 1)
+    drafts, executions = [], []
+    for i in range(count):
+        created_at = (start + timedelta(seconds=i)).isoformat()
+        draft = DraftProtocol(
+            draft_id=str(uuid.uuid4()),
+            tenant_id=TENANT_ID,
+            draft_type="docs",
+            payload={"title": f"Draft {i}", "body": text[:PAYLOAD_BYTES]},
+            status=DraftStatus.EXECUTED,
+            risk_level="low",
+            created_by="user-1",
+            created_at=created_at,
+            source_context={"session_id": "session-1", "prompt": text[:512]},
+        )
+        drafts.append(draft)
+        executions.append(ExecutionRecord(
+            execution_id=str(uuid.uuid4()),
+            draft_id=draft.draft_id,
+            tool_id="docs.cell.publish",
+            tenant_id=TENANT_ID,
+            actor_id="user-1",
+            status=ExecutionStatus.SUCCEEDED,
+            result_payload={"document": text[:PAYLOAD_BYTES]},
+            created_at=created_at,
+            completed_at=created_at,
+            source_context={"session_id": "session-1"},
+        ))
+    return drafts, executions
+
+
+async def measure(call, iterations: int):
+    """Return (p50 ms, p95 ms) of an async call."""
+    await call()  # warm up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def report(name: str, full_bytes: int, summary_bytes: int, full_ms, summary_ms):
+    print(f"   {name:<22} {full_bytes / 1024:9.1f} KiB -> {summary_bytes / 1024:7.1f} KiB "
+          f"({full_bytes / max(summary_bytes, 1):5.1f}x)   "
+          f"p50 {full_ms[0]:7.2f} -> {summary_ms[0]:6.2f} ms   "
+          f"p95 {full_ms[1]:7.2f} -> {summary_ms[1]:6.2f} ms")
+
+
+async def bench_supabase(drafts, executions, iterations: int):
+    client = FakeSupabase()
+    draft_storage = DraftStorageSupabase(supabase_client=client)
+    execution_storage = ExecutionStorageSupabase(supabase_client=client)
+    await draft_storage.create_drafts_bulk(drafts)
+    for execution in executions:
+        await execution_storage.create_execution(execution)
+
+    def returned_bytes(table: str, columns: str) -> int:
+        rows = client.table(table).select(columns).eq("tenant_id", TENANT_ID).execute().data
+        return len(json.dumps(rows, default=str))
+
+    report(
+        "drafts",
+        returned_bytes("lynx_drafts", "*"),
+        returned_bytes("lynx_drafts", ",".join(DraftSummary.columns())),
+        await measure(lambda: draft_storage.list_drafts(TENANT_ID), iterations),
+        await measure(lambda: draft_storage.list_draft_summaries(TENANT_ID), iterations),
+    )
+    report(
+        "executions",
+        returned_bytes("lynx_executions", "*"),
+        returned_bytes("lynx_executions", ",".join(ExecutionSummary.columns())),
+        await measure(lambda: execution_storage.list_executions(TENANT_ID), iterations),
+        await measure(lambda: execution_storage.list_execution_summaries(TENANT_ID), iterations),
+    )
+
+
+async def bench_sqlite(drafts, executions, iterations: int):
+    with tempfile.TemporaryDirectory() as directory:
+        database = SQLiteDatabase(os.path.join(directory, "lynx.db"))
+        try:
+            draft_storage = DraftStorageSQLite(database)
+            execution_storage = ExecutionStorageSQLite(database)
+            await draft_storage.create_drafts_bulk(drafts)
+            for execution in executions:
+                await execution_storage.create_execution(execution)
+
+            async def returned_bytes(table: str, columns: str) -> int:
+                rows = await database.read(lambda connection: [
+                    dict(row) for row in connection.execute(
+                        f"SELECT {columns} FROM {table} WHERE tenant_id = ?", (TENANT_ID,),
+                    )
+                ])
+                return len(json.dumps(rows, default=str))
+
+            report(
+                "drafts",
+                await returned_bytes("lynx_drafts", "*"),
+                await returned_bytes("lynx_drafts", ", ".join(DraftSummary.columns())),
+                await measure(lambda: draft_storage.list_drafts(TENANT_ID), iterations),
+                await measure(lambda: draft_storage.list_draft_summaries(TENANT_ID), iterations),
+            )
+            report(
+                "executions",
+                await returned_bytes("lynx_executions", "*"),
+                await returned_bytes("lynx_executions", ", ".join(ExecutionSummary.columns())),
+                await measure(lambda: execution_storage.list_executions(TENANT_ID), iterations),
+                await measure(lambda: execution_storage.list_execution_summaries(TENANT_ID), iterations),
+            )
+        finally:
+            database.close()
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    drafts, executions = make_records(count)
+
+    print("=" * 100)
+    print(f"List projection benchmark: {count} drafts + {count} executions, "
+          f"~{PAYLOAD_BYTES} byte payloads, {iterations} iterations")
+    print("=" * 100)
+    print("   list                   bytes returned (full -> summary)       latency per list call (full -> summary)")
+
+    print("\nSQLite")
+    await bench_sqlite(drafts, executions, iterations)
+
+    print("\nSupabase (in-process FakeSupabase, no network)")
+    await bench_supabase(drafts, executions, iterations)
+
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Logging Benchmark - Compare print, synchronous logging and the queue pipeline.
+
+Runs many concurrent coroutines that each log a stream of messages and
+measures per-call overhead on the event loop and the worst loop lag seen by
+a LoopMonitor probe. The output sink can be slowed down to stand in for a
+blocked stdout pipe (container log collectors under load).
+
+Usage:
+    python scripts/benchmark-logging.py [tasks] [messages_per_task]
+
+Environment:
+    BENCH_SINK_LATENCY_US   Per-write latency of the output sink (default 50)
+"""
+
+import asyncio
+import io
+import logging
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lynx.observability.logging import JsonFormatter, get_logger, log_context, setup_logging, shutdown_logging
+from lynx.observability.loop_monitor import LoopMonitor
+
+SINK_LATENCY = float(os.getenv("BENCH_SINK_LATENCY_US", "50")) / 1_000_000
+
+
+class SlowSink(io.TextIOBase):
+    """Text stream that takes a fixed time per write (stand-in for a busy pipe)."""
+
+    def __init__(self):
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        if SINK_LATENCY:
+            time.sleep(SINK_LATENCY)
+        self.lines += text.count("\n")
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+async def run_workload(log_call, tasks: int, messages: int):
+    """Run the logging workload and return (elapsed seconds, max loop lag seconds)."""
+    monitor = LoopMonitor(interval=0.001, window_seconds=3600)
+    probe = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0)
+
+    async def worker(worker_id: int):
+        with log_context(run_id=f"run-{worker_id}", tenant_id=f"tenant-{worker_id % 8}"):
+            for i in range(messages):
+                log_call(worker_id, i)
+                if i % 10 == 0:
+                    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(tasks)))
+    elapsed = time.perf_counter() - start
+
+    lag_max = monitor.sample().lag_max_seconds
+    probe.cancel()
+    try:
+        await probe
+    except asyncio.CancelledError:
+        pass
+    return elapsed, lag_max
+
+
+def report(name: str, elapsed: float, lag_max: float, calls: int, sink: SlowSink):
+    print(f"   {name:<28} {elapsed * 1_000_000 / calls:8.1f} µs/call   "
+          f"max loop lag {lag_max * 1000:7.1f} ms   lines written {sink.lines}")
+
+
+async def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    calls = tasks * messages
+
+    print("=" * 78)
+    print(f"Logging benchmark: {tasks} tasks x {messages} messages "
+          f"(sink latency {SINK_LATENCY * 1_000_000:.0f} µs/write)")
+    print("=" * 78)
+
+    # 1. print (baseline - what the daemon used to do)
+    sink = SlowSink()
+    elapsed, lag = await run_workload(
+        lambda w, i: print(f"💓 worker {w} message {i}", file=sink), tasks, messages,
+    )
+    report("print", elapsed, lag, calls, sink)
+
+    # 2. logging with a synchronous StreamHandler + JSON formatter
+    sink = SlowSink()
+    sync_logger = logging.getLogger("bench.sync")
+    sync_logger.propagate = False
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(JsonFormatter())
+    sync_logger.addHandler(handler)
+    sync_logger.setLevel(logging.INFO)
+    elapsed, lag = await run_workload(
+        lambda w, i: sync_logger.info("worker message", extra={"worker": w, "i": i}), tasks, messages,
+    )
+    report("sync JSON handler", elapsed, lag, calls, sink)
+
+    # 3. queue pipeline (setup_logging) - records are written by the listener thread
+    logger = get_logger("bench.queue")
+    for name, rates in (("queue pipeline", {}), ("queue pipeline, 10% sampled", {"lynx.bench": 0.1})):
+        sink = SlowSink()
+        setup_logging(level="info", log_format="json", stream=sink, queue_size=calls + 1, sample_rates=rates)
+        elapsed, lag = await run_workload(
+            lambda w, i: logger.info("worker message", extra={"worker": w, "i": i}), tasks, messages,
+        )
+        shutdown_logging()
+        report(name, elapsed, lag, calls, sink)
+
+    print("=" * 78)
+    print("µs/call is time on the event loop; queue pipelines write from a background thread.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
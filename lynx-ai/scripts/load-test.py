@@ -17,7 +17,7 @@ from uuid import uuid4
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from lynx.mcp.cluster.drafts.base import create_draft
+from lynx.mcp.cluster.drafts.base import create_drafts
 from lynx.storage.draft_storage import get_draft_storage
 from lynx.mcp.cluster.drafts.models import DraftStatus
 from lynx.mcp.cell.execution.base import create_execution_record, complete_execution
@@ -27,21 +27,20 @@ from lynx.core.session import ExecutionContext
 
 
 async def create_drafts_batch(tenant_id: str, count: int) -> list:
-    """Create a batch of drafts."""
+    """Create a batch of drafts (one bulk insert)."""
     print(f"Creating {count} drafts...")
     start_time = time.time()
     
-    tasks = []
-    for i in range(count):
-        tasks.append(create_draft(
-            tenant_id=tenant_id,
-            draft_type="docs",
-            payload={"title": f"Load Test Doc {i}", "content": f"Content for doc {i}"},
-            created_by="load-test-user",
-            source_context={"test": "load_test", "batch_index": i},
-        ))
-    
-    drafts = await asyncio.gather(*tasks)
+    items = [
+        {
+            "draft_type": "docs",
+            "payload": {"title": f"Load Test Doc {i}", "content": f"Content for doc {i}"},
+            "source_context": {"test": "load_test", "batch_index": i},
+        }
+        for i in range(count)
+    ]
+    
+    drafts = await create_drafts(tenant_id=tenant_id, created_by="load-test-user", items=items)
     elapsed = time.time() - start_time
     
     print(f"  ✅ Created {len(drafts)} drafts in {elapsed:.2f}s ({elapsed/len(drafts)*1000:.2f}ms per draft)")
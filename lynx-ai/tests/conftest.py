@@ -216,22 +216,24 @@ def audit_logger_in_memory():
                 "input": input_data,
             })
         
-        async def log_execution_success(self, context, tool, output_data):
+        async def log_execution_success(self, context, tool, output_data, duration_ms=None):
             self.logs.append({
                 "type": "execution_success",
                 "run_id": context.lynx_run_id,
                 "tool_id": tool.id,
                 "tenant_id": context.tenant_id,
                 "output": output_data,
+                "duration_ms": duration_ms,
             })
         
-        async def log_execution_failure(self, context, tool, error):
+        async def log_execution_failure(self, context, tool, error, duration_ms=None):
             self.logs.append({
                 "type": "execution_failure",
                 "run_id": context.lynx_run_id,
                 "tool_id": tool.id,
                 "tenant_id": context.tenant_id,
                 "error": error,
+                "duration_ms": duration_ms,
             })
         
         async def log_refusal(self, context, tool, reason):
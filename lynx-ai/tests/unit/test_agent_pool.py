@@ -0,0 +1,150 @@
+"""
+Agent Pool Unit Tests
+
+Tests agent reuse, exclusive leases, per-turn context injection,
+health checks and idle eviction using stub agents.
+"""
+
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from lynx.core.runtime.agent_pool import AgentPool
+from lynx.core.session import ExecutionContext
+
+
+class StubApp:
+    """Stand-in for MCPApp that counts run() entries."""
+
+    def __init__(self):
+        self.runs = 0
+
+    @asynccontextmanager
+    async def run(self):
+        self.runs += 1
+        yield self
+
+
+class StubLLM:
+    def __init__(self, agent=None, **kwargs):
+        self.agent = agent
+        self.instruction = None
+
+
+class StubAgent:
+    created = 0
+
+    def __init__(self, context: ExecutionContext):
+        StubAgent.created += 1
+        self.initialized = False
+        self.shutdowns = 0
+
+    async def initialize(self):
+        self.initialized = True
+
+    async def attach_llm(self, llm_factory):
+        return llm_factory(agent=self)
+
+    async def shutdown(self):
+        self.shutdowns += 1
+        self.initialized = False
+
+
+async def create_stub_agent(context: ExecutionContext) -> StubAgent:
+    return StubAgent(context)
+
+
+def make_context(tenant_id: str = "tenant-t1", user_id: str = "user-1", role: str = "admin"):
+    return ExecutionContext(
+        user_id=user_id,
+        tenant_id=tenant_id,
+        user_role=role,
+        user_scope=[],
+        session_id="session-1",
+    )
+
+
+@pytest.fixture
+def app():
+    StubAgent.created = 0
+    return StubApp()
+
+
+def make_pool(app, **kwargs) -> AgentPool:
+    return AgentPool(agent_factory=create_stub_agent, llm_factory=StubLLM, app=app, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_agents_are_reused_per_tenant_and_role(app):
+    """Test that sequential turns reuse one agent and enter MCPApp once."""
+    pool = make_pool(app, max_size=4)
+
+    for i in range(5):
+        async with pool.lease(make_context(user_id=f"user-{i}")) as pooled:
+            assert f"User: user-{i}" in pooled.llm.instruction
+
+    assert StubAgent.created == 1
+    assert app.runs == 1
+    assert pool.metrics()["reused_total"] == 4
+
+    async with pool.lease(make_context(tenant_id="tenant-t2")):
+        pass
+    assert StubAgent.created == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_leases_are_exclusive(app):
+    """Test that concurrent turns for one key get different agents."""
+    pool = make_pool(app, max_size=4)
+
+    async with pool.lease(make_context()) as first:
+        async with pool.lease(make_context()) as second:
+            assert first.agent is not second.agent
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_full_pool_waits_for_release(app):
+    """Test that acquiring beyond max_size waits for a lease to return."""
+    pool = make_pool(app, max_size=1)
+
+    async with pool.lease(make_context()) as first:
+        waiter = asyncio.create_task(pool.lease(make_context()).__aenter__())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+    second = await asyncio.wait_for(waiter, timeout=1)
+    assert second is first
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_agent_is_discarded(app):
+    """Test that an agent that lost its connection is not reused."""
+    pool = make_pool(app, max_size=2)
+
+    async with pool.lease(make_context()) as pooled:
+        pooled.agent.initialized = False
+
+    assert pool.metrics()["size"] == 0
+    assert pool.metrics()["unhealthy_total"] == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_agents_are_evicted(app):
+    """Test idle eviction and LRU eviction when the pool is full."""
+    pool = make_pool(app, max_size=1, idle_timeout_seconds=0)
+
+    async with pool.lease(make_context()) as pooled:
+        agent = pooled.agent
+    assert await pool.evict_idle() == 1
+    assert agent.shutdowns == 1
+
+    async with pool.lease(make_context(tenant_id="tenant-t1")):
+        pass
+    async with pool.lease(make_context(tenant_id="tenant-t2")):
+        pass
+    assert pool.metrics()["size"] == 1
+    assert pool.metrics()["evicted_total"] == 2
+    await pool.close()
@@ -0,0 +1,183 @@
+"""
+Audit Archive Unit Tests
+
+Tests the Parquet audit archive: moving cold rows out of the hot tables
+(partitioned by tenant and day), scans with predicate pushdown, and the
+audit API over hot and archived runs (list via the hot run summaries,
+detail, export).
+Requires pyarrow (skipped otherwise).
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from lynx.api import audit_routes
+from lynx.api.auth import get_current_session
+from lynx.storage.audit_archive import AuditArchive
+from tests.utils.fake_supabase import FakeSupabase
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+NOW = datetime(2026, 6, 1, 12, 0)
+CUTOFF = NOW - timedelta(days=90)
+
+
+def _ts(days_ago: int, minutes: int = 0) -> str:
+    return (NOW - timedelta(days=days_ago) + timedelta(minutes=minutes)).isoformat()
+
+
+@pytest.fixture
+def supabase():
+    """Two tenants; tenant-1 runs 0-2 are cold (>90 days), 3-4 hot."""
+    client = FakeSupabase()
+    for i, days_ago in enumerate([200, 120, 100, 10, 1]):
+        run_id = f"run-{i}"
+        client.table("lynx_runs").rows.append({
+            "run_id": run_id, "user_id": "user-1", "tenant_id": "tenant-1",
+            "user_query": f"query {i}", "lynx_response": f"response {i}",
+            "timestamp": _ts(days_ago), "status": "completed", "created_at": _ts(days_ago),
+        })
+        for j, tool_id in enumerate(["docs.draft.create", "vpm.payment.draft.create"]):
+            client.table("audit_logs").rows.append({
+                "audit_id": f"audit-{i}-{j}", "run_id": run_id, "tool_id": tool_id,
+                "user_id": "user-1", "tenant_id": "tenant-1",
+                "input": {"title": f"Doc {i}"}, "output": {"ok": j == 0}, "risk_level": "low",
+                "approved": j == 0, "approved_by": None, "refused": j == 1,
+                "refusal_reason": "denied" if j == 1 else None,
+                "timestamp": _ts(days_ago, minutes=1), "created_at": _ts(days_ago, minutes=1),
+            })
+        client.table("lynx_audit_events").rows.append({
+            "event_id": f"event-{i}", "run_id": run_id, "tenant_id": "tenant-1", "tool_id": None,
+            "event_type": "run_success", "status": "succeeded", "input_data": None,
+            "output_data": {"n": i}, "error_message": None, "created_at": _ts(days_ago),
+        })
+        # Run summaries stay hot when runs are archived
+        client.table("lynx_run_summaries").rows.append({
+            "run_id": run_id, "tenant_id": "tenant-1", "user_id": "user-1", "status": "completed",
+            "user_query": f"query {i}", "lynx_response": f"response {i}",
+            "tool_count": 2, "success_count": 1, "failure_count": 0, "refusal_count": 1,
+            "max_risk": "low", "tool_ids": ["docs.draft.create", "vpm.payment.draft.create"],
+            "total_duration_ms": 0, "first_event_at": _ts(days_ago), "last_event_at": _ts(days_ago, minutes=1),
+            "completed_at": _ts(days_ago, minutes=1),
+        })
+    client.table("lynx_runs").rows.append({
+        "run_id": "run-other", "user_id": "user-2", "tenant_id": "tenant-2",
+        "user_query": "other", "lynx_response": "other",
+        "timestamp": _ts(150), "status": "completed", "created_at": _ts(150),
+    })
+    # Tool call without a run (e.g. draft transitions logged outside a run row)
+    client.table("audit_logs").rows.append({
+        "audit_id": "audit-orphan", "run_id": None, "tool_id": "drafts.approve",
+        "user_id": "user-1", "tenant_id": "tenant-1", "input": {}, "output": {},
+        "risk_level": "medium", "approved": True, "approved_by": "user-1", "refused": False,
+        "refusal_reason": None, "timestamp": _ts(95), "created_at": _ts(95),
+    })
+    return client
+
+
+@pytest.fixture
+def archive(tmp_path, supabase):
+    archive = AuditArchive(str(tmp_path / "archive"))
+    archive.archive(supabase, before=CUTOFF, batch_size=2)
+    return archive
+
+
+def test_archive_moves_cold_rows_into_tenant_day_partitions(tmp_path, supabase):
+    """Test that cold runs move with their child rows and hot rows stay."""
+    archive = AuditArchive(str(tmp_path / "archive"))
+    counts = archive.archive(supabase, before=CUTOFF, batch_size=2)
+
+    assert counts == {"lynx_runs": 4, "audit_logs": 7, "lynx_audit_events": 3}
+    assert sorted(r["run_id"] for r in supabase.table("lynx_runs").rows) == ["run-3", "run-4"]
+    assert sorted(r["audit_id"] for r in supabase.table("audit_logs").rows) == [
+        "audit-3-0", "audit-3-1", "audit-4-0", "audit-4-1",
+    ]
+    assert len(supabase.table("lynx_audit_events").rows) == 2
+
+    tenant_dir = tmp_path / "archive" / "lynx_runs" / "tenant_id=tenant-1"
+    assert sorted(os.listdir(tenant_dir)) == [f"day={_ts(d)[:10]}" for d in (200, 120, 100)]
+    assert archive.days("lynx_runs", "tenant-2") == [_ts(150)[:10]]
+
+    # Re-running finds nothing left to archive
+    assert archive.archive(supabase, before=CUTOFF) == {"lynx_runs": 0, "audit_logs": 0, "lynx_audit_events": 0}
+
+
+def test_scan_pushes_down_filters_and_decodes_rows(archive):
+    """Test tenant/time/column filters, analytics scans and row round trips."""
+    failures = archive.scan("audit_logs", "tenant-1", ["tool_id"], filter=ds.field("refused") == True)  # noqa: E712
+    assert failures.column("tool_id").to_pylist() == ["vpm.payment.draft.create"] * 3
+
+    volume = archive.scan("lynx_runs", columns=["tenant_id"]).group_by("tenant_id").aggregate([([], "count_all")])
+    assert sorted(volume.to_pylist(), key=lambda r: r["tenant_id"]) == [
+        {"tenant_id": "tenant-1", "count_all": 3},
+        {"tenant_id": "tenant-2", "count_all": 1},
+    ]
+
+    assert archive.count("lynx_runs", "tenant-1", from_ts=_ts(150), to_ts=_ts(100)) == 2
+    assert archive.count("lynx_runs", "tenant-2", where={"run_id": "run-0"}) == 0
+    assert archive.count("lynx_runs", "tenant-3") == 0
+
+    [log] = archive.rows("audit_logs", "tenant-1", where={"audit_id": "audit-0-0"})
+    assert log["input"] == {"title": "Doc 0"}
+    assert log["approved"] is True
+    assert log["tenant_id"] == "tenant-1"
+    assert "day" not in log
+    assert [r["run_id"] for r in archive.rows("lynx_runs", "tenant-1", offset=1)] == ["run-1", "run-0"]
+
+
+def test_reads_drop_rows_archived_twice(archive):
+    """Test that an interrupted archive run (written, not deleted) does not duplicate rows."""
+    [row] = archive.rows("lynx_runs", "tenant-1", where={"run_id": "run-1"})
+    archive.write("lynx_runs", [row])
+
+    assert archive.count("lynx_runs", "tenant-1") == 3
+    pages = list(archive.iter_pages("lynx_runs", "tenant-1", page_size=2))
+    assert [[r["run_id"] for r in page] for page in pages] == [["run-2"], ["run-1"], ["run-0"]]
+
+
+@pytest.fixture
+def client(supabase, archive, monkeypatch):
+    monkeypatch.setattr(audit_routes, "get_supabase_client", lambda: supabase)
+    monkeypatch.setattr(audit_routes, "get_audit_archive", lambda: archive)
+    monkeypatch.setattr(audit_routes.Config, "AUDIT_EXPORT_PAGE_SIZE", 2)
+    app = FastAPI()
+    app.include_router(audit_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {"tenant_id": "tenant-1", "user_id": "user-1"}
+    return TestClient(app)
+
+
+def test_audit_list_keeps_archived_runs(client):
+    """Test that archived runs stay listed (hot summaries) with tool calls from the archive."""
+    body = client.get("/api/audit/runs", params={"limit": 3, "include_tool_calls": "true"}).json()
+    assert body["total"] == 5
+    assert [r["run_id"] for r in body["runs"]] == ["run-4", "run-3", "run-2"]
+    assert body["runs"][2]["query"] == "query 2"
+    assert [tc["status"] for tc in body["runs"][0]["tool_calls"]] == ["success", "error"]
+    assert [tc["status"] for tc in body["runs"][2]["tool_calls"]] == ["success", "error"]
+
+    body = client.get("/api/audit/runs", params={"limit": 3, "offset": 3}).json()
+    assert [r["run_id"] for r in body["runs"]] == ["run-1", "run-0"]
+
+    body = client.get("/api/audit/runs", params={"from_date": _ts(110)}).json()
+    assert body["total"] == 3
+
+
+def test_audit_detail_and_export_read_archived_runs(client):
+    """Test run details from the archive and exports continuing into it (with resume)."""
+    run = client.get("/api/audit/runs/run-0").json()
+    assert run["query"] == "query 0"
+    assert run["tool_calls"][0]["input"] == {"title": "Doc 0"}
+    assert client.get("/api/audit/runs/run-other").status_code == 404
+
+    lines = client.get("/api/audit/runs/export", params={"format": "ndjson"}).text.splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [r["run_id"] for r in rows] == ["run-4", "run-3", "run-2", "run-1", "run-0"]
+
+    resumed = client.get("/api/audit/runs/export", params={"format": "ndjson", "cursor": rows[2]["cursor"]})
+    assert [json.loads(line)["run_id"] for line in resumed.text.splitlines()] == ["run-1", "run-0"]
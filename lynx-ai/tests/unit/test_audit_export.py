@@ -0,0 +1,108 @@
+"""
+Audit Export Unit Tests
+
+Tests the streamed audit export: keyset pagination in bounded pages,
+CSV/NDJSON/JSON formats, resumable exports via per-row cursors, gzip, date
+filters and tenant scoping (against a fake Supabase client).
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from lynx.api import audit_routes
+from lynx.api.auth import get_current_session
+from tests.utils.fake_supabase import FakeSupabase
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    client = FakeSupabase()
+    runs = client.table("lynx_runs")
+    for i in range(7):
+        runs.rows.append({
+            "run_id": f"run-{i:02d}",
+            "tenant_id": "tenant-1",
+            "user_id": "user-1",
+            "user_query": f"query {i}, with a comma",
+            "lynx_response": f"response {i}",
+            # run-03 and run-04 share a timestamp (keyset tie-break on run_id)
+            "timestamp": (START + timedelta(minutes=min(i, 3) if i < 5 else i)).isoformat(),
+            "status": "completed",
+        })
+    runs.rows.append({**runs.rows[0], "run_id": "other-tenant", "tenant_id": "tenant-2"})
+    monkeypatch.setattr(audit_routes, "get_supabase_client", lambda: client)
+    monkeypatch.setattr(audit_routes.Config, "AUDIT_EXPORT_PAGE_SIZE", 2)
+    return client
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(audit_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {"tenant_id": "tenant-1", "user_id": "user-1"}
+    return TestClient(app)
+
+
+EXPECTED = ["run-06", "run-05", "run-04", "run-03", "run-02", "run-01", "run-00"]
+
+
+def test_csv_export_streams_keyset_pages(supabase, client):
+    """Test that /runs/export is routed (not shadowed by /runs/{run_id}) and pages through all rows."""
+    response = client.get("/api/audit/runs/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [r["run_id"] for r in rows] == EXPECTED
+    assert rows[0]["query"] == "query 6, with a comma"
+    # 7 rows in pages of 2: 4 selects, none larger than a page
+    assert supabase.table("lynx_runs").calls == ["select"] * 4
+
+
+def test_export_resumes_from_cursor(supabase, client):
+    """Test resuming after the last row received, across a timestamp tie."""
+    first = [json.loads(line) for line in client.get(
+        "/api/audit/runs/export", params={"format": "ndjson", "limit": 3},
+    ).text.splitlines()]
+    assert [r["run_id"] for r in first] == EXPECTED[:3]
+
+    rest = [json.loads(line) for line in client.get(
+        "/api/audit/runs/export", params={"format": "ndjson", "cursor": first[-1]["cursor"]},
+    ).text.splitlines()]
+    assert [r["run_id"] for r in rest] == EXPECTED[3:]
+
+    assert client.get("/api/audit/runs/export", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_gzip_and_json_array_exports(supabase, client):
+    """Test gzip-compressed downloads and the JSON array format."""
+    response = client.get("/api/audit/runs/export", params={"format": "json", "gzip": "true"})
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"].endswith('.json.gz"')
+    runs = json.loads(gzip.decompress(response.content))
+    assert [r["run_id"] for r in runs] == EXPECTED
+
+    supabase.table("lynx_runs").rows.clear()
+    assert client.get("/api/audit/runs/export", params={"format": "json"}).json() == []
+
+
+def test_export_filters_by_date(supabase, client):
+    """Test from_date/to_date filters on the run timestamp."""
+    response = client.get("/api/audit/runs/export", params={
+        "format": "ndjson",
+        "from_date": (START + timedelta(minutes=1)).isoformat(),
+        "to_date": (START + timedelta(minutes=3)).isoformat(),
+    })
+
+    assert [json.loads(line)["run_id"] for line in response.text.splitlines()] == ["run-04", "run-03", "run-02", "run-01"]
+    assert client.get("/api/audit/runs/export", params={"format": "xml"}).status_code == 400
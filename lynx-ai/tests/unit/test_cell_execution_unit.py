@@ -0,0 +1,254 @@
+"""
+Cell Execution Unit Unit Tests
+
+Tests that a Cell execution commits the draft transition, the execution
+record and the settlement intent all-or-nothing, in one RPC for Supabase.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.core.session import ExecutionContext
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus  # before lynx.storage
+from lynx.mcp.cell.execution import base as execution_base
+from lynx.mcp.cell.execution.models import ExecutionStatus
+from lynx.mcp.cell.vpm import payment_execute
+from lynx.mcp.cell.vpm.payment_execute import VPMPaymentExecuteInput, vpm_payment_execute_handler
+from lynx.storage.cell_execution_unit import CellExecutionUnit, CellExecutionUnitSupabase
+from lynx.storage.draft_storage import DraftStatusConflictError, DraftStorage, DraftStorageSupabase
+from lynx.storage.execution_storage import ExecutionStorage, ExecutionStorageSupabase
+from lynx.storage.settlement_storage import (
+    SettlementIntent,
+    SettlementIntentStorage,
+    SettlementIntentStorageSupabase,
+)
+from tests.utils.fake_supabase import FakeSupabase
+
+TOOL_ID = "vpm.cell.payment.execute"
+
+
+def _draft(status=DraftStatus.APPROVED, request_id=None) -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id="tenant-1",
+        draft_type="payment",
+        payload={
+            "amount": 1200,
+            "currency": "EUR",
+            "vendor_snapshot": {"vendor_id": "vendor-1", "status": "active"},
+            "execution_readiness": {"is_vendor_active": True},
+        },
+        status=status,
+        risk_level="high",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={},
+        request_id=request_id,
+    )
+
+
+def _context() -> ExecutionContext:
+    return ExecutionContext(
+        user_id="user-1",
+        tenant_id="tenant-1",
+        user_role="admin",
+        user_scope=[],
+        session_id="session-1",
+    )
+
+
+def _execution(draft: DraftProtocol, request_id=None):
+    return execution_base.build_execution_record(
+        draft_id=draft.draft_id,
+        tool_id=TOOL_ID,
+        context=_context(),
+        status=ExecutionStatus.SUCCEEDED,
+        result_payload={"payment_id": f"payment-{draft.draft_id[:8]}"},
+        request_id=request_id,
+    )
+
+
+def _intent(draft: DraftProtocol) -> SettlementIntent:
+    return SettlementIntent(payment_id=f"payment-{draft.draft_id[:8]}", tenant_id="tenant-1")
+
+
+def _memory_unit() -> CellExecutionUnit:
+    return CellExecutionUnit(DraftStorage(), ExecutionStorage(), SettlementIntentStorage())
+
+
+@pytest.mark.asyncio
+async def test_memory_commit_applies_all_writes():
+    """Test that a commit moves the draft and stores execution and intent."""
+    unit = _memory_unit()
+    draft = await unit.draft_storage.create_draft(_draft())
+    execution = _execution(draft)
+
+    stored = await unit.commit(draft, execution, DraftStatus.APPROVED, DraftStatus.EXECUTED, _intent(draft))
+
+    assert stored is execution
+    assert stored.completed_at is not None
+    assert (await unit.draft_storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.EXECUTED
+    assert await unit.execution_storage.get_execution(execution.execution_id, "tenant-1") is execution
+    assert await unit.settlement_storage.get_intent(_intent(draft).payment_id, "tenant-1") is not None
+
+
+@pytest.mark.asyncio
+async def test_memory_commit_writes_nothing_on_failure():
+    """Test conflict, missing draft and exactly-once: no partial writes."""
+    unit = _memory_unit()
+    draft = await unit.draft_storage.create_draft(_draft(status=DraftStatus.DRAFT))
+
+    with pytest.raises(DraftStatusConflictError):
+        await unit.commit(draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED, _intent(draft))
+    with pytest.raises(ValueError, match="not found"):
+        await unit.commit(_draft(), _execution(_draft()), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+    assert draft.status == DraftStatus.DRAFT
+    assert unit.execution_storage.executions == {}
+    assert unit.settlement_storage.intents == {}
+
+    # A succeeded execution already exists (e.g., draft was re-approved)
+    draft.status = DraftStatus.APPROVED
+    await unit.commit(draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+    draft.status = DraftStatus.APPROVED
+    with pytest.raises(ValueError, match="already been successfully executed"):
+        await unit.commit(draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED, _intent(draft))
+    assert draft.status == DraftStatus.APPROVED
+    assert len(unit.execution_storage.executions) == 1
+    assert unit.settlement_storage.intents == {}
+
+
+@pytest.mark.asyncio
+async def test_memory_commit_retry_returns_stored_execution():
+    """Test that a retry with the same request_id does not write again."""
+    unit = _memory_unit()
+    draft = await unit.draft_storage.create_draft(_draft())
+    first = await unit.commit(draft, _execution(draft, "req-1"), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+
+    retried = await unit.commit(draft, _execution(draft, "req-1"), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+
+    assert retried is first
+    assert len(unit.execution_storage.executions) == 1
+
+
+@pytest.fixture
+def memory_unit(monkeypatch):
+    unit = _memory_unit()
+    monkeypatch.setattr(execution_base, "get_draft_storage", lambda: unit.draft_storage)
+    monkeypatch.setattr(execution_base, "get_execution_storage", lambda: unit.execution_storage)
+    monkeypatch.setattr(payment_execute, "get_cell_execution_unit", lambda: unit)
+    return unit
+
+
+@pytest.mark.asyncio
+async def test_payment_handler_commits_once(memory_unit):
+    """Test the payment handler end to end; a second execution is refused."""
+    draft = await memory_unit.draft_storage.create_draft(_draft())
+
+    output = await vpm_payment_execute_handler(VPMPaymentExecuteInput(draft_id=draft.draft_id), _context())
+
+    assert output.status == "pending_settlement"
+    assert draft.status == DraftStatus.EXECUTED
+    execution = memory_unit.execution_storage.executions[output.execution_id]
+    assert execution.status == ExecutionStatus.SUCCEEDED
+    assert execution.result_payload["payment_id"] == output.payment_id
+    assert list(memory_unit.settlement_storage.intents) == [output.payment_id]
+
+    with pytest.raises(ValueError):
+        await vpm_payment_execute_handler(VPMPaymentExecuteInput(draft_id=draft.draft_id), _context())
+    assert len(memory_unit.settlement_storage.intents) == 1
+
+
+@pytest.mark.asyncio
+async def test_payment_handler_records_failed_commit(memory_unit, monkeypatch):
+    """Test that a lost compare-and-set leaves one FAILED record and no intent."""
+    draft = await memory_unit.draft_storage.create_draft(_draft())
+
+    async def validate_then_lose_race(**kwargs):
+        result = await execution_base.validate_cell_execution_with_draft(**kwargs)
+        draft.status = DraftStatus.CANCELLED  # changed between validation and commit
+        return result
+
+    monkeypatch.setattr(payment_execute, "validate_cell_execution_with_draft", validate_then_lose_race)
+
+    with pytest.raises(DraftStatusConflictError):
+        await vpm_payment_execute_handler(VPMPaymentExecuteInput(draft_id=draft.draft_id), _context())
+
+    executions = list(memory_unit.execution_storage.executions.values())
+    assert [e.status for e in executions] == [ExecutionStatus.FAILED]
+    assert executions[0].rollback_instructions["action"] == "revert_payment_creation"
+    assert memory_unit.settlement_storage.intents == {}
+
+
+def _commit_cell_execution(client: FakeSupabase, params):
+    """Python stand-in for the lynx_commit_cell_execution SQL function."""
+    execution = params["p_execution"]
+    executions = client.table("lynx_executions").rows
+    for row in executions:
+        if execution["request_id"] and (row["tenant_id"], row["request_id"]) == (
+            execution["tenant_id"], execution["request_id"],
+        ):
+            return {"outcome": "duplicate", "execution": row}
+    drafts = [
+        row for row in client.table("lynx_drafts").rows
+        if row["draft_id"] == execution["draft_id"] and row["tenant_id"] == execution["tenant_id"]
+    ]
+    if not drafts:
+        return {"outcome": "not_found", "status": None}
+    if drafts[0]["status"] != params["p_expected_status"]:
+        return {"outcome": "conflict", "status": drafts[0]["status"]}
+    drafts[0]["status"] = params["p_new_status"]
+    executions.append(dict(execution))
+    if params["p_settlement"]:
+        client.table("settlement_intents").rows.append(dict(params["p_settlement"]))
+    return {"outcome": "committed"}
+
+
+@pytest.fixture
+def supabase_unit():
+    client = FakeSupabase(functions={"lynx_commit_cell_execution": _commit_cell_execution})
+    return CellExecutionUnitSupabase(
+        DraftStorageSupabase(supabase_client=client),
+        ExecutionStorageSupabase(supabase_client=client),
+        SettlementIntentStorageSupabase(supabase_client=client),
+    )
+
+
+@pytest.mark.asyncio
+async def test_supabase_commit_is_one_rpc(supabase_unit):
+    """Test that the fast path is a single round trip and refreshes the draft cache."""
+    client = supabase_unit.client
+    draft = await supabase_unit.draft_storage.create_draft(_draft(request_id="req-draft"))
+    client.table("lynx_drafts").calls.clear()
+
+    stored = await supabase_unit.commit(
+        draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED, _intent(draft),
+    )
+
+    assert client.rpc_calls == ["lynx_commit_cell_execution"]
+    assert all(not table.calls for table in client.tables.values())
+    assert stored.status == ExecutionStatus.SUCCEEDED
+    assert client.table("lynx_drafts").rows[0]["status"] == "executed"
+    assert len(client.table("settlement_intents").rows) == 1
+    cached = supabase_unit.draft_storage.idempotency_cache.get("tenant-1", "payment", "req-draft")
+    assert cached.status == DraftStatus.EXECUTED
+
+
+@pytest.mark.asyncio
+async def test_supabase_commit_maps_outcomes(supabase_unit):
+    """Test duplicate, conflict and not_found results of the RPC."""
+    draft = await supabase_unit.draft_storage.create_draft(_draft())
+    first = await supabase_unit.commit(draft, _execution(draft, "req-1"), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+
+    retried = await supabase_unit.commit(draft, _execution(draft, "req-1"), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+    assert retried.execution_id == first.execution_id
+
+    with pytest.raises(DraftStatusConflictError) as exc_info:
+        await supabase_unit.commit(draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+    assert exc_info.value.current_status == DraftStatus.EXECUTED
+
+    with pytest.raises(ValueError, match="not found"):
+        await supabase_unit.commit(_draft(), _execution(_draft()), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+    assert len(supabase_unit.client.table("lynx_executions").rows) == 1
@@ -0,0 +1,118 @@
+"""
+Cell Validation Unit Tests
+
+Tests that Cell validation loads the draft and its successful execution
+in one storage call and hands the draft to the handler.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.core.session import ExecutionContext
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus  # before lynx.storage
+from lynx.mcp.cell.execution import base as execution_base
+from lynx.mcp.cell.workflow.draft_publish import WorkflowDraftPublishInput, workflow_draft_publish_handler
+from lynx.storage.draft_storage import DraftStorage, DraftStorageSupabase
+from tests.utils.fake_supabase import FakeSupabase
+
+TOOL_ID = "workflow.cell.draft.publish"
+
+
+def _draft(status=DraftStatus.APPROVED) -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id="tenant-1",
+        draft_type="workflow",
+        payload={"workflow_kind": "approval", "name": "Onboarding"},
+        status=status,
+        risk_level="medium",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={},
+    )
+
+
+def _context() -> ExecutionContext:
+    return ExecutionContext(
+        user_id="user-1",
+        tenant_id="tenant-1",
+        user_role="admin",
+        user_scope=[],
+        session_id="session-1",
+    )
+
+
+@pytest.mark.asyncio
+async def test_supabase_loads_draft_and_execution_in_one_query():
+    """Test the embedded lynx_executions select."""
+    client = FakeSupabase()
+    storage = DraftStorageSupabase(supabase_client=client)
+    executed, fresh = _draft(), _draft()
+    await storage.create_drafts_bulk([executed, fresh])
+    client.table("lynx_executions").rows.extend([
+        {"execution_id": "exec-failed", "draft_id": executed.draft_id, "tenant_id": "tenant-1",
+         "tool_id": TOOL_ID, "status": "failed"},
+        {"execution_id": "exec-other-tool", "draft_id": executed.draft_id, "tenant_id": "tenant-1",
+         "tool_id": "vpm.cell.payment.execute", "status": "succeeded"},
+        {"execution_id": "exec-ok", "draft_id": executed.draft_id, "tenant_id": "tenant-1",
+         "tool_id": TOOL_ID, "status": "succeeded"},
+    ])
+    calls = client.table("lynx_drafts").calls
+    calls.clear()
+
+    draft, execution_id = await storage.get_draft_for_execution(executed.draft_id, "tenant-1", TOOL_ID)
+    assert draft.draft_id == executed.draft_id
+    assert execution_id == "exec-ok"
+
+    draft, execution_id = await storage.get_draft_for_execution(fresh.draft_id, "tenant-1", TOOL_ID)
+    assert draft.draft_id == fresh.draft_id
+    assert execution_id is None
+
+    assert await storage.get_draft_for_execution(fresh.draft_id, "tenant-2", TOOL_ID) == (None, None)
+    assert calls == ["select", "select", "select"]
+
+
+@pytest.mark.asyncio
+async def test_validation_returns_draft_and_keeps_wrapper(monkeypatch):
+    """Test validate_cell_execution_with_draft and the 3-tuple wrapper."""
+    storage = DraftStorage()
+    monkeypatch.setattr(execution_base, "get_draft_storage", lambda: storage)
+    approved, pending = _draft(), _draft(status=DraftStatus.DRAFT)
+    await storage.create_drafts_bulk([approved, pending])
+
+    is_valid, error, bypass, draft = await execution_base.validate_cell_execution_with_draft(
+        approved.draft_id, _context(), TOOL_ID,
+    )
+    assert (is_valid, error, bypass) == (True, None, None)
+    assert draft is approved
+
+    is_valid, error, bypass = await execution_base.validate_cell_execution(pending.draft_id, _context(), TOOL_ID)
+    assert not is_valid
+    assert "not approved" in error
+
+
+@pytest.mark.asyncio
+async def test_handler_does_not_read_the_draft_again(monkeypatch):
+    """Test that the publish handler uses the validated draft (one draft read)."""
+    storage = DraftStorage()
+    draft = _draft()
+    await storage.create_draft(draft)
+    reads = []
+    get_draft = storage.get_draft
+
+    async def counting_get_draft(draft_id, tenant_id):
+        reads.append(draft_id)
+        return await get_draft(draft_id, tenant_id)
+
+    monkeypatch.setattr(storage, "get_draft", counting_get_draft)
+    monkeypatch.setattr(execution_base, "get_draft_storage", lambda: storage)
+    monkeypatch.setattr("lynx.mcp.cell.workflow.draft_publish.get_draft_storage", lambda: storage)
+
+    output = await workflow_draft_publish_handler(WorkflowDraftPublishInput(draft_id=draft.draft_id), _context())
+
+    assert output.status == "published"
+    # One read for validation, one inside the compare-and-set status update
+    assert len(reads) == 2
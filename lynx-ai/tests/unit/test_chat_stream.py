@@ -0,0 +1,170 @@
+"""
+Chat Streaming Unit Tests
+
+Tests the SSE chat endpoint with a stub agent pool: event order,
+tool-call durations, policy and audit-once behaviour.
+"""
+
+import asyncio
+import json
+import pytest
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.api import chat_routes
+from lynx.api.auth import get_current_session
+from lynx.core.runtime.tool_calls import tool_call_observer
+
+
+class StubLLM:
+    """LLM that calls one tool through the observer, then answers."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+
+    async def generate_str(self, query, request_params=None):
+        observer = tool_call_observer.get()
+        call = observer.start("cluster.docs.draft.create", {"title": "Doc"})
+        await asyncio.sleep(0.01)
+        observer.finish(call, output={"draft_id": "draft-1"})
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return "Draft created for review"
+
+
+class StubPool:
+    def __init__(self, llm):
+        self.llm = llm
+
+    @asynccontextmanager
+    async def lease(self, context):
+        class Pooled:
+            llm = self.llm
+        yield Pooled()
+
+
+class RecordingAuditLogger:
+    def __init__(self):
+        self.runs = []
+
+    async def log_lynx_run(self, **kwargs):
+        self.runs.append(kwargs)
+
+
+@pytest.fixture
+def audit_logger(monkeypatch):
+    logger = RecordingAuditLogger()
+    monkeypatch.setattr(chat_routes, "get_audit_logger", lambda: logger)
+    return logger
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(chat_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {
+        "tenant_id": "tenant-t1",
+        "user_id": "user-1",
+        "role": "admin",
+    }
+    return TestClient(app)
+
+
+def parse_events(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_emits_tool_calls_tokens_and_policy(client, audit_logger, monkeypatch):
+    """Test SSE event order and payloads for a successful turn."""
+    monkeypatch.setattr(chat_routes, "get_agent_pool", lambda: StubPool(StubLLM()))
+
+    response = client.post("/api/chat/query/stream", json={"query": "create a doc"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+    names = [name for name, _ in events]
+
+    assert names[0] == "run_start"
+    assert names[1:3] == ["tool_call_start", "tool_call_finish"]
+    assert names[-2:] == ["policy", "done"]
+    assert "".join(data["text"] for name, data in events if name == "token") == "Draft created for review"
+
+    finish = events[2][1]
+    assert finish["tool_id"] == "cluster.docs.draft.create"
+    assert finish["status"] == "success"
+    assert finish["duration_ms"] >= 10
+
+    policy = events[-2][1]
+    assert policy["risk_level"] == "medium"
+    assert len(audit_logger.runs) == 1
+    assert audit_logger.runs[0]["status"] == "completed"
+    assert audit_logger.runs[0]["tenant_id"] == "tenant-t1"
+
+
+def test_stream_reports_agent_error(client, audit_logger, monkeypatch):
+    """Test that agent failures end the stream with an error event."""
+    monkeypatch.setattr(chat_routes, "get_agent_pool", lambda: StubPool(StubLLM(fail=True)))
+
+    response = client.post("/api/chat/query/stream", json={"query": "create a doc"})
+    events = parse_events(response.text)
+
+    assert events[-1][0] == "error"
+    assert "model unavailable" in events[-1][1]["message"]
+    assert [run["status"] for run in audit_logger.runs] == ["failed"]
+
+
+def test_query_reports_observed_tool_calls(client, audit_logger, monkeypatch):
+    """Test that the non-streaming endpoint returns observed tool calls."""
+    monkeypatch.setattr(chat_routes, "get_agent_pool", lambda: StubPool(StubLLM()))
+
+    response = client.post("/api/chat/query", json={"query": "create a doc"})
+    body = response.json()
+
+    assert body["tool_calls"][0]["tool_id"] == "cluster.docs.draft.create"
+    assert body["policy"]["risk_level"] == "medium"
+    assert len(audit_logger.runs) == 1
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_generation_and_audits_once(audit_logger):
+    """Test that closing the stream cancels the agent turn."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    class SlowLLM:
+        async def generate_str(self, query, request_params=None):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    original = chat_routes.get_agent_pool
+    chat_routes.get_agent_pool = lambda: StubPool(SlowLLM())
+    try:
+        context = chat_routes._create_chat_context(
+            {"tenant_id": "tenant-t1", "user_id": "user-1", "role": "admin"}
+        )
+        stream = chat_routes._stream_chat_run("run-1", "slow query", context)
+        assert (await stream.__anext__()).startswith("event: run_start")
+        next_frame = asyncio.ensure_future(stream.__anext__())
+        await started.wait()
+
+        # Simulate the server cancelling the response on disconnect
+        next_frame.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await next_frame
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+    finally:
+        chat_routes.get_agent_pool = original
+
+    assert [run["status"] for run in audit_logger.runs] == ["cancelled"]
@@ -0,0 +1,116 @@
+"""
+Draft Cache Unit Tests
+
+Tests the byte-bounded, tenant-scoped read-through cache of drafts and its
+write-through from Supabase draft storage.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus  # before lynx.storage
+from lynx.observability.metrics import get_metrics_registry
+from lynx.storage.draft_cache import ENTRY_OVERHEAD_BYTES, DraftCache
+from lynx.storage.draft_storage import DraftStatusConflictError, DraftStorageSupabase
+from tests.utils.fake_supabase import FakeSupabase
+
+
+def _draft(tenant_id="tenant-1", payload_size=10, status=DraftStatus.DRAFT) -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        draft_type="docs",
+        payload={"body": "x" * payload_size},
+        status=status,
+        risk_level="low",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={},
+    )
+
+
+def test_cache_is_bounded_by_bytes():
+    """Test LRU eviction by total size, and that oversized drafts are skipped."""
+    drafts = [_draft(payload_size=1000) for _ in range(4)]
+    entry_size = len(drafts[0].model_dump_json()) + ENTRY_OVERHEAD_BYTES
+    cache = DraftCache("test-bytes", max_bytes=4 * entry_size, ttl=60)
+    for draft in drafts:
+        cache.put(draft)
+    cache.get("tenant-1", drafts[0].draft_id)  # most recently used
+
+    cache.put(_draft(payload_size=1000))
+
+    assert cache.bytes <= 4 * entry_size
+    assert cache.get("tenant-1", drafts[0].draft_id) is not None
+    assert cache.get("tenant-1", drafts[1].draft_id) is None
+    assert cache.metrics()["evictions"] == 1
+
+    huge = _draft(payload_size=10000)
+    cache.put(huge)
+    assert cache.get("tenant-1", huge.draft_id) is None
+
+
+def test_cache_is_tenant_scoped_returns_copies_and_expires():
+    """Test tenant isolation, copy-on-read and TTL expiry."""
+    cache = DraftCache("test-scope", max_bytes=10000, ttl=60)
+    draft = _draft()
+    cache.put(draft)
+
+    assert cache.get("tenant-2", draft.draft_id) is None
+    cached = cache.get("tenant-1", draft.draft_id)
+    cached.status = DraftStatus.APPROVED
+    assert cache.get("tenant-1", draft.draft_id).status == DraftStatus.DRAFT
+
+    expired = DraftCache("test-ttl", max_bytes=10000, ttl=0)
+    expired.put(draft)
+    assert expired.get("tenant-1", draft.draft_id) is None
+    assert expired.bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_supabase_reads_through_and_status_updates_write_through():
+    """Test that repeated reads skip the database and updates keep the cache current."""
+    client = FakeSupabase()
+    storage = DraftStorageSupabase(supabase_client=client)
+    table = client.table("lynx_drafts")
+    draft = await storage.create_draft(_draft())
+    table.calls.clear()
+
+    for _ in range(3):
+        assert (await storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.DRAFT
+    assert table.calls == []
+    assert await storage.get_draft(draft.draft_id, "tenant-2") is None
+
+    await storage.update_draft_status(draft.draft_id, "tenant-1", DraftStatus.APPROVED, DraftStatus.DRAFT)
+    table.calls.clear()
+    assert (await storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.APPROVED
+    assert table.calls == []
+
+    # Changed elsewhere: the conflict drops the stale entry
+    table.rows[0]["status"] = "rejected"
+    with pytest.raises(DraftStatusConflictError):
+        await storage.update_draft_status(draft.draft_id, "tenant-1", DraftStatus.PUBLISHED, DraftStatus.APPROVED)
+    assert (await storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.REJECTED
+
+    assert 'lynx_draft_cache_hit_ratio{cache="drafts"}' in get_metrics_registry().render_prometheus()
+    assert storage.draft_cache.metrics()["hits"] >= 4
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_writes_through():
+    """Test that bulk transitions update cached drafts and drop conflicting ones."""
+    client = FakeSupabase()
+    storage = DraftStorageSupabase(supabase_client=client)
+    moved, stale = [await storage.create_draft(_draft()) for _ in range(2)]
+    client.table("lynx_drafts").rows[1]["status"] = "rejected"
+
+    results = await storage.transition_drafts_bulk(
+        "tenant-1", [moved.draft_id, stale.draft_id], DraftStatus.DRAFT, DraftStatus.APPROVED,
+    )
+
+    assert [r.outcome for r in results] == ["updated", "conflict"]
+    assert storage.draft_cache.get("tenant-1", moved.draft_id).status == DraftStatus.APPROVED
+    assert storage.draft_cache.get("tenant-1", stale.draft_id) is None
@@ -0,0 +1,164 @@
+"""
+Draft Idempotency Unit Tests
+
+Tests the tenant-scoped idempotency cache, the single round-trip create
+path and bulk creation of DraftStorageSupabase (against a fake client that
+counts queries).
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts import base as drafts_base
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus
+from lynx.storage.draft_storage import DraftStorage, DraftStorageSupabase
+from lynx.storage.idempotency import IdempotencyCache
+from tests.utils.fake_supabase import FakeSupabase
+
+
+def _draft(tenant_id="tenant-1", request_id="req-1", draft_type="docs") -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        draft_type=draft_type,
+        payload={"title": "Q1 report"},
+        status=DraftStatus.DRAFT,
+        risk_level="low",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={"tool_id": "cluster.docs.draft_create"},
+        request_id=request_id,
+    )
+
+
+@pytest.fixture
+def storage():
+    return DraftStorageSupabase(supabase_client=FakeSupabase())
+
+
+@pytest.mark.asyncio
+async def test_first_create_is_one_round_trip_and_retry_is_free(storage):
+    """Test that a first-time create takes one query and a retry none."""
+    calls = storage.client.table("lynx_drafts").calls
+
+    created = await storage.create_draft(_draft())
+    assert calls == ["upsert"]
+
+    retried = await storage.create_draft(_draft())
+    assert calls == ["upsert"]
+    assert retried.draft_id == created.draft_id
+    assert storage.idempotency_cache.metrics()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_conflict_after_cache_miss_returns_existing_draft(storage):
+    """Test that a retry that misses the cache resolves to the stored draft."""
+    created = await storage.create_draft(_draft())
+    storage.idempotency_cache.clear()  # e.g. another worker served the first request
+
+    retried = await storage.create_draft(_draft())
+
+    assert retried.draft_id == created.draft_id
+    assert storage.client.table("lynx_drafts").calls == ["upsert", "upsert", "select"]
+    assert len(storage.client.table("lynx_drafts").rows) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_tenant_scoped(storage):
+    """Test that the same request_id in another tenant creates a new draft."""
+    first = await storage.create_draft(_draft(tenant_id="tenant-1"))
+    second = await storage.create_draft(_draft(tenant_id="tenant-2"))
+
+    assert second.draft_id != first.draft_id
+    assert second.tenant_id == "tenant-2"
+    assert storage.client.table("lynx_drafts").calls == ["upsert", "upsert"]
+
+
+@pytest.mark.asyncio
+async def test_drafts_without_request_id_bypass_cache(storage):
+    """Test that drafts without request_id use a plain insert."""
+    await storage.create_draft(_draft(request_id=None))
+    await storage.create_draft(_draft(request_id=None))
+
+    assert storage.client.table("lynx_drafts").calls == ["insert", "insert"]
+    assert len(storage.idempotency_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_request_ids_are_tenant_scoped():
+    """Test that in-memory storage does not share request_ids across tenants."""
+    storage = DraftStorage()
+    first = await storage.create_draft(_draft(tenant_id="tenant-1"))
+    second = await storage.create_draft(_draft(tenant_id="tenant-2"))
+    retried = await storage.create_draft(_draft(tenant_id="tenant-1"))
+
+    assert second.draft_id != first.draft_id
+    assert retried.draft_id == first.draft_id
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the cache stays bounded and keeps recently used entries."""
+    cache = IdempotencyCache("test", max_entries=2)
+    cache.put("t1", "docs", "a", "draft-a")
+    cache.put("t1", "docs", "b", "draft-b")
+    assert cache.get("t1", "docs", "a") == "draft-a"  # a is now most recent
+    cache.put("t1", "docs", "c", "draft-c")
+
+    assert cache.get("t1", "docs", "b") is None
+    assert cache.get("t1", "docs", "a") == "draft-a"
+    assert cache.get("t2", "docs", "a") is None
+    assert len(cache) == 2
+    assert cache.metrics()["hit_ratio"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_is_one_statement_with_per_item_idempotency(storage):
+    """Test that a bulk create batches inserts and resolves duplicates per item."""
+    existing = await storage.create_draft(_draft(request_id="req-old"))
+    storage.idempotency_cache.clear()
+    calls = storage.client.table("lynx_drafts").calls
+    calls.clear()
+
+    batch = [
+        _draft(request_id="req-a"),
+        _draft(request_id="req-old"),  # already stored
+        _draft(request_id=None),
+        _draft(request_id="req-a"),  # duplicate within the batch
+    ]
+    results = await storage.create_drafts_bulk(batch)
+
+    assert calls == ["upsert", "select"]
+    assert [d.draft_id for d in results] == [
+        batch[0].draft_id, existing.draft_id, batch[2].draft_id, batch[0].draft_id,
+    ]
+    assert len(storage.client.table("lynx_drafts").rows) == 3
+
+    # Retrying the whole batch is answered from the cache (except the item without request_id)
+    calls.clear()
+    retried = await storage.create_drafts_bulk([_draft(request_id="req-a"), _draft(request_id="req-old")])
+    assert calls == []
+    assert [d.draft_id for d in retried] == [batch[0].draft_id, existing.draft_id]
+
+
+@pytest.mark.asyncio
+async def test_create_drafts_helper_uses_bulk_storage(monkeypatch):
+    """Test the Draft Protocol bulk helper against in-memory storage."""
+    storage = DraftStorage()
+    monkeypatch.setattr(drafts_base, "get_draft_storage", lambda: storage)
+
+    drafts = await drafts_base.create_drafts(
+        tenant_id="tenant-1",
+        created_by="user-1",
+        items=[
+            {"draft_type": "docs", "payload": {"i": i}, "source_context": {}, "request_id": f"req-{i % 2}"}
+            for i in range(3)
+        ],
+    )
+
+    assert [d.payload for d in drafts] == [{"i": 0}, {"i": 1}, {"i": 0}]
+    assert drafts[0].draft_id == drafts[2].draft_id
+    assert all(d.status == DraftStatus.DRAFT and d.risk_level == "medium" for d in drafts)
+    assert len(storage.drafts) == 2
@@ -0,0 +1,136 @@
+"""
+Draft Preview Unit Tests
+
+Tests on-demand preview rendering: the per-draft_type renderer registry,
+memoization by draft_id and payload hash, the include_preview flag of
+Cluster MCP tools (including idempotent replays) and the draft API.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts import base as drafts_base
+from lynx.mcp.cluster.drafts import preview
+from lynx.api import draft_routes
+from lynx.api.auth import get_current_session
+from lynx.core.session import ExecutionContext
+from lynx.mcp.cluster.docs.draft_create import DocsDraftInput, docs_draft_create_handler
+from lynx.mcp.cluster.vpm.payment_draft_create import VPMPaymentDraftInput, vpm_payment_draft_create_handler
+from lynx.storage.draft_storage import DraftStorage
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = DraftStorage()
+    monkeypatch.setattr(drafts_base, "get_draft_storage", lambda: storage)
+    return storage
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Count renderer calls per draft_type."""
+    counts = {}
+    preview.clear_preview_cache()
+    for draft_type, renderer in list(preview._renderers.items()):
+        def counting(draft, renderer=renderer, draft_type=draft_type):
+            counts[draft_type] = counts.get(draft_type, 0) + 1
+            return renderer(draft)
+        monkeypatch.setitem(preview._renderers, draft_type, counting)
+    yield counts
+    preview.clear_preview_cache()
+
+
+@pytest.fixture
+def context():
+    return ExecutionContext(
+        user_id="user-1",
+        tenant_id="tenant-1",
+        user_role="admin",
+        user_scope=[],
+        session_id="session-1",
+    )
+
+
+def test_every_cluster_draft_type_has_a_renderer():
+    """Test that all Cluster MCP draft types register a preview renderer."""
+    import lynx.mcp.server  # noqa: F401 - imports every Cluster MCP (as the runtime does)
+
+    for draft_type in [
+        "docs", "docs_batch", "docs_message", "workflow", "workflow_digital",
+        "portal_scaffold", "portal_config", "vpm_payment",
+    ]:
+        assert preview.get_preview_renderer(draft_type) is not None, draft_type
+
+
+@pytest.mark.asyncio
+async def test_preview_is_rendered_once_per_draft_and_replays_reuse_it(storage, renders, context):
+    """Test that idempotent replays return the memoized preview of the stored draft."""
+    first = await docs_draft_create_handler(
+        DocsDraftInput(doc_type="ADR", title="Queue pipeline", content_outline="Why", request_id="req-1"), context,
+    )
+    replay = await docs_draft_create_handler(
+        DocsDraftInput(doc_type="ADR", title="Queue pipeline", content_outline="Why", request_id="req-1"), context,
+    )
+
+    assert replay.draft_id == first.draft_id
+    assert first.preview_markdown.startswith("# Queue pipeline\n\n**Document Type:** ADR")
+    assert "**Created By:** user-1" in first.preview_markdown
+    assert replay.preview_markdown == first.preview_markdown
+    assert renders == {"docs": 1}
+
+
+@pytest.mark.asyncio
+async def test_include_preview_false_skips_rendering(storage, renders, context):
+    """Test that high-volume callers can skip rendering entirely."""
+    output = await vpm_payment_draft_create_handler(
+        VPMPaymentDraftInput(vendor_id="vendor-1", amount=500, due_date="2026-01-31", include_preview=False),
+        context,
+    )
+
+    assert output.preview_markdown is None
+    assert renders == {}
+
+    draft = await storage.get_draft(output.draft_id, "tenant-1")
+    rendered = preview.render_preview(draft)
+    assert "**Amount:** USD 500.00" in rendered
+    assert "- Vendor Active: Yes" in rendered
+
+
+@pytest.mark.asyncio
+async def test_preview_memo_is_keyed_by_payload_hash_and_bounded(storage, renders, context, monkeypatch):
+    """Test re-rendering after a payload change and the LRU bound."""
+    output = await docs_draft_create_handler(DocsDraftInput(doc_type="ADR", title="First"), context)
+    draft = await storage.get_draft(output.draft_id, "tenant-1")
+
+    changed = draft.model_copy(update={"payload": {**draft.payload, "title": "Second"}})
+    assert preview.render_preview(changed).startswith("# Second")
+    reordered = draft.model_copy(update={"payload": dict(reversed(list(draft.payload.items())))})
+    assert preview.render_preview(reordered) == output.preview_markdown
+    assert renders == {"docs": 2}
+
+    monkeypatch.setattr("lynx.config.Config.DRAFT_PREVIEW_CACHE_SIZE", 1)
+    preview.render_preview(draft.model_copy(update={"payload": {**draft.payload, "title": "Third"}}))  # evicts the rest
+    preview.render_preview(draft)
+    assert renders == {"docs": 4}
+    assert preview.render_preview(draft.model_copy(update={"draft_type": "unknown"})) is None
+
+
+def test_draft_api_renders_preview_on_request(storage, renders, monkeypatch, context):
+    """Test that GET /api/drafts/{id} renders the preview only with include_preview=true."""
+    monkeypatch.setattr(draft_routes, "get_draft_storage", lambda: storage)
+    output = asyncio.run(docs_draft_create_handler(
+        DocsDraftInput(doc_type="ADR", title="Queue pipeline", include_preview=False), context,
+    ))
+    app = FastAPI()
+    app.include_router(draft_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {"tenant_id": "tenant-1", "user_id": "user-1"}
+    client = TestClient(app)
+
+    assert client.get(f"/api/drafts/{output.draft_id}").json()["preview_markdown"] is None
+    assert renders == {}
+    body = client.get(f"/api/drafts/{output.draft_id}", params={"include_preview": "true"}).json()
+    assert body["preview_markdown"].startswith("# Queue pipeline")
@@ -0,0 +1,213 @@
+"""
+Draft Transition Unit Tests
+
+Tests compare-and-set status transitions (single and bulk) in both storage
+backends and the approve/reject endpoints.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus  # before lynx.storage
+from lynx.api import draft_routes
+from lynx.api.auth import get_current_session
+from lynx.storage.draft_storage import DraftStatusConflictError, DraftStorage, DraftStorageSupabase
+from tests.utils.fake_supabase import FakeSupabase
+
+
+def _draft(tenant_id="tenant-1", status=DraftStatus.DRAFT) -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        draft_type="docs",
+        payload={"title": "Q1 report"},
+        status=status,
+        risk_level="low",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={},
+    )
+
+
+def _storage(backend: str) -> DraftStorage:
+    return DraftStorage() if backend == "memory" else DraftStorageSupabase(supabase_client=FakeSupabase())
+
+
+async def _seed(storage: DraftStorage):
+    drafts = [
+        _draft(),
+        _draft(),
+        _draft(status=DraftStatus.REJECTED),
+        _draft(tenant_id="tenant-2"),
+    ]
+    await storage.create_drafts_bulk(drafts)
+    return drafts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "supabase"])
+async def test_update_status_compare_and_set(backend):
+    """Test expected_status: update on match, conflict error otherwise, None if missing."""
+    storage = _storage(backend)
+    draft = (await _seed(storage))[0]
+
+    updated = await storage.update_draft_status(
+        draft.draft_id, "tenant-1", DraftStatus.APPROVED, expected_status=DraftStatus.DRAFT,
+    )
+    assert updated.status == DraftStatus.APPROVED
+
+    with pytest.raises(DraftStatusConflictError) as exc_info:
+        await storage.update_draft_status(
+            draft.draft_id, "tenant-1", DraftStatus.REJECTED, expected_status=DraftStatus.DRAFT,
+        )
+    assert exc_info.value.current_status == DraftStatus.APPROVED
+    assert (await storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.APPROVED
+
+    assert await storage.update_draft_status(
+        draft.draft_id, "tenant-2", DraftStatus.REJECTED, expected_status=DraftStatus.APPROVED,
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_approvals_only_one_wins():
+    """Test that racing transitions out of DRAFT cannot both succeed."""
+    storage = DraftStorageSupabase(supabase_client=FakeSupabase())
+    draft = (await _seed(storage))[0]
+    calls = storage.client.table("lynx_drafts").calls
+    calls.clear()
+
+    outcomes = await asyncio.gather(
+        storage.update_draft_status(draft.draft_id, "tenant-1", DraftStatus.APPROVED, DraftStatus.DRAFT),
+        storage.update_draft_status(draft.draft_id, "tenant-1", DraftStatus.REJECTED, DraftStatus.DRAFT),
+        return_exceptions=True,
+    )
+
+    assert isinstance(outcomes[0], DraftProtocol)
+    assert isinstance(outcomes[1], DraftStatusConflictError)
+    assert calls == ["update", "update", "select"]  # the winner needed one round trip
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "supabase"])
+async def test_bulk_transition_reports_per_id_outcomes(backend):
+    """Test CAS semantics: only drafts of the tenant in the expected status change."""
+    storage = _storage(backend)
+    drafts = await _seed(storage)
+    ids = [d.draft_id for d in drafts] + ["missing"]
+
+    results = await storage.transition_drafts_bulk(
+        tenant_id="tenant-1",
+        draft_ids=ids,
+        expected_status=DraftStatus.DRAFT,
+        new_status=DraftStatus.APPROVED,
+    )
+
+    assert [(r.outcome, r.status) for r in results] == [
+        ("updated", DraftStatus.APPROVED),
+        ("updated", DraftStatus.APPROVED),
+        ("conflict", DraftStatus.REJECTED),
+        ("not_found", None),  # other tenant
+        ("not_found", None),
+    ]
+    assert (await storage.get_draft(drafts[0].draft_id, "tenant-1")).status == DraftStatus.APPROVED
+    assert (await storage.get_draft(drafts[3].draft_id, "tenant-2")).status == DraftStatus.DRAFT
+
+    # A second approval of the same drafts loses the compare-and-set
+    again = await storage.transition_drafts_bulk("tenant-1", ids[:1], DraftStatus.DRAFT, DraftStatus.REJECTED)
+    assert again[0].outcome == "conflict"
+    assert again[0].status == DraftStatus.APPROVED
+
+
+@pytest.mark.asyncio
+async def test_supabase_bulk_transition_is_one_update():
+    """Test that a clean bulk transition costs a single statement."""
+    storage = DraftStorageSupabase(supabase_client=FakeSupabase())
+    drafts = [_draft() for _ in range(20)]
+    await storage.create_drafts_bulk(drafts)
+    calls = storage.client.table("lynx_drafts").calls
+    calls.clear()
+
+    results = await storage.transition_drafts_bulk(
+        "tenant-1", [d.draft_id for d in drafts], DraftStatus.DRAFT, DraftStatus.APPROVED,
+    )
+
+    assert all(r.outcome == "updated" for r in results)
+    assert calls == ["update"]
+
+
+class RecordingAuditLogger:
+    def __init__(self):
+        self.batches = []
+
+    async def log_draft_transitions(self, **kwargs):
+        self.batches.append(kwargs)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = DraftStorage()
+    monkeypatch.setattr(draft_routes, "get_draft_storage", lambda: storage)
+    return storage
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(draft_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {
+        "tenant_id": "tenant-1",
+        "user_id": "approver-1",
+        "role": "admin",
+    }
+    return TestClient(app)
+
+
+def test_approve_and_reject_use_compare_and_set(storage, client):
+    """Test single approve/reject: success, double approval and missing drafts."""
+    drafts = asyncio.run(_seed(storage))
+
+    response = client.post(f"/api/drafts/{drafts[0].draft_id}/approve", json={})
+    assert response.status_code == 200
+    assert response.json()["status"] == "approved"
+
+    response = client.post(f"/api/drafts/{drafts[0].draft_id}/reject", json={"reason": "late"})
+    assert response.status_code == 400
+    assert "already approved" in response.json()["detail"]
+
+    assert client.post(f"/api/drafts/{drafts[3].draft_id}/approve", json={}).status_code == 404  # other tenant
+    assert client.post(f"/api/drafts/{drafts[1].draft_id}/reject", json={"reason": "dup"}).status_code == 200
+
+
+def test_bulk_transition_endpoint(storage, client, monkeypatch):
+    """Test the endpoint: per-id results, counts and one audit batch."""
+    drafts = asyncio.run(_seed(storage))
+    audit_logger = RecordingAuditLogger()
+    monkeypatch.setattr(draft_routes, "get_audit_logger", lambda: audit_logger)
+
+    response = client.post("/api/drafts/bulk/transition", json={
+        "draft_ids": [d.draft_id for d in drafts[:3]],
+        "action": "reject",
+        "reason": "duplicate",
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["updated"] == 2
+    assert body["failed"] == 1
+    assert [r["outcome"] for r in body["results"]] == ["updated", "updated", "conflict"]
+    assert body["results"][0]["status"] == "rejected"
+
+    assert len(audit_logger.batches) == 1
+    batch = audit_logger.batches[0]
+    assert batch["action"] == "reject"
+    assert batch["user_id"] == "approver-1"
+    assert batch["reason"] == "duplicate"
+    assert len(batch["transitions"]) == 3
+
+    assert client.post("/api/drafts/bulk/transition", json={"draft_ids": [], "action": "approve"}).status_code == 422
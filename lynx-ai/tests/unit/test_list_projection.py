@@ -0,0 +1,163 @@
+"""
+List Projection Unit Tests
+
+Tests DraftSummary/ExecutionSummary projections: field validation, parity
+across the in-memory, Supabase and SQLite backends, that list queries select
+only the requested columns, and the payload-free draft list endpoint.
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus, DraftSummary  # before lynx.storage
+from lynx.api import draft_routes
+from lynx.api.auth import get_current_session
+from lynx.core.session import ExecutionContext
+from lynx.mcp.cell.execution import base as execution_base
+from lynx.mcp.cell.execution.models import ExecutionStatus, ExecutionSummary
+from lynx.storage.draft_storage import DraftStorage, DraftStorageSQLite, DraftStorageSupabase
+from lynx.storage.execution_storage import ExecutionStorage, ExecutionStorageSQLite, ExecutionStorageSupabase
+from lynx.storage.payload_codec import PayloadCodec
+from lynx.storage.sqlite import SQLiteDatabase
+from tests.utils.fake_supabase import FakeSupabase
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _draft(minutes: int, status=DraftStatus.DRAFT) -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id="tenant-1",
+        draft_type="docs",
+        payload={"body": "lorem ipsum " * 500},
+        status=status,
+        risk_level="low",
+        created_by="user-1",
+        created_at=(NOW + timedelta(minutes=minutes)).isoformat(),
+        source_context={"session_id": "session-1"},
+    )
+
+
+def _execution(draft: DraftProtocol, status=ExecutionStatus.SUCCEEDED):
+    return execution_base.build_execution_record(
+        draft_id=draft.draft_id,
+        tool_id="docs.cell.publish",
+        context=ExecutionContext(
+            user_id="user-1",
+            tenant_id=draft.tenant_id,
+            user_role="admin",
+            user_scope=[],
+            session_id="session-1",
+        ),
+        status=status,
+        result_payload={"document": "lorem ipsum " * 500},
+    )
+
+
+def test_summary_columns_validate_fields_and_keep_the_id():
+    """Test that projections always include the ID and reject unknown fields."""
+    assert DraftSummary.columns(("status", "created_at")) == ["draft_id", "status", "created_at"]
+    assert DraftSummary.columns() == list(DraftSummary.model_fields)
+    assert ExecutionSummary.columns(("status",)) == ["execution_id", "status"]
+    with pytest.raises(ValueError, match="payload"):
+        DraftSummary.columns(("status", "payload"))
+    with pytest.raises(ValueError, match="result_payload"):
+        ExecutionSummary.columns(("result_payload",))
+
+
+@pytest.fixture(params=["memory", "supabase", "sqlite"])
+def storages(request, tmp_path):
+    if request.param == "memory":
+        yield DraftStorage(), ExecutionStorage()
+    elif request.param == "supabase":
+        client = FakeSupabase()
+        yield DraftStorageSupabase(supabase_client=client), ExecutionStorageSupabase(supabase_client=client)
+    else:
+        database = SQLiteDatabase(str(tmp_path / "lynx.db"))
+        yield DraftStorageSQLite(database), ExecutionStorageSQLite(database)
+        database.close()
+
+
+@pytest.mark.asyncio
+async def test_summaries_match_full_records_on_every_backend(storages):
+    """Test newest-first order, filters, limit and projection on each backend."""
+    drafts, executions = storages
+    stored = [await drafts.create_draft(_draft(i)) for i in range(3)]
+    await drafts.create_draft(_draft(10, status=DraftStatus.APPROVED))
+    execution = await executions.create_execution(_execution(stored[0]))
+
+    summaries = await drafts.list_draft_summaries("tenant-1", status=DraftStatus.DRAFT, limit=2)
+    assert [s.draft_id for s in summaries] == [stored[2].draft_id, stored[1].draft_id]
+    assert summaries[0] == DraftSummary(**stored[2].model_dump(include=set(DraftSummary.model_fields)))
+
+    projected = await drafts.list_draft_summaries("tenant-1", fields=("status",))
+    assert projected[0].status == DraftStatus.APPROVED
+    assert projected[0].created_by is None
+    assert await drafts.list_draft_summaries("tenant-2") == []
+
+    [summary] = await executions.list_execution_summaries("tenant-1", draft_id=stored[0].draft_id)
+    assert summary == ExecutionSummary(**execution.model_dump(include=set(ExecutionSummary.model_fields)))
+    [partial] = await executions.list_execution_summaries("tenant-1", fields=("status",))
+    assert (partial.execution_id, partial.status, partial.tool_id) == (execution.execution_id, ExecutionStatus.SUCCEEDED, None)
+
+
+@pytest.mark.asyncio
+async def test_supabase_summaries_select_only_requested_columns():
+    """Test that summary lists transfer no payloads, inline or out-of-line."""
+    client = FakeSupabase()
+    drafts = DraftStorageSupabase(supabase_client=client)
+    for i in range(5):
+        await drafts.create_draft(_draft(i))
+
+    full = client.table("lynx_drafts").select("*").execute().data
+    summaries = client.table("lynx_drafts").select(",".join(DraftSummary.columns())).execute().data
+    assert len(json.dumps(summaries)) * 10 < len(json.dumps(full))
+
+    offloaded = FakeSupabase()
+    codec = PayloadCodec(max_bytes=0, compress_threshold=1024, offload_threshold=1024, codec="gzip")
+    drafts = DraftStorageSupabase(supabase_client=offloaded, payload_codec=codec)
+    for i in range(5):
+        await drafts.create_draft(_draft(i))
+    offloaded.table("lynx_draft_payloads").calls.clear()
+
+    listed = await drafts.list_draft_summaries("tenant-1", fields=("status", "created_at"))
+    assert len(listed) == 5
+    assert offloaded.table("lynx_draft_payloads").calls == []
+
+
+@pytest.fixture
+def client(monkeypatch):
+    storage = DraftStorage()
+    monkeypatch.setattr(draft_routes, "get_draft_storage", lambda: storage)
+    app = FastAPI()
+    app.include_router(draft_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {
+        "tenant_id": "tenant-1",
+        "user_id": "user-1",
+        "user_role": "admin",
+    }
+    return TestClient(app), storage
+
+
+def test_draft_list_endpoint_omits_payload_unless_requested(client):
+    """Test that /api/drafts lists summaries and include_payload=true restores payloads."""
+    client, storage = client
+    for i in range(3):
+        asyncio.run(storage.create_draft(_draft(i)))
+
+    response = client.get("/api/drafts", params={"limit": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 3
+    assert [d["payload"] for d in body["drafts"]] == [None, None]
+    assert body["drafts"][0]["created_at"] > body["drafts"][1]["created_at"]
+
+    with_payload = client.get("/api/drafts", params={"include_payload": "true"}).json()
+    assert all(d["payload"]["body"].startswith("lorem") for d in with_payload["drafts"])
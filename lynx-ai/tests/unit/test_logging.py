@@ -0,0 +1,140 @@
+"""
+Structured Logging Unit Tests
+
+Tests JSON output, correlation fields, sampling and the non-blocking
+queue pipeline, including its setup by the oneshot entry point.
+"""
+
+import io
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import pytest
+
+from lynx.observability.logging import (
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    get_logger,
+    log_context,
+    parse_sample_rates,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def pipeline():
+    """Install the logging pipeline writing to a buffer."""
+    stream = io.StringIO()
+    setup_logging(level="info", log_format="json", stream=stream, sample_rates={"lynx.test.sampled": 0.25})
+    yield stream
+    shutdown_logging()
+
+
+def _lines(stream: io.StringIO):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_records_carry_correlation_fields(pipeline):
+    """Test that log_context fields and extras end up in the JSON record."""
+    logger = get_logger("lynx.test.audit")
+
+    with log_context(run_id="run-1", tenant_id="tenant-1"):
+        with log_context(tool_id="domain.test.read", ignored=None):
+            logger.warning("Failed to log tool call: %s", "timeout", extra={"attempt": 2})
+    logger.info("outside")
+    shutdown_logging()
+
+    inside, outside = _lines(pipeline)
+    assert inside["level"] == "warning"
+    assert inside["logger"] == "lynx.test.audit"
+    assert inside["msg"] == "Failed to log tool call: timeout"
+    assert inside["run_id"] == "run-1"
+    assert inside["tenant_id"] == "tenant-1"
+    assert inside["tool_id"] == "domain.test.read"
+    assert inside["attempt"] == 2
+    assert "ignored" not in inside
+    assert "run_id" not in outside
+
+
+def test_exceptions_are_rendered(pipeline):
+    """Test that tracebacks are kept separate from the message."""
+    logger = get_logger("lynx.test.errors")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("Daemon error")
+    shutdown_logging()
+
+    record = _lines(pipeline)[0]
+    assert record["msg"] == "Daemon error"
+    assert "RuntimeError: boom" in record["exc_info"]
+
+
+def test_sampling_keeps_one_in_n_and_never_drops_warnings(pipeline):
+    """Test per-logger sampling of high-volume info messages."""
+    logger = get_logger("lynx.test.sampled")
+    for i in range(8):
+        logger.info("Heartbeat", extra={"i": i})
+    logger.warning("Event loop degraded")
+    for i in range(4):
+        get_logger("lynx.test.other").info("per-call sampled", extra={"sample_rate": 0.5})
+    shutdown_logging()
+
+    records = _lines(pipeline)
+    heartbeats = [r for r in records if r["msg"] == "Heartbeat"]
+    assert [r["i"] for r in heartbeats] == [0, 4]
+    assert heartbeats[0]["sample_rate"] == 0.25
+    assert any(r["msg"] == "Event loop degraded" for r in records)
+    assert len([r for r in records if r["msg"] == "per-call sampled"]) == 2
+
+
+def test_full_queue_drops_instead_of_blocking():
+    """Test that enqueue never blocks the caller."""
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+    logger = logging.getLogger("lynx.test.full")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for i in range(5):
+            logger.warning("record %d", i)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped_total == 3
+    assert handler.queue.get_nowait().msg == "record 0"
+
+
+def test_setup_is_idempotent(pipeline):
+    """Test that a second setup call reuses the running pipeline."""
+    first = setup_logging()
+    assert setup_logging() is first
+    assert len([h for h in logging.getLogger("lynx").handlers if isinstance(h, NonBlockingQueueHandler)]) == 1
+
+
+def test_parse_sample_rates():
+    """Test LYNX_LOG_SAMPLE_RATES parsing."""
+    assert parse_sample_rates("lynx.runtime.daemon=0.1, lynx.api=0.5") == {
+        "lynx.runtime.daemon": 0.1,
+        "lynx.api": 0.5,
+    }
+    assert parse_sample_rates("") == {}
+    assert SamplingFilter({"lynx.api": 0.5})._rate_for("lynx.api.chat_routes") == 0.5
+
+
+def test_oneshot_entry_point_emits_structured_logs():
+    """Test that python -m lynx.main installs the pipeline (startup logs are not dropped)."""
+    env = {**os.environ, "LYNX_LOG_FORMAT": "json", "LYNX_RUNNER": "oneshot"}
+    result = subprocess.run(
+        [sys.executable, "-m", "lynx.main"], capture_output=True, text=True, timeout=120, env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    )
+
+    records = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+    messages = [record["msg"] for record in records]
+    assert "Starting Lynx AI" in messages
+    assert "Lynx AI status" in messages
@@ -0,0 +1,141 @@
+"""
+Loop Monitor Unit Tests
+
+Tests event loop lag measurement, GC pause tracking, degraded thresholds
+and the dashboard services row.
+"""
+
+import asyncio
+import gc
+import threading
+import time
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.api.dashboard_models import DashboardViewModel
+from lynx.observability.loop_monitor import LoopMonitor
+from lynx.observability.metrics import MetricsRegistry
+
+
+async def _start(monitor: LoopMonitor) -> asyncio.Task:
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0)
+    return task
+
+
+async def _stop(task: asyncio.Task) -> None:
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_shows_up_as_lag_and_degrades():
+    """Test that a synchronous sleep is measured as loop lag."""
+    registry = MetricsRegistry()
+    monitor = LoopMonitor(interval=0.01, lag_threshold=0.05, metrics_registry=registry)
+    task = await _start(monitor)
+    try:
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # Block the loop
+        await asyncio.sleep(0.03)
+
+        health = monitor.sample()
+    finally:
+        await _stop(task)
+
+    assert health.lag_max_seconds >= 0.05
+    assert health.status == "degraded"
+    assert any("loop lag" in reason for reason in health.degraded_reasons)
+    assert registry.histogram("lynx_loop_lag_seconds").count > 1
+    assert not monitor.running
+
+
+@pytest.mark.asyncio
+async def test_healthy_loop_and_task_count():
+    """Test that an idle loop is healthy and pending tasks are counted."""
+    monitor = LoopMonitor(interval=0.01, lag_threshold=1.0, pending_tasks_threshold=1000)
+    task = await _start(monitor)
+    sleepers = [asyncio.create_task(asyncio.sleep(1)) for _ in range(5)]
+    try:
+        await asyncio.sleep(0.05)
+        health = monitor.sample()
+    finally:
+        for sleeper in sleepers:
+            sleeper.cancel()
+        await _stop(task)
+
+    assert health.status == "ok"
+    assert health.pending_tasks >= 6  # sleepers + probe
+    assert health.to_dict()["degraded_reasons"] == []
+
+
+@pytest.mark.asyncio
+async def test_gc_pauses_and_executor_backlog_are_tracked():
+    """Test GC pause recording and default executor queue depth."""
+    registry = MetricsRegistry()
+    monitor = LoopMonitor(interval=0.01, executor_queue_threshold=1, metrics_registry=registry)
+    task = await _start(monitor)
+    loop = asyncio.get_running_loop()
+    try:
+        gc.collect()
+        # Saturate the default executor so jobs queue up
+        workers = loop._default_executor._max_workers if loop._default_executor else 64
+        jobs = [loop.run_in_executor(None, time.sleep, 0.05) for _ in range(workers + 8)]
+        health = monitor.sample()
+        await asyncio.gather(*jobs)
+    finally:
+        await _stop(task)
+
+    assert health.gc_collections >= 1
+    assert health.executor_queue_depth >= 2
+    assert any("executor queue" in reason for reason in health.degraded_reasons)
+    assert any(labels["generation"] == "2" for labels, _ in registry.histograms("lynx_gc_pause_seconds"))
+
+
+def test_gc_during_locked_section_does_not_deadlock():
+    """Test that a collection triggered while the monitor lock is held completes."""
+    registry = MetricsRegistry()
+    monitor = LoopMonitor(metrics_registry=registry)
+
+    def collect_under_lock():
+        with monitor._lock:
+            gc.collect()
+
+    gc.callbacks.append(monitor._on_gc)
+    try:
+        worker = threading.Thread(target=collect_under_lock, daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+    finally:
+        gc.callbacks.remove(monitor._on_gc)
+
+    assert not worker.is_alive(), "gc callback blocked on the monitor lock"
+    assert monitor.sample().gc_collections >= 1
+    assert any(labels["generation"] == "2" for labels, _ in registry.histograms("lynx_gc_pause_seconds"))
+
+
+@pytest.mark.asyncio
+async def test_services_fragment_shows_event_loop_row():
+    """Test that degraded loop health is rendered in the services fragment."""
+    from lynx.api.dashboard import render_fragment_services
+
+    vm = DashboardViewModel({
+        "status": "degraded",
+        "event_loop": {
+            "status": "degraded",
+            "lag_ms": 250.0,
+            "lag_max_ms": 300.0,
+            "pending_tasks": 12,
+            "executor_queue_depth": 0,
+            "gc_pause_max_ms": 1.0,
+            "degraded_reasons": ["loop lag 300ms > 100ms"],
+        },
+    })
+
+    html = render_fragment_services(vm)
+
+    assert "Event Loop" in html
+    assert "Degraded" in html
+    assert "loop lag 300ms &gt; 100ms" in html
+    assert "Event Loop" not in render_fragment_services(DashboardViewModel({}))
@@ -0,0 +1,107 @@
+"""
+Metrics Unit Tests
+
+Tests HDR-style histograms, Prometheus exposition and execute_tool
+stage instrumentation.
+"""
+
+import random
+import pytest
+from lynx.core.registry import execute_tool
+from lynx.observability.metrics import Histogram, MetricsRegistry, get_metrics_registry
+
+
+class TestHistogram:
+    """Test log-linear histogram accuracy."""
+
+    def test_quantiles_are_within_relative_error(self):
+        """Test that quantiles are within a few percent of exact values."""
+        random.seed(7)
+        values = [random.lognormvariate(-5, 1.5) for _ in range(20000)]
+        hist = Histogram()
+        for value in values:
+            hist.observe(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * len(ordered)) - 1]
+            assert hist.quantile(q) == pytest.approx(exact, rel=0.05)
+        assert hist.count == len(values)
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zero."""
+        assert Histogram().quantile(0.99) == 0.0
+
+
+class TestPrometheusExposition:
+    """Test text exposition format."""
+
+    def test_render_histogram_counter_and_gauge(self):
+        """Test that families render with TYPE lines and cumulative buckets."""
+        registry = MetricsRegistry()
+        hist = registry.histogram("lynx_test_seconds", "Test latency", tool_id="a.b.c")
+        hist.observe(0.002)
+        hist.observe(0.2)
+        registry.counter("lynx_test_total", "Test counter").inc(3)
+        registry.gauge("lynx_test_depth", "Test gauge", tenant_id='t"1').set(4)
+
+        text = registry.render_prometheus()
+
+        assert "# TYPE lynx_test_seconds histogram" in text
+        assert 'lynx_test_seconds_bucket{tool_id="a.b.c",le="0.0025"} 1' in text
+        assert 'lynx_test_seconds_bucket{tool_id="a.b.c",le="0.25"} 2' in text
+        assert 'lynx_test_seconds_bucket{tool_id="a.b.c",le="+Inf"} 2' in text
+        assert 'lynx_test_seconds_count{tool_id="a.b.c"} 2' in text
+        assert "lynx_test_total 3.0" in text
+        assert 'lynx_test_depth{tenant_id="t\\"1"} 4' in text
+
+    def test_collectors_run_before_render(self):
+        """Test that collectors refresh gauges at scrape time."""
+        registry = MetricsRegistry()
+        registry.register_collector(lambda r: r.gauge("lynx_collected").set(42))
+
+        assert "lynx_collected 42" in registry.render_prometheus()
+
+    def test_type_conflict_is_rejected(self):
+        """Test that a name cannot be reused with another metric type."""
+        registry = MetricsRegistry()
+        registry.counter("lynx_conflict")
+        with pytest.raises(ValueError):
+            registry.gauge("lynx_conflict")
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_records_stage_timings(
+    registered_tool,
+    tool_registry,
+    context_t1,
+    permission_checker,
+    mock_audit_logger,
+):
+    """Test that each execute_tool stage is timed with tool labels."""
+    await execute_tool(
+        tool_id=registered_tool.id,
+        input_data={"query": "q", "tenant_id": context_t1.tenant_id},
+        context=context_t1,
+        registry=tool_registry,
+        permission_checker=permission_checker,
+        audit_logger=mock_audit_logger,
+    )
+
+    stages = {
+        labels["stage"]: hist
+        for labels, hist in get_metrics_registry().histograms("lynx_tool_stage_seconds")
+        if labels["tool_id"] == registered_tool.id
+    }
+    for stage in (
+        "input_validation", "permission_check", "scheduler_wait",
+        "audit_start", "handler", "output_validation", "audit_finish", "total",
+    ):
+        assert stages[stage].count >= 1
+
+    labels = next(
+        labels for labels, _ in get_metrics_registry().histograms("lynx_tool_stage_seconds")
+        if labels["tool_id"] == registered_tool.id
+    )
+    assert labels["layer"] == "domain"
+    assert labels["risk"] == "low"
@@ -0,0 +1,131 @@
+"""
+Payload Codec Unit Tests
+
+Tests the draft payload size limit, compression above a threshold and
+out-of-line storage in lynx_draft_payloads with lazy loading.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus  # before lynx.storage
+from lynx.storage.draft_storage import DraftStorage, DraftStorageSQLite, DraftStorageSupabase
+from lynx.storage.payload_codec import ENVELOPE_KEY, PayloadCodec, PayloadTooLargeError, is_offloaded
+from lynx.storage.sqlite import SQLiteDatabase
+from tests.utils.fake_supabase import FakeSupabase
+
+
+def _payload(items=200):
+    return {"items": [{"title": f"Draft {i}", "body": "lorem ipsum " * 20} for i in range(items)]}
+
+
+def _draft(payload, request_id=None) -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id="tenant-1",
+        draft_type="docs",
+        payload=payload,
+        status=DraftStatus.DRAFT,
+        risk_level="low",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={},
+        request_id=request_id,
+    )
+
+
+def test_codec_compresses_above_threshold_and_round_trips():
+    """Test pass-through for small payloads and compressed envelopes for large ones."""
+    codec = PayloadCodec(max_bytes=0, compress_threshold=1024, offload_threshold=0, codec="gzip")
+    small = {"title": "Short"}
+    assert codec.encode(small).column is small
+
+    encoded = codec.encode(_payload())
+    envelope = encoded.column[ENVELOPE_KEY]
+    assert envelope["codec"] == "gzip"
+    assert envelope["size"] == encoded.size
+    assert len(json.dumps(encoded.column)) < encoded.size / 5
+    assert codec.decode(encoded.column) == _payload()
+
+
+def test_codec_enforces_size_limit_and_offloads():
+    """Test the size limit and the out-of-line reference."""
+    codec = PayloadCodec(max_bytes=100_000, compress_threshold=1024, offload_threshold=4096, codec="gzip")
+    with pytest.raises(PayloadTooLargeError):
+        codec.encode(_payload(items=1000))
+
+    encoded = codec.encode(_payload())
+    assert is_offloaded(encoded.column)
+    assert "data" not in encoded.column[ENVELOPE_KEY]
+    assert codec.decode(encoded.column) == encoded.column  # not loaded yet
+    assert codec.decode(encoded.column, blob=encoded.blob) == _payload()
+    assert not is_offloaded(codec.encode(_payload(), allow_offload=False).column)
+
+
+@pytest.mark.asyncio
+async def test_memory_storage_enforces_size_limit(monkeypatch):
+    """Test that in-memory storage rejects the same payloads as the databases."""
+    monkeypatch.setattr("lynx.config.Config.DRAFT_PAYLOAD_MAX_BYTES", 10_000)
+    with pytest.raises(PayloadTooLargeError):
+        await DraftStorage().create_draft(_draft(_payload()))
+
+
+@pytest.fixture
+def offloading_storage():
+    codec = PayloadCodec(max_bytes=0, compress_threshold=1024, offload_threshold=4096, codec="gzip")
+    return DraftStorageSupabase(supabase_client=FakeSupabase(), payload_codec=codec)
+
+
+@pytest.mark.asyncio
+async def test_supabase_offloaded_payload_loads_on_read(offloading_storage):
+    """Test that draft rows stay small and full drafts load their payload."""
+    client = offloading_storage.client
+    draft = await offloading_storage.create_draft(_draft(_payload()))
+    small = await offloading_storage.create_draft(_draft({"title": "Short"}))
+
+    rows = client.table("lynx_drafts").rows
+    assert is_offloaded(rows[0]["payload"])
+    assert rows[1]["payload"] == {"title": "Short"}
+    assert len(client.table("lynx_draft_payloads").rows) == 1
+
+    offloading_storage.draft_cache.clear()
+    assert (await offloading_storage.get_draft(draft.draft_id, "tenant-1")).payload == _payload()
+    listed = {d.draft_id: d.payload for d in await offloading_storage.list_drafts("tenant-1")}
+    assert listed == {draft.draft_id: _payload(), small.draft_id: {"title": "Short"}}
+
+    await offloading_storage.transition_drafts_bulk("tenant-1", [draft.draft_id], DraftStatus.DRAFT, DraftStatus.APPROVED)
+    cached = offloading_storage.draft_cache.get("tenant-1", draft.draft_id)
+    assert cached.payload == _payload()
+
+
+@pytest.mark.asyncio
+async def test_supabase_conflicting_create_removes_unused_payload(offloading_storage):
+    """Test that a request_id retry that missed the cache leaves no orphaned payload."""
+    client = offloading_storage.client
+    first = await offloading_storage.create_draft(_draft(_payload(), request_id="req-1"))
+    offloading_storage.idempotency_cache.clear()
+
+    retried = await offloading_storage.create_draft(_draft(_payload(), request_id="req-1"))
+
+    assert retried.draft_id == first.draft_id
+    assert retried.payload == _payload()
+    assert [r["draft_id"] for r in client.table("lynx_draft_payloads").rows] == [first.draft_id]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_compresses_inline(tmp_path):
+    """Test compressed payload columns in the SQLite backend."""
+    database = SQLiteDatabase(str(tmp_path / "lynx.db"))
+    codec = PayloadCodec(max_bytes=0, compress_threshold=1024, offload_threshold=4096, codec="gzip")
+    storage = DraftStorageSQLite(database, payload_codec=codec)
+    try:
+        draft = await storage.create_draft(_draft(_payload()))
+        stored = database._connection().execute("SELECT payload FROM lynx_drafts").fetchone()[0]
+        assert json.loads(stored)[ENVELOPE_KEY]["codec"] == "gzip"
+        assert (await storage.get_draft(draft.draft_id, "tenant-1")).payload == _payload()
+    finally:
+        database.close()
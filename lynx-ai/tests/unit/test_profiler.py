@@ -0,0 +1,128 @@
+"""
+Profiler Unit Tests
+
+Tests the sampling profiler output formats, the slow-callback detector
+and the token-protected /debug/profile endpoint.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from fastapi.testclient import TestClient
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.config import Config
+from lynx.observability.metrics import MetricsRegistry
+from lynx.observability.profiler import SamplingProfiler, SlowCallbackDetector
+
+
+def _spin_in_marker_function(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    """Run a thread that spins inside a recognisable function."""
+    stop = threading.Event()
+    thread = threading.Thread(target=_spin_in_marker_function, args=(stop,), name="busy-worker")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+class TestSamplingProfiler:
+    """Test stack sampling and output formats."""
+
+    def test_collapsed_stacks_include_thread_and_function(self, busy_thread):
+        """Test that samples of other threads are captured root-first."""
+        profile = SamplingProfiler(interval=0.001).capture(0.1)
+
+        assert profile.sample_count > 1
+        lines = [line for line in profile.to_collapsed().splitlines() if line.startswith("busy-worker;")]
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert "_spin_in_marker_function (unit/test_profiler.py:" in stack
+        assert int(count) >= 1
+
+    def test_speedscope_document(self, busy_thread):
+        """Test that speedscope output has shared frames and one profile per thread."""
+        doc = SamplingProfiler(interval=0.001).capture(0.05).to_speedscope()
+
+        frames = doc["shared"]["frames"]
+        profile = next(p for p in doc["profiles"] if p["name"] == "busy-worker")
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        names = {frames[i]["name"] for sample in profile["samples"] for i in sample}
+        assert "_spin_in_marker_function" in names
+
+    def test_concurrent_capture_is_rejected(self):
+        """Test that only one capture runs at a time."""
+        profiler = SamplingProfiler(interval=0.001)
+        worker = threading.Thread(target=profiler.capture, args=(0.2,))
+        worker.start()
+        time.sleep(0.05)
+        try:
+            with pytest.raises(RuntimeError):
+                profiler.capture(0.01)
+        finally:
+            worker.join()
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_detector_reports_blocking_step():
+    """Test that a synchronous sleep inside a coroutine is reported."""
+    registry = MetricsRegistry()
+    detector = SlowCallbackDetector(threshold=0.05, metrics_registry=registry)
+
+    async def blocking_call():
+        time.sleep(0.08)
+
+    detector.install()
+    try:
+        await asyncio.create_task(blocking_call(), name="blocker")
+        await asyncio.sleep(0)
+    finally:
+        detector.uninstall()
+
+    assert detector.slow_total >= 1
+    event = detector.events[-1]
+    assert "blocker" in event["callback"] and "blocking_call" in event["callback"]
+    assert event["duration_ms"] >= 50
+    assert registry.histogram("lynx_loop_slow_callback_seconds").count >= 1
+    assert not detector.installed
+
+
+class TestProfileEndpoint:
+    """Test /debug/profile access control."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        from lynx.api import dashboard
+        monkeypatch.setattr(Config, "PROFILER_ENABLED", True)
+        monkeypatch.setattr(Config, "PROFILER_TOKEN", "secret")
+        return TestClient(dashboard.app)
+
+    def test_disabled_profiler_is_hidden(self, client, monkeypatch):
+        """Test that the endpoint 404s unless profiling is enabled."""
+        monkeypatch.setattr(Config, "PROFILER_ENABLED", False)
+        assert client.get("/debug/profile").status_code == 404
+
+    def test_wrong_token_is_rejected(self, client):
+        """Test that a missing or wrong token is refused."""
+        assert client.get("/debug/profile").status_code == 403
+        assert client.get("/debug/profile", headers={"X-Lynx-Profiler-Token": "nope"}).status_code == 403
+
+    def test_capture_returns_requested_format(self, client):
+        """Test collapsed and speedscope responses."""
+        headers = {"X-Lynx-Profiler-Token": "secret"}
+
+        collapsed = client.get("/debug/profile?seconds=0.1", headers=headers)
+        assert collapsed.status_code == 200
+        assert collapsed.headers["content-type"].startswith("text/plain")
+
+        speedscope = client.get("/debug/profile?seconds=0.1&format=speedscope", headers=headers)
+        assert speedscope.status_code == 200
+        assert speedscope.json()["profiles"]
@@ -0,0 +1,235 @@
+"""
+Run Summary Unit Tests
+
+Tests the per-run audit summaries (lynx_run_summaries): counters, max risk,
+tools and durations folded in as audit events are logged (one RPC per
+event), handler durations measured by the executor, and the audit list API
+and audit.domain.run.read serving summaries instead of aggregating
+audit_logs (against a fake Supabase client).
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from lynx.api import audit_routes
+from lynx.api.auth import get_current_session
+from lynx.core.registry import MCPTool
+from lynx.core.registry.executor import execute_tool
+from lynx.core.audit.logger import AuditLogger
+from lynx.mcp.domain.audit import run_read
+from lynx.mcp.domain.audit.run_read import AuditRunInput, audit_run_read_handler
+from tests.utils.fake_supabase import FakeSupabase
+
+RISK_RANK = {"low": 1, "medium": 2, "high": 3}
+
+
+def _record_run_event(client: FakeSupabase, params):
+    """Python stand-in for the lynx_record_run_event SQL function."""
+    summaries = client.table("lynx_run_summaries").rows
+    summary = next((row for row in summaries if row["run_id"] == params["p_run_id"]), None)
+    if summary is None:
+        summary = {
+            "run_id": params["p_run_id"], "tenant_id": params["p_tenant_id"], "user_id": params["p_user_id"],
+            "status": None, "tool_count": 0, "success_count": 0, "failure_count": 0, "refusal_count": 0,
+            "user_query": None, "lynx_response": None, "max_risk": None, "tool_ids": [], "total_duration_ms": 0,
+            "first_event_at": params["p_at"], "last_event_at": params["p_at"], "completed_at": None,
+        }
+        summaries.append(summary)
+    summary["tool_count"] += params["p_tool_calls"]
+    summary["success_count"] += params["p_successes"]
+    summary["failure_count"] += params["p_failures"]
+    summary["refusal_count"] += params["p_refusals"]
+    summary["total_duration_ms"] += params["p_duration_ms"] or 0
+    if params["p_risk"] and RISK_RANK[params["p_risk"]] > RISK_RANK.get(summary["max_risk"], 0):
+        summary["max_risk"] = params["p_risk"]
+    if params["p_tool_id"] and params["p_tool_id"] not in summary["tool_ids"]:
+        summary["tool_ids"].append(params["p_tool_id"])
+    summary["first_event_at"] = min(summary["first_event_at"], params["p_at"])
+    summary["last_event_at"] = max(summary["last_event_at"], params["p_at"])
+    if params["p_status"]:
+        summary["status"] = params["p_status"]
+        summary["completed_at"] = params["p_at"]
+    for column in ("user_query", "lynx_response"):
+        if params.get(f"p_{column}") is not None:
+            summary[column] = params[f"p_{column}"]
+
+
+class _Input(BaseModel):
+    query: str
+
+
+class _Output(BaseModel):
+    result: str
+
+
+async def _ok(input_data, context):
+    return {"result": input_data.query}
+
+
+async def _fail(input_data, context):
+    raise RuntimeError("boom")
+
+
+def _tool(tool_id: str, risk: str, handler=_ok) -> MCPTool:
+    return MCPTool(
+        id=tool_id, name=tool_id, description=tool_id, layer="domain", risk=risk, domain="test",
+        input_schema=_Input, output_schema=_Output, handler=handler,
+    )
+
+
+@pytest.fixture
+def supabase():
+    return FakeSupabase(functions={"lynx_record_run_event": _record_run_event})
+
+
+@pytest.fixture
+def audit_logger(supabase):
+    audit_logger = AuditLogger.__new__(AuditLogger)
+    audit_logger.supabase = supabase
+    return audit_logger
+
+
+@pytest.mark.asyncio
+async def test_audit_events_fold_into_run_summary(audit_logger, supabase, context_t1):
+    """Test counters, max risk, tools, durations and completion (one RPC per event)."""
+    read, payment, approve = _tool("a.read", "low"), _tool("b.pay", "high"), _tool("c.approve", "medium")
+
+    await audit_logger.log_execution_start(context_t1, read, {"query": "x"})
+    await audit_logger.log_execution_success(context_t1, read, {"result": "x"}, duration_ms=30)
+    await audit_logger.log_execution_start(context_t1, payment, {"query": "y"})
+    await audit_logger.log_execution_failure(context_t1, payment, "boom", duration_ms=12)
+    await audit_logger.log_refusal(context_t1, approve, "not allowed")
+    await audit_logger.log_execution_warning(context_t1, read, "slow")  # not a call of its own
+    await audit_logger.log_lynx_run(
+        context_t1.lynx_run_id, context_t1.user_id, context_t1.tenant_id, "q", "r", status="failed",
+    )
+
+    assert supabase.rpc_calls == ["lynx_record_run_event"] * 6
+    [summary] = supabase.table("lynx_run_summaries").rows
+    assert summary["tenant_id"] == context_t1.tenant_id
+    assert (summary["tool_count"], summary["success_count"], summary["failure_count"], summary["refusal_count"]) == (3, 1, 1, 1)
+    assert summary["max_risk"] == "high"
+    assert summary["tool_ids"] == ["a.read", "b.pay", "c.approve"]
+    assert summary["total_duration_ms"] == 42
+    assert summary["status"] == "failed"
+    assert summary["completed_at"] == summary["last_event_at"]
+    assert [row.get("duration_ms") for row in supabase.table("audit_logs").rows] == [None, 30, None, 12, None, None]
+
+
+@pytest.mark.asyncio
+async def test_executor_records_handler_durations(audit_logger, supabase, context_t1, tool_registry, permission_checker):
+    """Test that execute_tool passes measured handler durations on success and failure."""
+    tool_registry.register(_tool("a.read", "low"))
+    tool_registry.register(_tool("b.fail", "low", handler=_fail))
+
+    await execute_tool("a.read", {"query": "x"}, context_t1, tool_registry, permission_checker, audit_logger)
+    with pytest.raises(Exception):
+        await execute_tool("b.fail", {"query": "x"}, context_t1, tool_registry, permission_checker, audit_logger)
+
+    finished = [row for row in supabase.table("audit_logs").rows if "duration_ms" in row]
+    assert len(finished) == 2
+    assert all(isinstance(row["duration_ms"], int) and row["duration_ms"] >= 0 for row in finished)
+    [summary] = supabase.table("lynx_run_summaries").rows
+    assert (summary["tool_count"], summary["success_count"], summary["failure_count"]) == (2, 1, 1)
+
+
+@pytest.fixture
+def api(supabase, monkeypatch):
+    """Summaries of three runs: run-0/run-1 finished, run-2 still in progress."""
+    for i in range(3):
+        supabase.table("audit_logs").rows.append({
+            "audit_id": f"audit-{i}", "run_id": f"run-{i}", "tool_id": "a.read", "tenant_id": "tenant-1",
+            "approved": True, "refused": False, "duration_ms": 5, "timestamp": f"2026-03-0{i + 1}T10:00:01",
+        })
+        _record_run_event(supabase, {
+            "p_run_id": f"run-{i}", "p_tenant_id": "tenant-1", "p_user_id": f"user-{i % 2}",
+            "p_at": f"2026-03-0{i + 1}T10:00:01", "p_tool_id": "a.read", "p_risk": "low",
+            "p_tool_calls": 1, "p_successes": 1, "p_failures": 0, "p_refusals": 0,
+            "p_duration_ms": 5, "p_status": None,
+        })
+    for i in range(2):
+        supabase.table("lynx_runs").rows.append({"run_id": f"run-{i}", "tenant_id": "tenant-1"})
+        _record_run_event(supabase, {
+            "p_run_id": f"run-{i}", "p_tenant_id": "tenant-1", "p_user_id": f"user-{i % 2}",
+            "p_at": f"2026-03-0{i + 1}T10:00:02", "p_tool_id": None, "p_risk": None,
+            "p_tool_calls": 0, "p_successes": 0, "p_failures": 0, "p_refusals": 0,
+            "p_duration_ms": 0, "p_status": "completed",
+            "p_user_query": f"query {i}", "p_lynx_response": f"response {i}",
+        })
+    monkeypatch.setattr(audit_routes, "get_supabase_client", lambda: supabase)
+    monkeypatch.setattr(audit_routes, "get_audit_archive", lambda: None)
+    app = FastAPI()
+    app.include_router(audit_routes.router)
+    app.dependency_overrides[get_current_session] = lambda: {"tenant_id": "tenant-1", "user_id": "user-1"}
+    return TestClient(app)
+
+
+def test_audit_list_is_one_summaries_read(api, supabase):
+    """Test that a list page (rows + total) is served by one lynx_run_summaries read."""
+    body = api.get("/api/audit/runs").json()
+
+    assert supabase.table("lynx_run_summaries").calls == ["select"]
+    assert supabase.table("lynx_runs").calls == []
+    assert supabase.table("audit_logs").calls == []
+    assert body["total"] == 3
+    assert [r["run_id"] for r in body["runs"]] == ["run-2", "run-1", "run-0"]
+    assert (body["runs"][1]["query"], body["runs"][1]["response"]) == ("query 1", "response 1")
+    assert body["runs"][1]["summary"]["tool_count"] == 1
+    assert body["runs"][1]["summary"]["total_duration_ms"] == 5
+    assert body["runs"][1]["created_at"].startswith("2026-03-02T10:00:01")
+    assert body["runs"][1]["completed_at"].startswith("2026-03-02T10:00:02")
+    assert body["runs"][0]["query"] == "" and body["runs"][0]["completed_at"] is None  # In progress
+    assert all(r["tool_calls"] == [] for r in body["runs"])
+
+
+def test_audit_list_filters_and_pages(api, supabase):
+    """Test offset pagination, user and date filters, and opt-in tool calls (one extra read)."""
+    body = api.get("/api/audit/runs", params={"limit": 2, "offset": 2}).json()
+    assert (body["total"], [r["run_id"] for r in body["runs"]]) == (3, ["run-0"])
+
+    body = api.get("/api/audit/runs", params={"user_id": "user-0"}).json()
+    assert [r["run_id"] for r in body["runs"]] == ["run-2", "run-0"]
+
+    body = api.get("/api/audit/runs", params={"from_date": "2026-03-02", "to_date": "2026-03-02T23:59:59"}).json()
+    assert [r["run_id"] for r in body["runs"]] == ["run-1"]
+
+    body = api.get("/api/audit/runs", params={"include_tool_calls": "true"}).json()
+    assert supabase.table("audit_logs").calls == ["select"]
+    assert [[tc["duration_ms"] for tc in r["tool_calls"]] for r in body["runs"]] == [[5], [5], [5]]
+
+
+@pytest.mark.asyncio
+async def test_run_read_tool_serves_summaries(audit_logger, supabase, context_t1, monkeypatch):
+    """Test audit.domain.run.read filters and maps summaries (tenant-scoped)."""
+    for i, (tool_id, failures) in enumerate([("a.read", 0), ("b.pay", 1), ("a.read", 0)]):
+        _record_run_event(supabase, {
+            "p_run_id": f"run-{i}", "p_tenant_id": context_t1.tenant_id, "p_user_id": "user-1",
+            "p_at": f"2026-03-0{i + 1}T10:00:00", "p_tool_id": tool_id, "p_risk": "medium",
+            "p_tool_calls": 1, "p_successes": 1 - failures, "p_failures": failures, "p_refusals": 0,
+            "p_duration_ms": 7, "p_status": "completed" if i < 2 else None,
+        })
+    _record_run_event(supabase, {
+        "p_run_id": "run-other", "p_tenant_id": "tenant-other", "p_user_id": "user-2",
+        "p_at": "2026-03-05T10:00:00", "p_tool_id": "a.read", "p_risk": "low",
+        "p_tool_calls": 1, "p_successes": 1, "p_failures": 0, "p_refusals": 0,
+        "p_duration_ms": 1, "p_status": None,
+    })
+    monkeypatch.setattr(run_read, "get_audit_logger", lambda: audit_logger)
+
+    output = await audit_run_read_handler(AuditRunInput(limit=10, tool_id="a.read"), context_t1)
+
+    assert output.total_count == 2
+    assert [(r.run_id, r.status, r.outcome) for r in output.runs] == [
+        ("run-2", "in_progress", "completed"), ("run-0", "completed", "completed"),
+    ]
+    assert output.runs[0].duration_ms == 7
+    assert output.runs[0].max_risk == "medium"
+
+    output = await audit_run_read_handler(AuditRunInput(status="completed", since="2026-03-02"), context_t1)
+    assert [(r.run_id, r.outcome, r.tool_id) for r in output.runs] == [("run-1", "failed", "b.pay")]
+
+    monkeypatch.setattr(run_read, "get_audit_logger", lambda: None)
+    output = await audit_run_read_handler(AuditRunInput(), context_t1)
+    assert output.runs == [] and output.total_count == 0
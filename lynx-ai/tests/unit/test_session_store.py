@@ -0,0 +1,104 @@
+"""
+Session Store Unit Tests
+
+Tests expiry sweeping, LRU eviction and session metrics.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from lynx.core.session import SessionManager, Session
+
+
+def _create(manager: SessionManager, user_id: str = "user-1") -> Session:
+    return manager.create_session(
+        user_id=user_id,
+        tenant_id="tenant-t1",
+        user_role="admin",
+        user_scope=["read"],
+    )
+
+
+class TestSessionSlots:
+    """Test that sessions are slotted objects."""
+
+    def test_session_has_no_instance_dict(self):
+        """Test that Session uses __slots__."""
+        session = _create(SessionManager())
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unexpected_attribute = True
+
+
+class TestExpirySweep:
+    """Test that expired sessions are swept without a lookup."""
+
+    def test_sweep_removes_only_expired_sessions(self):
+        """Test that sweep removes expired sessions and keeps live ones."""
+        manager = SessionManager(session_timeout_hours=1)
+        expired = [_create(manager, f"user-{i}") for i in range(3)]
+        live = _create(manager, "user-live")
+
+        for session in expired:
+            session.expires_at = datetime.now() - timedelta(seconds=1)
+            manager._push_expiry(session)
+
+        removed = manager.sweep_expired()
+
+        assert removed == 3
+        assert list(manager.sessions) == [live.session_id]
+        assert manager.metrics()["expired_total"] == 3
+
+    def test_sweep_skips_sessions_already_removed(self):
+        """Test that stale index entries are ignored."""
+        manager = SessionManager(session_timeout_hours=1)
+        session = _create(manager)
+        manager.remove_session(session.session_id)
+
+        removed = manager.sweep_expired(now=datetime.now() + timedelta(hours=2))
+
+        assert removed == 0
+        assert manager.metrics()["expired_total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_background_sweeper_runs(self):
+        """Test that the sweeper task evicts expired sessions."""
+        manager = SessionManager(session_timeout_hours=1)
+        session = _create(manager)
+        session.expires_at = datetime.now() - timedelta(seconds=1)
+        manager._push_expiry(session)
+
+        task = asyncio.create_task(manager.run_sweeper(interval_seconds=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+
+        assert len(manager.sessions) == 0
+
+
+class TestLRUEviction:
+    """Test that the store is bounded."""
+
+    def test_least_recently_used_session_is_evicted(self):
+        """Test LRU eviction when max_sessions is exceeded."""
+        manager = SessionManager(max_sessions=2)
+        first = _create(manager, "user-1")
+        second = _create(manager, "user-2")
+
+        # Touch first so second becomes least recently used
+        assert manager.get_session(first.session_id) is not None
+
+        third = _create(manager, "user-3")
+
+        assert set(manager.sessions) == {first.session_id, third.session_id}
+        assert manager.get_session(second.session_id) is None
+        assert manager.metrics()["evicted_total"] == 1
+
+    def test_expiry_index_stays_bounded(self):
+        """Test that evicted sessions do not grow the expiry index forever."""
+        manager = SessionManager(max_sessions=10)
+        for i in range(1000):
+            _create(manager, f"user-{i}")
+
+        assert len(manager.sessions) == 10
+        assert len(manager._expiry_heap) <= 2 * 10 + 64 + 1
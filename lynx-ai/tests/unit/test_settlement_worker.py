@@ -0,0 +1,186 @@
+"""
+Settlement Worker Unit Tests
+
+Tests claiming with leases, provider dispatch, retries with exponential
+backoff, bounded concurrency and throughput metrics.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.observability.metrics import MetricsRegistry
+from lynx.runtime.settlement_worker import (
+    FakeSettlementProvider,
+    SettlementProvider,
+    SettlementWorker,
+)
+from lynx.storage.settlement_storage import (
+    SettlementIntent,
+    SettlementIntentStorage,
+    SettlementIntentStorageSupabase,
+)
+from tests.utils.fake_supabase import FakeSupabase
+
+
+async def _seed(storage: SettlementIntentStorage, count: int, provider: str = "none"):
+    for i in range(count):
+        await storage.create_intent(SettlementIntent(
+            payment_id=f"payment-{provider}-{i}",
+            tenant_id=f"tenant-{i % 2}",
+            provider=provider,
+            created_at=datetime.now().isoformat(),
+        ))
+
+
+def _make_due(storage: SettlementIntentStorage) -> None:
+    for intent in storage.intents.values():
+        intent.next_attempt_at = (datetime.now() - timedelta(seconds=1)).isoformat()
+
+
+class FailingProvider(SettlementProvider):
+    name = "none"
+
+    async def settle(self, intent):
+        raise ConnectionError("bank unreachable")
+
+
+@pytest.mark.asyncio
+async def test_worker_settles_claimed_intents():
+    """Test that due intents of registered providers are completed."""
+    storage = SettlementIntentStorage()
+    await _seed(storage, 3)
+    await _seed(storage, 1, provider="manual")  # no provider registered: left alone
+    registry = MetricsRegistry()
+    worker = SettlementWorker(storage=storage, worker_id="w1", metrics_registry=registry)
+
+    assert await worker.run_once() == 3
+    assert await worker.run_once() == 0
+
+    settled = [storage.intents[f"payment-none-{i}"] for i in range(3)]
+    assert all(i.settlement_status == "completed" and i.locked_by is None for i in settled)
+    assert settled[0].metadata["settlement_reference"] == "fake-payment-none-0"
+    assert storage.intents["payment-manual-0"].settlement_status == "queued"
+    assert worker.metrics()["completed_total"] == 3
+    assert 'lynx_settlement_intents_total{outcome="completed",provider="none"} 3.0' in registry.render_prometheus()
+
+
+@pytest.mark.asyncio
+async def test_failures_retry_with_backoff_then_fail():
+    """Test re-queueing with a future next_attempt_at until max_attempts."""
+    storage = SettlementIntentStorage()
+    await _seed(storage, 1)
+    worker = SettlementWorker(
+        storage=storage, providers={"none": FailingProvider()}, max_attempts=3, backoff_base=60,
+    )
+    intent = storage.intents["payment-none-0"]
+
+    await worker.run_once()
+    assert (intent.settlement_status, intent.attempts) == ("queued", 1)
+    assert intent.last_error == "bank unreachable"
+    assert datetime.fromisoformat(intent.next_attempt_at) > datetime.now() + timedelta(seconds=29)
+    assert await worker.run_once() == 0  # not due yet
+
+    for _ in range(2):
+        _make_due(storage)
+        await worker.run_once()
+
+    assert (intent.settlement_status, intent.attempts) == ("failed", 3)
+    assert worker.metrics()["retried_total"] == 2
+    assert worker.metrics()["failed_total"] == 1
+
+
+def test_backoff_is_exponential_and_capped():
+    """Test delays double per attempt, stay within jitter bounds and the cap."""
+    worker = SettlementWorker(storage=SettlementIntentStorage(), backoff_base=2, backoff_max=30)
+    for attempts, delay in [(1, 2), (2, 4), (3, 8), (10, 30)]:
+        assert delay / 2 <= worker.backoff_seconds(attempts) <= delay
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed_and_old_worker_loses_it():
+    """Test lease takeover after a crashed or slow worker."""
+    storage = SettlementIntentStorage()
+    await _seed(storage, 1)
+
+    (first,) = await storage.claim_intents("w1", ["none"], batch_size=10, lease_seconds=60)
+    assert await storage.claim_intents("w2", ["none"], batch_size=10, lease_seconds=60) == []
+
+    storage.intents[first.payment_id].locked_until = (datetime.now() - timedelta(seconds=1)).isoformat()
+    (second,) = await storage.claim_intents("w2", ["none"], batch_size=10, lease_seconds=60)
+    assert second.attempts == 2
+
+    assert await storage.release_intent(first.payment_id, first.tenant_id, "w1", "completed") is None
+    released = await storage.release_intent(second.payment_id, second.tenant_id, "w2", "completed")
+    assert released.settlement_status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """Test that no more than `concurrency` provider calls run at once."""
+    storage = SettlementIntentStorage()
+    await _seed(storage, 8)
+    provider = FakeSettlementProvider(latency=0.01)
+    active = peak = 0
+    settle = provider.settle
+
+    async def tracking_settle(intent):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            return await settle(intent)
+        finally:
+            active -= 1
+
+    provider.settle = tracking_settle
+    worker = SettlementWorker(storage=storage, providers={"none": provider}, concurrency=3)
+
+    assert await worker.run_once() == 8
+    assert peak == 3
+    assert provider.calls == 8
+
+
+@pytest.mark.asyncio
+async def test_run_polls_until_cancelled():
+    """Test the background loop drains the queue and stops on cancel."""
+    storage = SettlementIntentStorage()
+    await _seed(storage, 5)
+    worker = SettlementWorker(storage=storage, batch_size=2, poll_interval=0.01)
+
+    task = asyncio.create_task(worker.run())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await task
+
+    assert all(i.settlement_status == "completed" for i in storage.intents.values())
+    assert worker.metrics()["completed_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_supabase_claim_is_one_rpc_and_release_checks_lease():
+    """Test the Supabase claim RPC parameters and the lease-conditional release."""
+    claims = []
+
+    def claim(client, params):
+        claims.append(params)
+        rows = [r for r in client.table("settlement_intents").rows if r["settlement_status"] == "queued"]
+        for row in rows[:params["p_batch_size"]]:
+            row.update(settlement_status="processing", locked_by=params["p_worker_id"], attempts=row["attempts"] + 1)
+        return rows[:params["p_batch_size"]]
+
+    client = FakeSupabase(functions={"lynx_claim_settlement_intents": claim})
+    storage = SettlementIntentStorageSupabase(supabase_client=client)
+    await _seed(storage, 2)
+    worker = SettlementWorker(storage=storage, worker_id="w1", batch_size=10)
+
+    assert await worker.run_once() == 2
+
+    assert client.rpc_calls == ["lynx_claim_settlement_intents"]
+    assert claims[0] == {"p_worker_id": "w1", "p_providers": ["none"], "p_batch_size": 10, "p_lease_seconds": 300}
+    rows = client.table("settlement_intents").rows
+    assert [r["settlement_status"] for r in rows] == ["completed", "completed"]
+    assert rows[0]["locked_by"] is None
+    assert await storage.release_intent(rows[0]["payment_id"], rows[0]["tenant_id"], "w1", "failed") is None
@@ -0,0 +1,245 @@
+"""
+SQLite Storage Unit Tests
+
+Tests the embedded SQLite backend: durability across reopen, idempotency,
+compare-and-set transitions, exactly-once executions, settlement leases,
+the atomic Cell execution unit and backend selection.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import lynx.core.registry  # noqa: F401 - import order for lynx.core.audit
+from lynx.core.session import ExecutionContext
+from lynx.mcp.cluster.drafts.models import DraftProtocol, DraftStatus  # before lynx.storage
+from lynx.mcp.cell.execution import base as execution_base
+from lynx.mcp.cell.execution.models import ExecutionStatus
+from lynx.storage import cell_execution_unit, draft_storage, execution_storage, settlement_storage
+from lynx.storage.cell_execution_unit import CellExecutionUnitSQLite
+from lynx.storage.draft_storage import DraftStatusConflictError, DraftStorage, DraftStorageSQLite
+from lynx.storage.execution_storage import ExecutionStorageSQLite
+from lynx.storage.settlement_storage import SettlementIntent, SettlementIntentStorageSQLite
+from lynx.storage.sqlite import SQLiteDatabase
+
+TOOL_ID = "vpm.cell.payment.execute"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "lynx.db")
+
+
+@pytest.fixture
+def database(db_path):
+    database = SQLiteDatabase(db_path)
+    yield database
+    database.close()
+
+
+def _draft(status=DraftStatus.DRAFT, request_id=None, draft_type="payment", tenant_id="tenant-1") -> DraftProtocol:
+    return DraftProtocol(
+        draft_id=str(uuid.uuid4()),
+        tenant_id=tenant_id,
+        draft_type=draft_type,
+        payload={"amount": 1200, "currency": "EUR"},
+        status=status,
+        risk_level="high",
+        created_by="user-1",
+        created_at=datetime.now(timezone.utc).isoformat(),
+        source_context={"session_id": "session-1"},
+        recommended_approvers=["finance"],
+        request_id=request_id,
+    )
+
+
+def _execution(draft: DraftProtocol, request_id=None, status=ExecutionStatus.SUCCEEDED):
+    return execution_base.build_execution_record(
+        draft_id=draft.draft_id,
+        tool_id=TOOL_ID,
+        context=ExecutionContext(
+            user_id="user-1",
+            tenant_id=draft.tenant_id,
+            user_role="admin",
+            user_scope=[],
+            session_id="session-1",
+        ),
+        status=status,
+        result_payload={"payment_id": f"payment-{draft.draft_id[:8]}"},
+        request_id=request_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_drafts_survive_reopen_and_are_tenant_scoped(db_path):
+    """Test that stored drafts are read back after the database is reopened."""
+    database = SQLiteDatabase(db_path)
+    draft = await DraftStorageSQLite(database).create_draft(_draft())
+    database.close()
+
+    reopened = SQLiteDatabase(db_path)
+    storage = DraftStorageSQLite(reopened)
+    try:
+        assert await storage.get_draft(draft.draft_id, "tenant-1") == draft
+        assert await storage.get_draft(draft.draft_id, "tenant-2") is None
+        assert [d.draft_id for d in await storage.list_drafts("tenant-1", status=DraftStatus.DRAFT)] == [draft.draft_id]
+        assert reopened._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_create_draft_is_idempotent(database):
+    """Test request_id retries, including within one bulk create."""
+    storage = DraftStorageSQLite(database)
+    first = await storage.create_draft(_draft(request_id="req-1"))
+
+    assert (await storage.create_draft(_draft(request_id="req-1"))).draft_id == first.draft_id
+    with pytest.raises(ValueError, match="another type"):
+        await storage.create_draft(_draft(request_id="req-1", draft_type="docs"))
+
+    bulk = await storage.create_drafts_bulk([_draft(request_id="req-1"), _draft(request_id="req-2"), _draft(request_id="req-2")])
+    assert bulk[0].draft_id == first.draft_id
+    assert bulk[1].draft_id == bulk[2].draft_id
+    assert len(await storage.list_drafts("tenant-1")) == 2
+
+
+@pytest.mark.asyncio
+async def test_status_updates_compare_and_set(database):
+    """Test single and bulk transitions against the expected status."""
+    storage = DraftStorageSQLite(database)
+    draft = await storage.create_draft(_draft())
+    other = await storage.create_draft(_draft(status=DraftStatus.REJECTED))
+
+    updated = await storage.update_draft_status(draft.draft_id, "tenant-1", DraftStatus.APPROVED, DraftStatus.DRAFT)
+    assert updated.status == DraftStatus.APPROVED
+    with pytest.raises(DraftStatusConflictError) as exc_info:
+        await storage.update_draft_status(draft.draft_id, "tenant-1", DraftStatus.APPROVED, DraftStatus.DRAFT)
+    assert exc_info.value.current_status == DraftStatus.APPROVED
+    assert await storage.update_draft_status("missing", "tenant-1", DraftStatus.APPROVED, DraftStatus.DRAFT) is None
+
+    results = await storage.transition_drafts_bulk(
+        "tenant-1", [draft.draft_id, other.draft_id, "missing"], DraftStatus.APPROVED, DraftStatus.PUBLISHED,
+    )
+    assert [r.outcome for r in results] == ["updated", "conflict", "not_found"]
+    assert (await storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.PUBLISHED
+    assert (await storage.get_draft(other.draft_id, "tenant-1")).status == DraftStatus.REJECTED
+
+
+@pytest.mark.asyncio
+async def test_executions_are_idempotent_and_exactly_once(database):
+    """Test request_id retries, the succeeded-execution index and draft lookup."""
+    drafts = DraftStorageSQLite(database)
+    executions = ExecutionStorageSQLite(database)
+    draft = await drafts.create_draft(_draft(status=DraftStatus.APPROVED))
+
+    failed = await executions.create_execution(_execution(draft, status=ExecutionStatus.FAILED))
+    first = await executions.create_execution(_execution(draft, request_id="req-1"))
+    assert (await executions.create_execution(_execution(draft, request_id="req-1"))).execution_id == first.execution_id
+    assert (await executions.create_execution(_execution(draft))).execution_id == first.execution_id
+
+    assert await drafts.get_draft_for_execution(draft.draft_id, "tenant-1", TOOL_ID) == (draft, first.execution_id)
+    listed = await executions.list_executions("tenant-1", draft_id=draft.draft_id, status=ExecutionStatus.SUCCEEDED)
+    assert [e.execution_id for e in listed] == [first.execution_id]
+
+    updated = await executions.update_execution_status(
+        failed.execution_id, ExecutionStatus.FAILED, result_payload={"retry": True}, error_message="timeout",
+    )
+    assert updated.result_payload == {**failed.result_payload, "retry": True}
+    assert updated.error_message == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_settlement_claims_do_not_overlap(database):
+    """Test that concurrent claims split the queue and releases check the lease."""
+    storage = SettlementIntentStorageSQLite(database)
+    for i in range(6):
+        await storage.create_intent(SettlementIntent(payment_id=f"payment-{i}", tenant_id="tenant-1"))
+
+    first, second = await asyncio.gather(
+        storage.claim_intents("w1", ["none"], batch_size=4, lease_seconds=60),
+        storage.claim_intents("w2", ["none"], batch_size=4, lease_seconds=60),
+    )
+    assert len(first) + len(second) == 6
+    assert not {i.payment_id for i in first} & {i.payment_id for i in second}
+    assert all(i.attempts == 1 and i.settlement_status == "processing" for i in first + second)
+
+    intent = first[0]
+    assert await storage.release_intent(intent.payment_id, "tenant-1", "w2", "completed") is None
+    retry_at = (datetime.now() + timedelta(minutes=5)).isoformat()
+    released = await storage.release_intent(
+        intent.payment_id, "tenant-1", "w1", "queued", last_error="bank unreachable", next_attempt_at=retry_at,
+    )
+    assert (released.settlement_status, released.locked_by, released.next_attempt_at) == ("queued", None, retry_at)
+    assert await storage.claim_intents("w1", ["none"], batch_size=10, lease_seconds=60) == []
+
+
+@pytest.mark.asyncio
+async def test_cell_unit_commits_all_or_nothing(database):
+    """Test that a commit writes draft, execution and intent, or none of them."""
+    unit = CellExecutionUnitSQLite(
+        DraftStorageSQLite(database), ExecutionStorageSQLite(database), SettlementIntentStorageSQLite(database),
+    )
+    draft = await unit.draft_storage.create_draft(_draft(status=DraftStatus.APPROVED))
+    intent = SettlementIntent(payment_id=f"payment-{draft.draft_id[:8]}", tenant_id="tenant-1")
+
+    # Duplicate payment_id: the draft transition and execution are rolled back
+    await unit.settlement_storage.create_intent(intent)
+    with pytest.raises(ValueError, match="already exists"):
+        await unit.commit(draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED, intent)
+    assert (await unit.draft_storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.APPROVED
+    assert await unit.execution_storage.list_executions("tenant-1") == []
+
+    intent = intent.model_copy(update={"payment_id": "payment-other"})
+    stored = await unit.commit(draft, _execution(draft, "req-1"), DraftStatus.APPROVED, DraftStatus.EXECUTED, intent)
+    assert (await unit.draft_storage.get_draft(draft.draft_id, "tenant-1")).status == DraftStatus.EXECUTED
+    assert await unit.settlement_storage.get_intent("payment-other", "tenant-1") is not None
+
+    retried = await unit.commit(draft, _execution(draft, "req-1"), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+    assert retried.execution_id == stored.execution_id
+    with pytest.raises(DraftStatusConflictError):
+        await unit.commit(draft, _execution(draft), DraftStatus.APPROVED, DraftStatus.EXECUTED)
+
+
+@pytest.fixture
+def reset_storages(monkeypatch):
+    for module, name in [
+        (draft_storage, "_draft_storage"),
+        (execution_storage, "_execution_storage"),
+        (settlement_storage, "_settlement_storage"),
+        (cell_execution_unit, "_cell_execution_unit"),
+    ]:
+        monkeypatch.setattr(module, name, None)
+
+
+def test_storage_backend_sqlite_selects_sqlite_everywhere(reset_storages, monkeypatch, database):
+    """Test LYNX_STORAGE_BACKEND=sqlite for all storages and the Cell unit."""
+    monkeypatch.setattr(draft_storage.Config, "STORAGE_BACKEND", "sqlite")
+    monkeypatch.setattr("lynx.storage.sqlite._sqlite_database", database)
+
+    assert draft_storage.get_draft_storage().backend == "sqlite"
+    assert execution_storage.get_execution_storage().backend == "sqlite"
+    assert settlement_storage.get_settlement_storage().backend == "sqlite"
+    assert isinstance(cell_execution_unit.get_cell_execution_unit(), CellExecutionUnitSQLite)
+
+
+def test_supabase_failure_fallback_is_logged(reset_storages, monkeypatch, caplog):
+    """Test that "auto" still falls back to memory, but no longer silently."""
+    monkeypatch.setattr(draft_storage.Config, "STORAGE_BACKEND", "auto")
+    monkeypatch.setattr(draft_storage.Config, "SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setattr(draft_storage.Config, "SUPABASE_KEY", "key")
+    monkeypatch.setattr(draft_storage, "SUPABASE_AVAILABLE", True)
+
+    def failing_init(self, supabase_client=None):
+        raise ValueError("invalid key")
+
+    monkeypatch.setattr(draft_storage.DraftStorageSupabase, "__init__", failing_init)
+
+    with caplog.at_level(logging.WARNING, logger="lynx.storage.draft_storage"):
+        storage = draft_storage.get_draft_storage()
+
+    assert type(storage) is DraftStorage
+    assert "invalid key" in caplog.text
@@ -0,0 +1,138 @@
+"""
+Tenant Snapshot Unit Tests
+
+Tests lazy loading, single-flight, TTL refresh, ExecutionContext wiring and
+the domain tools' mock-data fallback when the Kernel fails.
+"""
+
+import asyncio
+import pytest
+from lynx.core.session import SessionManager, TenantSnapshot
+from lynx.mcp.domain.tenant.profile_read import (
+    TenantProfileInput,
+    tenant_profile_read_handler,
+)
+from lynx.mcp.domain.workflow.status_read import (
+    WorkflowStatusInput,
+    workflow_status_read_handler,
+)
+
+
+class CountingKernel:
+    """Kernel client double that counts calls."""
+
+    calls = 0
+
+    def __init__(self, tenant_id: str):
+        self.tenant_id = tenant_id
+
+    async def get_tenant_customizations(self):
+        CountingKernel.calls += 1
+        await asyncio.sleep(0.01)
+        return {"name": f"Tenant {self.tenant_id}", "plan": "enterprise"}
+
+    async def get_metadata(self, entity_type: str):
+        CountingKernel.calls += 1
+        await asyncio.sleep(0.01)
+        return {"entity_type": entity_type, "active_count": 3}
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountingKernel.calls = 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_access_is_single_flight():
+    """Test that concurrent callers share one Kernel request."""
+    snapshot = TenantSnapshot("tenant-t1", client_factory=CountingKernel)
+
+    results = await asyncio.gather(*[snapshot.get_tenant_customizations() for _ in range(10)])
+
+    assert CountingKernel.calls == 1
+    assert all(r["name"] == "Tenant tenant-t1" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_entries_refresh_after_ttl():
+    """Test that stale entries are reloaded."""
+    snapshot = TenantSnapshot("tenant-t1", ttl_seconds=0, client_factory=CountingKernel)
+
+    await snapshot.get_metadata("workflow")
+    await snapshot.get_metadata("workflow")
+
+    assert CountingKernel.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_execution_contexts_share_session_snapshot():
+    """Test that contexts from one session share Kernel data."""
+    manager = SessionManager()
+    session = manager.create_session(
+        user_id="user-1",
+        tenant_id="tenant-t1",
+        user_role="admin",
+        user_scope=["read"],
+    )
+    session.tenant_snapshot = TenantSnapshot("tenant-t1", client_factory=CountingKernel)
+
+    first = manager.create_execution_context(session)
+    second = manager.create_execution_context(session)
+
+    output = await tenant_profile_read_handler(TenantProfileInput(), first)
+    await tenant_profile_read_handler(TenantProfileInput(), second)
+
+    assert output.tenant_name == "Tenant tenant-t1"
+    assert output.plan == "enterprise"
+    assert CountingKernel.calls == 1
+    assert second.tenant_customizations["plan"] == "enterprise"
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached():
+    """Test that a Kernel error is raised and retried on next access."""
+    attempts = []
+
+    class FailingKernel(CountingKernel):
+        async def get_tenant_customizations(self):
+            attempts.append(1)
+            raise RuntimeError("Kernel unavailable")
+
+    snapshot = TenantSnapshot("tenant-t1", client_factory=FailingKernel)
+
+    with pytest.raises(RuntimeError):
+        await snapshot.get_tenant_customizations()
+    with pytest.raises(RuntimeError):
+        await snapshot.get_tenant_customizations()
+
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_domain_tools_fall_back_to_mock_data_when_snapshot_load_fails():
+    """Test that a Kernel error behind the snapshot does not reach the caller."""
+    class FailingKernel(CountingKernel):
+        async def get_tenant_customizations(self):
+            raise RuntimeError("Kernel unavailable")
+
+        async def get_metadata(self, entity_type: str):
+            raise RuntimeError("Kernel unavailable")
+
+    manager = SessionManager()
+    session = manager.create_session(
+        user_id="user-1",
+        tenant_id="tenant-t1",
+        user_role="admin",
+        user_scope=["read"],
+    )
+    session.tenant_snapshot = TenantSnapshot("tenant-t1", client_factory=FailingKernel)
+    context = manager.create_execution_context(session)
+
+    profile = await tenant_profile_read_handler(TenantProfileInput(), context)
+    status = await workflow_status_read_handler(WorkflowStatusInput(), context)
+
+    assert profile.tenant_name == "Test Tenant"
+    assert (status.active_workflows_count, status.pending_approvals_count) == (5, 2)
@@ -0,0 +1,129 @@
+"""
+Tracing Unit Tests
+
+Tests span nesting, exporters and execute_tool / storage instrumentation.
+"""
+
+import json
+import pytest
+from lynx.core.registry import execute_tool
+from lynx.observability import tracing
+from lynx.observability.tracing import (
+    InMemorySpanExporter,
+    JsonFileSpanExporter,
+    Tracer,
+    trace_methods,
+)
+
+
+@pytest.fixture
+def exporter():
+    """Install an in-memory exporter on the global tracer."""
+    exporter = InMemorySpanExporter()
+    previous = tracing._tracer
+    tracing._tracer = Tracer(exporter)
+    yield exporter
+    tracing._tracer = previous
+
+
+class TestTracer:
+    """Test span lifecycle and linkage."""
+
+    def test_child_spans_share_trace_and_link_to_parent(self):
+        """Test that nested spans inherit the trace ID and parent span ID."""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+
+        with tracer.span("chat.run", trace_id="run-1") as parent:
+            with tracer.span("tool.execute", tool_id="a.b.c") as child:
+                pass
+
+        assert child.trace_id == "run-1"
+        assert child.parent_id == parent.span_id
+        assert [s.name for s in exporter.get_spans(trace_id="run-1")] == ["tool.execute", "chat.run"]
+        assert child.attributes["tool_id"] == "a.b.c"
+        assert child.duration_ms is not None
+        assert tracer.current_span() is None
+
+    def test_error_is_recorded_and_reraised(self):
+        """Test that exceptions mark the span as failed."""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+
+        with pytest.raises(RuntimeError):
+            with tracer.span("kernel.http"):
+                raise RuntimeError("boom")
+
+        span = exporter.get_spans(name="kernel.http")[0]
+        assert span.status == "error"
+        assert span.error == "RuntimeError: boom"
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that the default tracer is a no-op."""
+        tracer = Tracer()
+
+        with tracer.span("tool.execute") as span:
+            span.set_attribute("ignored", True)
+
+        assert not tracer.enabled
+        assert tracer.current_span() is None
+
+    def test_json_file_exporter_writes_lines(self, tmp_path):
+        """Test that the JSON exporter appends one span per line."""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(JsonFileSpanExporter(str(path)))
+
+        with tracer.span("chat.run", trace_id="run-2"):
+            with tracer.span("tool.handler"):
+                pass
+        tracer.exporter.shutdown()
+
+        spans = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [s["name"] for s in spans] == ["tool.handler", "chat.run"]
+        assert spans[0]["parent_id"] == spans[1]["span_id"]
+
+
+@pytest.mark.asyncio
+async def test_trace_methods_records_backend_and_tenant(exporter):
+    """Test that decorated storage methods produce spans with tenant_id."""
+
+    @trace_methods("storage.test")
+    class Storage:
+        async def get_item(self, item_id: str, tenant_id: str):
+            return item_id
+
+        async def _private(self):
+            return None
+
+    assert await Storage().get_item("x", "tenant-1") == "x"
+    await Storage()._private()
+
+    spans = exporter.get_spans()
+    assert [s.name for s in spans] == ["storage.test.get_item"]
+    assert spans[0].attributes == {"backend": "Storage", "tenant_id": "tenant-1"}
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_spans_are_keyed_by_run_id(
+    exporter,
+    registered_tool,
+    tool_registry,
+    context_t1,
+    permission_checker,
+    mock_audit_logger,
+):
+    """Test that execute_tool records tool.execute and tool.handler under lynx_run_id."""
+    await execute_tool(
+        tool_id=registered_tool.id,
+        input_data={"query": "q", "tenant_id": context_t1.tenant_id},
+        context=context_t1,
+        registry=tool_registry,
+        permission_checker=permission_checker,
+        audit_logger=mock_audit_logger,
+    )
+
+    spans = {s.name: s for s in exporter.get_spans(trace_id=context_t1.lynx_run_id)}
+    assert spans["tool.handler"].parent_id == spans["tool.execute"].span_id
+    assert spans["tool.execute"].attributes["tool_id"] == registered_tool.id
+    assert spans["tool.execute"].attributes["tenant_id"] == context_t1.tenant_id
+    assert spans["tool.execute"].status == "ok"
@@ -0,0 +1,266 @@
+"""
+In-memory stand-in for the supabase-py client.
+
+Implements the subset of the PostgREST query builder used by Lynx storage
+(select/insert/upsert/update/delete with eq/in_/lt/lte/gte/contains/or_/order/limit/range/single,
+exact counts, column projections and embedded child tables such as
+"*, lynx_executions(execution_id)") plus rpc() calls to
+Python stand-ins for SQL functions, and records every executed statement, so
+tests can assert round trips per operation.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class FakeResult:
+    """Query result (mirrors postgrest APIResponse.data)."""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """One query being built against a FakeTable."""
+
+    def __init__(self, table: "FakeTable", op: str, payload: Any = None, **options: Any):
+        self.table = table
+        self.op = op
+        self.payload = payload
+        self.options = options
+        self.filters: List[Tuple[str, Callable[[Any], bool]]] = []
+        self.embeds: List[str] = re.findall(r"(\w+)\(", payload) if op == "select" else []
+        self.columns: List[str] = [
+            column.strip() for column in re.sub(r"\w+\([^)]*\)", "", payload).split(",") if column.strip()
+        ] if op == "select" else []
+        self.embed_limits: Dict[str, int] = {}
+        self.row_filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.order_by: List[Tuple[str, bool]] = []
+        self.max_rows: Optional[int] = None
+        self.first_row = 0
+        self.single_row = False
+
+    def eq(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, lambda v: v == value))
+        return self
+
+    def in_(self, column: str, values: Sequence[Any]) -> "FakeQuery":
+        allowed = list(values)
+        self.filters.append((column, lambda v: v in allowed))
+        return self
+
+    def lt(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, lambda v: v is not None and v < value))
+        return self
+
+    def lte(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, lambda v: v is not None and v <= value))
+        return self
+
+    def gte(self, column: str, value: Any) -> "FakeQuery":
+        self.filters.append((column, lambda v: v is not None and v >= value))
+        return self
+
+    def contains(self, column: str, values: Sequence[Any]) -> "FakeQuery":
+        """Array column contains all values (PostgREST cs / SQL @>)."""
+        wanted = list(values)
+        self.filters.append((column, lambda v: v is not None and all(w in v for w in wanted)))
+        return self
+
+    def or_(self, filters: str) -> "FakeQuery":
+        """PostgREST logical filter, e.g. 'a.lt.1,and(a.eq.1,b.lt."x")' (eq/lt/lte/gt/gte)."""
+        self.row_filters.append(_parse_logical("or", filters))
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self.order_by.append((column, desc))
+        return self
+
+    def limit(self, count: int, foreign_table: Optional[str] = None) -> "FakeQuery":
+        if foreign_table:
+            self.embed_limits[foreign_table] = count
+        else:
+            self.max_rows = count
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.first_row = start
+        self.max_rows = end - start + 1
+        return self
+
+    def single(self) -> "FakeQuery":
+        self.single_row = True
+        return self
+
+    def _matches(self, row: Dict[str, Any], prefix: str = "") -> bool:
+        return all(
+            check(row.get(column[len(prefix):]))
+            for column, check in self.filters
+            if column.startswith(prefix) and (prefix or "." not in column)
+        ) and (bool(prefix) or all(check(row) for check in self.row_filters))
+
+    def _embed(self, row: Dict[str, Any], child: str) -> List[Dict[str, Any]]:
+        key = self.table.client.foreign_keys[child]
+        rows = [
+            dict(r) for r in self.table.client.table(child).rows
+            if r.get(key) == row.get(key) and self._matches(r, prefix=f"{child}.")
+        ]
+        return rows[:self.embed_limits.get(child, len(rows))]
+
+    def execute(self) -> FakeResult:
+        self.table.calls.append(self.op)
+        if self.op == "select":
+            return self._select()
+        if self.op == "update":
+            rows = [row for row in self.table.rows if self._matches(row)]
+            for row in rows:
+                row.update(self.payload)
+            return FakeResult([dict(row) for row in rows])
+        if self.op == "delete":
+            rows = [row for row in self.table.rows if self._matches(row)]
+            self.table.rows[:] = [row for row in self.table.rows if not self._matches(row)]
+            return FakeResult(rows)
+        return self._insert()
+
+    def _select(self) -> FakeResult:
+        rows = [dict(row) for row in self.table.rows if self._matches(row)]
+        for row in rows:
+            for child in self.embeds:
+                row[child] = self._embed(row, child)
+        for column, desc in reversed(self.order_by):
+            rows.sort(key=lambda row: row.get(column), reverse=desc)
+        count = len(rows) if self.options.get("count") else None
+        rows = rows[self.first_row:]
+        if self.max_rows is not None:
+            rows = rows[:self.max_rows]
+        if "*" not in self.columns:
+            rows = [{column: row.get(column) for column in self.columns + self.embeds} for row in rows]
+        if self.single_row:
+            return FakeResult(rows[0] if rows else None)
+        return FakeResult(rows, count)
+
+    def _insert(self) -> FakeResult:
+        records = self.payload if isinstance(self.payload, list) else [self.payload]
+        inserted = []
+        for record in records:
+            if self.table.conflicts(record):
+                if self.op == "upsert" and self.options.get("ignore_duplicates"):
+                    continue
+                raise Exception("duplicate key value violates unique constraint")
+            self.table.rows.append(dict(record))
+            inserted.append(dict(record))
+        return FakeResult(inserted)
+
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "lt": lambda a, b: a is not None and a < b,
+    "lte": lambda a, b: a is not None and a <= b,
+    "gt": lambda a, b: a is not None and a > b,
+    "gte": lambda a, b: a is not None and a >= b,
+}
+
+
+def _split_top_level(text: str) -> List[str]:
+    parts, depth, quoted, current = [], 0, False, ""
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in "()":
+            depth += 1 if char == "(" else -1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    return parts + [current]
+
+
+def _parse_logical(operator: str, filters: str) -> Callable[[Dict[str, Any]], bool]:
+    checks = []
+    for part in _split_top_level(filters):
+        nested = re.fullmatch(r"(and|or)\((.*)\)", part)
+        if nested:
+            checks.append(_parse_logical(nested.group(1), nested.group(2)))
+            continue
+        column, op, value = part.split(".", 2)
+        value = value[1:-1] if value.startswith('"') else value
+        checks.append(lambda row, column=column, op=op, value=value: _COMPARISONS[op](row.get(column), value))
+    combine = all if operator == "and" else any
+    return lambda row: combine(check(row) for check in checks)
+
+
+class FakeTable:
+    """Rows and executed statements of one table."""
+
+    def __init__(self, client: "FakeSupabase", unique: Sequence[str] = ()):
+        self.client = client
+        self.rows: List[Dict[str, Any]] = []
+        self.calls: List[str] = []
+        self.unique = tuple(unique)
+
+    def conflicts(self, record: Dict[str, Any]) -> bool:
+        if not self.unique or any(record.get(column) is None for column in self.unique):
+            return False  # NULLs never conflict (Postgres semantics)
+        return any(all(row.get(c) == record.get(c) for c in self.unique) for row in self.rows)
+
+    def select(self, columns: str = "*", count: Optional[str] = None) -> FakeQuery:
+        return FakeQuery(self, "select", columns, count=count)
+
+    def insert(self, record: Any) -> FakeQuery:
+        return FakeQuery(self, "insert", record)
+
+    def upsert(self, record: Any, on_conflict: str = "", ignore_duplicates: bool = False) -> FakeQuery:
+        assert tuple(on_conflict.split(",")) == self.unique, f"no unique index on {on_conflict}"
+        return FakeQuery(self, "upsert", record, ignore_duplicates=ignore_duplicates)
+
+    def update(self, values: Dict[str, Any]) -> FakeQuery:
+        return FakeQuery(self, "update", values)
+
+    def delete(self) -> FakeQuery:
+        return FakeQuery(self, "delete")
+
+
+class FakeRpc:
+    """One call of a SQL function (client.rpc(name, params))."""
+
+    def __init__(self, client: "FakeSupabase", name: str, params: Dict[str, Any]):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    def execute(self) -> FakeResult:
+        self.client.rpc_calls.append(self.name)
+        return FakeResult(self.client.functions[self.name](self.client, self.params))
+
+
+class FakeSupabase:
+    """
+    Client exposing table(name) and rpc(name, params).
+    
+    unique mirrors the migration's unique indexes (upsert conflict targets);
+    foreign_keys maps an embeddable child table to its parent key column;
+    functions maps a SQL function name to a Python stand-in taking
+    (client, params).
+    """
+
+    def __init__(
+        self,
+        unique: Optional[Dict[str, Sequence[str]]] = None,
+        foreign_keys: Optional[Dict[str, str]] = None,
+        functions: Optional[Dict[str, Callable[["FakeSupabase", Dict[str, Any]], Any]]] = None,
+    ):
+        self.unique = unique or {"lynx_drafts": ("tenant_id", "request_id")}
+        self.foreign_keys = foreign_keys or {"lynx_executions": "draft_id"}
+        self.functions = functions or {}
+        self.tables: Dict[str, FakeTable] = {}
+        self.rpc_calls: List[str] = []
+
+    def table(self, name: str) -> FakeTable:
+        if name not in self.tables:
+            self.tables[name] = FakeTable(self, self.unique.get(name, ()))
+        return self.tables[name]
+
+    def rpc(self, name: str, params: Dict[str, Any]) -> FakeRpc:
+        return FakeRpc(self, name, params)